@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""Throughput benchmark of the post processors.
+
+Synthetic jobs of a given number of commands are postprocessed by every
+post processor, the legacy scripts through WrapperPost and the refactored
+ones through their PostProcessor class.  The refactored posts are run a
+second time writing straight to files with export_to_files, the streaming
+path of long jobs.  For each post and job the throughput in lines per
+second, the peak Python memory and a hash of the output are reported.  The
+hashes can be saved as a baseline and compared later, thus a change of the
+output of any post is noticed.
+
+Run it with FreeCADCmd, in the GUI some posts open their editor:
+
+    import CAMTests.PostBenchmark as PostBenchmark
+    PostBenchmark.run(sizes=[10000, 100000], baseline="/tmp/post_baseline.json")
+    PostBenchmark.run(posts=["grbl", "refactored_grbl"], jobs=["drilling"])
+
+The first run with a baseline file name writes the baseline, the following
+runs compare against it.  Pass update_baseline=True to overwrite it.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import FreeCAD
+import Path
+import Path.Main.Job as PathJob
+import Path.Op.Custom as PathCustom
+from Path.Post.Processor import PostProcessorFactory, WrapperPost
+
+Commands = List[Path.Command]
+Result = Dict[str, Any]
+
+DEFAULT_SIZES = [10000]
+
+# the time stamps in the headers differ on every run
+TIME_STAMP = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}")
+
+
+def adaptive_commands(size: int) -> Commands:
+    """Return about size commands of an adaptive clearing like path.
+
+    Trochoidal loops of short lines and arcs moving along a spiral, with
+    a rapid link to the next step down every few loops.
+    """
+    commands: Commands = [Path.Command("G0", {"X": 0.0, "Y": 0.0, "Z": 5.0})]
+    loop = 0
+    while len(commands) < size:
+        angle = loop * 0.05
+        radius = 5.0 + 0.2 * angle
+        x = 50.0 + radius * math.cos(angle)
+        y = 50.0 + radius * math.sin(angle)
+        z = -1.0 - (loop // 200) * 0.5
+        if loop % 200 == 0:
+            commands.append(Path.Command("G0", {"Z": 5.0}))
+            commands.append(Path.Command("G0", {"X": x, "Y": y}))
+            commands.append(Path.Command("G1", {"Z": z, "F": 300.0}))
+        for i in range(8):
+            a = angle + i * math.pi / 4
+            commands.append(
+                Path.Command(
+                    "G1",
+                    {"X": x + math.cos(a), "Y": y + math.sin(a), "Z": z, "F": 1200.0},
+                )
+            )
+        commands.append(
+            Path.Command(
+                "G2",
+                {"X": x + 1.0, "Y": y, "Z": z, "I": -0.5, "J": 0.0, "F": 1200.0},
+            )
+        )
+        commands.append(
+            Path.Command(
+                "G3",
+                {"X": x, "Y": y + 1.0, "Z": z, "I": -1.0, "J": 0.0, "F": 1200.0},
+            )
+        )
+        loop += 1
+    commands.append(Path.Command("G0", {"Z": 5.0}))
+    return commands
+
+
+def surface_commands(size: int) -> Commands:
+    """Return about size commands of a 3D surface like path.
+
+    Zig-zag raster lines over a wavy surface, every command moves in X, Y and Z.
+    """
+    commands: Commands = [Path.Command("G0", {"X": 0.0, "Y": 0.0, "Z": 5.0})]
+    steps = max(10, int(math.sqrt(size)))
+    row = 0
+    while len(commands) < size:
+        y = row * 0.5
+        xs = range(steps) if row % 2 == 0 else range(steps - 1, -1, -1)
+        for i in xs:
+            x = i * 100.0 / steps
+            z = -2.0 + math.sin(x * 0.1) * math.cos(y * 0.1)
+            commands.append(Path.Command("G1", {"X": x, "Y": y, "Z": z, "F": 800.0}))
+        row += 1
+    commands.append(Path.Command("G0", {"Z": 5.0}))
+    return commands
+
+
+def drilling_commands(size: int) -> Commands:
+    """Return about size commands of a drilling path.
+
+    A grid of holes, alternating between simple and peck drilling cycles.
+    """
+    commands: Commands = [
+        Path.Command("G0", {"Z": 5.0}),
+        Path.Command("G90"),
+        Path.Command("G99"),
+    ]
+    hole = 0
+    while len(commands) < size:
+        x = (hole % 100) * 3.0
+        y = (hole // 100) * 3.0
+        commands.append(Path.Command("G0", {"X": x, "Y": y}))
+        if hole % 2 == 0:
+            commands.append(Path.Command("G81", {"X": x, "Y": y, "Z": -3.0, "R": 2.0, "F": 100.0}))
+        else:
+            commands.append(
+                Path.Command(
+                    "G83",
+                    {"X": x, "Y": y, "Z": -6.0, "R": 2.0, "Q": 1.0, "F": 100.0},
+                )
+            )
+        hole += 1
+    commands.append(Path.Command("G80"))
+    commands.append(Path.Command("G0", {"Z": 5.0}))
+    return commands
+
+
+JOBS: Dict[str, Callable[[int], Commands]] = {
+    "adaptive": adaptive_commands,
+    "surface": surface_commands,
+    "drilling": drilling_commands,
+}
+
+
+def create_job(doc, commands: Commands):
+    """Create a job in doc with one custom operation following commands."""
+    box = doc.addObject("Part::Box", "Box")
+    box.Length = 100
+    box.Width = 100
+    box.Height = 10
+    doc.recompute()
+    job = PathJob.Create("Job", [box], None)
+    op = PathCustom.Create("Custom", parentJob=job)
+    doc.recompute()
+    # set the path after the recompute, the op would replace it with its empty gcode
+    op.Path = Path.Path(commands)
+    return job
+
+
+def postprocessor_args(post) -> str:
+    """Return the arguments to postprocess without showing the editor."""
+    if "--no-show-editor" in str(post.tooltipArgs):
+        return "--no-show-editor"
+    return ""
+
+
+def normalize_output(sections) -> str:
+    """Return the gcode of all sections without the lines with time stamps."""
+    gcode = "".join(g for _, g in sections if isinstance(g, str))
+    return "\n".join(line for line in gcode.splitlines() if not TIME_STAMP.search(line))
+
+
+def read_sections(sections, filenames: List[str]):
+    """Return sections with the gcode of the sections written to files read back."""
+    result = []
+    for i, (partname, gcode) in enumerate(sections):
+        if gcode is None and i < len(filenames) and os.path.isfile(filenames[i]):
+            with open(filenames[i], "r", encoding="utf-8") as f:
+                gcode = f.read()
+        result.append((partname, gcode))
+    return result
+
+
+def measure(post, repeat: int, streaming: bool = False) -> Result:
+    """Postprocess the job of post, the time is the best of repeat runs.
+
+    If streaming is True the post writes to files in a temporary directory
+    with export_to_files, otherwise the gcode is returned by export().
+    The peak memory is measured in an extra run, tracing the allocations slows
+    the post down too much to time it in the same run.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        filenames: List[str] = []
+
+        def filename_for(partname: str) -> str:
+            filenames.append(os.path.join(directory, f"part{len(filenames)}.nc"))
+            return filenames[-1]
+
+        def export():
+            filenames.clear()
+            if streaming:
+                return post.export_to_files(filename_for)
+            return post.export()
+
+        best = math.inf
+        sections = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            sections = export()
+            best = min(best, time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            export()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        gcode = normalize_output(read_sections(sections or [], filenames))
+    lines = gcode.count("\n") + 1 if gcode else 0
+    return {
+        "seconds": best,
+        "lines": lines,
+        "lines_per_second": lines / max(best, 1e-9),
+        "peak_mb": peak / 1e6,
+        "hash": hashlib.sha1(gcode.encode("utf-8")).hexdigest(),
+    }
+
+
+def benchmark_post(job, postname: str, repeat: int) -> List[Result]:
+    """Return the measurements of postname for job, or the error it raised.
+
+    The first result is the one of export().  Refactored posts have a second
+    one of export_to_files, its output is "same" if it wrote the gcode of
+    export() and "CHANGED" otherwise.
+    """
+    result: Result = {"post": postname, "mode": "export"}
+    results = [result]
+    try:
+        post = PostProcessorFactory.get_post_processor(job, postname)
+        if post is None:
+            raise ImportError(f"post processor {postname} not found")
+        result["kind"] = "legacy" if isinstance(post, WrapperPost) else "refactored"
+        job.PostProcessorArgs = postprocessor_args(post)
+        result.update(measure(post, repeat))
+        if result["kind"] == "refactored":
+            # the legacy posts have no streaming path, export_to_files calls export()
+            streamed: Result = {"post": postname, "kind": result["kind"], "mode": "files"}
+            results.append(streamed)
+            streamed.update(measure(post, repeat, streaming=True))
+            streamed["output"] = "same" if streamed["hash"] == result["hash"] else "CHANGED"
+    except Exception as e:
+        results[-1]["error"] = f"{type(e).__name__}: {e}"
+    return results
+
+
+def load_baseline(filename: Optional[str]) -> Dict[str, str]:
+    if filename and os.path.isfile(filename):
+        with open(filename, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_baseline(filename: str, baseline: Dict[str, str]) -> None:
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=1, sort_keys=True)
+
+
+def format_results(results: List[Result]) -> str:
+    lines = [
+        "{:<24} {:<10} {:<6} {:<10} {:>8} {:>9} {:>9} {:>12} {:>8} {:<8}".format(
+            "post",
+            "kind",
+            "mode",
+            "job",
+            "size",
+            "lines",
+            "seconds",
+            "lines/s",
+            "peak MB",
+            "output",
+        )
+    ]
+    for r in results:
+        if "error" in r:
+            lines.append(
+                f"{r['post']:<24} {r.get('kind', ''):<10} {r['mode']:<6} {r['job']:<10} "
+                f"{r['error']}"
+            )
+            continue
+        lines.append(
+            "{:<24} {:<10} {:<6} {:<10} {:>8} {:>9} {:>9.3f} {:>12.0f} {:>8.1f} {:<8}".format(
+                r["post"],
+                r["kind"],
+                r["mode"],
+                r["job"],
+                r["size"],
+                r["lines"],
+                r["seconds"],
+                r["lines_per_second"],
+                r["peak_mb"],
+                r["output"],
+            )
+        )
+    return "\n".join(lines)
+
+
+def run(
+    sizes: Optional[List[int]] = None,
+    posts: Optional[List[str]] = None,
+    jobs: Optional[List[str]] = None,
+    repeat: int = 1,
+    baseline: Optional[str] = None,
+    update_baseline: bool = False,
+) -> List[Result]:
+    """Benchmark the posts on the synthetic jobs of every size.
+
+    posts defaults to all available post processors and jobs to all of JOBS.
+    If baseline is the name of a json file, the output hashes are compared
+    to the ones saved in it, missing ones are added.  The output column is
+    "same" or "CHANGED" then, "new" for added hashes and "-" without a baseline.
+    The rows of export_to_files ("files" mode) compare to the output of
+    export() instead, they must write the same gcode.
+    Returns a list of dicts with the results, which are printed as a table too.
+    """
+    if sizes is None:
+        sizes = DEFAULT_SIZES
+    if posts is None:
+        posts = Path.Preferences.allAvailablePostProcessors()
+    if jobs is None:
+        jobs = list(JOBS)
+
+    hashes = load_baseline(baseline)
+    results: List[Result] = []
+    for jobname in jobs:
+        for size in sizes:
+            doc = FreeCAD.newDocument("PostBenchmark")
+            try:
+                job = create_job(doc, JOBS[jobname](size))
+                for postname in posts:
+                    key = f"{postname}/{jobname}/{size}"
+                    for result in benchmark_post(job, postname, repeat):
+                        result["job"] = jobname
+                        result["size"] = size
+                        if "error" in result or result["mode"] != "export":
+                            pass
+                        elif not baseline:
+                            result["output"] = "-"
+                        elif key in hashes and not update_baseline:
+                            same = hashes[key] == result["hash"]
+                            result["output"] = "same" if same else "CHANGED"
+                        else:
+                            hashes[key] = result["hash"]
+                            result["output"] = "new"
+                        results.append(result)
+                        Path.Log.debug(f"{key}: {result}")
+            finally:
+                FreeCAD.closeDocument(doc.Name)
+
+    if baseline:
+        save_baseline(baseline, hashes)
+    FreeCAD.Console.PrintMessage(format_results(results) + "\n")
+    return results
+
+
+def regressions(results: List[Result]) -> List[Result]:
+    """Return the results whose output differs from the baseline or which failed."""
+    return [r for r in results if "error" in r or r.get("output") == "CHANGED"]
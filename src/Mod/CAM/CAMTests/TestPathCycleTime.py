@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import math
+import Path
+import Path.Base.CycleTime as PathCycleTime
+
+from CAMTests.PathTestUtils import PathTestBase
+
+
+def C(name, params={}):
+    return Path.Command(name, params)
+
+
+class TestPathCycleTime(PathTestBase):
+    """Test the cycle time and statistics of toolpaths."""
+
+    def test00(self):
+        """Verify the lengths of lines and arcs."""
+        path = Path.Path(
+            [
+                C("G0", {"X": 10, "Y": 0, "Z": 5}),
+                C("G1", {"Z": 0}),
+                C("G2", {"X": -10, "Y": 0, "I": -10, "J": 0}),
+                C("G3", {"X": 10, "Y": 0, "I": 10, "J": 0}),
+                C("G2", {"X": 10, "Y": 0, "I": -10, "J": 0}),
+            ]
+        )
+        segments = PathCycleTime.pathSegments(path)
+        self.assertRoughly(segments.length[0], math.sqrt(125))
+        self.assertRoughly(segments.length[1], 5)
+        self.assertRoughly(segments.length[2], 10 * math.pi)
+        self.assertRoughly(segments.length[3], 10 * math.pi)
+        # an arc ending where it started is a full circle
+        self.assertRoughly(segments.length[4], 20 * math.pi)
+
+        stats = PathCycleTime.pathStatistics(path, 10, 5, 100, 50)
+        self.assertRoughly(stats["feedDistance"], 5 + 40 * math.pi)
+        self.assertRoughly(stats["rapidDistance"], math.sqrt(125))
+        self.assertRoughly(stats["feedTime"], 5 / 5 + 40 * math.pi / 10)
+        # the rapid moves in Z, thus at the vertical rate
+        self.assertRoughly(stats["rapidTime"], math.sqrt(125) / 50)
+        self.assertRoughly(stats["cycleTime"], stats["feedTime"] + stats["rapidTime"])
+        self.assertEqual(stats["boundBox"], (-10, 0, 0, 10, 0, 5))
+        self.assertEqual(stats["cutBoundBox"], (-10, 0, 0, 10, 0, 0))
+
+    def test01(self):
+        """Verify drilling cycles and dwells."""
+        path = Path.Path(
+            [
+                C("G0", {"Z": 10}),
+                C("G99"),
+                C("G83", {"X": 0, "Y": 0, "Z": -6, "R": 2, "Q": 1}),
+                C("G81", {"X": 3, "Y": 0, "Z": -3, "R": 2}),
+                C("G98"),
+                C("G82", {"X": 6, "Z": -3, "R": 2, "P": 1}),
+                C("G80"),
+                C("G4", {"P": 2}),
+            ]
+        )
+        stats = PathCycleTime.pathStatistics(path, 1, 1, 1, 1)
+        # G83: approach 8, 8 pecks of 1 return 7 * 8 in total, retract to R 8
+        # G81 and G82: 3 in XY and 5 back to R
+        self.assertRoughly(stats["rapidDistance"], 10 + 72 + 8 + 8)
+        self.assertRoughly(stats["feedDistance"], 8 + 5 + 5)
+        self.assertRoughly(stats["feedTime"], 18 + 1 + 2)
+        self.assertEqual(stats["cutBoundBox"][2], -6)
+
+    def test02(self):
+        """Verify the rate fallbacks and acceleration limits."""
+        path = Path.Path([C("G1", {"X": 100}), C("G0", {"X": 0})])
+        stats = PathCycleTime.pathStatistics(path, 10, 10)
+        self.assertRoughly(stats["rapidTime"], 10)
+        self.assertEqual(PathCycleTime.pathStatistics(path, 0, 10)["cycleTime"], 0)
+
+        stats = PathCycleTime.pathStatistics(path, 10, 10, 100, 100, acceleration=100)
+        # the feed reaches its rate, the rapid just reaches it at half way
+        self.assertRoughly(stats["feedTime"], 10 + 0.1)
+        self.assertRoughly(stats["rapidTime"], 2)
@@ -24,7 +24,7 @@ import CAMTests.PathTestUtils as PathTestUtils
 import math
 
 from FreeCAD import Vector
-from Path.Dressup.Tags import Tag
+from Path.Dressup.Tags import Tag, tagSolid
 
 
 class TestHoldingTags(PathTestUtils.PathTestBase):
@@ -67,3 +67,14 @@ class TestHoldingTags(PathTestUtils.PathTestBase):
         h = 2.5 * math.tan((60 / 180.0) * math.pi) * 1.01
         print(h)
         self.assertConeAt(tag.solid, Vector(0, 0, -h * 0.01), 2.5, 0, h)
+
+    def test05(self):
+        """Verify tags of the same size share their solid but are placed on their own."""
+        tag1 = Tag(0, 100, 200, 4, 5, 90, 0, True)
+        tag2 = Tag(1, -10, 20, 4, 5, 90, 0, True)
+        tag1.createSolidsAt(17, 0)
+        tag2.createSolidsAt(3, 0)
+
+        self.assertIs(tagSolid(2, 5, 90, 0), tagSolid(2, 5, 90, 0))
+        self.assertCylinderAt(tag1.solid, Vector(100, 200, 17 - 5 * 0.01), 2, 5 * 1.01)
+        self.assertCylinderAt(tag2.solid, Vector(-10, 20, 3 - 5 * 0.01), 2, 5 * 1.01)
@@ -257,3 +257,16 @@ class TestPathDrillable(PathTestUtils.PathTestBase):
 
         results = Drillable.getDrillableTargets(self.obj, ToolDiameter=20, vector=None)
         self.assertEqual(len(results), 5)
+
+    def test30(self):
+        """Test the hole index"""
+        index = Drillable.holeIndex(self.obj.Shape)
+        self.assertIs(index, Drillable.holeIndex(self.obj.Shape))
+
+        # the cylindrical faces of the shape are indexed
+        self.assertGreaterEqual(len(index.cylinders), 20)
+
+        # the targets are kept with the index
+        results = Drillable.getDrillableTargets(self.obj)
+        self.assertEqual(results, Drillable.getDrillableTargets(self.obj))
+        self.assertEqual(len(results), 15)
@@ -574,6 +574,37 @@ class TestPathGeom(PathTestBase):
         self.assertEqual(len(wires[1].Edges), 1)
         self.assertLine(wires[1].Edges[0], Vector(0, 1, 0), Vector(0, 0, 0))
 
+    def test51(self):
+        """Verify edges of a path are built on demand and shared."""
+        commands = []
+        commands.append(Path.Command("G1", {"X": 1}))
+        commands.append(Path.Command("G1", {"X": 1}))
+        commands.append(Path.Command("G2", {"X": 3, "I": 1, "J": 0}))
+        commands.append(Path.Command("G81", {"X": 5, "Z": -1, "R": 1}))
+        commands.append(Path.Command("G0", {"Y": 4}))
+
+        edges = Path.Geom.PathEdges(commands)
+        self.assertEqual(len(edges), 5)
+        self.assertEqual(edges.hasEdge, [True, False, True, False, True])
+        self.assertEqual(edges.edges, {})
+        # drilling cycles do not move the tool, like in wireForPath()
+        self.assertCoincide(edges.start[4], Vector(3, 0, 0))
+
+        self.assertIsNone(edges.edge(1))
+        self.assertLine(edges.edge(0), Vector(0, 0, 0), Vector(1, 0, 0))
+        self.assertEqual(list(edges.edges), [0])
+        bb = edges.boundBox(2)
+        self.assertRoughly(bb.XMin, 1)
+        self.assertRoughly(bb.XMax, 3)
+        self.assertRoughly(bb.YMin, -1)
+        self.assertRoughly(bb.YMax, 1)
+
+        path = Path.Path(commands)
+        self.assertIs(Path.Geom.pathEdges(path), Path.Geom.pathEdges(Path.Path(commands)))
+        wire, rapid = Path.Geom.wireForPath(path)
+        self.assertEqual(len(wire.Edges), 3)
+        self.assertEqual(len(rapid), 1)
+
     def test60(self):
         """Verify arcToHelix returns proper helix."""
         p1 = Vector(10, -10, 0)
@@ -21,6 +21,7 @@
 # ***************************************************************************
 
 import FreeCAD
+import math
 import Part
 import Path
 import Path.Base.FeedRate as PathFeedRate
@@ -147,3 +148,38 @@ class TestPathHelpers(PathTestBase):
         l = Part.makeLine(v1, v2)
         results = PathUtils.filterArcs(l)
         self.assertTrue(len(results) == 0)
+
+    def test03(self):
+        """Test PathUtils simplify3dLineArray gives the points of simplify3dLine"""
+
+        def check(line, tolerance=1e-4):
+            expected = [(v.x, v.y, v.z) for v in PathUtils.simplify3dLine(line, tolerance)]
+            points = [(v.x, v.y, v.z) for v in line]
+            result = PathUtils.simplify3dLineArray(points, tolerance)
+            self.assertEqual(result.shape, (len(expected), 3))
+            self.assertEqual([tuple(p) for p in result.tolist()], expected)
+            return expected
+
+        # degenerate lines
+        self.assertEqual(check([]), [])
+        self.assertEqual(check([FreeCAD.Vector(1, 2, 3)]), [(1, 2, 3)])
+        self.assertEqual(
+            check([FreeCAD.Vector(1, 2, 3), FreeCAD.Vector(4, 5, 6)]), [(1, 2, 3), (4, 5, 6)]
+        )
+        # coincident points
+        self.assertEqual(len(check([FreeCAD.Vector(1, 1, 1)] * 5)), 2)
+
+        # collinear points are reduced to the end points
+        collinear = [FreeCAD.Vector(i, 2 * i, -i) for i in range(20)]
+        self.assertEqual(check(collinear), [(0, 0, 0), (19, 38, -19)])
+
+        # every corner of a zig-zag is kept
+        zigzag = [FreeCAD.Vector(i, i % 2, 0) for i in range(11)]
+        self.assertEqual(len(check(zigzag)), 11)
+        # corners within the tolerance are not
+        self.assertEqual(len(check(zigzag, 1.0)), 2)
+
+        # a noisy curve, the same points are kept for every tolerance
+        curve = [FreeCAD.Vector(i, math.sin(i / 5.0), 0.01 * (i % 3)) for i in range(100)]
+        for tolerance in (1e-4, 0.005, 0.05, 0.5):
+            check(curve, tolerance)
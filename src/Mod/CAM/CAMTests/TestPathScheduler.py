@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Path
+import Path.Main.Job as PathJob
+import Path.Main.Scheduler as PathScheduler
+import Path.Op.Custom as PathCustom
+import Path.Op.PocketShape as PathPocketShape
+
+from CAMTests.PathTestUtils import PathTestBase
+
+
+class TestPathScheduler(PathTestBase):
+    def setUp(self):
+        self.doc = FreeCAD.newDocument("TestPathScheduler")
+        box = self.doc.addObject("Part::Box", "Box")
+        self.doc.recompute()
+        self.job = PathJob.Create("Job", [box], None)
+        self.ops = []
+        for i in range(3):
+            op = PathCustom.Create("Custom", parentJob=self.job)
+            op.Gcode = ["G0 X{} Y0 Z5".format(i)]
+            self.ops.append(op)
+        self.doc.recompute()
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.doc.Name)
+
+    def opGcode(self, op):
+        return [cmd.toGCode() for cmd in op.Path.Commands if cmd.Name == "G0"]
+
+    def test00(self):
+        """Check that the path objects of a job exclude its tool controllers."""
+        objs = PathScheduler.jobPathObjects(self.job)
+        self.assertEqual([obj.Name for obj in objs], [op.Name for op in self.ops])
+        self.assertFalse(any(PathScheduler.needsRecompute(obj) for obj in objs))
+
+        self.ops[1].Gcode = ["G0 X7 Y0 Z5"]
+        self.assertEqual([PathScheduler.needsRecompute(obj) for obj in objs], [False, True, False])
+
+    def test01(self):
+        """Check that operations computed in worker processes are merged into the document."""
+        for i, op in enumerate(self.ops):
+            op.Gcode = ["G0 X{} Y1 Z5".format(10 + i)]
+        PathScheduler.recomputeJob(self.job, 2)
+
+        for i, op in enumerate(self.ops):
+            self.assertTrue(op.isValid())
+            self.assertNotIn("Touched", op.State)
+            self.assertEqual(self.opGcode(op), ["G0 X{:.6f} Y1.000000 Z5.000000".format(10 + i)])
+
+        # the merged operations are recomputed as usual afterwards
+        self.ops[0].Gcode = ["G0 X20 Y1 Z5"]
+        self.doc.recompute()
+        self.assertEqual(self.opGcode(self.ops[0]), ["G0 X20.000000 Y1.000000 Z5.000000"])
+
+    def test02(self):
+        """Check that a single process recomputes the document as before."""
+        self.ops[2].Gcode = ["G0 X30 Y1 Z5"]
+        PathScheduler.recomputeJob(self.job, 1)
+        self.assertEqual(self.opGcode(self.ops[2]), ["G0 X30.000000 Y1.000000 Z5.000000"])
+        self.assertFalse(self.doc.mustExecute())
+
+    def test03(self):
+        """Check that a reactivated operation does not keep the path of its inactive state."""
+        op = self.ops[0]
+        expected = self.opGcode(op)
+        self.assertEqual(expected, ["G0 X0.000000 Y0.000000 Z5.000000"])
+
+        op.Active = False
+        self.doc.recompute()
+        self.assertEqual(self.opGcode(op), [])
+        self.assertEqual(op.Path.Commands[0].toGCode(), "(inactive operation)")
+
+        op.Active = True
+        self.doc.recompute()
+        self.assertEqual(self.opGcode(op), expected)
+
+    def test04(self):
+        """Check that worker processes compute the same operations as a single process."""
+
+        def results():
+            return [(op.Path.toGCode(), op.CycleTime) for op in self.ops]
+
+        for i, op in enumerate(self.ops):
+            op.Gcode = [
+                "G0 X{} Y0 Z5".format(i),
+                "G1 X{} Y{} Z-1 F100".format(i + 5, i),
+                "G2 X{} Y{} I2 J0".format(i + 9, i),
+            ]
+        PathScheduler.recomputeJob(self.job, 2)
+        parallel = results()
+
+        for op in self.ops:
+            # do not reuse the Path merged from the workers
+            op.Proxy.lastInputFingerprint = None
+            op.touch()
+        PathScheduler.recomputeJob(self.job, 1)
+        self.assertEqual(results(), parallel)
+
+    def test05(self):
+        """Check that a rest machining operation is regenerated when an earlier operation changes."""
+        box = self.doc.getObject("Box")
+        pocket = PathPocketShape.Create("Pocket", parentJob=self.job)
+        pocket.Base = [(box, ["Face6"])]
+        pocket.setExpression("FinalDepth", None)
+        pocket.FinalDepth = 5
+        pocket.UseRestMachining = True
+        self.ops[0].Gcode = ["G0 X2 Y2 Z15", "G1 X2 Y2 Z5 F100", "G1 X8 Y2 Z5"]
+        self.doc.recompute()
+        fingerprint = pocket.Proxy.lastInputFingerprint
+        self.assertIsNotNone(fingerprint)
+
+        # the pocket has no link to the earlier operations
+        self.ops[0].Gcode = ["G0 X2 Y8 Z15", "G1 X2 Y8 Z5 F100", "G1 X8 Y8 Z5"]
+        self.doc.recompute()
+        pocket.touch()
+        self.doc.recompute()
+        self.assertIsNotNone(pocket.Proxy.lastInputFingerprint)
+        self.assertNotEqual(pocket.Proxy.lastInputFingerprint, fingerprint)
+
+        # deactivating an earlier operation changes the rest area too
+        fingerprint = pocket.Proxy.lastInputFingerprint
+        self.ops[1].Active = False
+        self.doc.recompute()
+        pocket.touch()
+        self.doc.recompute()
+        self.assertNotEqual(pocket.Proxy.lastInputFingerprint, fingerprint)
+
+    def test06(self):
+        """Check that a rest machining operation waits for all operations before it."""
+        pocket = PathPocketShape.Create("Pocket", parentJob=self.job)
+        names = [op.Name for op in self.ops] + [pocket.Name]
+
+        dependencies = {name: [] for name in names}
+        PathScheduler._addRestMachiningDependencies(self.job, set(names), dependencies)
+        self.assertEqual(dependencies[pocket.Name], [])
+
+        pocket.UseRestMachining = True
+        PathScheduler._addRestMachiningDependencies(self.job, set(names[1:]), dependencies)
+        self.assertEqual(dependencies[pocket.Name], sorted(names[1:3]))
+        self.assertEqual(dependencies[self.ops[2].Name], [])
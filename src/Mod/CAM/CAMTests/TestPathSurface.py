@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import math
+import multiprocessing
+import numpy
+import os
+import unittest
+
+from types import SimpleNamespace
+from CAMTests.PathTestUtils import PathTestBase
+
+# the Surface operation can only be imported with OpenCamLib installed
+try:
+    import Path.Op.Surface as PathSurface
+except ImportError:
+    PathSurface = None
+
+
+class OclPoint:
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+
+class OclSpan:
+    def __init__(self, p1, p2, c=None, ccw=None):
+        self.p1, self.p2, self.c = p1, p2, c
+
+
+class OclPath:
+    def __init__(self):
+        self.spans = []
+
+    def append(self, span):
+        self.spans.append(span)
+
+
+# stand-in for the ocl module, the tests do not need OpenCamLib
+ocl = SimpleNamespace(Point=OclPoint, Line=OclSpan, Arc=OclSpan, Path=OclPath)
+
+
+class StubCutter:
+    """Drop cutter on the surface z = sin(x) + y / 10, remembering the processes it ran in."""
+
+    def __init__(self):
+        self.pids = []
+        self.points = []
+
+    def setPath(self, path):
+        self.path = path
+
+    def run(self):
+        self.pids.append(os.getpid())
+        self.points = []
+        for span in self.path.spans:
+            for i in range(5):
+                x = span.p1.x + (span.p2.x - span.p1.x) * i / 4
+                y = span.p1.y + (span.p2.y - span.p1.y) * i / 4
+                if span.c is not None:
+                    # not on the arc, but depending on its center
+                    y += span.c.y
+                self.points.append(OclPoint(x, y, math.sin(x) + y / 10))
+
+    def getCLPoints(self):
+        return self.points
+
+
+@unittest.skipIf(PathSurface is None, "OpenCamLib is not installed")
+class TestPathSurface(PathTestBase):
+    def setUp(self):
+        self.ocl = PathSurface.ocl
+        PathSurface.ocl = ocl
+        self.scans = [("line", ((0.0, i), (10.0, i + 0.5))) for i in range(12)]
+        self.scans.extend(
+            ("arc", (((5.0 + i, 0.0), (0.0, 5.0 + i), (0.0, 2.0 * i)), i % 2 == 0))
+            for i in range(6)
+        )
+
+    def tearDown(self):
+        PathSurface.ocl = self.ocl
+
+    def test00(self):
+        """Verify a single process scans in this process."""
+        pdc = StubCutter()
+        scans = PathSurface.mapDropCutScans(pdc, self.scans, 1)
+
+        self.assertEqual(len(scans), len(self.scans))
+        self.assertEqual(pdc.pids, [os.getpid()] * len(self.scans))
+        # the line from (0, 0) to (10, 0.5)
+        self.assertEqual(len(scans[0]), 5)
+        self.assertRoughly(scans[0][2][0], 5.0)
+        self.assertRoughly(scans[0][2][1], 0.25)
+        self.assertRoughly(scans[0][2][2], math.sin(5.0) + 0.025)
+
+    def test01(self):
+        """Verify worker processes return the scans of a single process in the same order."""
+        serial = PathSurface.mapDropCutScans(StubCutter(), self.scans, 1)
+        pdc = StubCutter()
+        parallel = PathSurface.mapDropCutScans(pdc, self.scans, 3)
+
+        self.assertEqual(parallel, serial)
+        if FreeCAD.GuiUp:
+            # a process running the GUI is never forked
+            self.assertEqual(pdc.pids, [os.getpid()] * len(self.scans))
+        elif "fork" in multiprocessing.get_all_start_methods():
+            # the scans ran in the workers, not in this process
+            self.assertEqual(pdc.pids, [])
+
+    def test02(self):
+        """Verify the scan arrays of the planar drop cutter."""
+        serial = PathSurface.mapDropCutScans(StubCutter(), self.scans, 1)
+        for processes in (1, 3):
+            arrays = PathSurface.ObjectSurface._planarDropCutScans(
+                None, StubCutter(), self.scans, processes
+            )
+            self.assertEqual(len(arrays), len(serial))
+            for array, points in zip(arrays, serial):
+                self.assertEqual(array.shape, (len(points), 3))
+                self.assertEqual([tuple(p) for p in array.tolist()], points)
+
+    def test03(self):
+        """Verify the layer depth and hold points of multi pass scans."""
+        line = numpy.array([[0, 0, 5], [1, 0, -1], [2, 0, -3], [3, 0, 0.5], [4, 0, 6]], float)
+        obj = SimpleNamespace(
+            OptimizeStepOverTransitions=False,
+            SafeHeight=FreeCAD.Units.Quantity(9.5, "mm"),
+            FinalDepth=FreeCAD.Units.Quantity(-4, "mm"),
+        )
+        preProcess = PathSurface.ObjectSurface._planarMultipassPreProcess
+
+        # points below the layer are raised to the layer depth
+        (pts, lMax) = preProcess(None, obj, line, 0.0, -2.0)
+        self.assertEqual(pts[:, 2].tolist(), [5, -1, -2, 0.5, 6])
+        self.assertEqual(pts[:, :2].tolist(), line[:, :2].tolist())
+        self.assertEqual(lMax, 6)
+        # the scan itself is not changed
+        self.assertEqual(line[2].tolist(), [2, 0, -3])
+
+        # points above the previous layer are holds at safe height, leading and trailing
+        # ones are removed
+        obj.OptimizeStepOverTransitions = True
+        (pts, lMax) = preProcess(None, obj, line, 0.0, -2.0)
+        self.assertEqual(pts.tolist(), [[1, 0, -1], [2, 0, -2]])
+        self.assertEqual(lMax, -1)
+        (pts, lMax) = preProcess(None, obj, line[[0, 1, 3, 2, 4]], 0.0, -2.0)
+        self.assertEqual(pts[:, 2].tolist(), [-1, 10, -2])
+
+        # a scan of hold points only
+        (pts, lMax) = preProcess(None, obj, line + [0, 0, 10], 0.0, -2.0)
+        self.assertEqual(pts.shape, (0, 3))
+        self.assertEqual(lMax, -4)
+
+    def test04(self):
+        """Verify the depth offset and the G-code of scans."""
+        scan = numpy.array([[0, 0, 1], [1, 0, 2], [2, 1, 3]], float)
+        data = [[scan, "BRK", scan[:1].copy()]]
+        PathSurface.ObjectSurface._planarApplyDepthOffset(None, data, -0.5)
+        self.assertEqual(data[0][0][:, 2].tolist(), [0.5, 1.5, 2.5])
+        self.assertEqual(data[0][1], "BRK")
+        self.assertEqual(data[0][2].tolist(), [[0, 0, 0.5]])
+
+        op = SimpleNamespace(horizFeed=100)
+        obj = SimpleNamespace(
+            OptimizeLinearPaths=False, LinearDeflection=FreeCAD.Units.Quantity(0.1, "mm")
+        )
+        commands = PathSurface.ObjectSurface._planarSinglepassProcess(op, obj, scan)
+        self.assertEqual([cmd.Name for cmd in commands], ["G1"] * 3)
+        for cmd, (x, y, z) in zip(commands, scan.tolist()):
+            self.assertRoughly(cmd.Parameters["X"], x)
+            self.assertRoughly(cmd.Parameters["Y"], y)
+            self.assertRoughly(cmd.Parameters["Z"], z)
+            self.assertRoughly(cmd.Parameters["F"], 100)
+
+        # collinear points of a scan are removed
+        line = numpy.array([[i, 2 * i, 1] for i in range(10)], float)
+        obj.OptimizeLinearPaths = True
+        commands = PathSurface.ObjectSurface._planarSinglepassProcess(op, obj, line)
+        self.assertEqual(len(commands), 2)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Path.Op.SurfaceSupport as PathSurfaceSupport
+
+from types import SimpleNamespace
+from CAMTests.PathTestUtils import PathTestBase
+
+
+class OclPoint:
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+
+class OclTriangle:
+    def __init__(self, p1, p2, p3):
+        self.points = (p1, p2, p3)
+
+
+class OclSTLSurf:
+    def __init__(self):
+        self.triangles = []
+
+    def addTriangle(self, t):
+        self.triangles.append(t)
+
+
+# stand-in for the ocl module, the tests do not need OpenCamLib
+ocl = SimpleNamespace(Point=OclPoint, Triangle=OclTriangle, STLSurf=OclSTLSurf)
+
+
+class TestPathSurfaceSupport(PathTestBase):
+    def setUp(self):
+        self.doc = FreeCAD.newDocument("TestPathSurfaceSupport")
+        self.box = self.doc.addObject("Part::Box", "Box")
+        self.doc.recompute()
+        self.job = SimpleNamespace(Proxy=SimpleNamespace())
+
+    def tearDown(self):
+        FreeCAD.closeDocument("TestPathSurfaceSupport")
+
+    def opObject(self, linearDeflection=0.1):
+        return SimpleNamespace(LinearDeflection=FreeCAD.Units.Quantity(linearDeflection, "mm"))
+
+    def test00(self):
+        """Verify the STL of a shape has the triangles of its tessellation."""
+        points, facets = self.box.Shape.tessellate(0.1)
+        stl = PathSurfaceSupport._makeSTL(self.box, self.opObject(), ocl)
+
+        self.assertEqual(len(stl.triangles), len(facets))
+        for triangle, facet in zip(stl.triangles, facets):
+            for p, i in zip(triangle.points, facet):
+                self.assertCoincide(FreeCAD.Vector(p.x, p.y, p.z), points[i])
+
+    def test01(self):
+        """Verify operations of a job share the STL of an unchanged model."""
+        obj = self.opObject()
+        stl = PathSurfaceSupport.getModelSTL(self.job, self.box, obj, ocl, "S")
+        self.assertIs(PathSurfaceSupport.getModelSTL(self.job, self.box, obj, ocl, "S"), stl)
+
+        # another LinearDeflection needs another tessellation
+        fine = PathSurfaceSupport.getModelSTL(self.job, self.box, self.opObject(0.01), ocl, "S")
+        self.assertIsNot(fine, stl)
+        self.assertIs(PathSurfaceSupport.getModelSTL(self.job, self.box, obj, ocl, "S"), stl)
+
+        # a changed model is tessellated again
+        self.box.Length = 20
+        self.doc.recompute()
+        self.assertIsNot(PathSurfaceSupport.getModelSTL(self.job, self.box, obj, ocl, "S"), stl)
+
+    def test02(self):
+        """Verify the job STL cache keeps the most recently used STLs only."""
+        for i in range(PathSurfaceSupport.STL_CACHE_SIZE + 2):
+            PathSurfaceSupport.getModelSTL(self.job, self.box, self.opObject(0.1 + i), ocl, "S")
+        self.assertEqual(len(self.job.Proxy.stlCache), PathSurfaceSupport.STL_CACHE_SIZE)
+
+    def test03(self):
+        """Verify a cached STL is only used for the shape it was made of."""
+        obj = self.opObject()
+        model = SimpleNamespace(Label="Model", Shape=self.box.Shape)
+
+        # a rebuilt shape with the same size and the same key
+        modelSTLKey = PathSurfaceSupport._modelSTLKey
+        PathSurfaceSupport._modelSTLKey = lambda *args: "key"
+        try:
+            stl = PathSurfaceSupport.getModelSTL(self.job, model, obj, ocl, "S")
+            self.assertIs(PathSurfaceSupport.getModelSTL(self.job, model, obj, ocl, "S"), stl)
+            model.Shape = self.box.Shape.copy()
+            self.assertIsNot(PathSurfaceSupport.getModelSTL(self.job, model, obj, ocl, "S"), stl)
+        finally:
+            PathSurfaceSupport._modelSTLKey = modelSTLKey
@@ -20,10 +20,15 @@
 # *                                                                         *
 # ***************************************************************************
 
+import FreeCAD
 import Path.Tool.Bit as PathToolBit
+import Path.Tool.Index as PathToolIndex
 import CAMTests.PathTestUtils as PathTestUtils
 import glob
+import json
 import os
+import shutil
+import tempfile
 
 TestToolDir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "Tools")
 TestInvalidDir = os.path.join(
@@ -151,3 +156,56 @@ class TestPathToolBit(PathTestUtils.PathTestBase):
         path = PathToolBit.findToolBit(testToolBit())
         self.assertIsNot(path, None)
         self.assertEqual(path, testToolBit())
+
+    def test30(self):
+        """Find tool files in subdirectories and notice changed files"""
+        with tempfile.TemporaryDirectory() as tmp:
+            sub = os.path.join(tmp, "sub")
+            os.mkdir(sub)
+            bit = os.path.join(sub, "bit.fctb")
+            with open(bit, "w") as fp:
+                json.dump({"name": "one"}, fp)
+
+            index = PathToolIndex.ToolIndex(os.path.join(tmp, "index.json"))
+            self.assertEqual(index.find(tmp, "bit.fctb"), bit)
+            self.assertIsNone(index.find(tmp, "other.fctb"))
+            self.assertEqual(index.declaration(bit)["name"], "one")
+
+            other = os.path.join(sub, "other.fctb")
+            with open(other, "w") as fp:
+                json.dump({"name": "two"}, fp)
+            # make sure the modification time changes on coarse file systems
+            os.utime(sub, (0, 0))
+            self.assertEqual(index.find(tmp, "other.fctb"), other)
+
+            with open(bit, "w") as fp:
+                json.dump({"name": "three"}, fp)
+            os.utime(bit, (0, 0))
+            self.assertEqual(index.declaration(bit)["name"], "three")
+
+            # a saved index is used by the next session
+            index.save()
+            index = PathToolIndex.ToolIndex(os.path.join(tmp, "index.json"))
+            self.assertIn(bit, index.files)
+            self.assertEqual(index.find(tmp, "other.fctb"), other)
+
+    def test31(self):
+        """Share the documents of tool shapes and reopen them after the file changed"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "endmill.fcstd")
+            shutil.copyfile(PathToolBit.findToolShape("endmill.fcstd"), path)
+
+            doc = PathToolIndex.shapeDocument(path)
+            self.assertIs(PathToolIndex.shapeDocument(path), doc)
+            self.assertTrue(PathToolIndex.isShapeDocument(doc.Name))
+
+            os.utime(path, (0, 0))
+            changed = PathToolIndex.shapeDocument(path)
+            self.assertIsNot(changed, doc)
+            self.assertEqual(len(PathToolIndex._shapeDocuments), 1)
+            doc = changed
+            self.assertIn(doc.Name, FreeCAD.listDocuments())
+
+            PathToolIndex.closeShapeDocuments()
+            self.assertNotIn(doc.Name, FreeCAD.listDocuments())
+            self.assertFalse(PathToolIndex.isShapeDocument(doc.Name))
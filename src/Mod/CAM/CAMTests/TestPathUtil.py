@@ -115,3 +115,34 @@ class TestPathUtil(PathTestBase):
 
         # however, the object itself is no longer valid
         self.assertFalse(PathUtil.isValidBaseObject(box))
+
+    def test05(self):
+        """Check that the fingerprint of an object follows its inputs."""
+        box = self.doc.addObject("Part::Box", "Box")
+        cylinder = self.doc.addObject("Part::Cylinder", "Cylinder")
+        self.doc.recompute()
+
+        properties = PathUtil.propertyFingerprint(box)
+        fingerprint = PathUtil.fingerprint(properties, PathUtil.shapeFingerprint(box.Shape))
+        self.assertEqual(
+            fingerprint,
+            PathUtil.fingerprint(
+                PathUtil.propertyFingerprint(box), PathUtil.shapeFingerprint(box.Shape)
+            ),
+        )
+
+        # changing a property changes the fingerprint, changing it back restores it
+        box.Height = 20
+        self.doc.recompute()
+        self.assertNotEqual(properties, PathUtil.propertyFingerprint(box))
+        box.Height = 10
+        self.doc.recompute()
+        self.assertEqual(properties, PathUtil.propertyFingerprint(box))
+
+        # results of a recompute are not part of the fingerprint
+        self.assertNotIn("Proxy", dict(properties))
+        self.assertIn("Height", dict(properties))
+
+        self.assertNotEqual(
+            PathUtil.shapeFingerprint(box.Shape), PathUtil.shapeFingerprint(cylinder.Shape)
+        )
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import numpy
+import unittest
+
+from types import SimpleNamespace
+from CAMTests.PathTestUtils import PathTestBase
+
+# the Waterline operation can only be imported with OpenCamLib installed
+try:
+    import Path.Op.Waterline as PathWaterline
+except ImportError:
+    PathWaterline = None
+
+
+def scanLines(heights):
+    """Returns the scan of a height grid, point p of line l is at x = p, y = l."""
+    heights = numpy.array(heights, dtype=float)
+    (lines, pnts) = heights.shape
+    scan = numpy.zeros((lines, pnts, 3))
+    scan[:, :, 0] = numpy.arange(pnts)[numpy.newaxis, :]
+    scan[:, :, 1] = numpy.arange(lines)[:, numpy.newaxis]
+    scan[:, :, 2] = heights
+    return scan
+
+
+def signedArea(loop):
+    """Returns the area of a closed loop, positive if it runs counter-clockwise."""
+    (x, y) = (loop[:, 0], loop[:, 1])
+    return 0.5 * float((x * numpy.roll(y, -1) - numpy.roll(x, -1) * y).sum())
+
+
+@unittest.skipIf(PathWaterline is None, "OpenCamLib is not installed")
+class TestPathWaterline(PathTestBase):
+    def waterlines(self, heights, layDep, cutClimb=True):
+        op = SimpleNamespace(CutClimb=cutClimb)
+        ObjectWaterline = PathWaterline.ObjectWaterline
+        (grid, XY) = ObjectWaterline._bufferScanGrid(op, scanLines(heights))
+        op.topoMap = ObjectWaterline._createTopoMap(op, grid, layDep)
+        return ObjectWaterline._extractWaterlines(op, None, XY, 0, layDep)
+
+    def assertClosed(self, loop):
+        self.assertEqual(loop[0].tolist(), loop[-1].tolist())
+
+    def assertLow(self, heights, loop, layDep):
+        """Verify the loop runs on low grid points only, next to the high area."""
+        heights = numpy.array(heights)
+        for x, y in loop.astype(int).tolist():
+            self.assertLessEqual(heights[y, x], layDep)
+            around = heights[max(0, y - 1) : y + 2, max(0, x - 1) : x + 2]
+            self.assertTrue((around > layDep).any())
+
+    def test00(self):
+        """Verify the waterline around an island is a closed loop with the island on its left."""
+        heights = numpy.zeros((7, 7))
+        heights[2:5, 2:5] = 5.0
+
+        (loop,) = self.waterlines(heights, 1.0)
+        self.assertClosed(loop)
+        self.assertLow(heights, loop, 1.0)
+        # the loop surrounds the island, counter-clockwise for climb milling
+        self.assertEqual(loop[:, 0].min(), 1)
+        self.assertEqual(loop[:, 0].max(), 5)
+        self.assertEqual(loop[:, 1].min(), 1)
+        self.assertEqual(loop[:, 1].max(), 5)
+        self.assertGreater(signedArea(loop), 0)
+
+        (conventional,) = self.waterlines(heights, 1.0, False)
+        self.assertClosed(conventional)
+        self.assertEqual(signedArea(conventional), -signedArea(loop))
+        self.assertEqual(sorted(conventional.tolist()), sorted(loop.tolist()))
+
+        # nothing above the layer, no waterline
+        self.assertEqual(self.waterlines(heights, 6.0), [])
+
+    def test01(self):
+        """Verify the waterline in a pocket runs opposite to the one around an island."""
+        heights = numpy.full((7, 7), 5.0)
+        heights[2:5, 2:5] = 0.0
+
+        (loop,) = self.waterlines(heights, 1.0)
+        self.assertClosed(loop)
+        self.assertLow(heights, loop, 1.0)
+        # the eight low points around the center of the pocket, the material on the left
+        self.assertEqual(len(loop), 9)
+        self.assertEqual(len(set(map(tuple, loop.tolist()))), 8)
+        self.assertLess(signedArea(loop), 0)
+
+        (conventional,) = self.waterlines(heights, 1.0, False)
+        self.assertClosed(conventional)
+        self.assertGreater(signedArea(conventional), 0)
+
+    def test02(self):
+        """Verify a waterline is cut open where it reaches the border of the scan."""
+        heights = numpy.zeros((5, 6))
+        heights[:, :2] = 5.0
+
+        (line,) = self.waterlines(heights, 1.0)
+        self.assertLow(heights, line, 1.0)
+        # along the high area from the first to the last scan line, not around the grid
+        self.assertEqual(line.tolist(), [[2, y] for y in range(5)])
+
+        (conventional,) = self.waterlines(heights, 1.0, False)
+        self.assertEqual(conventional.tolist(), line[::-1].tolist())
+
+    def test03(self):
+        """Verify the waterlines of several areas are ordered as the grid is searched."""
+        heights = numpy.zeros((9, 12))
+        heights[2:4, 7:10] = 5.0
+        heights[5:7, 2:4] = 5.0
+
+        loops = self.waterlines(heights, 1.0)
+        self.assertEqual(len(loops), 2)
+        for loop in loops:
+            self.assertClosed(loop)
+            self.assertLow(heights, loop, 1.0)
+            self.assertGreater(signedArea(loop), 0)
+        self.assertLess(loops[0][:, 1].min(), loops[1][:, 1].min())
@@ -1272,3 +1272,24 @@ G54
         # print(f"--------{nl}{gcode}--------{nl}")
         self.assertEqual(split_gcode[3], "M4 S3000")
         self.assertEqual(split_gcode[4], "G4 P1.23456")
+
+    def test00280(self):
+        """Test postprocessing straight to a file."""
+        self.profile_op.Path = Path.Path(
+            [Path.Command("G0 X1 Y2 Z3"), Path.Command("G1 X4 Y5 Z6 F7")]
+        )
+        self.job.PostProcessorArgs = "--no-show-editor"
+        gcode = self.post.export()[0][1]
+
+        progress = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = path.join(tmpdir, "test_postprocessor_stream.nc")
+            sections = self.post.export_to_files(
+                lambda partname: filename, lambda done, total: progress.append((done, total))
+            )
+            self.assertEqual(len(sections), 1)
+            self.assertIsNone(sections[0][1])
+            with open(filename, "r") as f:
+                self.assertEqual(f.read(), gcode)
+        self.assertTrue(progress)
+        self.assertEqual(progress[-1][0], progress[-1][1])
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import math
+import numpy
+import Path
+import Path.Base.Util as PathUtil
+
+__title__ = "CAM Cycle Time"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Cycle time, travel and extent of toolpaths, computed on arrays of segments"
+
+"""
+The commands of a path are converted once into arrays with one row per command,
+holding the kind of move, its start and end point and its length. The times are
+then computed for all rows at once. The machine model is the one of
+Path.getCycleTime(): the feed rates of the tool controller are used, with the
+vertical rate for every move changing Z. In addition arcs are measured with their
+real sweep, drilling cycles and dwells are included and an optional acceleration
+limit adds the time to speed up and slow down for every move.
+Only the XY plane (G17) is supported for arcs.
+"""
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+MoveNone = 0
+MoveRapid = 1
+MoveStraight = 2
+MoveCW = 3
+MoveCCW = 4
+MoveDrill = 5
+MoveDwell = 6
+
+MoveKinds = {}
+for name in Path.Geom.CmdMoveRapid:
+    MoveKinds[name] = MoveRapid
+for name in Path.Geom.CmdMoveStraight:
+    MoveKinds[name] = MoveStraight
+for name in Path.Geom.CmdMoveCW:
+    MoveKinds[name] = MoveCW
+for name in Path.Geom.CmdMoveCCW:
+    MoveKinds[name] = MoveCCW
+for name in Path.Geom.CmdMoveDrill:
+    MoveKinds[name] = MoveDrill
+for name in ["G4", "G04"]:
+    MoveKinds[name] = MoveDwell
+
+
+def forwardFill(values, initial):
+    """forwardFill(values, initial) ... returns values with every NaN replaced by the last
+    value before it, or by initial if there is none."""
+    index = numpy.where(numpy.isnan(values), -1, numpy.arange(len(values)))
+    numpy.maximum.accumulate(index, out=index)
+    return numpy.where(index < 0, initial, values[numpy.maximum(index, 0)])
+
+
+def moveTime(length, rate, acceleration=None):
+    """moveTime(length, rate, acceleration=None) ... returns the times of moves of the given
+    lengths at the given rates, arrays of the same shape.
+    With an acceleration every move starts and ends at rest, short moves do not reach their
+    rate. Moves with a rate of 0 take no time."""
+    length = numpy.asarray(length, dtype=float)
+    rate = numpy.asarray(rate, dtype=float)
+    valid = rate > 0
+    safeRate = numpy.where(valid, rate, 1.0)
+    if not acceleration:
+        return numpy.where(valid, length / safeRate, 0.0)
+    reachesRate = length >= safeRate * safeRate / acceleration
+    time = numpy.where(
+        reachesRate,
+        length / safeRate + safeRate / acceleration,
+        2.0 * numpy.sqrt(length / acceleration),
+    )
+    return numpy.where(valid & (length > 0), time, 0.0)
+
+
+class PathSegments:
+    """PathSegments(commands, start=(0, 0, 0)) ... the commands of a path as arrays.
+    Each row is one command:
+        kind     ... MoveNone, MoveRapid, MoveStraight, MoveCW, MoveCCW, MoveDrill or MoveDwell
+        start    ... (N, 3) position before the command
+        end      ... (N, 3) position after the command, drilling cycles end at their retract height
+        length   ... length of rapid, straight and arc moves, 0 for all others
+        tool     ... number of the tool loaded by the last M6, -1 before the first one
+    The drilling cycles keep their R, Q and P values and retract mode for times()."""
+
+    def __init__(self, commands, start=(0.0, 0.0, 0.0)):
+        count = len(commands)
+        names = [cmd.Name for cmd in commands]
+        params = [cmd.Parameters for cmd in commands]
+
+        def column(key):
+            return numpy.fromiter((p.get(key, math.nan) for p in params), float, count)
+
+        self.count = count
+        self.kind = numpy.fromiter((MoveKinds.get(n, MoveNone) for n in names), numpy.int8, count)
+        drill = self.kind == MoveDrill
+        # G83 pecks, G85 feeds out of the hole and G82 dwells at its bottom
+        self.peck = numpy.fromiter((n == "G83" for n in names), bool, count)
+        self.feedOut = numpy.fromiter((n == "G85" for n in names), bool, count)
+        self.dwellAtBottom = numpy.fromiter((n == "G82" for n in names), bool, count)
+
+        tools = numpy.fromiter(
+            (p.get("T", math.nan) if n == "M6" else math.nan for n, p in zip(names, params)),
+            float,
+            count,
+        )
+        self.tool = forwardFill(tools, -1).astype(int)
+
+        # G98 retracts to the height before the cycle, G99 to its R plane
+        modes = numpy.fromiter(
+            (99.0 if n == "G99" else 98.0 if n == "G98" else math.nan for n in names),
+            float,
+            count,
+        )
+        self.retractToR = forwardFill(modes, 98.0) == 99.0
+
+        self.x = column("X")
+        self.y = column("Y")
+        self.z = column("Z")
+        self.r = column("R")
+        self.q = column("Q")
+        self.p = column("P")
+        zEnd = self.z.copy()
+        zEnd[drill] = numpy.where(self.retractToR[drill], self.r[drill], math.nan)
+
+        self.end = numpy.column_stack(
+            (
+                forwardFill(self.x, start[0]),
+                forwardFill(self.y, start[1]),
+                forwardFill(zEnd, start[2]),
+            )
+        )
+        self.start = numpy.vstack((numpy.asarray(start, dtype=float), self.end[:-1]))
+        self.start = self.start[:count]
+
+        delta = self.end - self.start
+        self.vertical = delta[:, 2] != 0
+        self.length = numpy.zeros(count)
+
+        straight = (self.kind == MoveRapid) | (self.kind == MoveStraight)
+        self.length[straight] = numpy.linalg.norm(delta[straight], axis=1)
+
+        arc = (self.kind == MoveCW) | (self.kind == MoveCCW)
+        if numpy.any(arc):
+            s = self.start[arc]
+            e = self.end[arc]
+            cx = s[:, 0] + numpy.nan_to_num(column("I")[arc])
+            cy = s[:, 1] + numpy.nan_to_num(column("J")[arc])
+            radius = numpy.hypot(s[:, 0] - cx, s[:, 1] - cy)
+            a0 = numpy.arctan2(s[:, 1] - cy, s[:, 0] - cx)
+            a1 = numpy.arctan2(e[:, 1] - cy, e[:, 0] - cx)
+            sweep = numpy.where(self.kind[arc] == MoveCCW, a1 - a0, a0 - a1) % (2 * math.pi)
+            # an arc ending where it starts is a full circle
+            sweep[sweep < 1e-9] = 2 * math.pi
+            self.length[arc] = numpy.hypot(radius * sweep, e[:, 2] - s[:, 2])
+
+    def drillMoves(self):
+        """drillMoves() ... returns the rows of the drilling cycles and, for those, the
+        lengths of the rapid moves in XY, the vertical rapid moves, the vertical feed moves and
+        the dwell times."""
+        rows = numpy.flatnonzero(self.kind == MoveDrill)
+        s = self.start[rows]
+        e = self.end[rows]
+        rPlane = numpy.where(numpy.isnan(self.r[rows]), s[:, 2], self.r[rows])
+        bottom = numpy.where(numpy.isnan(self.z[rows]), rPlane, self.z[rows])
+        depth = numpy.maximum(rPlane - bottom, 0.0)
+
+        xy = numpy.hypot(e[:, 0] - s[:, 0], e[:, 1] - s[:, 1])
+        approach = numpy.abs(s[:, 2] - rPlane)
+        retract = numpy.abs(e[:, 2] - bottom)
+
+        # G83 retracts to the R plane after every peck and returns rapid to the last depth
+        q = self.q[rows]
+        peck = self.peck[rows] & (numpy.nan_to_num(q) > 0)
+        safeQ = numpy.where(peck, q, 1.0)
+        pecks = numpy.ceil(depth / safeQ)
+        peckTravel = numpy.where(peck, numpy.maximum(pecks - 1, 0) * pecks * safeQ, 0.0)
+
+        feedOut = self.feedOut[rows]
+        p = self.p[rows]
+        dwell = numpy.where(self.dwellAtBottom[rows] & ~numpy.isnan(p), p, 0.0)
+
+        rapidVertical = approach + numpy.where(feedOut, 0.0, retract) + peckTravel
+        feedVertical = depth + numpy.where(feedOut, retract, 0.0)
+        return rows, xy, rapidVertical, feedVertical, dwell
+
+    def times(self, hFeed, vFeed, hRapid=0, vRapid=0, acceleration=None):
+        """times(hFeed, vFeed, hRapid=0, vRapid=0, acceleration=None) ... returns the rapid and the
+        feed time of every row as two arrays.
+        Rapid rates of 0 fall back to the feed rates, like Path.getCycleTime() does."""
+        if not hRapid:
+            hRapid = hFeed
+        if not vRapid:
+            vRapid = vFeed
+
+        rapid = numpy.zeros(self.count)
+        feed = numpy.zeros(self.count)
+
+        rows = self.kind == MoveRapid
+        rapid[rows] = moveTime(
+            self.length[rows], numpy.where(self.vertical[rows], vRapid, hRapid), acceleration
+        )
+        rows = (self.kind == MoveStraight) | (self.kind == MoveCW) | (self.kind == MoveCCW)
+        feed[rows] = moveTime(
+            self.length[rows], numpy.where(self.vertical[rows], vFeed, hFeed), acceleration
+        )
+
+        rows, xy, rapidVertical, feedVertical, dwell = self.drillMoves()
+        rapid[rows] = moveTime(xy, hRapid, acceleration) + moveTime(
+            rapidVertical, vRapid, acceleration
+        )
+        feed[rows] = moveTime(feedVertical, vFeed, acceleration) + dwell
+
+        rows = (self.kind == MoveDwell) & ~numpy.isnan(self.p)
+        feed[rows] = self.p[rows]
+        return rapid, feed
+
+    def distances(self):
+        """distances() ... returns the rapid and the feed distance of every row as two arrays."""
+        rapid = numpy.where(self.kind == MoveRapid, self.length, 0.0)
+        feed = numpy.where(
+            (self.kind == MoveStraight) | (self.kind == MoveCW) | (self.kind == MoveCCW),
+            self.length,
+            0.0,
+        )
+        rows, xy, rapidVertical, feedVertical, dwell = self.drillMoves()
+        rapid[rows] = xy + rapidVertical
+        feed[rows] = feedVertical
+        return rapid, feed
+
+    def boundBox(self, cutting=False):
+        """boundBox(cutting=False) ... returns the minimum and the maximum of the end points of all
+        moves, or of the feed moves only, as two arrays (x, y, z). None if there are no moves.
+        Drilling cycles contribute their bottom, arcs only their end points."""
+        if cutting:
+            rows = self.kind >= MoveStraight
+            rows &= self.kind != MoveDwell
+        else:
+            rows = (self.kind != MoveNone) & (self.kind != MoveDwell)
+        if not numpy.any(rows):
+            return None
+        points = self.end[rows].copy()
+        drill = self.kind[rows] == MoveDrill
+        bottom = self.z[rows]
+        points[drill, 2] = numpy.where(numpy.isnan(bottom[drill]), points[drill, 2], bottom[drill])
+        return points.min(axis=0), points.max(axis=0)
+
+
+def pathSegments(path, start=(0.0, 0.0, 0.0)):
+    """pathSegments(path, start=(0, 0, 0)) ... returns the PathSegments of a Path.Path."""
+    return PathSegments(path.Commands, start)
+
+
+def toolControllerRates(tc):
+    """toolControllerRates(tc) ... returns (hFeed, vFeed, hRapid, vRapid) of tc in mm/s."""
+    return (tc.HorizFeed.Value, tc.VertFeed.Value, tc.HorizRapid.Value, tc.VertRapid.Value)
+
+
+def pathStatistics(path, hFeed, vFeed, hRapid=0, vRapid=0, acceleration=None):
+    """pathStatistics(path, hFeed, vFeed, hRapid=0, vRapid=0, acceleration=None) ... returns a
+    dictionary with the cycle time of path in seconds, split into rapid and feed time, the
+    rapid and feed distances, the number of commands and the bound box of all moves and of
+    the feed moves, each a tuple (xmin, ymin, zmin, xmax, ymax, zmax) or None.
+    If hFeed or vFeed is 0 the times are 0, like Path.getCycleTime() returns."""
+    segments = pathSegments(path)
+    if hFeed and vFeed:
+        rapidTime, feedTime = segments.times(hFeed, vFeed, hRapid, vRapid, acceleration)
+    else:
+        rapidTime = feedTime = numpy.zeros(segments.count)
+    rapidDistance, feedDistance = segments.distances()
+
+    def box(cutting):
+        bb = segments.boundBox(cutting)
+        if bb is None:
+            return None
+        return tuple(float(v) for v in numpy.concatenate(bb))
+
+    return {
+        "cycleTime": float(rapidTime.sum() + feedTime.sum()),
+        "rapidTime": float(rapidTime.sum()),
+        "feedTime": float(feedTime.sum()),
+        "rapidDistance": float(rapidDistance.sum()),
+        "feedDistance": float(feedDistance.sum()),
+        "commands": segments.count,
+        "boundBox": box(False),
+        "cutBoundBox": box(True),
+    }
+
+
+def operationStatistics(op, acceleration=None):
+    """operationStatistics(op, acceleration=None) ... returns the pathStatistics() of op, with the
+    rates of its tool controller, and the tool number as "tool". None if op has no tool
+    controller."""
+    tc = PathUtil.toolControllerForOp(op)
+    if tc is None:
+        return None
+    if acceleration is None:
+        acceleration = Path.Preferences.machineAcceleration()
+    stats = pathStatistics(op.Path, *toolControllerRates(tc), acceleration=acceleration)
+    stats["tool"] = tc.ToolNumber
+    return stats
+
+
+def jobStatistics(job, acceleration=None):
+    """jobStatistics(job, acceleration=None) ... returns the statistics of the active operations
+    of job as a dictionary with
+        "operations" ... list of (op, operationStatistics(op))
+        "tools"      ... tool number -> dictionary with the summed cycleTime, rapidTime, feedTime,
+                         rapidDistance and feedDistance of the operations using the tool
+        "cycleTime"  ... the total cycle time in seconds
+    """
+    operations = []
+    tools = {}
+    total = 0.0
+    keys = ["cycleTime", "rapidTime", "feedTime", "rapidDistance", "feedDistance"]
+    for op in job.Operations.Group:
+        if PathUtil.opProperty(op, "Active") is False:
+            continue
+        stats = operationStatistics(op, acceleration)
+        if stats is None:
+            continue
+        operations.append((op, stats))
+        tool = tools.setdefault(stats["tool"], dict.fromkeys(keys, 0.0))
+        for key in keys:
+            tool[key] += stats[key]
+        total += stats["cycleTime"]
+    return {"operations": operations, "tools": tools, "cycleTime": total}
@@ -11,29 +11,97 @@ else:
     Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
 
 
+# The hole indexes of the last shapes, see holeIndex()
+HoleIndexCacheSize = 16
+_holeIndexes = {}
+
+
+class HoleIndex:
+    """HoleIndex(shape) ... one pass index of the holes of shape.
+    The circular faces of shape are indexed by the hash codes of their edges, thus the
+    bottom face of a blind hole is found without looking at all faces of the shape.
+    The cylindrical faces are listed for getDrillableTargets(). The results of
+    the raised feature checks and of getDrillableTargets() are kept with the index.
+    Use holeIndex(shape) to get the cached index of a shape."""
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.faces = shape.Faces
+        self.cylinders = []
+        # hash code -> outer edges of circular faces
+        self.circularOuterEdges = {}
+        # hash code -> [(face index, edge)] of all edges of circular faces
+        self.circularFaceEdges = {}
+        for i, face in enumerate(self.faces):
+            if isinstance(face.Surface, Part.Cylinder):
+                self.cylinders.append(i)
+            outer = face.OuterWire.Edges
+            if len(outer) == 1 and type(outer[0].Curve) == Part.Circle:
+                self.circularOuterEdges.setdefault(outer[0].hashCode(), []).append(outer[0])
+                for edge in face.Edges:
+                    self.circularFaceEdges.setdefault(edge.hashCode(), []).append((i, edge))
+        self.raised = {}
+        self.targets = {}
+
+    def bottomFace(self, face):
+        """bottomFace(face) ... returns the circular face sharing the first edge of face that is
+        the outer edge of a circular face, None if there is none."""
+        for edge in face.Edges:
+            code = edge.hashCode()
+            if any(edge.isSame(e) for e in self.circularOuterEdges.get(code, [])):
+                # the last circular face with the edge, in the order of the shape's faces
+                matches = [i for i, e in self.circularFaceEdges.get(code, []) if e.isSame(edge)]
+                return self.faces[matches[-1]] if matches else None
+        return None
+
+    def isRaised(self, face):
+        """isRaised(face) ... returns True if the cylindrical face is a raised feature.
+        The cylindrical 'lids' of a hole are inside the shape, this eliminates extruded
+        circles but allows actual holes."""
+        key = face.hashCode()
+        for f, raised in self.raised.get(key, []):
+            if f.isSame(face):
+                return raised
+
+        bb = face.BoundBox
+        startLidCenter = App.Vector(bb.Center.x, bb.Center.y, bb.ZMax)
+        endLidCenter = App.Vector(bb.Center.x, bb.Center.y, bb.ZMin)
+        raised = self.shape.isInside(startLidCenter, 1e-6, False) or self.shape.isInside(
+            endLidCenter, 1e-6, False
+        )
+        self.raised.setdefault(key, []).append((face, raised))
+        return raised
+
+
+def holeIndex(shape):
+    """holeIndex(shape) ... returns the HoleIndex of shape.
+    The indexes of the last shapes are cached. An index keeps its shape alive, thus a
+    rebuilt shape never gets the hash code of a shape in the cache."""
+    key = shape.hashCode()
+    index = _holeIndexes.get(key)
+    if index is not None and index.shape.isSame(shape):
+        return index
+    index = HoleIndex(shape)
+    _holeIndexes.pop(key, None)
+    while len(_holeIndexes) >= HoleIndexCacheSize:
+        _holeIndexes.pop(next(iter(_holeIndexes)))
+    _holeIndexes[key] = index
+    return index
+
+
+def getSeam(candidate):
+    """getSeam(candidate) ... returns the straight seam edge of a cylindrical face."""
+    for e in candidate.Edges:
+        if isinstance(e.Curve, Part.Line):  # found the seam
+            return e
+
+
 def checkForBlindHole(baseshape, selectedFace):
     """
     check for blind holes, returns the bottom face if found, none
     if the hole is a thru-hole
     """
-    circularFaces = [
-        f
-        for f in baseshape.Faces
-        if len(f.OuterWire.Edges) == 1 and type(f.OuterWire.Edges[0].Curve) == Part.Circle
-    ]
-
-    circularFaceEdges = [f.OuterWire.Edges[0] for f in circularFaces]
-    commonedges = [i for i in selectedFace.Edges for x in circularFaceEdges if i.isSame(x)]
-
-    bottomface = None
-    for f in circularFaces:
-        for e in f.Edges:
-            for i in commonedges:
-                if e.isSame(i):
-                    bottomface = f
-                break
-
-    return bottomface
+    return holeIndex(baseshape).bottomFace(selectedFace)
 
 
 def isDrillableCylinder(obj, candidate, tooldiameter=None, vector=App.Vector(0, 0, 1)):
@@ -48,32 +116,6 @@ def isDrillableCylinder(obj, candidate, tooldiameter=None, vector=App.Vector(0,
         "\n match tool diameter {} \n match vector {}".format(matchToolDiameter, matchVector)
     )
 
-    def raisedFeature(obj, candidate):
-        # check if the cylindrical 'lids' are inside the base
-        # object.  This eliminates extruded circles but allows
-        # actual holes.
-
-        startLidCenter = App.Vector(
-            candidate.BoundBox.Center.x,
-            candidate.BoundBox.Center.y,
-            candidate.BoundBox.ZMax,
-        )
-
-        endLidCenter = App.Vector(
-            candidate.BoundBox.Center.x,
-            candidate.BoundBox.Center.y,
-            candidate.BoundBox.ZMin,
-        )
-
-        return obj.isInside(startLidCenter, 1e-6, False) or obj.isInside(endLidCenter, 1e-6, False)
-
-    def getSeam(candidate):
-        # Finds the vertical seam edge in a cylinder
-
-        for e in candidate.Edges:
-            if isinstance(e.Curve, Part.Line):  # found the seam
-                return e
-
     if not candidate.ShapeType == "Face":
         raise TypeError("expected a Face")
 
@@ -83,7 +125,7 @@ def isDrillableCylinder(obj, candidate, tooldiameter=None, vector=App.Vector(0,
     if len(candidate.Edges) != 3:
         raise TypeError("cylinder does not have 3 edges.  Not supported yet")
 
-    if raisedFeature(obj, candidate):
+    if holeIndex(obj).isRaised(candidate):
         Path.Log.debug("The cylindrical face is a raised feature")
         return False
 
@@ -275,27 +317,34 @@ def getDrillableTargets(obj, ToolDiameter=None, vector=App.Vector(0, 0, 1)):
     Finds cylindrical faces that are larger than the tool diameter (if provided) and
     oriented with the vector.  If vector is None, all drillables are returned
 
+    The cylindrical faces are taken from the shape's HoleIndex, which also keeps the
+    results, thus they are only searched again once the shape changed.
     """
 
     shp = obj.Shape
-
-    results = []
-    for i in range(1, len(shp.Faces) + 1):
-        fname = "Face{}".format(i)
-        Path.Log.debug(fname)
-        candidate = obj.getSubObject(fname)
-
-        if not isinstance(candidate.Surface, Part.Cylinder):
-            continue
-
-        try:
-            drillable = isDrillable(shp, candidate, tooldiameter=ToolDiameter, vector=vector)
-            Path.Log.debug("fname: {} : drillable {}".format(fname, drillable))
-        except Exception as e:
-            Path.Log.debug(e)
-            continue
-
-        if drillable:
-            results.append((obj, fname))
-
-    return results
+    index = holeIndex(shp)
+    key = (
+        None if ToolDiameter is None else float(ToolDiameter),
+        None if vector is None else (vector.x, vector.y, vector.z),
+    )
+    names = index.targets.get(key)
+
+    if names is None:
+        names = []
+        for i in index.cylinders:
+            fname = "Face{}".format(i + 1)
+            Path.Log.debug(fname)
+            try:
+                drillable = isDrillable(
+                    shp, index.faces[i], tooldiameter=ToolDiameter, vector=vector
+                )
+                Path.Log.debug("fname: {} : drillable {}".format(fname, drillable))
+            except Exception as e:
+                Path.Log.debug(e)
+                continue
+
+            if drillable:
+                names.append(fname)
+        index.targets[key] = names
+
+    return [(obj, fname) for fname in names]
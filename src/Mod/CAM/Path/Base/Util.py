@@ -32,6 +32,7 @@ other than Path.Log, then it probably doesn't belong here.
 
 import FreeCAD
 import Path
+import hashlib
 
 translate = FreeCAD.Qt.translate
 
@@ -166,3 +167,88 @@ def clearExpressionEngine(obj):
     if hasattr(obj, "ExpressionEngine"):
         for attr, expr in obj.ExpressionEngine:
             obj.setExpression(attr, None)
+
+
+# Properties which are results of a recompute, not inputs
+FingerprintExcludes = ["Proxy", "Path", "CycleTime", "ExpressionEngine", "Visibility", "Label2"]
+
+
+def shapeFingerprint(shape):
+    """shapeFingerprint(shape) ... return a tuple identifying the shape's geometry.
+    The shape's hash code changes whenever the shape is rebuilt, the size and vertex
+    sums guard against a rebuilt shape getting the hash code of the previous one."""
+    if shape.isNull():
+        return ("Null",)
+    bb = shape.BoundBox
+    vertexes = shape.Vertexes
+    return (
+        shape.hashCode(),
+        shape.ShapeType,
+        len(shape.Faces),
+        len(shape.Edges),
+        len(vertexes),
+        (bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax, bb.ZMax),
+        shape.Area,
+        tuple(sum(v.Point[i] for v in vertexes) for i in range(3)),
+    )
+
+
+def objectFingerprint(obj):
+    """objectFingerprint(obj) ... return a tuple identifying obj and its shape or mesh."""
+    shape = getattr(obj, "Shape", None)
+    if hasattr(shape, "hashCode"):
+        return (obj.Name, shapeFingerprint(shape))
+    mesh = getattr(obj, "Mesh", None)
+    if hasattr(mesh, "CountFacets"):
+        bb = mesh.BoundBox
+        return (
+            obj.Name,
+            mesh.CountPoints,
+            mesh.CountFacets,
+            mesh.Area,
+            mesh.Volume,
+            (bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax, bb.ZMax),
+        )
+    return (obj.Name,)
+
+
+def pathFingerprint(path):
+    """pathFingerprint(path) ... return a hex digest of the G-code of path."""
+    return hashlib.sha1(path.toGCode().encode("utf-8")).hexdigest()
+
+
+def _fingerprintValue(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_fingerprintValue(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _fingerprintValue(v)) for k, v in value.items()))
+    if isinstance(value, FreeCAD.Units.Quantity):
+        return (value.Value, str(value.Unit))
+    if isinstance(value, FreeCAD.Vector):
+        return (value.x, value.y, value.z)
+    if isinstance(value, FreeCAD.Placement):
+        return (_fingerprintValue(value.Base), tuple(value.Rotation.Q))
+    if isinstance(value, FreeCAD.DocumentObject):
+        # linked objects are identified by their name and geometry, not by their properties
+        return objectFingerprint(value)
+    if hasattr(value, "hashCode") and hasattr(value, "BoundBox"):
+        return shapeFingerprint(value)
+    # unknown values, a repr with an address changes and forces a recompute
+    return (type(value).__name__, repr(value))
+
+
+def propertyFingerprint(obj, excludes=FingerprintExcludes):
+    """propertyFingerprint(obj, excludes=FingerprintExcludes) ... return a tuple of all property values of obj.
+    Linked objects contribute their name and shape, see shapeFingerprint()."""
+    return tuple(
+        (prop, _fingerprintValue(obj.getPropertyByName(prop)))
+        for prop in sorted(obj.PropertiesList)
+        if prop not in excludes
+    )
+
+
+def fingerprint(*values):
+    """fingerprint(values) ... return a hex digest of values, tuples from propertyFingerprint() and shapeFingerprint()."""
+    return hashlib.sha1(repr(values).encode("utf-8")).hexdigest()
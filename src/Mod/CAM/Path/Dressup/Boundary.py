@@ -203,16 +203,25 @@ class PathBoundary:
         commands = [cmd]
         lastExit = None
         isStartMovements = True
-        for cmd in path.Commands[1:]:
+        moves = Path.Geom.PathEdges(path.Commands[1:], pos)
+        boundBox = self.boundary.BoundBox
+        boundBox.enlarge(Path.Geom.Tolerance)
+        for i, cmd in enumerate(moves.commands):
             if cmd.Name in Path.Geom.CmdMoveAll:
                 if bogusX:
                     bogusX = "X" not in cmd.Parameters
                 if bogusY:
                     bogusY = "Y" not in cmd.Parameters
-                edge = Path.Geom.edgeForCmd(cmd, pos)
-                if edge:
-                    inside = edge.common(self.boundary).Edges
-                    outside = edge.cut(self.boundary).Edges
+                if moves.hasEdge[i]:
+                    if boundBox.intersect(moves.boundBox(i)):
+                        edge = Path.Geom.edgeForCmd(cmd, pos)
+                        inside = edge.common(self.boundary).Edges
+                        outside = edge.cut(self.boundary).Edges
+                    else:
+                        # the move is nowhere near the boundary, no need for its edge
+                        # or the boolean operations, only the number of edges is used
+                        inside = []
+                        outside = [None]
                     if not self.inside:  # UI "inside boundary" param
                         tmp = inside
                         inside = outside
@@ -25,8 +25,10 @@ from PathScripts.PathUtils import waiting_effects
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import FreeCAD
 import Path
+import Path.Base.Util as PathUtil
 import Path.Dressup.Utils as PathDressup
 import PathScripts.PathUtils as PathUtils
+import bisect
 import copy
 import math
 
@@ -109,6 +111,67 @@ def debugCone(vector, r1, r2, height, label, color=None):
             obj.ViewObject.ShapeColor = color
 
 
+TagSolidCacheSize = 32
+_tagSolids = {}
+
+
+def _makeTagSolid(r1, tagHeight, tagAngle, tagRadius):
+    isSquare = False
+    r2 = r1
+    actualHeight = tagHeight
+    height = tagHeight * 1.01
+    radius = 0
+    if Path.Geom.isRoughly(90, tagAngle) and height > 0:
+        # cylinder
+        isSquare = True
+        solid = Part.makeCylinder(r1, height)
+        radius = min(min(tagRadius, r1), tagHeight)
+        Path.Log.debug("Part.makeCylinder(%f, %f)" % (r1, height))
+    elif tagAngle > 0.0 and height > 0.0:
+        # cone
+        rad = math.radians(tagAngle)
+        tangens = math.tan(rad)
+        dr = height / tangens
+        if dr < r1:
+            # with top
+            r2 = r1 - dr
+            s = height / math.sin(rad)
+            radius = min(r2, s) * math.tan((math.pi - rad) / 2) * 0.95
+        else:
+            # triangular
+            r2 = 0
+            height = r1 * tangens * 1.01
+            actualHeight = height
+        Path.Log.debug("Part.makeCone(%f, %f, %f)" % (r1, r2, height))
+        solid = Part.makeCone(r1, r2, height)
+    else:
+        # degenerated case - no tag
+        Path.Log.debug("Part.makeSphere(%f / 10000)" % (r1))
+        solid = Part.makeSphere(r1 / 10000)
+    radius = min(tagRadius, radius)
+    if not Path.Geom.isRoughly(0, radius):
+        # the fillet does not depend on where the tag is, rotating and moving the
+        # solid keeps its edges
+        Path.Log.debug("makeFillet(%.4f)" % radius)
+        solid = solid.makeFillet(radius, [solid.Edges[0]])
+    return (solid, isSquare, r2, actualHeight, radius)
+
+
+def tagSolid(r1, height, angle, radius):
+    """tagSolid(r1, height, angle, radius) ... returns (solid, isSquare, r2, actualHeight, realRadius)
+    of a tag with the bottom radius r1, standing on the origin.
+    Tags of a dressup mostly share their size, the solids of the last sizes are cached. The
+    solid must be copied before it is moved."""
+    key = (round(r1, 6), round(height, 6), round(angle, 6), round(radius, 6))
+    result = _tagSolids.get(key)
+    if result is None:
+        result = _makeTagSolid(r1, height, angle, radius)
+        while len(_tagSolids) >= TagSolidCacheSize:
+            _tagSolids.pop(next(iter(_tagSolids)))
+        _tagSolids[key] = result
+    return result
+
+
 class Tag:
     def __init__(self, nr, x, y, width, height, angle, radius, enabled=True):
         Path.Log.track(
@@ -152,37 +215,10 @@ class Tag:
         self.toolRadius = R
         r1 = self.fullWidth() / 2
         self.r1 = r1
-        self.r2 = r1
-        height = self.height * 1.01
-        radius = 0
-        if Path.Geom.isRoughly(90, self.angle) and height > 0:
-            # cylinder
-            self.isSquare = True
-            self.solid = Part.makeCylinder(r1, height)
-            radius = min(min(self.radius, r1), self.height)
-            Path.Log.debug("Part.makeCylinder(%f, %f)" % (r1, height))
-        elif self.angle > 0.0 and height > 0.0:
-            # cone
-            rad = math.radians(self.angle)
-            tangens = math.tan(rad)
-            dr = height / tangens
-            if dr < r1:
-                # with top
-                r2 = r1 - dr
-                s = height / math.sin(rad)
-                radius = min(r2, s) * math.tan((math.pi - rad) / 2) * 0.95
-            else:
-                # triangular
-                r2 = 0
-                height = r1 * tangens * 1.01
-                self.actualHeight = height
-            self.r2 = r2
-            Path.Log.debug("Part.makeCone(%f, %f, %f)" % (r1, r2, height))
-            self.solid = Part.makeCone(r1, r2, height)
-        else:
-            # degenerated case - no tag
-            Path.Log.debug("Part.makeSphere(%f / 10000)" % (r1))
-            self.solid = Part.makeSphere(r1 / 10000)
+        (solid, self.isSquare, self.r2, self.actualHeight, self.realRadius) = tagSolid(
+            r1, self.height, self.angle, self.radius
+        )
+        self.solid = solid.copy()
         if not Path.Geom.isRoughly(0, R):  # testing is easier if the solid is not rotated
             angle = -Path.Geom.getAngle(self.originAt(0)) * 180 / math.pi
             Path.Log.debug("solid.rotate(%f)" % angle)
@@ -190,11 +226,6 @@ class Tag:
         orig = self.originAt(z - 0.01 * self.actualHeight)
         Path.Log.debug("solid.translate(%s)" % orig)
         self.solid.translate(orig)
-        radius = min(self.radius, radius)
-        self.realRadius = radius
-        if not Path.Geom.isRoughly(0, radius):
-            Path.Log.debug("makeFillet(%.4f)" % radius)
-            self.solid = self.solid.makeFillet(radius, [self.solid.Edges[0]])
 
     def filterIntersections(self, pts, face):
         if (
@@ -641,6 +672,34 @@ class _RapidEdges:
         return False
 
 
+class _TagIndex:
+    """Intervals of the tags' bound boxes in X, sorted by their start. Only the tags whose
+    bound box overlaps the bound box of an edge can intersect it."""
+
+    def __init__(self, tags):
+        boxes = []
+        for i, tag in enumerate(tags):
+            if tag.solid is not None:
+                bb = tag.solid.BoundBox
+                boxes.append((bb.XMin, bb.XMax, bb.YMin, bb.YMax, i))
+        boxes.sort()
+        self.boxes = boxes
+        self.xmin = [b[0] for b in boxes]
+        self.width = max([b[1] - b[0] for b in boxes], default=0)
+
+    def tagsNear(self, edge):
+        """tagsNear(edge) ... returns the sorted indexes of the tags edge might intersect."""
+        bb = edge.BoundBox
+        tol = Path.Geom.Tolerance
+        lo = bisect.bisect_left(self.xmin, bb.XMin - self.width - tol)
+        hi = bisect.bisect_right(self.xmin, bb.XMax + tol)
+        return sorted(
+            i
+            for (xmin, xmax, ymin, ymax, i) in self.boxes[lo:hi]
+            if xmax >= bb.XMin - tol and ymin <= bb.YMax + tol and ymax >= bb.YMin - tol
+        )
+
+
 class PathData:
     def __init__(self, obj):
         Path.Log.track(obj.Base.Name)
@@ -957,6 +1016,7 @@ class ObjectTagDressup:
         self.solids = []
         self.tags = []
         self.pathData = None
+        self.pathDataKey = None
         self.toolRadius = None
         self.mappers = []
 
@@ -971,6 +1031,7 @@ class ObjectTagDressup:
         self.solids = []
         self.tags = []
         self.pathData = None
+        self.pathDataKey = None
         self.toolRadius = None
         self.mappers = []
         return None
@@ -1059,6 +1120,10 @@ class ObjectTagDressup:
         horizRapid = tc.HorizRapid.Value
         vertRapid = tc.VertRapid.Value
 
+        tagIndex = _TagIndex(tags)
+        nearEdge = None
+        nearTags = []
+
         while edge or lastEdge < len(pathData.edges):
             Path.Log.debug("------- lastEdge = %d/%d.%d/%d" % (lastEdge, lastTag, t, len(tags)))
             if not edge:
@@ -1077,9 +1142,15 @@ class ObjectTagDressup:
                     edge = None
 
             if edge:
-                tIndex = (t + lastTag) % len(tags)
-                t += 1
-                i = tags[tIndex].intersects(edge, edge.FirstParameter)
+                # skip the tags which are too far away to intersect the edge
+                if edge is not nearEdge:
+                    nearEdge = edge
+                    nearTags = tagIndex.tagsNear(edge)
+                tIndex = next((n for n in nearTags if n >= t), len(tags))
+                t = tIndex + 1
+                i = None
+                if tIndex < len(tags):
+                    i = tags[tIndex].intersects(edge, edge.FirstParameter)
                 if i and self.isValidTagStartIntersection(edge, i):
                     mapper = MapWireToTag(
                         edge,
@@ -1247,7 +1318,7 @@ class ObjectTagDressup:
         Path.Log.debug("setup")
         self.obj = obj
         try:
-            pathData = PathData(obj)
+            pathData = self.pathDataFor(obj)
         except ValueError:
             Path.Log.error(
                 translate(
@@ -1269,6 +1340,20 @@ class ObjectTagDressup:
             self.generateTags(obj, count)
         return self.pathData
 
+    def pathDataFor(self, obj):
+        """pathDataFor(obj) ... returns the PathData of obj's base path.
+        Building the wire of a long path is expensive, the PathData is reused as long as
+        the base path and its placement do not change."""
+        placement = obj.Base.Placement
+        key = PathUtil.fingerprint(
+            obj.Base.Path.toGCode(), tuple(placement.Base), tuple(placement.Rotation.Q)
+        )
+        if self.pathData is not None and getattr(self, "pathDataKey", None) == key:
+            return self.pathData
+        pathData = PathData(obj)
+        self.pathDataKey = key
+        return pathData
+
     def setXyEnabled(self, triples):
         Path.Log.track()
         if not self.pathData:
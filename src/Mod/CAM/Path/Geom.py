@@ -23,6 +23,7 @@
 
 import FreeCAD
 import Path
+import hashlib
 import math
 
 from FreeCAD import Vector
@@ -467,42 +468,134 @@ def edgeForCmd(cmd, startPoint):
     return None
 
 
+class PathEdges:
+    """PathEdges(commands, startPoint=Vector(0,0,0))
+    The move commands of a path with their start and end points, computed in one pass.
+    The Part.Edge of a command is only built when edge() asks for it, thus code looking at
+    a few commands of a long path does not pay for all of them. Like in wireForPath() commands
+    without an edge, drilling cycles and moves to where the tool already is, do not move
+    the tool."""
+
+    def __init__(self, commands, startPoint=Vector(0, 0, 0)):
+        self.commands = list(commands)
+        self.start = []
+        self.end = []
+        self.hasEdge = []
+        self.edges = {}
+        self._wire = None
+        for cmd in self.commands:
+            endPoint = commandEndPoint(cmd, startPoint)
+            if cmd.Name in CmdMoveStraight or cmd.Name in CmdMoveRapid:
+                hasEdge = not pointsCoincide(startPoint, endPoint)
+            else:
+                hasEdge = cmd.Name in CmdMoveArc
+            self.start.append(startPoint)
+            self.end.append(endPoint)
+            self.hasEdge.append(hasEdge)
+            if hasEdge:
+                startPoint = endPoint
+
+    def __len__(self):
+        return len(self.commands)
+
+    def edge(self, i):
+        """edge(i) ... returns the edge of command i, or None if it has none."""
+        if not self.hasEdge[i]:
+            return None
+        edge = self.edges.get(i)
+        if edge is None:
+            edge = edgeForCmd(self.commands[i], self.start[i])
+            self.edges[i] = edge
+        return edge
+
+    def boundBox(self, i):
+        """boundBox(i) ... returns a BoundBox containing the move of command i, without building
+        its edge. The box of an arc is the one of its full circle."""
+        p0 = self.start[i]
+        p1 = self.end[i]
+        bb = FreeCAD.BoundBox(
+            min(p0.x, p1.x),
+            min(p0.y, p1.y),
+            min(p0.z, p1.z),
+            max(p0.x, p1.x),
+            max(p0.y, p1.y),
+            max(p0.z, p1.z),
+        )
+        if self.commands[i].Name in CmdMoveArc:
+            center = p0 + commandEndPoint(self.commands[i], Vector(0, 0, 0), "I", "J", "K")
+            r = xy(p0 - center).Length
+            bb.add(Vector(center.x - r, center.y - r, bb.ZMin))
+            bb.add(Vector(center.x + r, center.y + r, bb.ZMax))
+        return bb
+
+    def wire(self):
+        """wire() ... returns the wire of all moves and the edges of the rapid moves, see wireForPath()."""
+        if self._wire is None:
+            edges = []
+            rapid = []
+            for i, cmd in enumerate(self.commands):
+                edge = self.edge(i)
+                if edge:
+                    if cmd.Name in CmdMoveRapid:
+                        rapid.append(edge)
+                    edges.append(edge)
+            self._wire = (Part.Wire(edges) if edges else None, rapid)
+        return (self._wire[0], list(self._wire[1]))
+
+    def wires(self):
+        """wires() ... returns a wire for each continuous cutting sequence, see wiresForPath()."""
+        wires = []
+        edges = []
+        for i, cmd in enumerate(self.commands):
+            if cmd.Name in CmdMove:
+                edge = self.edge(i)
+                if edge:
+                    edges.append(edge)
+            elif cmd.Name in CmdMoveRapid:
+                if edges:
+                    wires.append(Part.Wire(edges))
+                    edges = []
+        if edges:
+            wires.append(Part.Wire(edges))
+        return wires
+
+
+PathEdgesCacheSize = 8
+_pathEdges = {}
+
+
+def pathEdges(path, startPoint=Vector(0, 0, 0)):
+    """pathEdges(path, [startPoint=Vector(0,0,0)])
+    Returns the PathEdges of path. The PathEdges of the last paths are shared, dressups stacked
+    on the same base path, or recomputed without it changing, get the edges built before.
+    The edges must not be modified."""
+    key = (
+        hashlib.sha1(path.toGCode().encode("utf-8")).hexdigest(),
+        (startPoint.x, startPoint.y, startPoint.z),
+    )
+    edges = _pathEdges.get(key)
+    if edges is None:
+        edges = PathEdges(path.Commands, startPoint)
+        while len(_pathEdges) >= PathEdgesCacheSize:
+            _pathEdges.pop(next(iter(_pathEdges)))
+        _pathEdges[key] = edges
+    return edges
+
+
 def wireForPath(path, startPoint=Vector(0, 0, 0)):
     """wireForPath(path, [startPoint=Vector(0,0,0)])
     Returns a wire representing all move commands found in the given path."""
-    edges = []
-    rapid = []
-    if hasattr(path, "Commands"):
-        for cmd in path.Commands:
-            edge = edgeForCmd(cmd, startPoint)
-            if edge:
-                if cmd.Name in CmdMoveRapid:
-                    rapid.append(edge)
-                edges.append(edge)
-                startPoint = commandEndPoint(cmd, startPoint)
-    if not edges:
-        return (None, rapid)
-    return (Part.Wire(edges), rapid)
+    if not hasattr(path, "Commands"):
+        return (None, [])
+    return pathEdges(path, startPoint).wire()
 
 
 def wiresForPath(path, startPoint=Vector(0, 0, 0)):
     """wiresForPath(path, [startPoint=Vector(0,0,0)])
     Returns a collection of wires, each representing a continuous cutting Path in path."""
-    wires = []
-    if hasattr(path, "Commands"):
-        edges = []
-        for cmd in path.Commands:
-            if cmd.Name in CmdMove:
-                edges.append(edgeForCmd(cmd, startPoint))
-                startPoint = commandEndPoint(cmd, startPoint)
-            elif cmd.Name in CmdMoveRapid:
-                if len(edges) > 0:
-                    wires.append(Part.Wire(edges))
-                    edges = []
-                startPoint = commandEndPoint(cmd, startPoint)
-        if edges:
-            wires.append(Part.Wire(edges))
-    return wires
+    if not hasattr(path, "Commands"):
+        return []
+    return pathEdges(path, startPoint).wires()
 
 
 def arcToHelix(edge, z0, z1):
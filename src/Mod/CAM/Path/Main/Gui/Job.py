@@ -34,6 +34,7 @@ import Path.GuiInit as PathGuiInit
 import Path.Main.Gui.JobCmd as PathJobCmd
 import Path.Main.Gui.JobDlg as PathJobDlg
 import Path.Main.Job as PathJob
+import Path.Main.Scheduler as PathScheduler
 import Path.Main.Stock as PathStock
 import Path.Tool.Gui.Bit as PathToolBitGui
 import Path.Tool.Gui.Controller as PathToolControllerGui
@@ -806,7 +807,12 @@ class TaskPanel:
         FreeCADGui.Control.closeDialog()
         if resetEdit:
             FreeCADGui.ActiveDocument.resetEdit()
-        FreeCAD.ActiveDocument.recompute()
+        job = FreeCAD.ActiveDocument.getObject(self.name)
+        if job:
+            # the GUI process is never forked, the operations are recomputed in this process
+            PathScheduler.recomputeJob(job)
+        else:
+            FreeCAD.ActiveDocument.recompute()
 
     def updateTooltips(self):
         if (
@@ -633,6 +633,36 @@ class ObjectJob:
             self.getCycleTime()
             if hasattr(obj, "PathChanged"):
                 obj.PathChanged = True
+        self.logRecomputeReport(obj)
+
+    def reportOperationRecompute(self, op, reused):
+        """reportOperationRecompute(op, reused) ... record if the op's Path was reused or generated,
+        the records are logged and cleared on the next execute of the job."""
+        if getattr(self, "recomputeReport", None) is None:
+            self.recomputeReport = {}
+        self.recomputeReport[op.Label] = reused
+
+    def getRecomputeReport(self):
+        """getRecomputeReport() ... returns the labels of the ops with reused Path and of the ops
+        with generated Path since the last execute of the job."""
+        report = getattr(self, "recomputeReport", None) or {}
+        reused = [label for label, r in report.items() if r]
+        recomputed = [label for label, r in report.items() if not r]
+        return (reused, recomputed)
+
+    def logRecomputeReport(self, obj):
+        (reused, recomputed) = self.getRecomputeReport()
+        if reused or recomputed:
+            Path.Log.info(
+                "{}: {} operations reused ({}), {} recomputed ({})".format(
+                    obj.Label,
+                    len(reused),
+                    ", ".join(reused),
+                    len(recomputed),
+                    ", ".join(recomputed),
+                )
+            )
+        self.recomputeReport = {}
 
     def getCycleTime(self):
         seconds = 0
@@ -648,16 +678,21 @@ class ObjectJob:
                 if PathUtil.opProperty(op, "CycleTime") is None:
                     continue
 
-                formattedCycleTime = PathUtil.opProperty(op, "CycleTime")
-                opCycleTime = 0
-                try:
-                    # Convert the formatted time from HH:MM:SS to just seconds
-                    opCycleTime = sum(
-                        x * int(t)
-                        for x, t in zip([1, 60, 3600], reversed(formattedCycleTime.split(":")))
-                    )
-                except Exception:
-                    continue
+                # the seconds of the last estimate are not rounded to full seconds
+                stats = getattr(PathUtil.opProperty(op, "Proxy"), "cycleTimeStatistics", None)
+                if stats is not None:
+                    opCycleTime = stats["cycleTime"]
+                else:
+                    formattedCycleTime = PathUtil.opProperty(op, "CycleTime")
+                    opCycleTime = 0
+                    try:
+                        # Convert the formatted time from HH:MM:SS to just seconds
+                        opCycleTime = sum(
+                            x * int(t)
+                            for x, t in zip([1, 60, 3600], reversed(formattedCycleTime.split(":")))
+                        )
+                    except Exception:
+                        continue
 
                 if opCycleTime > 0:
                     seconds = seconds + opCycleTime
@@ -150,11 +150,13 @@ html_template = Template(
 <h2 class="western"><a name="_run_summary"></a>${runSummaryLabel}</h2>
 <table cellpadding="2" cellspacing="2" bgcolor="#ffffff" style="background: #ffffff;">
     <colgroup>
-        <col width="210"/>
-        <col width="210"/>
-        <col width="210"/>
-        <col width="210"/>
-        <col width="210"/>
+        <col width="150"/>
+        <col width="150"/>
+        <col width="150"/>
+        <col width="150"/>
+        <col width="150"/>
+        <col width="150"/>
+        <col width="150"/>
     </colgroup>
     <tr>
         <td style="border: 1px solid #dedede; padding: 0.05cm">
@@ -172,6 +174,12 @@ html_template = Template(
         <td style="border: 1px solid #dedede; padding: 0.05cm">
             <strong>${cycleTimeLabel}</strong>
         </td>
+        <td style="border: 1px solid #dedede; padding: 0.05cm">
+            <strong>${feedDistanceLabel}</strong>
+        </td>
+        <td style="border: 1px solid #dedede; padding: 0.05cm">
+            <strong>${rapidDistanceLabel}</strong>
+        </td>
     </tr>
     ${run_summary_ops}
 </table>
@@ -462,6 +470,14 @@ tool_template = Template(
             ${diameter}
         </td>
     </tr>
+    <tr>
+        <td style="border: 1px solid #dedede; padding: 0.05cm">
+            <strong>${cycleTimeLabel}</strong>
+        </td>
+        <td style="border: 1px solid #dedede; padding: 0.05cm" colspan="2">
+            ${cycleTime}
+        </td>
+    </tr>
 </table>
 ${ops}
         """
@@ -526,6 +542,12 @@ op_run_template = Template(
     <td style="border: 1px solid #dedede; padding: 0.05cm">
         ${cycleTime}
     </td>
+    <td style="border: 1px solid #dedede; padding: 0.05cm">
+        ${feedDistance}
+    </td>
+    <td style="border: 1px solid #dedede; padding: 0.05cm">
+        ${rapidDistance}
+    </td>
 </tr>
         """
 )
@@ -58,6 +58,7 @@ class ReportGenerator:
             "descriptionLabel": translate("CAM_Sanity", "Description"),
             "diameterLabel": translate("CAM_Sanity", "Tool Diameter"),
             "feedLabel": translate("CAM_Sanity", "Feed Rate"),
+            "feedDistanceLabel": translate("CAM_Sanity", "Feed Distance"),
             "fileSizeLabel": translate("CAM_Sanity", "File Size (kB)"),
             "fixturesLabel": translate("CAM_Sanity", "Fixtures"),
             "flagsLabel": translate("CAM_Sanity", "Post Processor Flags"),
@@ -79,6 +80,7 @@ class ReportGenerator:
             "partNumberLabel": translate("CAM_Sanity", "Part Number"),
             "postLabel": translate("CAM_Sanity", "Postprocessor"),
             "programmerLabel": translate("CAM_Sanity", "Programmer"),
+            "rapidDistanceLabel": translate("CAM_Sanity", "Rapid Distance"),
             "roughStockLabel": translate("CAM_Sanity", "Rough Stock"),
             "runSummaryLabel": translate("CAM_Sanity", "Run Summary"),
             "shapeLabel": translate("CAM_Sanity", "Tool Shape"),
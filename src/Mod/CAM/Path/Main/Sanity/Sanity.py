@@ -33,10 +33,12 @@ from datetime import datetime
 import FreeCAD
 import Path
 import Path.Log
+import Path.Base.CycleTime as PathCycleTime
 import Path.Main.Sanity.ImageBuilder as ImageBuilder
 import Path.Main.Sanity.ReportGenerator as ReportGenerator
 import os
 import tempfile
+import time
 import Path.Dressup.Utils as PathDressup
 
 translate = FreeCAD.Qt.translate
@@ -273,6 +275,18 @@ class CAMSanity:
                 oplabel = "{} (INACTIVE)".format(oplabel)
                 ctime = "00:00:00"
 
+            feedDistance = ""
+            rapidDistance = ""
+            if not hasattr(op, "Active") or op.Active:
+                stats = PathCycleTime.operationStatistics(op)
+                if stats is not None:
+                    feedDistance = FreeCAD.Units.Quantity(
+                        stats["feedDistance"], FreeCAD.Units.Length
+                    ).UserString
+                    rapidDistance = FreeCAD.Units.Quantity(
+                        stats["rapidDistance"], FreeCAD.Units.Length
+                    ).UserString
+
             if op.Path.BoundBox.isValid():
                 zmin = FreeCAD.Units.Quantity(
                     op.Path.BoundBox.ZMin, FreeCAD.Units.Length
@@ -290,6 +304,8 @@ class CAMSanity:
                 "maxZ": zmax,
                 "cycleTime": ctime,
                 "coolantMode": cool,
+                "feedDistance": feedDistance,
+                "rapidDistance": rapidDistance,
             }
             data["operations"].append(opdata)
 
@@ -350,6 +366,7 @@ class CAMSanity:
 
         obj = self.job
         data = {"squawkData": []}
+        toolStatistics = PathCycleTime.jobStatistics(obj)["tools"]
 
         for TC in obj.Tools.Group:
             if not hasattr(TC.Tool, "BitBody"):
@@ -423,6 +440,9 @@ class CAMSanity:
                     )
                 )
 
+            seconds = toolStatistics.get(TC.ToolNumber, {}).get("cycleTime", 0)
+            tooldata["cycleTime"] = time.strftime("%H:%M:%S", time.gmtime(seconds))
+
             tooldata["spindlespeed"] = str(TC.SpindleSpeed)
             if TC.SpindleSpeed == 0.0:
                 data["squawkData"].append(
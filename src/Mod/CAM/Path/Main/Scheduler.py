@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+"""Recomputes the operations of a job in parallel worker processes.
+
+The operations of a job mostly depend on the job's models, stock, tool controllers
+and setup sheet only. Those inputs are recomputed first, then the operations which
+do not depend on another operation to be recomputed are computed in a pool of forked
+worker processes. A process running the GUI is never forked, the Qt and Coin state and
+the document observers must not be shared with a child process, there the operations
+are recomputed in this process. Thus the job task panel, which calls recomputeJob(),
+recomputes the operations in a single process, only scripts and FreeCADCmd use the
+worker processes. Each worker inherits a copy of the document, recomputes its
+operation and sends back the commands of the Path and the properties the operation
+changed. These are set on the operation in the document, which then is not recomputed
+again. Operations depending on merged operations follow in the next round, dressups
+and everything else left is recomputed by the final document recompute. Operations with
+rest machining depend on all operations before them in the job, although they do not
+link to them."""
+
+import multiprocessing
+import pickle
+
+import FreeCAD
+import Path
+import Path.Base.Util as PathUtil
+import Path.Op.Base as PathOp
+
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+# properties the workers do not send back, the Path is sent as its commands
+ExcludedProperties = ["Proxy", "Path", "ExpressionEngine", "Label", "Label2", "Visibility"]
+
+# set before the fork, thus the workers inherit the document
+_poolDocument = None
+
+
+def jobPathObjects(job):
+    """jobPathObjects(job) ... returns the operations and dressups of job, including the base
+    operations of dressups, but not its tool controllers."""
+    tools = [tc.Name for tc in job.Tools.Group] if job.Tools else []
+    names = set()
+    objs = []
+    for op in job.Operations.Group:
+        for obj in [op] + op.OutListRecursive:
+            if (
+                hasattr(obj, "Path")
+                and obj.Name not in names
+                and obj.Name != job.Name
+                and obj.Name not in tools
+            ):
+                names.add(obj.Name)
+                objs.append(obj)
+    return objs
+
+
+def isTouched(obj):
+    """isTouched(obj) ... returns True if obj must be recomputed itself."""
+    return "Touched" in obj.State or not obj.isValid()
+
+
+def needsRecompute(obj):
+    """needsRecompute(obj) ... returns True if obj or anything it depends on must be recomputed."""
+    return isTouched(obj) or any(isTouched(dep) for dep in obj.OutListRecursive)
+
+
+def recomputeJob(job, processes=None):
+    """recomputeJob(job, processes=None) ... recomputes the document of job, computing the job's
+    operations with the given number of processes. Returns the number of objects recomputed
+    by the final document recompute.
+    If processes is None the OperationProcesses preference is used. With a single process,
+    with the GUI up or where no fork is available, this is a plain document recompute."""
+    if processes is None:
+        processes = Path.Preferences.operationProcesses()
+    if processes > 1:
+        computeOperations(job, processes)
+    return job.Document.recompute()
+
+
+def computeOperations(job, processes):
+    """computeOperations(job, processes) ... computes the operations of job which must be
+    recomputed in worker processes and merges their results into the document.
+    Operations which are not computed in a worker, for example because they depend on a
+    dressup or their recompute failed in the worker, are touched, as is the job, and left
+    to the next document recompute."""
+    global _poolDocument
+
+    if FreeCAD.GuiUp:
+        Path.Log.debug("The GUI is up, computing the operations in this process.")
+        return
+
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        Path.Log.debug("No fork on this platform, computing the operations in this process.")
+        return
+
+    doc = job.Document
+    pending = [obj for obj in jobPathObjects(job) if needsRecompute(obj)]
+    ops = [obj for obj in pending if isinstance(getattr(obj, "Proxy", None), PathOp.ObjectOp)]
+    if len(ops) < 2:
+        return
+
+    pendingNames = {obj.Name for obj in pending}
+    dependencies = {}
+    inputs = {}
+    for obj in pending:
+        deps = obj.OutListRecursive
+        dependencies[obj.Name] = [dep.Name for dep in deps if dep.Name in pendingNames]
+        for dep in deps:
+            if dep.Name not in pendingNames and dep.Name != job.Name:
+                inputs[dep.Name] = dep
+    _addRestMachiningDependencies(job, pendingNames, dependencies)
+
+    merged = set()
+    failed = set()
+    try:
+        # the workers must not recompute the inputs each on their own
+        doc.recompute(list(inputs.values()))
+        if not all(dep.isValid() for dep in inputs.values()):
+            Path.Log.debug("Invalid inputs, computing the operations in this process.")
+            return
+
+        while True:
+            wave = [
+                op
+                for op in ops
+                if op.Name not in merged
+                and op.Name not in failed
+                and all(name in merged for name in dependencies[op.Name])
+            ]
+            if len(wave) < 2:
+                break
+            Path.Log.debug("computing {} in worker processes".format([op.Label for op in wave]))
+
+            _poolDocument = doc
+            try:
+                with context.Pool(min(processes, len(wave)), _initWorker) as pool:
+                    for name, commands, properties, fingerprint in pool.imap_unordered(
+                        _computeOperation, [op.Name for op in wave]
+                    ):
+                        op = doc.getObject(name)
+                        if commands is None:
+                            failed.add(name)
+                            continue
+                        _mergeOperation(op, commands, properties, fingerprint)
+                        merged.add(name)
+                        job.Proxy.reportOperationRecompute(op, False)
+            finally:
+                _poolDocument = None
+    finally:
+        # the inputs are recomputed, thus the rest would not be recomputed anymore
+        for obj in pending:
+            if obj.Name not in merged:
+                obj.touch()
+        job.touch()
+
+
+def _addRestMachiningDependencies(job, pendingNames, dependencies):
+    # rest machining reads the Path of every earlier operation, see Area.restMachiningOperations()
+    earlier = set()
+    for groupOp in job.Operations.Group:
+        objs = [groupOp] + groupOp.OutListRecursive
+        for obj in objs:
+            if obj.Name in dependencies and getattr(obj, "UseRestMachining", False):
+                dependencies[obj.Name] = sorted(
+                    set(dependencies[obj.Name]) | (earlier & pendingNames)
+                )
+        earlier.update(obj.Name for obj in objs if obj.Name != job.Name)
+
+
+def _initWorker():
+    # a worker has no GUI of its own to update
+    FreeCAD.GuiUp = False
+
+
+def _computeOperation(name):
+    op = _poolDocument.getObject(name)
+    before = dict(PathUtil.propertyFingerprint(op, ExcludedProperties))
+    try:
+        ok = op.recompute() and op.isValid()
+    except Exception as e:
+        Path.Log.debug("{}: {}".format(op.Label, e))
+        ok = False
+    if not ok:
+        # the document recompute reports the error
+        return (name, None, None, None)
+
+    properties = {}
+    for prop, value in PathUtil.propertyFingerprint(op, ExcludedProperties):
+        if value == before.get(prop) or op.getTypeIdOfProperty(prop).startswith(
+            "App::PropertyLink"
+        ):
+            continue
+        value = op.getPropertyByName(prop)
+        if isinstance(value, FreeCAD.Units.Quantity):
+            # the unit is given by the property
+            value = value.Value
+        try:
+            pickle.dumps(value)
+        except Exception as e:
+            Path.Log.debug("{}: {} not sent back: {}".format(op.Label, prop, e))
+            continue
+        properties[prop] = value
+
+    commands = [(cmd.Name, cmd.Parameters) for cmd in op.Path.Commands]
+    return (name, commands, properties, getattr(op.Proxy, "lastInputFingerprint", None))
+
+
+def _mergeOperation(op, commands, properties, fingerprint):
+    for prop, value in properties.items():
+        try:
+            setattr(op, prop, value)
+        except Exception as e:
+            Path.Log.debug("{}: {} not merged: {}".format(op.Label, prop, e))
+    op.Path = Path.Path([Path.Command(name, params) for name, params in commands])
+    op.Proxy.lastInputFingerprint = fingerprint
+    # the statistics of the worker's estimate are not sent back, the job uses the CycleTime
+    op.Proxy.cycleTimeStatistics = None
+    # the operation is up to date, the final recompute must not compute it again
+    op.purgeTouched()
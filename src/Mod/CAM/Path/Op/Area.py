@@ -23,6 +23,7 @@
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import FreeCAD
 import Path
+import Path.Base.Util as PathUtil
 import Path.Op.Base as PathOp
 import PathScripts.PathUtils as PathUtils
 
@@ -235,9 +236,7 @@ class ObjectOp(PathOp.ObjectOp):
                 bbox = section.getShape().BoundBox
                 z = bbox.ZMin
                 sectionClearedAreas = []
-                for op in self.job.Operations.Group:
-                    if self in [x.Proxy for x in [op] + op.OutListRecursive if hasattr(x, "Proxy")]:
-                        break
+                for op in self.restMachiningOperations():
                     if hasattr(op, "Active") and op.Active and op.Path:
                         tool = (
                             op.Proxy.tool
@@ -462,6 +461,36 @@ class ObjectOp(PathOp.ObjectOp):
         Path.Log.debug("obj.Name: " + str(obj.Name) + "\n\n")
         return sims
 
+    def restMachiningOperations(self):
+        """restMachiningOperations() ... returns the operations of the job before the receiver.
+        Rest machining removes the areas cleared by the active ones of them."""
+        ops = []
+        for op in self.job.Operations.Group:
+            if self in [x.Proxy for x in [op] + op.OutListRecursive if hasattr(x, "Proxy")]:
+                break
+            ops.append(op)
+        return ops
+
+    def inputFingerprint(self, obj):
+        """inputFingerprint(obj) ... adds the Path, the tool and the Active flag of every earlier
+        operation with rest machining, the receiver has no link to the operations it depends on."""
+        fingerprint = super().inputFingerprint(obj)
+        if not (hasattr(obj, "UseRestMachining") and obj.UseRestMachining):
+            return fingerprint
+        values = [fingerprint]
+        for op in self.restMachiningOperations():
+            active = hasattr(op, "Active") and op.Active
+            tc = PathUtil.toolControllerForOp(op)
+            values.append(
+                (
+                    op.Name,
+                    active,
+                    PathUtil.pathFingerprint(op.Path) if active else None,
+                    PathUtil.propertyFingerprint(tc.Tool) if getattr(tc, "Tool", None) else None,
+                )
+            )
+        return PathUtil.fingerprint(*values)
+
     def areaOpRetractTool(self, obj):
         """areaOpRetractTool(obj) ... return False to keep the tool at current level between shapes. Default is True."""
         return True
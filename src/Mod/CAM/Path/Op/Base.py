@@ -24,6 +24,7 @@ import FreeCAD
 from PathScripts.PathUtils import waiting_effects
 from PySide.QtCore import QT_TRANSLATE_NOOP
 import Path
+import Path.Base.CycleTime as PathCycleTime
 import Path.Base.Util as PathUtil
 import PathScripts.PathUtils as PathUtils
 import math
@@ -733,15 +734,20 @@ class ObjectOp(object):
         opExecute(obj) - which is expected to add the generated commands to self.commandlist
         Finally the base implementation adds a rapid move to clearance height and assigns
         the receiver's Path property from the command list.
+        If none of the inputs changed since the last execute, see inputFingerprint(obj), the
+        existing Path is kept and opExecute(obj) is not called.
         """
         Path.Log.track()
 
         if not obj.Active:
             path = Path.Path("(inactive operation)")
             obj.Path = path
+            # the placeholder Path must not be reused once the operation is active again
+            self.lastInputFingerprint = None
             return
 
         if not self._setBaseAndStock(obj):
+            self.lastInputFingerprint = None
             return
 
         # make sure Base is still valid or clear it
@@ -756,6 +762,7 @@ class ObjectOp(object):
                         "No Tool Controller is selected. We need a tool to build a Path.",
                     )
                 )
+                self.lastInputFingerprint = None
                 return
             else:
                 self.vertFeed = tc.VertFeed.Value
@@ -770,6 +777,7 @@ class ObjectOp(object):
                             "No Tool found or diameter is zero. We need a tool to build a Path.",
                         )
                     )
+                    self.lastInputFingerprint = None
                     return
                 self.radius = float(tool.Diameter) / 2.0
                 self.tool = tool
@@ -780,6 +788,16 @@ class ObjectOp(object):
         # in case they still have an expression referencing any op values
         obj.recompute()
 
+        fingerprint = None
+        if Path.Preferences.reuseUnchangedOperations():
+            fingerprint = self.inputFingerprint(obj)
+            if fingerprint == getattr(self, "lastInputFingerprint", None):
+                Path.Log.debug("{}: inputs unchanged, reusing Path".format(obj.Label))
+                self.job.Proxy.reportOperationRecompute(obj, True)
+                self.job.Proxy.getCycleTime()
+                return None
+        self.lastInputFingerprint = None
+
         self.commandlist = []
         self.commandlist.append(Path.Command("(%s)" % obj.Label))
         if obj.Comment:
@@ -794,11 +812,39 @@ class ObjectOp(object):
         path = Path.Path(self.commandlist)
         obj.Path = path
         obj.CycleTime = self.getCycleTimeEstimate(obj)
+        self.lastInputFingerprint = fingerprint
+        self.job.Proxy.reportOperationRecompute(obj, False)
         self.job.Proxy.getCycleTime()
         return result
 
+    def inputFingerprint(self, obj):
+        """inputFingerprint(obj) ... returns a digest of everything opExecute() depends on.
+        The default implementation covers the receiver's properties, the base geometry, the tool
+        controller and its tool, the job's models and stock and the job's own properties.
+        If the digest is the same as the one of the last successful execute, the Path is reused.
+        Can safely be overwritten by subclasses, to add inputs they read from elsewhere."""
+        values = [type(self).__name__, PathUtil.propertyFingerprint(obj)]
+        tc = getattr(obj, "ToolController", None)
+        if tc is not None:
+            values.append(PathUtil.propertyFingerprint(tc))
+            if getattr(tc, "Tool", None) is not None:
+                values.append(PathUtil.propertyFingerprint(tc.Tool))
+        # the job's output settings do not change any operation
+        excludes = PathUtil.FingerprintExcludes + [
+            prop
+            for prop in self.job.PropertiesList
+            if self.job.getGroupOfProperty(prop) == "Output"
+        ]
+        values.append(PathUtil.propertyFingerprint(self.job, excludes))
+        for model in self.model:
+            values.append(PathUtil.objectFingerprint(model))
+        if self.stock is not None:
+            values.append(PathUtil.objectFingerprint(self.stock))
+        return PathUtil.fingerprint(*values)
+
     def getCycleTimeEstimate(self, obj):
 
+        self.cycleTimeStatistics = None
         tc = obj.ToolController
 
         if tc is None or tc.ToolNumber == 0:
@@ -829,8 +875,16 @@ class ObjectOp(object):
                 )
             )
 
-        # Get the cycle time in seconds
-        seconds = obj.Path.getCycleTime(hFeedrate, vFeedrate, hRapidrate, vRapidrate)
+        # Get the cycle time in seconds, together with the travel and extent of the path
+        self.cycleTimeStatistics = PathCycleTime.pathStatistics(
+            obj.Path,
+            hFeedrate,
+            vFeedrate,
+            hRapidrate,
+            vRapidrate,
+            Path.Preferences.machineAcceleration(),
+        )
+        seconds = self.cycleTimeStatistics["cycleTime"]
 
         if not seconds or math.isnan(seconds):
             return translate("CAM", "Cycletime Error")
@@ -161,6 +161,16 @@ class ObjectCustom(PathOp.ObjectOp):
         if os.path.exists(prospective_path):
             return prospective_path
 
+    def inputFingerprint(self, obj):
+        """inputFingerprint(obj) ... adds the modification time of the gcode file to the op's inputs."""
+        fingerprint = super().inputFingerprint(obj)
+        if obj.Source == "File" and len(obj.GcodeFile) > 0:
+            gcode_file = self.findGcodeFile(obj.GcodeFile)
+            if gcode_file:
+                stat = os.stat(gcode_file)
+                fingerprint += "-{}-{}".format(stat.st_mtime_ns, stat.st_size)
+        return fingerprint
+
     def opExecute(self, obj):
         self.commandlist.append(Path.Command("(Begin Custom)"))
 
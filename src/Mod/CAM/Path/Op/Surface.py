@@ -50,6 +50,7 @@ import Path.Op.Base as PathOp
 import Path.Op.SurfaceSupport as PathSurfaceSupport
 import PathScripts.PathUtils as PathUtils
 import math
+import numpy
 import time
 
 # lazily loaded modules
@@ -68,6 +69,10 @@ else:
     Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
 
 
+# The PathDropCutter of the scan worker processes, see mapDropCutScans()
+_poolPDC = None
+
+
 class ObjectSurface(PathOp.ObjectOp):
     """Proxy object for Surfacing operation."""
 
@@ -1075,9 +1080,9 @@ class ObjectSurface(PathOp.ObjectOp):
         SCANDATA = []
 
         def getTransition(two):
-            first = two[0][0][0]  # [step][item][point]
+            (x, y, z) = two[0][0][0]  # [step][item][point]
             safe = obj.SafeHeight.Value + 0.1
-            trans = [[FreeCAD.Vector(first.x, first.y, safe)]]
+            trans = [numpy.array([[x, y, safe]])]
             return trans
 
         # Compute number and size of stepdowns, and final depth
@@ -1219,21 +1224,24 @@ class ObjectSurface(PathOp.ObjectOp):
         for the various cut patterns."""
         Path.Log.debug("_planarPerformOclScan()")
         SCANS = []
+        processes = Path.Preferences.oclScanProcesses()
 
         if offsetPoints or obj.CutPattern == "Offset":
             PNTSET = PathSurfaceSupport.pathGeomToOffsetPointSet(obj, pathGeom)
+            # D format is ((p1, p2), (p3, p4))
+            lines = [("line", I) for D in PNTSET for I in D if I != "BRK"]
+            scans = iter(self._planarDropCutScans(pdc, lines, processes))
             for D in PNTSET:
                 stpOvr = []
                 ofst = []
                 for I in D:
                     if I == "BRK":
-                        stpOvr.append(ofst)
+                        stpOvr.append(_joinScans(ofst))
                         stpOvr.append(I)
                         ofst = []
                     else:
-                        # D format is ((p1, p2), (p3, p4))
-                        (A, B) = I
-                        ofst.extend(self._planarDropCutScan(pdc, A, B))
+                        ofst.append(next(scans))
+                ofst = _joinScans(ofst)
                 if len(ofst) > 0:
                     stpOvr.append(ofst)
                 SCANS.extend(stpOvr)
@@ -1248,14 +1256,15 @@ class ObjectSurface(PathOp.ObjectOp):
             elif obj.CutPattern == "Spiral":
                 PNTSET = PathSurfaceSupport.pathGeomToSpiralPointSet(obj, pathGeom)
 
+            # D format is ((p1, p2), (p3, p4))
+            lines = [("line", LN) for STEP in PNTSET for LN in STEP if LN != "BRK"]
+            scans = iter(self._planarDropCutScans(pdc, lines, processes))
             for STEP in PNTSET:
                 for LN in STEP:
                     if LN == "BRK":
                         stpOvr.append(LN)
                     else:
-                        # D format is ((p1, p2), (p3, p4))
-                        (A, B) = LN
-                        stpOvr.append(self._planarDropCutScan(pdc, A, B))
+                        stpOvr.append(next(scans))
                 SCANS.append(stpOvr)
                 stpOvr = []
         elif obj.CutPattern in ["Circular", "CircularZigZag"]:
@@ -1264,27 +1273,30 @@ class ObjectSurface(PathOp.ObjectOp):
             # PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(obj, pathGeom, self.CutClimb, self.toolDiam, self.closedGap, self.gaps, self.tmpCOM)
             PNTSET = PathSurfaceSupport.pathGeomToCircularPointSet(self, obj, pathGeom)
 
+            # dirFlg 1 is cMode True
+            arcs = [
+                ("arc", (Arc, dirFlg == 1))
+                for (aTyp, dirFlg, ARCS) in PNTSET
+                for Arc in ARCS
+                if Arc != "BRK"
+            ]
+            scans = iter(self._planarDropCutScans(pdc, arcs, processes))
             for so in range(0, len(PNTSET)):
                 stpOvr = []
                 erFlg = False
                 (aTyp, dirFlg, ARCS) = PNTSET[so]
 
-                if dirFlg == 1:  # 1
-                    cMode = True
-                else:
-                    cMode = False
-
                 for a in range(0, len(ARCS)):
                     Arc = ARCS[a]
                     if Arc == "BRK":
                         stpOvr.append("BRK")
                     else:
-                        scan = self._planarCircularDropCutScan(pdc, Arc, cMode)
+                        scan = next(scans)
                         if scan is False:
                             erFlg = True
                         else:
                             if aTyp == "L":
-                                scan.append(FreeCAD.Vector(scan[0].x, scan[0].y, scan[0].z))
+                                scan = numpy.vstack((scan, scan[:1]))
                             stpOvr.append(scan)
                 if erFlg is False:
                     SCANS.append(stpOvr)
@@ -1292,36 +1304,21 @@ class ObjectSurface(PathOp.ObjectOp):
 
         return SCANS
 
+    def _planarDropCutScans(self, pdc, scans, processes=1):
+        """_planarDropCutScans(pdc, scans, processes=1) ... Returns the CL points of all scans.
+        A scan is ("line", (A, B)) or ("arc", (Arc, cMode)), the results are in the order of
+        the scans, as (N, 3) arrays of the point coordinates."""
+        return [
+            numpy.array(CLP, dtype=float).reshape(-1, 3)
+            for CLP in mapDropCutScans(pdc, scans, processes)
+        ]
+
     def _planarDropCutScan(self, pdc, A, B):
-        (x1, y1) = A
-        (x2, y2) = B
-        path = ocl.Path()  # create an empty path object
-        p1 = ocl.Point(x1, y1, 0)  # start-point of line
-        p2 = ocl.Point(x2, y2, 0)  # end-point of line
-        lo = ocl.Line(p1, p2)  # line-object
-        path.append(lo)  # add the line to the path
-        pdc.setPath(path)
-        pdc.run()  # run dropcutter algorithm on path
-        CLP = pdc.getCLPoints()
-        PNTS = [FreeCAD.Vector(p.x, p.y, p.z) for p in CLP]
-        return PNTS  # pdc.getCLPoints()
+        return [FreeCAD.Vector(x, y, z) for (x, y, z) in _dropCutLine(pdc, A, B)]
 
     def _planarCircularDropCutScan(self, pdc, Arc, cMode):
-        path = ocl.Path()  # create an empty path object
-        (sp, ep, cp) = Arc
-
-        # process list of segment tuples (vect, vect)
-        p1 = ocl.Point(sp[0], sp[1], 0)  # start point of arc
-        p2 = ocl.Point(ep[0], ep[1], 0)  # end point of arc
-        C = ocl.Point(cp[0], cp[1], 0)  # center point of arc
-        ao = ocl.Arc(p1, p2, C, cMode)  # arc object
-        path.append(ao)  # add the arc to the path
-        pdc.setPath(path)
-        pdc.run()  # run dropcutter algorithm on path
-        CLP = pdc.getCLPoints()
-
         # Convert OCL object data to FreeCAD vectors
-        return [FreeCAD.Vector(p.x, p.y, p.z) for p in CLP]
+        return [FreeCAD.Vector(x, y, z) for (x, y, z) in _dropCutArc(pdc, Arc, cMode)]
 
     # Main planar scan functions
     def _planarDropCutSingle(self, JOB, obj, pdc, safePDC, depthparams, SCANDATA):
@@ -1345,7 +1342,7 @@ class ObjectSurface(PathOp.ObjectOp):
             peIdx = lenSCANDATA - 1
 
         # Send cutter to x,y position of first point on first line
-        first = SCANDATA[0][0][0]  # [step][item][point]
+        first = _pointVector(SCANDATA[0][0][0])  # [step][item][point]
         GCODE.append(Path.Command("G0", {"X": first.x, "Y": first.y, "F": self.horizRapid}))
 
         # Cycle through step-over sections (line segments or arcs)
@@ -1355,7 +1352,7 @@ class ObjectSurface(PathOp.ObjectOp):
             cmds = []
             PRTS = SCANDATA[so]
             lenPRTS = len(PRTS)
-            first = PRTS[0][0]  # first point of arc/line stepover group
+            first = _pointVector(PRTS[0][0])  # first point of arc/line stepover group
             last = None
             cmds.append(Path.Command("N (Begin step {}.)".format(so), {}))
 
@@ -1375,13 +1372,13 @@ class ObjectSurface(PathOp.ObjectOp):
             for i in range(0, lenPRTS):
                 prt = PRTS[i]
                 lenPrt = len(prt)
-                if prt == "BRK":
-                    nxtStart = PRTS[i + 1][0]
+                if isinstance(prt, str):
+                    nxtStart = _pointVector(PRTS[i + 1][0])
                     cmds.append(Path.Command("N (Break)", {}))
                     cmds.extend(self._stepTransitionCmds(obj, last, nxtStart, safePDC, tolrnc))
                 else:
                     cmds.append(Path.Command("N (part {}.)".format(i + 1), {}))
-                    last = prt[lenPrt - 1]
+                    last = _pointVector(prt[lenPrt - 1])
                     if so == peIdx or peIdx == -1:
                         cmds.extend(self._planarSinglepassProcess(obj, prt))
                     elif (
@@ -1410,13 +1407,11 @@ class ObjectSurface(PathOp.ObjectOp):
 
     def _planarSinglepassProcess(self, obj, points):
         if obj.OptimizeLinearPaths:
-            points = PathUtils.simplify3dLine(points, tolerance=obj.LinearDeflection.Value)
-        # Begin processing ocl points list into gcode
+            points = PathUtils.simplify3dLineArray(points, tolerance=obj.LinearDeflection.Value)
+        # Begin processing ocl points array into gcode
         commands = []
-        for pnt in points:
-            commands.append(
-                Path.Command("G1", {"X": pnt.x, "Y": pnt.y, "Z": pnt.z, "F": self.horizFeed})
-            )
+        for x, y, z in points.tolist():
+            commands.append(Path.Command("G1", {"X": x, "Y": y, "Z": z, "F": self.horizFeed}))
         return commands
 
     def _planarDropCutMulti(self, JOB, obj, pdc, safePDC, depthparams, SCANDATA):
@@ -1466,7 +1461,7 @@ class ObjectSurface(PathOp.ObjectOp):
                 for i in range(0, lenSO):
                     prt = SO[i]
                     lenPrt = len(prt)
-                    if prt == "BRK":
+                    if isinstance(prt, str):
                         if brkFlg:
                             ADJPRTS.append(prt)
                             LMAX.append(prt)
@@ -1488,7 +1483,7 @@ class ObjectSurface(PathOp.ObjectOp):
                 stpOvrCmds = []
                 transCmds = []
                 if soHasPnts is True:
-                    first = ADJPRTS[0][0]  # first point of arc/line stepover group
+                    first = _pointVector(ADJPRTS[0][0])  # first point of arc/line stepover group
                     last = None
 
                     # Manage step over transition and CircularZigZag direction
@@ -1514,9 +1509,9 @@ class ObjectSurface(PathOp.ObjectOp):
                     for i in range(0, lenAdjPrts):
                         prt = ADJPRTS[i]
                         lenPrt = len(prt)
-                        if prt == "BRK" and prtsHasCmds:
+                        if isinstance(prt, str) and prtsHasCmds:
                             if i + 1 < lenAdjPrts:
-                                nxtStart = ADJPRTS[i + 1][0]
+                                nxtStart = _pointVector(ADJPRTS[i + 1][0])
                                 prtsCmds.append(Path.Command("N (--Break)", {}))
                             else:
                                 # Transition straight up to Safe Height if no more parts
@@ -1527,7 +1522,7 @@ class ObjectSurface(PathOp.ObjectOp):
                         else:
                             segCmds = False
                             prtsCmds.append(Path.Command("N (part {})".format(i + 1), {}))
-                            last = prt[lenPrt - 1]
+                            last = _pointVector(prt[lenPrt - 1])
                             if so == peIdx or peIdx == -1:
                                 segCmds = self._planarSinglepassProcess(obj, prt)
                             elif (
@@ -1599,62 +1594,30 @@ class ObjectSurface(PathOp.ObjectOp):
         return GCODE
 
     def _planarMultipassPreProcess(self, obj, LN, prvDep, layDep):
-        ALL = []
-        PTS = []
         optLinTrans = obj.OptimizeStepOverTransitions
         safe = math.ceil(obj.SafeHeight.Value)
 
-        if optLinTrans is True:
-            for P in LN:
-                ALL.append(P)
-                # Handle layer depth AND hold points
-                if P.z <= layDep:
-                    PTS.append(FreeCAD.Vector(P.x, P.y, layDep))
-                elif P.z > prvDep:
-                    PTS.append(FreeCAD.Vector(P.x, P.y, safe))
-                else:
-                    PTS.append(FreeCAD.Vector(P.x, P.y, P.z))
-            # Efor
-        else:
-            for P in LN:
-                ALL.append(P)
-                # Handle layer depth only
-                if P.z <= layDep:
-                    PTS.append(FreeCAD.Vector(P.x, P.y, layDep))
-                else:
-                    PTS.append(FreeCAD.Vector(P.x, P.y, P.z))
-            # Efor
+        # Handle layer depth
+        Z = LN[:, 2]
+        PTS = LN.copy()
+        PTS[:, 2] = numpy.where(Z <= layDep, layDep, Z)
 
         if optLinTrans is True:
+            # Handle hold points
+            PTS[:, 2] = numpy.where((Z > layDep) & (Z > prvDep), safe, PTS[:, 2])
             # Remove leading and trailing Hold Points
-            popList = []
-            for i in range(0, len(PTS)):  # identify leading string
-                if PTS[i].z == safe:
-                    popList.append(i)
-                else:
-                    break
-            popList.sort(reverse=True)
-            for p in popList:  # Remove hold points
-                PTS.pop(p)
-                ALL.pop(p)
-            popList = []
-            for i in range(len(PTS) - 1, -1, -1):  # identify trailing string
-                if PTS[i].z == safe:
-                    popList.append(i)
-                else:
-                    break
-            popList.sort(reverse=True)
-            for p in popList:  # Remove hold points
-                PTS.pop(p)
-                ALL.pop(p)
+            (cut,) = numpy.nonzero(PTS[:, 2] != safe)
+            if len(cut) > 0:
+                LN = LN[cut[0] : cut[-1] + 1]
+                PTS = PTS[cut[0] : cut[-1] + 1]
+            else:
+                LN = LN[:0]
+                PTS = PTS[:0]
 
         # Determine max Z height for remaining points on line
         lMax = obj.FinalDepth.Value
-        if len(ALL) > 0:
-            lMax = ALL[0].z
-            for P in ALL:
-                if P.z > lMax:
-                    lMax = P.z
+        if len(LN) > 0:
+            lMax = float(LN[:, 2].max())
 
         return (PTS, lMax)
 
@@ -1804,8 +1767,8 @@ class ObjectSurface(PathOp.ObjectOp):
 
     def _arcsToG2G3(self, LN, numPts, odd, gDIR, tolrnc):
         cmds = []
-        strtPnt = LN[0]
-        endPnt = LN[numPts - 1]
+        strtPnt = _pointVector(LN[0])
+        endPnt = _pointVector(LN[numPts - 1])
         strtHght = strtPnt.z
         coPlanar = True
         isCircle = False
@@ -1885,10 +1848,8 @@ class ObjectSurface(PathOp.ObjectOp):
                 )
             )
         else:
-            for pt in LN:
-                if abs(pt.z - strtHght) > tolrnc:  # test for horizontal coplanar
-                    coPlanar = False
-                    break
+            if (numpy.abs(LN[:, 2] - strtHght) > tolrnc).any():  # test for horizontal coplanar
+                coPlanar = False
             if coPlanar is True:
                 # ijk = self.tmpCOM - strtPnt
                 ijk = self.tmpCOM.sub(strtPnt)  # vector from start to center
@@ -1934,16 +1895,10 @@ class ObjectSurface(PathOp.ObjectOp):
 
     def _planarApplyDepthOffset(self, SCANDATA, DepthOffset):
         Path.Log.debug("Applying DepthOffset value: {}".format(DepthOffset))
-        lenScans = len(SCANDATA)
-        for s in range(0, lenScans):
-            SO = SCANDATA[s]  # StepOver
-            numParts = len(SO)
-            for prt in range(0, numParts):
-                PRT = SO[prt]
-                if PRT != "BRK":
-                    numPts = len(PRT)
-                    for pt in range(0, numPts):
-                        SCANDATA[s][prt][pt].z += DepthOffset
+        for SO in SCANDATA:  # StepOver
+            for PRT in SO:
+                if not isinstance(PRT, str):
+                    PRT[:, 2] += DepthOffset
 
     def _planarGetPDC(self, stl, finalDep, SampleInterval, cutter):
         pdc = ocl.PathDropCutter()  # create a pdc [PathDropCutter] object
@@ -2626,6 +2581,97 @@ class ObjectSurface(PathOp.ObjectOp):
 # Eclass
 
 
+def _pointVector(p):
+    """Returns the FreeCAD vector of a row of a scan array."""
+    return FreeCAD.Vector(p[0], p[1], p[2])
+
+
+def _joinScans(scans):
+    """Joins scan arrays into one (N, 3) array."""
+    if not scans:
+        return numpy.empty((0, 3))
+    return numpy.concatenate(scans)
+
+
+def _dropCutLine(pdc, A, B):
+    """Runs the drop cutter along the line from A to B, returns the CL points as tuples."""
+    (x1, y1) = A
+    (x2, y2) = B
+    path = ocl.Path()  # create an empty path object
+    p1 = ocl.Point(x1, y1, 0)  # start-point of line
+    p2 = ocl.Point(x2, y2, 0)  # end-point of line
+    lo = ocl.Line(p1, p2)  # line-object
+    path.append(lo)  # add the line to the path
+    pdc.setPath(path)
+    pdc.run()  # run dropcutter algorithm on path
+    return [(p.x, p.y, p.z) for p in pdc.getCLPoints()]
+
+
+def _dropCutArc(pdc, Arc, cMode):
+    """Runs the drop cutter along an arc (sp, ep, cp), returns the CL points as tuples."""
+    path = ocl.Path()  # create an empty path object
+    (sp, ep, cp) = Arc
+
+    # process list of segment tuples (vect, vect)
+    p1 = ocl.Point(sp[0], sp[1], 0)  # start point of arc
+    p2 = ocl.Point(ep[0], ep[1], 0)  # end point of arc
+    C = ocl.Point(cp[0], cp[1], 0)  # center point of arc
+    ao = ocl.Arc(p1, p2, C, cMode)  # arc object
+    path.append(ao)  # add the arc to the path
+    pdc.setPath(path)
+    pdc.run()  # run dropcutter algorithm on path
+    return [(p.x, p.y, p.z) for p in pdc.getCLPoints()]
+
+
+def _dropCut(pdc, scan):
+    (kind, args) = scan
+    if kind == "arc":
+        return _dropCutArc(pdc, *args)
+    return _dropCutLine(pdc, *args)
+
+
+def _poolDropCut(scan):
+    return _dropCut(_poolPDC, scan)
+
+
+def mapDropCutScans(pdc, scans, processes=1):
+    """mapDropCutScans(pdc, scans, processes=1) ... Returns the CL points of the scans.
+    A scan is ("line", (A, B)) or ("arc", (Arc, cMode)), the result of a scan is a list of
+    (x, y, z) tuples, in the order of the scans.
+    The scans are independent from each other, thus with more than one process they are
+    run in a pool of forked processes. Each worker inherits its own copy of the pdc with
+    its STL surface and cutter from the fork, only the scans and the CL points are
+    transferred. The CL points are the same as with a single process.
+    A process running the GUI is never forked, the Qt and Coin state and the document
+    observers must not be shared with a child process. There, and where no fork is
+    available, the scans are run in this process."""
+    global _poolPDC
+
+    scans = list(scans)
+    if processes <= 1 or len(scans) < 2 * processes:
+        return [_dropCut(pdc, scan) for scan in scans]
+    if FreeCAD.GuiUp:
+        Path.Log.debug("The GUI is up, scanning in a single process.")
+        return [_dropCut(pdc, scan) for scan in scans]
+
+    import multiprocessing
+
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        Path.Log.debug("No fork on this platform, scanning in a single process.")
+        return [_dropCut(pdc, scan) for scan in scans]
+
+    chunksize = max(1, len(scans) // (4 * processes))
+    # set before the fork, thus the workers inherit the pdc
+    _poolPDC = pdc
+    try:
+        with context.Pool(processes) as pool:
+            return pool.map(_poolDropCut, scans, chunksize)
+    finally:
+        _poolPDC = None
+
+
 def SetupProperties():
     """SetupProperties() ... Return list of properties required for operation."""
     return [tup[1] for tup in ObjectSurface.opPropertyDefinitions(False)]
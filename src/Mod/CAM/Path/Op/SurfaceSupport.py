@@ -32,6 +32,8 @@ import Path
 import Path.Op.Util as PathOpUtil
 import PathScripts.PathUtils as PathUtils
 import math
+import numpy
+from collections import OrderedDict
 
 # lazily loaded modules
 from lazy_loader.lazy_loader import LazyLoader
@@ -49,6 +51,9 @@ else:
 
 translate = FreeCAD.Qt.translate
 
+# Number of model STLs a job keeps for reuse by its 3D operations, see getModelSTL()
+STL_CACHE_SIZE = 4
+
 
 class PathGeometryGenerator:
     """Creates a path geometry shape from an assigned pattern for conversion to tool paths.
@@ -1161,7 +1166,65 @@ def _prepareModelSTLs(self, JOB, obj, m, ocl):
     objects"""
     if self.modelSTLs[m] is True:
         model = JOB.Model.Group[m]
-        self.modelSTLs[m] = _makeSTL(model, obj, ocl, self.modelTypes[m])
+        self.modelSTLs[m] = getModelSTL(JOB, model, obj, ocl, self.modelTypes[m])
+
+
+def getModelSTL(JOB, model, obj, ocl, model_type=None):
+    """getModelSTL(JOB, model, obj, ocl, model_type=None) ... Returns the ocl.STLSurf of a model.
+    The STLs are cached in the job, keyed on the model shape and obj.LinearDeflection,
+    so all Surface and Waterline operations of a job share the STL of an unchanged model.
+    OCL only reads the STL, the cached object is used by the operations directly.
+    An entry keeps the shape it was made of alive, a rebuilt shape never gets its hash code
+    and a hit is only used if it still is the same shape."""
+    key = _modelSTLKey(model, obj, model_type)
+    cache = getattr(JOB.Proxy, "stlCache", None) if JOB.Proxy else None
+    if cache is None:
+        cache = OrderedDict()
+        if JOB.Proxy:
+            JOB.Proxy.stlCache = cache
+    shape = None
+    if model_type != "M":
+        shape = model.Shape if hasattr(model, "Shape") else model
+    entry = cache.get(key)
+    if entry is not None:
+        cachedShape, stl = entry
+        if shape is None or cachedShape.isSame(shape):
+            Path.Log.debug("Reusing cached STL of {}".format(model.Label))
+            cache.move_to_end(key)
+            return stl
+        del cache[key]
+
+    stl = _makeSTL(model, obj, ocl, model_type)
+    cache[key] = (shape, stl)
+    while len(cache) > STL_CACHE_SIZE:
+        cache.popitem(last=False)
+    return stl
+
+
+def _modelSTLKey(model, obj, model_type):
+    """Returns the STL cache key of a model, a tuple of the geometry identity and size."""
+    if model_type == "M":
+        mesh = model.Mesh
+        bb = mesh.BoundBox
+        # a mesh is not tessellated, LinearDeflection does not apply
+        return (
+            "M",
+            model.Name,
+            mesh.CountPoints,
+            mesh.CountFacets,
+            mesh.Area,
+            mesh.Volume,
+            (bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax, bb.ZMax),
+        )
+    shape = model.Shape if hasattr(model, "Shape") else model
+    bb = shape.BoundBox
+    return (
+        "S",
+        shape.hashCode(),
+        len(shape.Faces),
+        (bb.XMin, bb.YMin, bb.ZMin, bb.XMax, bb.YMax, bb.ZMax),
+        obj.LinearDeflection.Value,
+    )
 
 
 def _makeSafeSTL(self, JOB, obj, mdlIdx, faceShapes, voidShapes, ocl):
@@ -1254,26 +1317,37 @@ def _makeSTL(model, obj, ocl, model_type=None):
     tolerance specified in obj.LinearDeflection.
     Returns an ocl.STLSurf()."""
     if model_type == "M":
-        facets = model.Mesh.Facets.Points
+        points, facet_indices = model.Mesh.Topology
     else:
         if hasattr(model, "Shape"):
             shape = model.Shape
         else:
             shape = model
-        vertices, facet_indices = shape.tessellate(obj.LinearDeflection.Value)
-        facets = ((vertices[f[0]], vertices[f[1]], vertices[f[2]]) for f in facet_indices)
+        points, facet_indices = shape.tessellate(obj.LinearDeflection.Value)
     stl = ocl.STLSurf()
-    for tri in facets:
-        v1, v2, v3 = tri
-        t = ocl.Triangle(
-            ocl.Point(v1[0], v1[1], v1[2]),
-            ocl.Point(v2[0], v2[1], v2[2]),
-            ocl.Point(v3[0], v3[1], v3[2]),
-        )
-        stl.addTriangle(t)
+    addTrianglesToSTL(stl, _getTriangleArray(points, facet_indices), ocl)
     return stl
 
 
+def _getTriangleArray(points, facet_indices):
+    """Returns the (N, 3, 3) array of triangle corner coordinates of a tessellation."""
+    if not facet_indices:
+        return numpy.empty((0, 3, 3))
+    vertices = numpy.array([(p.x, p.y, p.z) for p in points], dtype=float)
+    return vertices[numpy.array(facet_indices, dtype=numpy.int64)]
+
+
+def addTrianglesToSTL(stl, triangles, ocl):
+    """addTrianglesToSTL(stl, triangles, ocl) ... Adds an (N, 3, 3) array of triangle corners to an ocl.STLSurf.
+    The OCL python binding has no bulk constructor, so the array is converted once into
+    plain floats and only the OCL objects are created per triangle."""
+    Point = ocl.Point
+    Triangle = ocl.Triangle
+    addTriangle = stl.addTriangle
+    for (x1, y1, z1), (x2, y2, z2), (x3, y3, z3) in numpy.asarray(triangles).tolist():
+        addTriangle(Triangle(Point(x1, y1, z1), Point(x2, y2, z2), Point(x3, y3, z3)))
+
+
 # Functions to convert path geometry into line/arc segments for OCL input or directly to g-code
 def pathGeomToLinesPointSet(self, obj, compGeoShp):
     """pathGeomToLinesPointSet(self, obj, compGeoShp)...
@@ -47,6 +47,7 @@ import Path.Op.Base as PathOp
 import Path.Op.SurfaceSupport as PathSurfaceSupport
 import PathScripts.PathUtils as PathUtils
 import math
+import numpy
 import time
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
@@ -1238,30 +1239,29 @@ class ObjectWaterline(PathOp.ObjectOp):
         oclScan = self._waterlineDropCutScan(
             stl, smplInt, xmin, xmax, ymin, depthparams[lenDP - 1], numScanLines
         )
-        oclScan = [FreeCAD.Vector(P.x, P.y, P.z + depOfst) for P in oclScan]
+        oclScan = numpy.array([(P.x, P.y, P.z) for P in oclScan], dtype=float).reshape(-1, 3)
+        oclScan[:, 2] += depOfst
         lenOS = len(oclScan)
         ptPrLn = int(lenOS / numScanLines)
 
-        # Convert oclScan list of points to multi-dimensional list
-        scanLines = []
-        for L in range(0, numScanLines):
-            scanLines.append([])
-            for P in range(0, ptPrLn):
-                pi = L * ptPrLn + P
-                scanLines[L].append(oclScan[pi])
+        # Convert oclScan array of points to (line, point, xyz) array
+        scanLines = oclScan[: numScanLines * ptPrLn].reshape(numScanLines, ptPrLn, 3)
         lenSL = len(scanLines)
         pntsPerLine = len(scanLines[0])
         msg = "--OCL scan: " + str(lenSL * pntsPerLine) + " points, with "
         msg += str(numScanLines) + " lines and " + str(pntsPerLine) + " pts/line"
         Path.Log.debug(msg)
 
+        # Height and XY grids of the scan, thresholded per layer
+        (heights, XY) = self._bufferScanGrid(scanLines)
+
         # Extract Wl layers per depthparams
         lyr = 0
         cmds = []
         layTime = time.time()
-        self.topoMap = []
+        self.topoMap = None
         for layDep in depthparams:
-            cmds = self._getWaterline(obj, scanLines, layDep, lyr, lenSL, pntsPerLine)
+            cmds = self._getWaterline(obj, heights, XY, layDep, lyr)
             commands.extend(cmds)
             lyr += 1
         Path.Log.debug("--All layer scans combined took " + str(time.time() - layTime) + " s")
@@ -1290,381 +1290,139 @@ class ObjectWaterline(PathOp.ObjectOp):
         # return the list of points
         return pdc.getCLPoints()
 
-    def _getWaterline(self, obj, scanLines, layDep, lyr, lenSL, pntsPerLine):
-        """_getWaterline(obj, scanLines, layDep, lyr, lenSL, pntsPerLine) ... Get waterline."""
+    def _getWaterline(self, obj, heights, XY, layDep, lyr):
+        """_getWaterline(obj, heights, XY, layDep, lyr) ... Get waterline."""
         commands = []
         cmds = []
         loopList = []
-        self.topoMap = []
-        # Create topo map from scanLines (highs and lows)
-        self.topoMap = self._createTopoMap(scanLines, layDep, lenSL, pntsPerLine)
-        # Add buffer lines and columns to topo map
-        self._bufferTopoMap(lenSL, pntsPerLine)
-        # Identify layer waterline from OCL scan
-        self._highlightWaterline(4, 9)
+        # Create topo map from height grid (highs and lows)
+        self.topoMap = self._createTopoMap(heights, layDep)
         # Extract waterline and convert to gcode
-        loopList = self._extractWaterlines(obj, scanLines, lyr, layDep)
+        loopList = self._extractWaterlines(obj, XY, lyr, layDep)
         # save commands
         for loop in loopList:
             cmds = self._loopToGcode(obj, layDep, loop)
             commands.extend(cmds)
         return commands
 
-    def _createTopoMap(self, scanLines, layDep, lenSL, pntsPerLine):
-        """_createTopoMap(scanLines, layDep, lenSL, pntsPerLine) ... Create topo map version of OCL scan data."""
-        topoMap = []
-        for L in range(0, lenSL):
-            topoMap.append([])
-            for P in range(0, pntsPerLine):
-                if scanLines[L][P].z > layDep:
-                    topoMap[L].append(2)
-                else:
-                    topoMap[L].append(0)
-        return topoMap
-
-    def _bufferTopoMap(self, lenSL, pntsPerLine):
-        """_bufferTopoMap(lenSL, pntsPerLine) ... Add buffer boarder of zeros to all sides to topoMap data."""
-        pre = [0, 0]
-        post = [0, 0]
-        for p in range(0, pntsPerLine):
-            pre.append(0)
-            post.append(0)
-        for i in range(0, lenSL):
-            self.topoMap[i].insert(0, 0)
-            self.topoMap[i].append(0)
-        self.topoMap.insert(0, pre)
-        self.topoMap.append(post)
-        return True
-
-    def _highlightWaterline(self, extraMaterial, insCorn):
-        """_highlightWaterline(extraMaterial, insCorn) ... Highlight the waterline data, separating from extra material."""
-        TM = self.topoMap
-        lastPnt = len(TM[1]) - 1
-        lastLn = len(TM) - 1
-        highFlag = 0
-
-        # ("--Convert parallel data to ridges")
-        for lin in range(1, lastLn):
-            for pt in range(1, lastPnt):  # Ignore first and last points
-                if TM[lin][pt] == 0:
-                    if TM[lin][pt + 1] == 2:  # step up
-                        TM[lin][pt] = 1
-                    if TM[lin][pt - 1] == 2:  # step down
-                        TM[lin][pt] = 1
-
-        # ("--Convert perpendicular data to ridges and highlight ridges")
-        for pt in range(1, lastPnt):  # Ignore first and last points
-            for lin in range(1, lastLn):
-                if TM[lin][pt] == 0:
-                    highFlag = 0
-                    if TM[lin + 1][pt] == 2:  # step up
-                        TM[lin][pt] = 1
-                    if TM[lin - 1][pt] == 2:  # step down
-                        TM[lin][pt] = 1
-                elif TM[lin][pt] == 2:
-                    highFlag += 1
-                    if highFlag == 3:
-                        if TM[lin - 1][pt - 1] < 2 or TM[lin - 1][pt + 1] < 2:
-                            highFlag = 2
-                        else:
-                            TM[lin - 1][pt] = extraMaterial
-                            highFlag = 2
-
-        # ("--Square corners")
-        for pt in range(1, lastPnt):
-            for lin in range(1, lastLn):
-                if TM[lin][pt] == 1:  # point == 1
-                    cont = True
-                    if TM[lin + 1][pt] == 0:  # forward == 0
-                        if TM[lin + 1][pt - 1] == 1:  # forward left == 1
-                            if TM[lin][pt - 1] == 2:  # left == 2
-                                TM[lin + 1][pt] = 1  # square the corner
-                                cont = False
-
-                        if cont is True and TM[lin + 1][pt + 1] == 1:  # forward right == 1
-                            if TM[lin][pt + 1] == 2:  # right == 2
-                                TM[lin + 1][pt] = 1  # square the corner
-                        cont = True
-
-                    if TM[lin - 1][pt] == 0:  # back == 0
-                        if TM[lin - 1][pt - 1] == 1:  # back left == 1
-                            if TM[lin][pt - 1] == 2:  # left == 2
-                                TM[lin - 1][pt] = 1  # square the corner
-                                cont = False
-
-                        if cont is True and TM[lin - 1][pt + 1] == 1:  # back right == 1
-                            if TM[lin][pt + 1] == 2:  # right == 2
-                                TM[lin - 1][pt] = 1  # square the corner
-
-        # remove inside corners
-        for pt in range(1, lastPnt):
-            for lin in range(1, lastLn):
-                if TM[lin][pt] == 1:  # point == 1
-                    if TM[lin][pt + 1] == 1:
-                        if TM[lin - 1][pt + 1] == 1 or TM[lin + 1][pt + 1] == 1:
-                            TM[lin][pt + 1] = insCorn
-                    elif TM[lin][pt - 1] == 1:
-                        if TM[lin - 1][pt - 1] == 1 or TM[lin + 1][pt - 1] == 1:
-                            TM[lin][pt - 1] = insCorn
-
-        return True
-
-    def _extractWaterlines(self, obj, oclScan, lyr, layDep):
-        """_extractWaterlines(obj, oclScan, lyr, layDep) ... Extract water lines from OCL scan data."""
-        srch = True
-        lastPnt = len(self.topoMap[0]) - 1
-        lastLn = len(self.topoMap) - 1
-        maxSrchs = 5
-        srchCnt = 1
-        loopList = []
-        loop = []
-        loopNum = 0
-
-        if self.CutClimb is True:
-            lC = [
-                -1,
-                -1,
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-            ]
-            pC = [
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-            ]
-        else:
-            lC = [
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-                -1,
-                0,
-            ]
-            pC = [
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-                -1,
-                0,
-                1,
-                1,
-                1,
-                0,
-                -1,
-                -1,
-            ]
-
-        while srch is True:
-            srch = False
-            if srchCnt > maxSrchs:
-                Path.Log.debug(
-                    "Max search scans, "
-                    + str(maxSrchs)
-                    + " reached\nPossible incomplete waterline result!"
-                )
-                break
-            for L in range(1, lastLn):
-                for P in range(1, lastPnt):
-                    if self.topoMap[L][P] == 1:
-                        # start loop follow
-                        srch = True
-                        loopNum += 1
-                        loop = self._trackLoop(oclScan, lC, pC, L, P, loopNum)
-                        self.topoMap[L][P] = 0  # Mute the starting point
-                        loopList.append(loop)
-            srchCnt += 1
+    def _bufferScanGrid(self, scanLines):
+        """_bufferScanGrid(scanLines) ... Return height grid and XY grid of the scan lines,
+        with a buffer border on all sides. The border is below all layers, so no waterline runs off the grid.
+        """
+        heights = numpy.pad(scanLines[:, :, 2], 1, constant_values=-numpy.inf)
+        XY = numpy.pad(scanLines[:, :, :2], ((1, 1), (1, 1), (0, 0)), "edge")
+        return (heights, XY)
+
+    def _createTopoMap(self, heights, layDep):
+        """_createTopoMap(heights, layDep) ... Create topo map of height grid, True for points above layer."""
+        return heights > layDep
+
+    def _extractWaterlines(self, obj, XY, lyr, layDep):
+        """_extractWaterlines(obj, XY, lyr, layDep) ... Extract water lines from topo map.
+        Marching squares: every cell of four grid points holds the waterline segments between its edges
+        with a high and a low end point. Each segment is directed with the high points on its left side,
+        so the segments chain up into loops. The loop points are the low end points of the edges."""
+        high = self.topoMap
+        (lines, pnts) = high.shape
+        numHorz = lines * (pnts - 1)
+        numEdges = numHorz + (lines - 1) * pnts
+
+        # Corner points and edges of the cells, counter-clockwise starting at (line, point),
+        # edge k runs from corner k to corner k + 1
+        node = numpy.arange(lines * pnts).reshape(lines, pnts)
+        horz = numpy.arange(numHorz).reshape(lines, pnts - 1)
+        vert = numHorz + numpy.arange((lines - 1) * pnts).reshape(lines - 1, pnts)
+        corners = numpy.stack((node[:-1, :-1], node[:-1, 1:], node[1:, 1:], node[1:, :-1]), axis=-1)
+        edges = numpy.stack((horz[:-1], vert[:, 1:], horz[1:], vert[:, :-1]), axis=-1)
+        cornerHigh = high.ravel()[corners.reshape(-1, 4)]
+        edges = edges.reshape(-1, 4)
+
+        # A segment starts on an edge leaving the high area and ends on the next crossed edge
+        # counter-clockwise. On saddle cells, the two high corners are connected.
+        nextHigh = numpy.roll(cornerHigh, -1, axis=1)
+        crossed = cornerHigh != nextHigh
+        (cell, k) = numpy.nonzero(cornerHigh & ~nextHigh)
+        end = numpy.where(
+            crossed[cell, (k + 1) % 4],
+            (k + 1) % 4,
+            numpy.where(crossed[cell, (k + 2) % 4], (k + 2) % 4, (k + 3) % 4),
+        )
+        start = edges[cell, k]
+        following = numpy.full(numEdges, -1)
+        following[start] = edges[cell, end]
+
+        # Low end point of each edge
+        first = numpy.concatenate((node[:, :-1].ravel(), node[:-1].ravel()))
+        second = numpy.concatenate((node[:, 1:].ravel(), node[1:].ravel()))
+        lowNode = numpy.where(high.ravel()[first], second, first)
+
+        # The border is not scanned, loops are cut open where they pass it
+        border = numpy.ones((lines, pnts), dtype=bool)
+        border[1:-1, 1:-1] = False
+        border = border.ravel()
+
+        # Chain segments into loops
+        following = following.tolist()
+        done = bytearray(numEdges)
+        loopNodes = []
+        for e in start.tolist():
+            if done[e]:
+                continue
+            loop = []
+            while not done[e]:
+                done[e] = 1
+                loop.append(e)
+                e = following[e]
+            nodes = lowNode[loop]
+            # Neighboring segments share low end points
+            keep = nodes != numpy.roll(nodes, 1)
+            if keep.any():
+                nodes = nodes[keep]
+            else:
+                nodes = nodes[:1]
+            if self.CutClimb is False:
+                nodes = nodes[::-1]
+            onBorder = border[nodes]
+            if not onBorder.any():
+                # Start at the first point in line order, as the grid is searched
+                nodes = numpy.roll(nodes, -int(nodes.argmin()))
+                loopNodes.append(numpy.append(nodes, nodes[0]))
+                continue
+            nodes = numpy.roll(nodes, -int(onBorder.argmax()))
+            for part in numpy.split(nodes, numpy.flatnonzero(border[nodes])):
+                if len(part) > 1:
+                    loopNodes.append(part[1:])
+        loopNodes.sort(key=lambda nodes: nodes[0])
+
+        XY = XY.reshape(-1, 2)
+        loopList = [XY[nodes] for nodes in loopNodes]
         Path.Log.debug(
-            "Search count for layer "
-            + str(lyr)
-            + " is "
-            + str(srchCnt)
-            + ", with "
-            + str(loopNum)
-            + " loops."
+            "Layer " + str(lyr) + " at " + str(layDep) + " has " + str(len(loopList)) + " loops."
         )
         return loopList
 
-    def _trackLoop(self, oclScan, lC, pC, L, P, loopNum):
-        """_trackLoop(oclScan, lC, pC, L, P, loopNum) ... Track the loop direction."""
-        loop = [oclScan[L - 1][P - 1]]  # Start loop point list
-        cur = [L, P, 1]
-        prv = [L, P - 1, 1]
-        nxt = [L, P + 1, 1]
-        follow = True
-        ptc = 0
-        ptLmt = 200000
-        while follow is True:
-            ptc += 1
-            if ptc > ptLmt:
-                Path.Log.debug(
-                    "Loop number "
-                    + str(loopNum)
-                    + " at ["
-                    + str(nxt[0])
-                    + ", "
-                    + str(nxt[1])
-                    + "] pnt count exceeds, "
-                    + str(ptLmt)
-                    + ".  Stopped following loop."
-                )
-                break
-            nxt = self._findNextWlPoint(lC, pC, cur[0], cur[1], prv[0], prv[1])  # get next point
-            loop.append(oclScan[nxt[0] - 1][nxt[1] - 1])  # add it to loop point list
-            self.topoMap[nxt[0]][nxt[1]] = nxt[2]  # Mute the point, if not Y stem
-            if nxt[0] == L and nxt[1] == P:  # check if loop complete
-                follow = False
-            elif nxt[0] == cur[0] and nxt[1] == cur[1]:  # check if line cannot be detected
-                follow = False
-            prv = cur
-            cur = nxt
-        return loop
-
-    def _findNextWlPoint(self, lC, pC, cl, cp, pl, pp):
-        """_findNextWlPoint(lC, pC, cl, cp, pl, pp) ...
-        Find the next waterline point in the point cloud layer provided."""
-        dl = cl - pl
-        dp = cp - pp
-        num = 0
-        i = 3
-        s = 0
-        mtch = 0
-        found = False
-        while mtch < 8:  # check all 8 points around current point
-            if lC[i] == dl:
-                if pC[i] == dp:
-                    s = i - 3
-                    found = True
-                    # Check for y branch where current point is connection between branches
-                    for y in range(1, mtch):
-                        if lC[i + y] == dl:
-                            if pC[i + y] == dp:
-                                num = 1
-                                break
-                    break
-            i += 1
-            mtch += 1
-        if found is False:
-            # ("_findNext: No start point found.")
-            return [cl, cp, num]
-
-        for r in range(0, 8):
-            l = cl + lC[s + r]
-            p = cp + pC[s + r]
-            if self.topoMap[l][p] == 1:
-                return [l, p, num]
-
-        # ("_findNext: No next pnt found")
-        return [cl, cp, num]
-
     def _loopToGcode(self, obj, layDep, loop):
-        """_loopToGcode(obj, layDep, loop) ... Convert set of loop points to Gcode."""
+        """_loopToGcode(obj, layDep, loop) ... Convert loop of XY points to Gcode."""
         # generate the path commands
         output = []
 
-        # prev = FreeCAD.Vector(2135984513.165, -58351896873.17455, 13838638431.861)
-        nxt = FreeCAD.Vector(0.0, 0.0, 0.0)
-
-        # Create first point
-        pnt = FreeCAD.Vector(loop[0].x, loop[0].y, layDep)
+        XY = loop.tolist()
 
         # Position cutter to begin loop
+        (x, y) = XY[0]
         output.append(Path.Command("G0", {"Z": obj.ClearanceHeight.Value, "F": self.vertRapid}))
-        output.append(Path.Command("G0", {"X": pnt.x, "Y": pnt.y, "F": self.horizRapid}))
-        output.append(Path.Command("G1", {"Z": pnt.z, "F": self.vertFeed}))
+        output.append(Path.Command("G0", {"X": x, "Y": y, "F": self.horizRapid}))
+        output.append(Path.Command("G1", {"Z": layDep, "F": self.vertFeed}))
 
-        lenCLP = len(loop)
-        lastIdx = lenCLP - 1
         # Cycle through each point on loop
-        for i in range(0, lenCLP):
-            if i < lastIdx:
-                nxt.x = loop[i + 1].x
-                nxt.y = loop[i + 1].y
-                nxt.z = layDep
-
-            output.append(Path.Command("G1", {"X": pnt.x, "Y": pnt.y, "F": self.horizFeed}))
-
-            # Rotate point data
-            pnt = nxt
+        for x, y in XY[1:]:
+            output.append(Path.Command("G1", {"X": x, "Y": y, "F": self.horizFeed}))
 
         # Save layer end point for use in transitioning to next layer
-        self.layerEndPnt = pnt
+        self.layerEndPnt = FreeCAD.Vector(x, y, layDep)
 
         return output
 
-    # Experimental waterline functions
     def _experimentalWaterlineOp(self, JOB, obj, mdlIdx, subShp=None):
         """_waterlineOp(JOB, obj, mdlIdx, subShp=None) ...
         Main waterline function to perform waterline extraction from model."""
@@ -150,6 +150,17 @@ class CommandPathPost:
             # This is also backwards compatible with the "previous" way of doing things.
             newline_handling = None
 
+        filename = self._resolve_filename(filename, policy)
+        if filename is None:
+            return
+        with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
+            f.write(gcode)
+
+        FreeCAD.Console.PrintMessage(f"File written to {filename}\n")
+
+    def _resolve_filename(self, filename, policy):
+        """Returns the file name to write to according to the output policy,
+        None if the user canceled the file dialog."""
         if policy == "Open File Dialog":
             dlg = QtGui.QFileDialog()
             dlg.setFileMode(QtGui.QFileDialog.FileMode.AnyFile)
@@ -159,17 +170,13 @@ class CommandPathPost:
             if dlg.exec_():
                 filename = dlg.selectedFiles()[0]
                 Path.Log.debug(filename)
-                with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
-                    f.write(gcode)
             else:
-                return
+                return None
 
         elif policy == "Append Unique ID on conflict":
             while os.path.isfile(filename):
                 base, ext = os.path.splitext(filename)
                 filename = f"{base}-1{ext}"
-            with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
-                f.write(gcode)
 
         elif policy == "Open File Dialog on conflict":
             if os.path.isfile(filename):
@@ -181,19 +188,11 @@ class CommandPathPost:
                 if dlg.exec_():
                     filename = dlg.selectedFiles()[0]
                     Path.Log.debug(filename)
-                    with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
-                        f.write(gcode)
                 else:
-                    return
-            else:
-                with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
-                    f.write(gcode)
+                    return None
 
-        else:  # Overwrite
-            with open(filename, "w", encoding="utf-8", newline=newline_handling) as f:
-                f.write(gcode)
-
-        FreeCAD.Console.PrintMessage(f"File written to {filename}\n")
+        # else Overwrite
+        return filename
 
     def Activated(self):
         """
@@ -213,16 +212,51 @@ class CommandPathPost:
         # get a postprocessor
         postprocessor = PostProcessorFactory.get_post_processor(self.candidate, postprocessor_name)
 
-        post_data = postprocessor.export()
+        policy = Path.Preferences.defaultOutputPolicy()
+        generator = FilenameGenerator(job=self.candidate)
+        generated_filename = generator.generate_filenames()
+
+        # long jobs are written straight to their files, section by section
+        written_files = []
+
+        def filename_for(subpart):
+            subpart = "" if subpart == "allitems" else subpart
+            generator.set_subpartname(subpart)
+            filename = self._resolve_filename(next(generated_filename), policy)
+            written_files.append(filename)
+            return filename
+
+        # started on the first progress, the file dialogs are done by then
+        progress_bar = None
+        percent_shown = 0
+
+        def progress(done, total):
+            nonlocal progress_bar, percent_shown
+            if progress_bar is None:
+                progress_bar = FreeCAD.Base.ProgressIndicator()
+                progress_bar.start(translate("CAM_Post", "Post processing..."), 100)
+            percent = min(100, done * 100 // total) if total else 100
+            while percent_shown < percent:
+                progress_bar.next()
+                percent_shown += 1
+
+        try:
+            post_data = postprocessor.export_to_files(filename_for, progress)
+        finally:
+            if progress_bar is not None:
+                progress_bar.stop()
         # None is returned if there was an error during argument processing
         # otherwise the "usual" post_data data structure is returned.
         if not post_data:
             FreeCAD.ActiveDocument.abortTransaction()
             return
 
-        policy = Path.Preferences.defaultOutputPolicy()
-        generator = FilenameGenerator(job=self.candidate)
-        generated_filename = generator.generate_filenames()
+        for filename in written_files:
+            if filename:
+                FreeCAD.Console.PrintMessage(f"File written to {filename}\n")
+        if written_files:
+            # all sections have been written already
+            post_data = []
 
         for item in post_data:
             subpart, gcode = item
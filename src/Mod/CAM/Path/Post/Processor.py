@@ -33,7 +33,7 @@ import os
 from PySide import QtCore, QtGui
 import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import Path.Base.Util as PathUtil
 import Path.Post.UtilsArguments as PostUtilsArguments
@@ -77,6 +77,10 @@ Units = str
 Values = Dict[str, Any]
 Visible = Dict[str, bool]
 
+# Jobs with at least this many commands are postprocessed straight to their files.
+# Their gcode is too long to be shown in the editor anyway.
+STREAMING_COMMANDS = 10000
+
 
 class PostProcessorFactory:
     """Factory class for creating post processors."""
@@ -329,6 +333,38 @@ class PostProcessor:
         #
         return [("allitems", args)]  # type: ignore
 
+    def export_to_files(
+        self,
+        filename_for: Callable[[str], Optional[str]],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Union[None, GCodeSections]:
+        """Process the parser arguments, then postprocess the 'postables' straight to files.
+
+        Like export(), but long jobs are written section by section to the file
+        returned by filename_for(partname), without keeping their gcode in memory.
+        Their sections are returned with None as gcode.  If filename_for returns None
+        the section is skipped.  If given, progress is called with the number of
+        commands done and the total.
+        """
+        args: ParserArgs
+        flag: bool
+
+        Path.Log.debug("Exporting the job to files")
+
+        if (
+            type(self).export is not PostProcessor.export
+            or type(self).process_postables is not PostProcessor.process_postables
+        ):
+            # a post processor with its own export, for example a WrapperPost
+            return self.export()
+
+        (flag, args) = self.process_arguments()
+        if flag:
+            return self.process_postables_to_files(filename_for, progress)
+        if args is None:
+            return None
+        return [("allitems", args)]  # type: ignore
+
     def init_arguments(
         self,
         values: Values,
@@ -433,6 +469,42 @@ class PostProcessor:
 
         return g_code_sections
 
+    def process_postables_to_files(
+        self,
+        filename_for: Callable[[str], Optional[str]],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> GCodeSections:
+        """Postprocess the 'postables' in the job, long jobs straight to files."""
+        done: int = 0
+        filename: Optional[str]
+        filenames: List[Optional[str]]
+        g_code_sections: GCodeSections
+        postables: Postables
+        total: int
+
+        postables = self._buildPostList()
+        total = sum(PostUtilsExport.count_commands(sublist) for _, sublist in postables)
+        if FreeCAD.GuiUp and self.values["SHOW_EDITOR"] and total < STREAMING_COMMANDS:
+            return self.process_postables()
+
+        Path.Log.debug(f"postables count: {len(postables)}, commands: {total}")
+
+        def section_progress(section_done: int, section_total: int) -> None:
+            progress(done + section_done, total)
+
+        # get all file names first, filename_for may ask the user
+        filenames = [filename_for(partname) for partname, _ in postables]
+        g_code_sections = []
+        for (partname, sublist), filename in zip(postables, filenames):
+            if filename:
+                PostUtilsExport.export_to_file(
+                    self.values, sublist, filename, section_progress if progress else None
+                )
+            done += PostUtilsExport.count_commands(sublist)
+            g_code_sections.append((partname, None))
+
+        return g_code_sections
+
     def reinitialize(self) -> None:
         """Initialize or reinitialize the 'core' data structures for the postprocessor."""
         #
@@ -598,6 +598,12 @@ def init_shared_values(values: Values) -> None:
     #
     values["PRE_OPERATION"] = """"""
     #
+    # If this is set to a function, it is called with the number of
+    # commands parsed since its last call, to report the progress of
+    # postprocessing long paths.
+    #
+    values["PROGRESS_CALLBACK"] = None
+    #
     # Defines which G-code commands are considered "rapid" moves.
     #
     values["RAPID_MOVES"] = ["G0", "G00"]
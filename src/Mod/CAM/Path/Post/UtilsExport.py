@@ -29,7 +29,7 @@
 
 import datetime
 import os
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Union
 
 import FreeCAD
 import Path.Base.Util as PathUtil
@@ -41,6 +41,9 @@ import Path.Tool.Controller as PathToolController
 Gcode = List[str]
 Values = Dict[str, Any]
 
+# The number of lines written to the file at once by export_to_file
+CHUNK_LINES = 10000
+
 
 def check_canned_cycles(values: Values) -> None:
     """Check canned cycles for drilling."""
@@ -267,21 +270,32 @@ def output_units(values: Values, gcode: Gcode) -> None:
         gcode.append(f'{PostUtilsParse.linenumber(values)}{values["UNITS"]}')
 
 
-def export_common(values: Values, objectslist, filename: str) -> str:
-    """Do the common parts of postprocessing the objects in objectslist to filename."""
-    coolant_mode: str
-    dia: PostUtils.GCodeEditorDialog
-    final: str
-    final_for_editor: str
-    gcode: Gcode = []
+def count_commands(objectslist) -> int:
+    """Return the number of path commands of the active objects in objectslist."""
 
+    def count_group(obj) -> int:
+        if hasattr(obj, "Group"):
+            return sum(count_group(p) for p in obj.Group)
+        if hasattr(obj, "Path"):
+            return obj.Path.Size
+        return 0
+
+    return sum(count_group(obj) for obj in objectslist if PathUtil.activeForOp(obj))
+
+
+def check_objects(objectslist) -> bool:
+    """Check that all objects in objectslist are paths."""
     for obj in objectslist:
         if not hasattr(obj, "Path"):
             print(f"The object {obj.Name} is not a path.")
             print("Please select only path and Compounds.")
-            return ""
+            return False
+    return True
 
-    print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} postprocessing...')
+
+def output_gcode(values: Values, gcode: Gcode, objectslist) -> None:
+    """Output the gcode lines of the objects in objectslist, including header and postamble."""
+    coolant_mode: str
 
     check_canned_cycles(values)
     output_header(values, gcode)
@@ -317,6 +331,21 @@ def export_common(values: Values, objectslist, filename: str) -> str:
     output_safetyblock(values, gcode)
     output_postamble(values, gcode)
 
+
+def export_common(values: Values, objectslist, filename: str) -> str:
+    """Do the common parts of postprocessing the objects in objectslist to filename."""
+    dia: PostUtils.GCodeEditorDialog
+    final: str
+    final_for_editor: str
+    gcode: Gcode = []
+
+    if not check_objects(objectslist):
+        return ""
+
+    print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} postprocessing...')
+
+    output_gcode(values, gcode, objectslist)
+
     # add the appropriate end-of-line characters to the gcode, including after the last line
     gcode.append("")
     if values["END_OF_LINE_CHARACTERS"] == "\n\n":
@@ -377,3 +406,90 @@ def export_common(values: Values, objectslist, filename: str) -> str:
                 gfile.write(final)
 
     return final
+
+
+class GcodeFileWriter:
+    """Collect gcode lines like a list, but write them to a file in chunks.
+
+    The output functions append the lines to their gcode argument, given a
+    GcodeFileWriter instead of a list the memory used does not grow with the
+    length of the paths.
+    """
+
+    def __init__(self, gfile, end_of_line: str, chunk_lines: int = CHUNK_LINES) -> None:
+        self.gfile = gfile
+        self.end_of_line: str = end_of_line
+        self.chunk_lines: int = chunk_lines
+        self.lines: Gcode = []
+        self.line_count: int = 0
+
+    def append(self, line: str) -> None:
+        """Add a line, write the lines out if there are enough of them."""
+        self.lines.append(line)
+        if len(self.lines) >= self.chunk_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out the lines, each one followed by the end-of-line characters."""
+        if self.lines:
+            self.gfile.write(self.end_of_line.join(self.lines))
+            self.gfile.write(self.end_of_line)
+            self.line_count += len(self.lines)
+            self.lines = []
+
+
+def export_to_file(
+    values: Values,
+    objectslist,
+    filename: str,
+    progress: Union[Callable[[int, int], None], None] = None,
+) -> bool:
+    """Postprocess the objects in objectslist straight to filename.
+
+    Unlike export_common the gcode is not collected in memory and not shown in
+    the editor.  The file has the same content as written by export_common.
+    If given, progress is called with the number of commands done and the total.
+    """
+    done: int = 0
+    end_of_line: str
+    newline: Union[str, None]
+    total: int
+
+    if not check_objects(objectslist):
+        return False
+
+    print(f'PostProcessor:  {values["POSTPROCESSOR_FILE_NAME"]} postprocessing to {filename}...')
+
+    end_of_line = values["END_OF_LINE_CHARACTERS"]
+    if end_of_line == "\n\n":
+        # write out the gcode using "\n" as the end-of-line characters
+        (end_of_line, newline) = ("\n", "")
+    elif end_of_line == "\n":
+        # "\n" means "use the end-of-line characters that match the system"
+        newline = None
+    else:
+        # "\r" or "\r\n"
+        newline = ""
+
+    def commands_done(count: int) -> None:
+        nonlocal done
+        done += count
+        progress(done, total)
+
+    previous_progress = values["PROGRESS_CALLBACK"]
+    if progress:
+        total = count_commands(objectslist)
+        values["PROGRESS_CALLBACK"] = commands_done
+    try:
+        with open(filename, "w", encoding="utf-8", newline=newline) as gfile:
+            gcode = GcodeFileWriter(gfile, end_of_line)
+            output_gcode(values, gcode, objectslist)  # type: ignore
+            gcode.flush()
+        if progress and done < total:
+            # commands which were not postprocessed, for example of disabled objects
+            progress(total, total)
+    finally:
+        values["PROGRESS_CALLBACK"] = previous_progress
+
+    print("done postprocessing.")
+    return True
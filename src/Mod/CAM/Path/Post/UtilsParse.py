@@ -46,6 +46,11 @@ Values = Dict[str, Any]
 
 ParameterFunction = Callable[[Values, str, str, PathParameter, PathParameters], str]
 
+# The number of commands between calls of values["PROGRESS_CALLBACK"]
+PROGRESS_INTERVAL = 10000
+
+_unit_factors: Dict[str, float] = {}
+
 
 def check_for_an_adaptive_op(
     values: Values,
@@ -203,7 +208,7 @@ def default_axis_parameter(
         and math.fabs(current_location[param] - param_value) < epsilon
     ):
         return ""
-    return format_for_axis(values, Units.Quantity(param_value, Units.Length))
+    return format_axis_value(values, param_value)
 
 
 def default_D_parameter(
@@ -218,7 +223,7 @@ def default_D_parameter(
     if command in ("G41", "G42"):
         return str(int(param_value))
     if command in ("G41.1", "G42.1"):
-        return format_for_axis(values, Units.Quantity(param_value, Units.Length))
+        return format_axis_value(values, param_value)
     if command in ("G96", "G97"):
         return format_for_spindle(values, param_value)
     # anything else that is supported
@@ -252,8 +257,7 @@ def default_F_parameter(
     # more obvious where to put that check.
     if command in values["RAPID_MOVES"]:
         return ""
-    feed = Units.Quantity(param_value, Units.Velocity)
-    if feed.getValueAs(values["UNIT_SPEED_FORMAT"]) <= 0.0:
+    if param_value / unit_factor(values["UNIT_SPEED_FORMAT"]) <= 0.0:
         return ""
     # if any of X, Y, Z, U, V, or W are in the parameters
     # and any of their values is different than where the device currently should be
@@ -263,7 +267,7 @@ def default_F_parameter(
         if key in parameters and math.fabs(current_location[key] - parameters[key]) > epsilon:
             found = True
     if found:
-        return format_for_feed(values, feed)
+        return format_feed_value(values, param_value)
     # else if any of A, B, or C are in the parameters, the feed is in degrees,
     #     which should not be converted when in --inches mode
     found = False
@@ -272,10 +276,10 @@ def default_F_parameter(
             found = True
     if found:
         # converting from degrees per second to degrees per minute as well
-        return format(float(feed * 60.0), f'.{str(values["FEED_PRECISION"])}f')
+        return format(float(param_value * 60.0), f'.{str(values["FEED_PRECISION"])}f')
     # which leaves none of X, Y, Z, U, V, W, A, B, C,
     # which should not be valid but return a converted value just in case
-    return format_for_feed(values, feed)
+    return format_feed_value(values, param_value)
 
 
 def default_int_parameter(
@@ -299,7 +303,7 @@ def default_length_parameter(
     current_location: PathParameters,  # pylint: disable=unused-argument
 ) -> str:
     """Process a parameter that is treated like a length."""
-    return format_for_axis(values, Units.Quantity(param_value, Units.Length))
+    return format_axis_value(values, param_value)
 
 
 def default_P_parameter(
@@ -316,7 +320,7 @@ def default_P_parameter(
     if command in ("G4", "G04", "G76", "G82", "G86", "G89"):
         return str(float(param_value))
     if command in ("G5", "G05", "G64"):
-        return format_for_axis(values, Units.Quantity(param_value, Units.Length))
+        return format_axis_value(values, param_value)
     # anything else that is supported
     return str(param_value)
 
@@ -333,7 +337,7 @@ def default_Q_parameter(
     if command == "G10":
         return str(int(param_value))
     if command in ("G64", "G73", "G83"):
-        return format_for_axis(values, Units.Quantity(param_value, Units.Length))
+        return format_axis_value(values, param_value)
     return ""
 
 
@@ -502,11 +506,43 @@ def format_for_feed(values: Values, number) -> str:
     )
 
 
+def format_axis_value(values: Values, value: float) -> str:
+    """Format a length value in mm using the unit and precision for an axis value.
+
+    The same as format_for_axis(values, Units.Quantity(value, Units.Length)),
+    without creating a Quantity for every value.
+    """
+    return format(value / unit_factor(values["UNIT_FORMAT"]), f'.{values["AXIS_PRECISION"]}f')
+
+
+def format_feed_value(values: Values, value: float) -> str:
+    """Format a velocity value in mm/s using the unit and precision for a feed rate.
+
+    The same as format_for_feed(values, Units.Quantity(value, Units.Velocity)),
+    without creating a Quantity for every value.
+    """
+    return format(value / unit_factor(values["UNIT_SPEED_FORMAT"]), f'.{values["FEED_PRECISION"]}f')
+
+
 def format_for_spindle(values: Values, number) -> str:
     """Format a number using the precision for a spindle speed."""
     return str(format(float(number), f'.{str(values["SPINDLE_DECIMALS"])}f'))
 
 
+def unit_factor(unit: str) -> float:
+    """Return the value of one unit, for example "in" or "mm/min", in internal units.
+
+    Dividing by it is what Quantity.getValueAs(unit) does, the factors are cached
+    as parsing the unit string is much slower than the division.
+    """
+    factor: float = _unit_factors.get(unit, 0.0)
+
+    if not factor:
+        factor = Units.Quantity(unit).Value
+        _unit_factors[unit] = factor
+    return factor
+
+
 def init_parameter_functions(parameter_functions: Dict[str, ParameterFunction]) -> None:
     """Initialize a list of parameter functions.
 
@@ -675,7 +711,12 @@ def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
     lastcommand: str = ""
     motion_location: PathParameters = {}  # keep track of last motion location
     parameter: str
+    parameter_function: ParameterFunction
+    parameter_functions: List[Tuple[str, ParameterFunction]]
     parameter_value: str
+    params: PathParameters
+    progress: Union[Callable[[int], None], None] = values["PROGRESS_CALLBACK"]
+    progress_count: int = 0
 
     # Check to see if values["TOOL_BEFORE_CHANGE"] is set and value is true
     # doing it here to reduce the number of times it is checked
@@ -702,10 +743,23 @@ def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
         ).Parameters
     )
     adaptive_op_variables = determine_adaptive_op(values, pathobj)
+    # look up the functions for the parameters once instead of for every command
+    parameter_functions = [
+        (parameter, values["PARAMETER_FUNCTIONS"][parameter])
+        for parameter in values["PARAMETER_ORDER"]
+        if parameter in values["PARAMETER_FUNCTIONS"]
+    ]
 
     for c in pathobj.Path.Commands:
         command = c.Name
         command_line = []
+        # every c.Parameters call creates a new dictionary
+        params = c.Parameters
+        if progress:
+            progress_count += 1
+            if progress_count == PROGRESS_INTERVAL:
+                progress(progress_count)
+                progress_count = 0
 
         # Modify the command name if necessary
         if command[0] == "(":
@@ -723,24 +777,24 @@ def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
             command_line.pop(0)
 
         # Now add the remaining parameters in order
-        for parameter in values["PARAMETER_ORDER"]:
-            if parameter in c.Parameters:
-                parameter_value = values["PARAMETER_FUNCTIONS"][parameter](
+        for parameter, parameter_function in parameter_functions:
+            if parameter in params:
+                parameter_value = parameter_function(
                     values,
                     command,
                     parameter,
-                    c.Parameters[parameter],
-                    c.Parameters,
+                    params[parameter],
+                    params,
                     current_location,
                 )
                 if parameter_value:
                     command_line.append(f"{parameter}{parameter_value}")
 
-        set_adaptive_op_speed(values, command, command_line, c.Parameters, adaptive_op_variables)
+        set_adaptive_op_speed(values, command, command_line, params, adaptive_op_variables)
         # Remember the current command
         lastcommand = command
         # Remember the current location
-        current_location.update(c.Parameters)
+        current_location.update(params)
         if command in ("G90", "G91"):
             # Remember the motion mode
             values["MOTION_MODE"] = command
@@ -749,13 +803,13 @@ def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
             drill_retract_mode = command
         if command in values["MOTION_COMMANDS"]:
             # Remember the current location for drill_translate
-            motion_location.update(c.Parameters)
+            motion_location.update(params)
         if check_for_drill_translate(
             values,
             gcode,
             command,
             command_line,
-            c.Parameters,
+            params,
             motion_location,
             drill_retract_mode,
         ):
@@ -780,9 +834,12 @@ def parse_a_path(values: Values, gcode: Gcode, pathobj) -> None:
                 # Add a line number to the front of the command line
                 gcode.append(f"{linenumber(values)}{format_command_line(values, command_line)}")
 
-        check_for_tlo(values, gcode, command, c.Parameters)
+        check_for_tlo(values, gcode, command, params)
         check_for_machine_specific_commands(values, gcode, command)
 
+    if progress and progress_count:
+        progress(progress_count)
+
 
 def set_adaptive_op_speed(
     values: Values,
@@ -68,6 +68,20 @@ WarningSuppressVelocity = "WarningSuppressVelocity"
 EnableExperimentalFeatures = "EnableExperimentalFeatures"
 EnableAdvancedOCLFeatures = "EnableAdvancedOCLFeatures"
 
+# Number of processes for OpenCamLib drop cutter scans, 0 is one per CPU core,
+# only used without the GUI
+OCLScanProcesses = "OCLScanProcesses"
+
+# Keep the Path of operations whose inputs did not change on recompute
+ReuseUnchangedOperations = "ReuseUnchangedOperations"
+
+# Number of processes computing the operations of a job, 0 is one per CPU core,
+# only used without the GUI
+OperationProcesses = "OperationProcesses"
+
+# Acceleration of the machine in mm/s^2 for the cycle time estimate, 0 is unlimited
+MachineAcceleration = "MachineAcceleration"
+
 
 def preferences():
     return FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/CAM")
@@ -251,6 +265,28 @@ def advancedOCLFeaturesEnabled():
     return preferences().GetBool(EnableAdvancedOCLFeatures, False)
 
 
+def oclScanProcesses():
+    processes = preferences().GetInt(OCLScanProcesses, 1)
+    if processes <= 0:
+        processes = os.cpu_count() or 1
+    return processes
+
+
+def reuseUnchangedOperations():
+    return preferences().GetBool(ReuseUnchangedOperations, True)
+
+
+def operationProcesses():
+    processes = preferences().GetInt(OperationProcesses, 1)
+    if processes <= 0:
+        processes = os.cpu_count() or 1
+    return processes
+
+
+def machineAcceleration():
+    return preferences().GetFloat(MachineAcceleration, 0.0)
+
+
 def experimentalFeaturesEnabled():
     return preferences().GetBool(EnableExperimentalFeatures, False)
 
@@ -24,9 +24,9 @@ import FreeCAD
 import Path
 import Path.Base.Util as PathUtil
 import Path.Base.PropertyBag as PathPropertyBag
+import Path.Tool.Index as PathToolIndex
 import json
 import os
-import zipfile
 from PySide.QtCore import QT_TRANSLATE_NOOP
 
 # lazily loaded modules
@@ -63,21 +63,10 @@ def _findToolFile(name, containerFile, typ):
         paths = []
     paths.extend(Path.Preferences.searchPathsTool(typ))
 
-    def _findFile(path, name):
-        Path.Log.track(path, name)
-        fullPath = os.path.join(path, name)
-        if os.path.exists(fullPath):
-            return (True, fullPath)
-        for root, ds, fs in os.walk(path):
-            for d in ds:
-                found, fullPath = _findFile(d, name)
-                if found:
-                    return (True, fullPath)
-        return (False, None)
-
+    index = PathToolIndex.toolIndex()
     for p in paths:
-        found, path = _findFile(p, name)
-        if found:
+        path = index.find(p, name)
+        if path:
             return path
     return None
 
@@ -271,10 +260,9 @@ class ToolBit(object):
     def _loadBitBody(self, obj, path=None):
         Path.Log.track(obj.Label, path)
         p = path if path else obj.BitShape
-        docOpened = False
         doc = None
         for d in FreeCAD.listDocuments():
-            if FreeCAD.getDocument(d).FileName == p:
+            if FreeCAD.getDocument(d).FileName == p and not PathToolIndex.isShapeDocument(d):
                 doc = FreeCAD.getDocument(d)
                 break
         if doc is None:
@@ -285,12 +273,12 @@ class ToolBit(object):
             if not path and p != obj.BitShape:
                 obj.BitShape = p
             Path.Log.debug("ToolBit {} using shape file: {}".format(obj.Label, p))
-            doc = FreeCAD.openDocument(p, True)
+            # the shape document stays open for all bits using the same shape
+            doc = PathToolIndex.shapeDocument(p)
             obj.ShapeName = doc.Name
-            docOpened = True
         else:
             Path.Log.debug("ToolBit {} already open: {}".format(obj.Label, doc))
-        return (doc, docOpened)
+        return doc
 
     def _removeBitBody(self, obj):
         if obj.BitBody:
@@ -307,14 +295,10 @@ class ToolBit(object):
 
     def loadBitBody(self, obj, force=False):
         if force or not obj.BitBody:
-            activeDoc = FreeCAD.ActiveDocument
             if force:
                 self._removeBitBody(obj)
-            (doc, opened) = self._loadBitBody(obj)
+            doc = self._loadBitBody(obj)
             obj.BitBody = obj.Document.copyObject(doc.RootObjects[0], True)
-            if opened:
-                FreeCAD.setActiveDocument(activeDoc.Name)
-                FreeCAD.closeDocument(doc.Name)
             self._updateBitShape(obj)
 
     def unloadBitBody(self, obj):
@@ -337,9 +321,8 @@ class ToolBit(object):
     def _setupBitShape(self, obj, path=None):
         Path.Log.track(obj.Label)
 
-        activeDoc = FreeCAD.ActiveDocument
         try:
-            (doc, docOpened) = self._loadBitBody(obj, path)
+            doc = self._loadBitBody(obj, path)
         except FileNotFoundError:
             Path.Log.error(
                 "Could not find shape file {} for tool bit {}".format(obj.BitShape, obj.Label)
@@ -351,9 +334,6 @@ class ToolBit(object):
         bitBody = obj.Document.copyObject(doc.RootObjects[0], True)
 
         docName = doc.Name
-        if docOpened:
-            FreeCAD.setActiveDocument(activeDoc.Name)
-            FreeCAD.closeDocument(doc.Name)
 
         if bitBody.ViewObject:
             bitBody.ViewObject.Visibility = False
@@ -411,15 +391,7 @@ class ToolBit(object):
         if obj.BitShape:
             path = findToolShape(obj.BitShape)
             if path:
-                with open(path, "rb") as fd:
-                    try:
-                        zf = zipfile.ZipFile(fd)
-                        pf = zf.open("thumbnails/Thumbnail.png", "r")
-                        data = pf.read()
-                        pf.close()
-                        return data
-                    except KeyError:
-                        pass
+                return PathToolIndex.toolIndex().thumbnail(path)
         return None
 
     def saveToFile(self, obj, path, setFile=True):
@@ -458,8 +430,7 @@ class ToolBit(object):
 
 def Declaration(path):
     Path.Log.track(path)
-    with open(path, "r") as fp:
-        return json.load(fp)
+    return PathToolIndex.toolIndex().declaration(path)
 
 
 class ToolBitFactory(object):
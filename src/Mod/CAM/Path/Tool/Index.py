@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Path
+import atexit
+import base64
+import copy
+import json
+import os
+import zipfile
+
+__title__ = "Tool file index."
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+__doc__ = "Index of tool bit, shape and library files and cache of the tool shape documents."
+
+"""
+Finding a tool file used to walk the tool directories on every call, and every tool bit
+opened its shape document on its own. The index remembers the files found in each tool
+directory, the declarations of the bit and library files and the thumbnails of the shape
+files. An entry is valid as long as the modification time of its directory or file does
+not change, the index is saved in the user cache directory when FreeCAD exits.
+The shape documents are opened once, hidden, and shared by all bits using the shape.
+With the GUI up they are closed as soon as control returns to the event loop, a later
+open of the same file by the user must not get the hidden document. Otherwise they are
+closed with the last other document, or when FreeCAD exits.
+"""
+
+if False:
+    Path.Log.setLevel(Path.Log.Level.DEBUG, Path.Log.thisModule())
+    Path.Log.trackModule(Path.Log.thisModule())
+else:
+    Path.Log.setLevel(Path.Log.Level.INFO, Path.Log.thisModule())
+
+
+IndexVersion = 1
+ShapeDocumentCacheSize = 16
+
+_toolIndex = None
+_shapeDocuments = {}
+_closeScheduled = False
+_closingDocuments = set()
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+class ToolIndex:
+    """ToolIndex(filename=None) ... index of the tool files, saved to filename if given."""
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.directories = {}
+        self.files = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        if not self.filename or not os.path.isfile(self.filename):
+            return
+        try:
+            with open(self.filename, "r", encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError) as e:
+            Path.Log.warning("Ignoring tool index {}: {}".format(self.filename, e))
+            return
+        if data.get("version") == IndexVersion:
+            self.directories = data.get("directories", {})
+            self.files = data.get("files", {})
+
+    def save(self):
+        """save() ... writes the index to its file if it changed."""
+        if not self.filename or not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            tmp = "{}.tmp".format(self.filename)
+            with open(tmp, "w", encoding="utf-8") as fp:
+                json.dump(
+                    {
+                        "version": IndexVersion,
+                        "directories": self.directories,
+                        "files": self.files,
+                    },
+                    fp,
+                )
+            os.replace(tmp, self.filename)
+            self.dirty = False
+        except OSError as e:
+            Path.Log.warning("Could not save tool index {}: {}".format(self.filename, e))
+
+    def directoryFiles(self, directory):
+        """directoryFiles(directory) ... returns the paths of all files in directory and its
+        subdirectories, relative to directory. The directory is only walked again if the
+        modification time of it or one of its subdirectories changed."""
+        entry = self.directories.get(directory)
+        if entry is not None and all(
+            _mtime(os.path.join(directory, d)) == m for d, m in entry["mtimes"].items()
+        ):
+            return entry["files"]
+
+        Path.Log.debug("indexing {}".format(directory))
+        mtimes = {}
+        files = []
+        for root, ds, fs in os.walk(directory):
+            rel = os.path.relpath(root, directory)
+            mtimes[rel] = _mtime(root)
+            files.extend(os.path.normpath(os.path.join(rel, f)) for f in sorted(fs))
+        if not mtimes:
+            # not a directory, checked again next time
+            mtimes["."] = None
+        self.directories[directory] = {"mtimes": mtimes, "files": files}
+        self.dirty = True
+        return files
+
+    def find(self, directory, name):
+        """find(directory, name) ... returns the path of the file name in directory or one of its
+        subdirectories, None if there is none."""
+        fullPath = os.path.join(directory, name)
+        if os.path.exists(fullPath):
+            return fullPath
+        suffix = os.sep + os.path.normpath(name)
+        for rel in self.directoryFiles(directory):
+            if (os.sep + rel).endswith(suffix):
+                return os.path.join(directory, rel)
+        return None
+
+    def _fileEntry(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.files.pop(path, None)
+            raise
+        entry = self.files.get(path)
+        if entry is None or entry["mtime"] != stat.st_mtime or entry["size"] != stat.st_size:
+            entry = {"mtime": stat.st_mtime, "size": stat.st_size}
+            self.files[path] = entry
+            self.dirty = True
+        return entry
+
+    def declaration(self, path):
+        """declaration(path) ... returns the json content of the tool bit or library file path.
+        Raises the errors of reading and parsing the file."""
+        entry = self._fileEntry(path)
+        if "declaration" not in entry:
+            with open(path, "r") as fp:
+                entry["declaration"] = json.load(fp)
+            self.dirty = True
+        # the callers are free to modify what they get
+        return copy.deepcopy(entry["declaration"])
+
+    def thumbnail(self, path):
+        """thumbnail(path) ... returns the png data of the thumbnail of the shape file path, or None."""
+        entry = self._fileEntry(path)
+        if "thumbnail" not in entry:
+            data = None
+            with open(path, "rb") as fd:
+                try:
+                    with zipfile.ZipFile(fd) as zf:
+                        data = zf.read("thumbnails/Thumbnail.png")
+                except (KeyError, zipfile.BadZipFile):
+                    pass
+            entry["thumbnail"] = base64.b64encode(data).decode("ascii") if data else None
+            self.dirty = True
+        if entry["thumbnail"] is None:
+            return None
+        return base64.b64decode(entry["thumbnail"])
+
+
+def toolIndex():
+    """toolIndex() ... returns the ToolIndex of this session, loaded from the user cache directory."""
+    global _toolIndex
+    if _toolIndex is None:
+        _toolIndex = ToolIndex(os.path.join(FreeCAD.getUserCachePath(), "CAM", "ToolIndex.json"))
+        atexit.register(_toolIndex.save)
+    return _toolIndex
+
+
+class _ShapeDocumentObserver:
+    """Closes the shape documents with the last other document."""
+
+    _instance = None
+
+    @classmethod
+    def attach(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+            FreeCAD.addDocumentObserver(cls._instance)
+            atexit.register(closeShapeDocuments)
+
+    def slotDeletedDocument(self, doc):
+        if doc.Name in _closingDocuments:
+            return
+        if isShapeDocument(doc.Name):
+            # closed by somebody else
+            for path, (__, docName) in list(_shapeDocuments.items()):
+                if docName == doc.Name:
+                    _shapeDocuments.pop(path)
+            return
+        others = [
+            name
+            for name in FreeCAD.listDocuments()
+            if name != doc.Name and not isShapeDocument(name)
+        ]
+        if not others:
+            _scheduleClose()
+
+
+def _closeDocument(docName):
+    if docName in FreeCAD.listDocuments():
+        _closingDocuments.add(docName)
+        try:
+            FreeCAD.closeDocument(docName)
+        finally:
+            _closingDocuments.discard(docName)
+
+
+def _scheduleClose():
+    """Closes the shape documents once control returns to the GUI's event loop, right away
+    without the GUI."""
+    global _closeScheduled
+    if not FreeCAD.GuiUp:
+        closeShapeDocuments()
+        return
+    if not _closeScheduled:
+        from PySide import QtCore
+
+        _closeScheduled = True
+        QtCore.QTimer.singleShot(0, closeShapeDocuments)
+
+
+def shapeDocument(path):
+    """shapeDocument(path) ... returns the document of the tool shape file path.
+    The document is opened hidden and kept open for the next bit using the same shape, until
+    the file changes, the documents of too many other shapes got opened or the shape documents
+    are closed, see closeShapeDocuments()."""
+    mtime = _mtime(path)
+    cached = _shapeDocuments.pop(path, None)
+    if cached is not None:
+        docMtime, docName = cached
+        doc = FreeCAD.listDocuments().get(docName)
+        if doc is not None and docMtime == mtime:
+            _shapeDocuments[path] = cached
+            return doc
+        _closeDocument(docName)
+
+    _ShapeDocumentObserver.attach()
+    if FreeCAD.GuiUp:
+        _scheduleClose()
+
+    activeDoc = FreeCAD.ActiveDocument
+    doc = FreeCAD.openDocument(path, True)
+    if activeDoc is not None:
+        FreeCAD.setActiveDocument(activeDoc.Name)
+
+    while len(_shapeDocuments) >= ShapeDocumentCacheSize:
+        oldest = next(iter(_shapeDocuments))
+        __, docName = _shapeDocuments.pop(oldest)
+        _closeDocument(docName)
+    _shapeDocuments[path] = (mtime, doc.Name)
+    return doc
+
+
+def isShapeDocument(docName):
+    """isShapeDocument(docName) ... returns True if docName is a cached shape document."""
+    return any(name == docName for __, name in _shapeDocuments.values())
+
+
+def closeShapeDocuments():
+    """closeShapeDocuments() ... closes all cached shape documents."""
+    global _closeScheduled
+    _closeScheduled = False
+    while _shapeDocuments:
+        __, (__, docName) = _shapeDocuments.popitem()
+        _closeDocument(docName)
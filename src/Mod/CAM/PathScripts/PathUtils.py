@@ -27,6 +27,7 @@ from PySide import QtCore
 import Path
 import Path.Main.Job as PathJob
 import math
+import numpy
 from numpy import linspace
 
 # lazily loaded modules
@@ -751,6 +752,8 @@ def simplify3dLine(line, tolerance=1e-4):
     maximum deviation from the original line within the defined tolerance.
     Implementation of
     https://en.wikipedia.org/wiki/Ramer%E2%80%93Douglas%E2%80%93Peucker_algorithm"""
+    if not line:
+        return []
     stack = [(0, len(line) - 1)]
     results = []
 
@@ -784,6 +787,44 @@ def simplify3dLine(line, tolerance=1e-4):
     return results
 
 
+def simplify3dLineArray(points, tolerance=1e-4):
+    """Simplify a line defined by an (N, 3) array of points, see simplify3dLine().
+    The distances of all points of a range to its chord are calculated at once.
+    Returns the (M, 3) array of the remaining points."""
+    points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+    if len(points) == 0:
+        return points
+    stack = [(0, len(points) - 1)]
+    keep = []
+
+    while len(stack):
+        start, end = stack.pop()
+        if end - start < 2:
+            keep.extend(range(start, end))
+            continue
+        # Find point with maximum distance, as Vector.distanceToLineSegment()
+        startPoint = points[start]
+        chord = points[end] - startPoint
+        offsets = points[start + 1 : end] - startPoint
+        chordSqrd = (chord * chord).sum()
+        if chordSqrd == 0:
+            deviations = -offsets
+        else:
+            t = numpy.clip((offsets * chord).sum(axis=1) / chordSqrd, 0.0, 1.0)
+            deviations = t[:, numpy.newaxis] * chord - offsets
+        distances = numpy.sqrt((deviations * deviations).sum(axis=1))
+        i = int(numpy.argmax(distances))
+        if distances[i] > tolerance:
+            # Push second branch first, to be executed last
+            stack.append((start + 1 + i, end))
+            stack.append((start, start + 1 + i))
+        else:
+            keep.append(start)
+    # Each segment only kept its start point, so add the last point.
+    keep.append(len(points) - 1)
+    return points[keep]
+
+
 def RtoIJ(startpoint, command):
     """
     This function takes a startpoint and an arc command in radius mode and
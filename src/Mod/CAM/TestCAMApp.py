@@ -27,6 +27,7 @@ from CAMTests.TestPathProfile import TestPathProfile
 
 from CAMTests.TestPathAdaptive import TestPathAdaptive
 from CAMTests.TestPathCore import TestPathCore
+from CAMTests.TestPathCycleTime import TestPathCycleTime
 from CAMTests.TestPathDepthParams import depthTestCases
 from CAMTests.TestPathDressupDogbone import TestDressupDogbone
 from CAMTests.TestPathDressupDogboneII import TestDressupDogboneII
@@ -56,8 +57,11 @@ from CAMTests.TestPathPreferences import TestPathPreferences
 from CAMTests.TestPathProfile import TestPathProfile
 from CAMTests.TestPathPropertyBag import TestPathPropertyBag
 from CAMTests.TestPathRotationGenerator import TestPathRotationGenerator
+from CAMTests.TestPathScheduler import TestPathScheduler
 from CAMTests.TestPathSetupSheet import TestPathSetupSheet
 from CAMTests.TestPathStock import TestPathStock
+from CAMTests.TestPathSurface import TestPathSurface
+from CAMTests.TestPathSurfaceSupport import TestPathSurfaceSupport
 from CAMTests.TestPathTapGenerator import TestPathTapGenerator
 from CAMTests.TestPathThreadMilling import TestPathThreadMilling
 from CAMTests.TestPathThreadMillingGenerator import TestPathThreadMillingGenerator
@@ -67,6 +71,7 @@ from CAMTests.TestPathToolController import TestPathToolController
 from CAMTests.TestPathUtil import TestPathUtil
 from CAMTests.TestPathVcarve import TestPathVcarve
 from CAMTests.TestPathVoronoi import TestPathVoronoi
+from CAMTests.TestPathWaterline import TestPathWaterline
 
 from CAMTests.TestCentroidPost import TestCentroidPost
 from CAMTests.TestGrblPost import TestGrblPost
@@ -97,6 +102,7 @@ False if TestPathLanguage.__name__ else True
 # False if TestOutputNameSubstitution.__name__ else True
 False if TestPathAdaptive.__name__ else True
 False if TestPathCore.__name__ else True
+False if TestPathCycleTime.__name__ else True
 False if TestPathOpDeburr.__name__ else True
 False if TestPathDrillable.__name__ else True
 False if TestPathGeom.__name__ else True
@@ -112,8 +118,11 @@ False if TestPathPreferences.__name__ else True
 False if TestPathProfile.__name__ else True
 False if TestPathPropertyBag.__name__ else True
 False if TestPathRotationGenerator.__name__ else True
+False if TestPathScheduler.__name__ else True
 False if TestPathSetupSheet.__name__ else True
 False if TestPathStock.__name__ else True
+False if TestPathSurface.__name__ else True
+False if TestPathSurfaceSupport.__name__ else True
 False if TestPathTapGenerator.__name__ else True
 False if TestPathThreadMilling.__name__ else True
 False if TestPathThreadMillingGenerator.__name__ else True
@@ -123,6 +132,7 @@ False if TestPathToolController.__name__ else True
 False if TestPathUtil.__name__ else True
 False if TestPathVcarve.__name__ else True
 False if TestPathVoronoi.__name__ else True
+False if TestPathWaterline.__name__ else True
 False if TestPathDrillGenerator.__name__ else True
 False if TestPathHelixGenerator.__name__ else True
 
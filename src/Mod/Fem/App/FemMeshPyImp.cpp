@@ -30,6 +30,7 @@
 #include <SMESHDS_Mesh.hxx>
 #include <SMESH_Group.hxx>
 #include <SMESH_Mesh.hxx>
+#include <SMESH_MeshEditor.hxx>
 #include <TopoDS.hxx>
 #include <TopoDS_Face.hxx>
 #include <TopoDS_Shape.hxx>
@@ -241,6 +242,53 @@ PyObject* FemMeshPy::addNode(PyObject* args)
     return nullptr;
 }
 
+PyObject* FemMeshPy::addNodeList(PyObject* args)
+{
+    PyObject* coordsObj = nullptr;
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(args, "O!|O!", &PyList_Type, &coordsObj, &PyList_Type, &idsObj)) {
+        return nullptr;
+    }
+
+    Py::List coordsList(coordsObj);
+    if (coordsList.size() % 3 != 0) {
+        PyErr_SetString(PyExc_ValueError, "The number of coordinates is not a multiple of 3");
+        return nullptr;
+    }
+    Py::List idsList;
+    if (idsObj) {
+        idsList = Py::List(idsObj);
+        if (idsList.size() * 3 != coordsList.size()) {
+            PyErr_SetString(PyExc_ValueError, "The number of ids differs from the number of nodes");
+            return nullptr;
+        }
+    }
+
+    SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+    Py::List result;
+    Py::List::iterator it = coordsList.begin();
+    Py::List::iterator idIt = idsList.begin();
+    while (it != coordsList.end()) {
+        double x = static_cast<double>(Py::Float(*it++));
+        double y = static_cast<double>(Py::Float(*it++));
+        double z = static_cast<double>(Py::Float(*it++));
+        SMDS_MeshNode* node = nullptr;
+        if (idsObj) {
+            node = meshDS->AddNodeWithID(x, y, z, static_cast<int>(Py::Long(*idIt++)));
+        }
+        else {
+            node = meshDS->AddNode(x, y, z);
+        }
+        if (!node) {
+            PyErr_SetString(Base::PyExc_FC_GeneralError, "Failed to add node");
+            return nullptr;
+        }
+        result.append(Py::Long(node->GetID()));
+    }
+
+    return Py::new_reference_to(result);
+}
+
 PyObject* FemMeshPy::addEdge(PyObject* args)
 {
     SMESH_Mesh* mesh = getFemMeshPtr()->getSMesh();
@@ -809,12 +857,59 @@ PyObject* FemMeshPy::addVolume(PyObject* args)
     return nullptr;
 }
 
+namespace
+{
+// adds the elements of addEdgeList, addFaceList and addVolumeList with the given ids
+PyObject* addElementListWithIds(SMESH_Mesh* mesh,
+                                SMDSAbs_ElementType type,
+                                const std::vector<const SMDS_MeshNode*>& nodes,
+                                const Py::List& npList,
+                                const Py::List& idList)
+{
+    if (idList.size() != npList.size()) {
+        PyErr_SetString(PyExc_ValueError, "The number of ids differs from the number of elements");
+        return nullptr;
+    }
+
+    SMESH_MeshEditor editor(mesh);
+    SMESH_MeshEditor::ElemFeatures elemFeat(type);
+    std::vector<const SMDS_MeshNode*>::const_iterator nodeIt = nodes.begin();
+    Py::List::const_iterator idIt = idList.begin();
+    Py::List result;
+    for (Py::List::const_iterator it = npList.begin(); it != npList.end(); ++it, ++idIt) {
+        long np = Py::Long(*it);
+        if (np < 1 || np > nodes.end() - nodeIt) {
+            PyErr_SetString(PyExc_ValueError, "Not enough node indices for the nodes per element");
+            return nullptr;
+        }
+        std::vector<const SMDS_MeshNode*> nodesElem(nodeIt, nodeIt + np);
+        nodeIt += np;
+        elemFeat.SetID(static_cast<int>(Py::Long(*idIt)));
+        const SMDS_MeshElement* elem = editor.AddElement(nodesElem, elemFeat);
+        if (!elem) {
+            PyErr_SetString(PyExc_TypeError, "Failed to add element, unknown node count or used id");
+            return nullptr;
+        }
+        result.append(Py::Long(elem->GetID()));
+    }
+
+    return Py::new_reference_to(result);
+}
+}  // namespace
+
 PyObject* FemMeshPy::addEdgeList(PyObject* args)
 {
     PyObject* nodesObj = nullptr;
     PyObject* npObj = nullptr;
-    ;
-    if (!PyArg_ParseTuple(args, "O!O!", &PyList_Type, &nodesObj, &PyList_Type, &npObj)) {
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(args,
+                          "O!O!|O!",
+                          &PyList_Type,
+                          &nodesObj,
+                          &PyList_Type,
+                          &npObj,
+                          &PyList_Type,
+                          &idsObj)) {
         return nullptr;
     }
 
@@ -832,6 +927,14 @@ PyObject* FemMeshPy::addEdgeList(PyObject* args)
         nodes.push_back(node);
     }
 
+    if (idsObj) {
+        return addElementListWithIds(getFemMeshPtr()->getSMesh(),
+                                     SMDSAbs_Edge,
+                                     nodes,
+                                     npList,
+                                     Py::List(idsObj));
+    }
+
     std::vector<const SMDS_MeshNode*>::iterator nodeIt = nodes.begin();
     SMDS_MeshEdge* edge = nullptr;
     Py::List result;
@@ -867,8 +970,15 @@ PyObject* FemMeshPy::addFaceList(PyObject* args)
 {
     PyObject* nodesObj = nullptr;
     PyObject* npObj = nullptr;
-    ;
-    if (!PyArg_ParseTuple(args, "O!O!", &PyList_Type, &nodesObj, &PyList_Type, &npObj)) {
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(args,
+                          "O!O!|O!",
+                          &PyList_Type,
+                          &nodesObj,
+                          &PyList_Type,
+                          &npObj,
+                          &PyList_Type,
+                          &idsObj)) {
         return nullptr;
     }
 
@@ -886,6 +996,14 @@ PyObject* FemMeshPy::addFaceList(PyObject* args)
         nodes.push_back(node);
     }
 
+    if (idsObj) {
+        return addElementListWithIds(getFemMeshPtr()->getSMesh(),
+                                     SMDSAbs_Face,
+                                     nodes,
+                                     npList,
+                                     Py::List(idsObj));
+    }
+
     std::vector<const SMDS_MeshNode*>::iterator nodeIt = nodes.begin();
     SMDS_MeshFace* face = nullptr;
     Py::List result;
@@ -939,8 +1057,15 @@ PyObject* FemMeshPy::addVolumeList(PyObject* args)
 {
     PyObject* nodesObj = nullptr;
     PyObject* npObj = nullptr;
-    ;
-    if (!PyArg_ParseTuple(args, "O!O!", &PyList_Type, &nodesObj, &PyList_Type, &npObj)) {
+    PyObject* idsObj = nullptr;
+    if (!PyArg_ParseTuple(args,
+                          "O!O!|O!",
+                          &PyList_Type,
+                          &nodesObj,
+                          &PyList_Type,
+                          &npObj,
+                          &PyList_Type,
+                          &idsObj)) {
         return nullptr;
     }
 
@@ -958,6 +1083,14 @@ PyObject* FemMeshPy::addVolumeList(PyObject* args)
         nodes.push_back(node);
     }
 
+    if (idsObj) {
+        return addElementListWithIds(getFemMeshPtr()->getSMesh(),
+                                     SMDSAbs_Volume,
+                                     nodes,
+                                     npList,
+                                     Py::List(idsObj));
+    }
+
     std::vector<const SMDS_MeshNode*>::iterator nodeIt = nodes.begin();
     SMDS_MeshVolume* vol = nullptr;
     Py::List result;
@@ -74,6 +74,7 @@ void DlgSettingsFemCcxImp::saveSettings()
     ui->dsb_ccx_maximum_time_step->onSave();  // Maximum time step
     ui->ckb_pipeline_result->onSave();
     ui->ckb_result_format->onSave();
+    ui->ckb_lazy_frd_results->onSave();
 
     ui->cb_analysis_type->onSave();
     ui->cb_BeamShellOutput->onSave();  // Beam shell output 3d or 2d
@@ -103,6 +104,7 @@ void DlgSettingsFemCcxImp::loadSettings()
     ui->dsb_ccx_maximum_time_step->onRestore();  // Maximum time step
     ui->ckb_pipeline_result->onRestore();
     ui->ckb_result_format->onRestore();
+    ui->ckb_lazy_frd_results->onRestore();
 
     ui->cb_analysis_type->onRestore();
     ui->cb_BeamShellOutput->onRestore();  // Beam shell output 3d or 2d
@@ -24,7 +24,6 @@
 
 import FreeCAD
 
-import Fem
 import ObjectsFem
 
 from .manager import get_meshname
@@ -62,15 +61,9 @@ def setup_boxanalysisbase(doc=None, solvertype="ccxtools"):
     analysis.addObject(material_obj)
 
     # mesh
-    from .meshes.mesh_boxanalysis_tetra10 import create_nodes, create_elements
+    from .meshes import load_mesh
 
-    fem_mesh = Fem.FemMesh()
-    control = create_nodes(fem_mesh)
-    if not control:
-        FreeCAD.Console.PrintError("Error on creating nodes.\n")
-    control = create_elements(fem_mesh)
-    if not control:
-        FreeCAD.Console.PrintError("Error on creating elements.\n")
+    fem_mesh = load_mesh("mesh_boxanalysis_tetra10")
     femmesh_obj = analysis.addObject(ObjectsFem.makeMeshGmsh(doc, get_meshname()))[0]
     femmesh_obj.FemMesh = fem_mesh
     femmesh_obj.Shape = geom_obj
@@ -28,7 +28,6 @@ from FreeCAD import Rotation
 from FreeCAD import Vector
 from FreeCAD import Units
 
-import Fem
 import ObjectsFem
 import Part
 import Sketcher
@@ -255,18 +254,9 @@ def setup(doc=None, solvertype="elmer"):
         FreeCAD.Console.PrintError(f"Unexpected error when creating mesh: {error}\n")
     if error:
         # try to create from existing rough mesh
-        from .meshes.mesh_electricforce_elmer_nongui6_tetra10 import (
-            create_nodes,
-            create_elements,
-        )
+        from .meshes import load_mesh
 
-        fem_mesh = Fem.FemMesh()
-        control = create_nodes(fem_mesh)
-        if not control:
-            FreeCAD.Console.PrintError("Error on creating nodes.\n")
-        control = create_elements(fem_mesh)
-        if not control:
-            FreeCAD.Console.PrintError("Error on creating elements.\n")
+        fem_mesh = load_mesh("mesh_electricforce_elmer_nongui6_tetra10")
         femmesh_obj.FemMesh = fem_mesh
 
     doc.recompute()
@@ -0,0 +1,83 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM example meshes"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## @package meshes
+#  \ingroup FEM
+#  \brief meshes of the FEM examples
+#
+#  Every mesh is a Python module with create_nodes() and create_elements()
+#  and an .npz file with the same mesh as arrays, see femmesh.mesharrays.
+#  The examples load the .npz files, a Python module with some ten thousand
+#  lines takes much longer to compile than the arrays to load.
+#  After a mesh module has been changed or added, convert it:
+#
+#  from femexamples import meshes
+#  meshes.convert_mesh_modules(["mesh_boxanalysis_tetra10"])
+
+import glob
+import importlib
+import os
+
+from femmesh import mesharrays
+
+
+MESH_DIR = os.path.dirname(__file__)
+
+
+def get_mesh_names():
+    """Returns the names of all mesh modules."""
+    return sorted(
+        os.path.splitext(os.path.basename(f))[0]
+        for f in glob.glob(os.path.join(MESH_DIR, "mesh_*.py"))
+    )
+
+
+def get_npz_file(mesh_name):
+    return os.path.join(MESH_DIR, mesh_name + ".npz")
+
+
+def load_mesh_arrays(mesh_name):
+    """Returns the mesh arrays of a mesh, from the .npz file if there is one."""
+    npz_file = get_npz_file(mesh_name)
+    if os.path.isfile(npz_file):
+        return mesharrays.load_npz(npz_file)
+    module = importlib.import_module(f"{__name__}.{mesh_name}")
+    return mesharrays.record_mesh_module(module)
+
+
+def load_mesh(mesh_name):
+    """Returns a new Fem.FemMesh of a mesh, for example load_mesh("mesh_canticcx_tetra10")."""
+    return mesharrays.make_femmesh(load_mesh_arrays(mesh_name))
+
+
+def convert_mesh_modules(mesh_names=None):
+    """Writes the .npz file of the mesh modules, all modules if no names are given."""
+    if mesh_names is None:
+        mesh_names = get_mesh_names()
+    for mesh_name in mesh_names:
+        module = importlib.import_module(f"{__name__}.{mesh_name}")
+        mesharrays.save_npz(get_npz_file(mesh_name), mesharrays.record_mesh_module(module))
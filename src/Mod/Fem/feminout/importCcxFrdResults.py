@@ -33,6 +33,8 @@ __url__ = "https://www.freecad.org"
 
 import os
 import math
+import weakref
+from collections import OrderedDict
 
 import FreeCAD
 from FreeCAD import Console
@@ -99,7 +101,14 @@ def setupPipeline(doc, analysis, results_name, result_data):
         pipeline_obj.ViewObject.Visibility = pipeline_visibility
 
 
-def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_type=""):
+def importFrd(
+    filename,
+    analysis=None,
+    result_name_prefix="",
+    result_analysis_type="",
+    columnar=None,
+    lazy=None,
+):
     import ObjectsFem
     from . import importToolsFem
 
@@ -108,14 +117,40 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
     else:
         doc = FreeCAD.ActiveDocument
 
-    m = read_frd_result(filename)
+    # the columnar reader parses the frd blocks into NumPy arrays
+    # the line by line reader below is kept as fallback
+    ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
+    if columnar is None:
+        columnar = ccx_prefs.GetBool("ColumnarFrdReader", True)
+    if lazy is None:
+        lazy = ccx_prefs.GetBool("LazyFrdResults", False)
+    lazy_loader = None
+    if columnar and lazy:
+        # only the mesh, the byte ranges of the result blocks and the step infos
+        # are read here, the result objects of multi step and eigenmode results
+        # but the first are filled on demand, without multistep result pipeline
+        from . import readCcxFrd
+
+        frd_index = readCcxFrd.FrdResultIndex(filename)
+        m = frd_index.get_mesh_data()
+        if len(m["Results"]) > 1:
+            lazy_loader = LazyResultLoader(
+                filename, ccx_prefs.GetInt("LazyFrdResultsLoaded", 3), frd_index
+            )
+    elif columnar:
+        from . import readCcxFrd
+
+        m = readCcxFrd.read_frd_result(filename)
+    else:
+        m = read_frd_result(filename)
     result_mesh_object = None
     res_obj = None
 
     if len(m["Nodes"]) > 0:
         mesh = importToolsFem.make_femmesh(m)
         res_mesh_is_compacted = False
-        nodenumbers_for_compacted_mesh = []
+        # None until a result set which is not a 1D flow result compacted the result mesh
+        nodenumbers_for_compacted_mesh = None
 
         number_of_increments = len(m["Results"])
         Console.PrintLog("Increments: " + str(number_of_increments) + "\n")
@@ -131,7 +166,7 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
         multistep_result = []
         multistep_value = []
         if len(m["Results"]) > 0:
-            for result_set in m["Results"]:
+            for set_number, result_set in enumerate(m["Results"]):
                 if "number" in result_set:
                     eigenmode_number = result_set["number"]
                 else:
@@ -155,71 +190,34 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
                     results_name = f"{result_name_prefix}Results"
 
                 res_obj = make_result_mesh(results_name)
+                if lazy_loader and set_number > 0:
+                    # only the first set is parsed on import, it compacts the result mesh
+                    # the others are parsed and filled on first use, see LazyResultLoader
+                    if analysis:
+                        analysis.addObject(res_obj)
+                    if nodenumbers_for_compacted_mesh is not None:
+                        res_obj.NodeNumbers = nodenumbers_for_compacted_mesh
+                    lazy_loader.add(res_obj, set_number, nodenumbers_for_compacted_mesh)
+                    multistep_value.append(step_time)
+                    multistep_result.append(res_obj)
+                    continue
+                if lazy_loader:
+                    result_set = frd_index.get_result_set(set_number)
                 res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
                 if analysis:
                     # need to be here, becasause later on, the analysis objs are needed
                     # see fill of principal stresses
                     analysis.addObject(res_obj)
 
-                # more result object calculations
-                from femresult import resulttools
-                from femtools import femutils
-
-                if not res_obj.MassFlowRate:
-                    # information 1:
-                    # only compact result if not Flow 1D results
-                    # compact result object, workaround for bug 2873
-                    # https://www.freecad.org/tracker/view.php?id=2873
-                    # information 2:
-                    # if the result data has multiple result sets there will be multiple result objs
-                    # they all will use one mesh obj
-                    # on the first res obj fill: the mesh obj will be compacted, thus
-                    # it does not need to be compacted on further result sets
-                    # but NodeNumbers need to be compacted for every result set (res object fill)
-                    # example frd file: https://forum.freecad.org/viewtopic.php?t=32649#p274291
-                    if res_mesh_is_compacted is False:
-                        # first result set, compact FemMesh and NodeNumbers
-                        res_obj = resulttools.compact_result(res_obj)
+                if res_mesh_is_compacted:
+                    res_obj = add_result_data(res_obj, nodenumbers_for_compacted_mesh)
+                else:
+                    res_obj = add_result_data(res_obj)
+                    if not res_obj.MassFlowRate:
                         res_mesh_is_compacted = True
                         nodenumbers_for_compacted_mesh = res_obj.NodeNumbers
-                    else:
-                        # all other result sets, do not compact FemMesh, only set NodeNumbers
-                        res_obj.NodeNumbers = nodenumbers_for_compacted_mesh
-
-                # fill DisplacementLengths
-                res_obj = resulttools.add_disp_apps(res_obj)
-                # fill vonMises
-                res_obj = resulttools.add_von_mises(res_obj)
-                # fill principal stress
-                # if material reinforced object use add additional values to the res_obj
-                if res_obj.getParentGroup():
-                    has_reinforced_mat = False
-                    for obj in res_obj.getParentGroup().Group:
-                        if femutils.is_of_type(obj, "Fem::MaterialReinforced"):
-                            has_reinforced_mat = True
-                            Console.PrintLog(
-                                "Reinforced material object detected, "
-                                "reinforced principal stresses and standard principal "
-                                "stresses will be added.\n"
-                            )
-                            resulttools.add_principal_stress_reinforced(res_obj)
-                            break
-                    if has_reinforced_mat is False:
-                        Console.PrintLog(
-                            "No reinforced material object detected, "
-                            "standard principal stresses will be added.\n"
-                        )
-                        # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
-                        res_obj = resulttools.add_principal_stress_std(res_obj)
-                else:
-                    Console.PrintLog(
-                        "No Analysis detected, standard principal stresses will be added.\n"
-                    )
-                    # if a pure frd file was opened no analysis and thus no parent group
-                    # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
-                    res_obj = resulttools.add_principal_stress_std(res_obj)
-                # fill Stats
-                res_obj = resulttools.fill_femresult_stats(res_obj)
+                if lazy_loader:
+                    lazy_loader.add(res_obj, set_number, nodenumbers_for_compacted_mesh, True)
 
                 # if we have multiple results we delay the pipeline creation
                 if number_of_increments == 1:
@@ -229,7 +227,14 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
                     multistep_result.append(res_obj)
 
             # we have collected all result objects, lets create the multistep result pipeline
-            if number_of_increments > 1:
+            # the pipeline needs the data of all result objects, thus not with lazy loading
+            if lazy_loader:
+                Console.PrintWarning(
+                    "Lazy loading of frd results is enabled (Ccx preference LazyFrdResults), "
+                    "the multistep result pipeline is not created, because it needs the "
+                    "data of all result sets. Turn off lazy loading to get the pipeline.\n"
+                )
+            elif number_of_increments > 1:
                 # figure out type and unit
                 match result_analysis_type:
                     case "frequency":
@@ -303,6 +308,212 @@ def importFrd(filename, analysis=None, result_name_prefix="", result_analysis_ty
     return res_obj
 
 
+def add_result_data(res_obj, compacted_node_numbers=None):
+    """Compacts the result and adds the derived results and the stats.
+
+    compacted_node_numbers are the NodeNumbers of the first result object
+    of a multi step result, None compacts the result mesh.
+    """
+    from femresult import resulttools
+    from femtools import femutils
+
+    if not res_obj.MassFlowRate:
+        # information 1:
+        # only compact result if not Flow 1D results
+        # compact result object, workaround for bug 2873
+        # https://www.freecad.org/tracker/view.php?id=2873
+        # information 2:
+        # if the result data has multiple result sets there will be multiple result objs
+        # they all will use one mesh obj
+        # on the first res obj fill: the mesh obj will be compacted, thus
+        # it does not need to be compacted on further result sets
+        # but NodeNumbers need to be compacted for every result set (res object fill)
+        # example frd file: https://forum.freecad.org/viewtopic.php?t=32649#p274291
+        if compacted_node_numbers is None:
+            # first result set, compact FemMesh and NodeNumbers
+            res_obj = resulttools.compact_result(res_obj)
+        else:
+            # all other result sets, do not compact FemMesh, only set NodeNumbers
+            res_obj.NodeNumbers = compacted_node_numbers
+
+    # fill DisplacementLengths
+    res_obj = resulttools.add_disp_apps(res_obj)
+    # fill vonMises
+    res_obj = resulttools.add_von_mises(res_obj)
+    # fill principal stress
+    # if material reinforced object use add additional values to the res_obj
+    if res_obj.getParentGroup():
+        has_reinforced_mat = False
+        for obj in res_obj.getParentGroup().Group:
+            if femutils.is_of_type(obj, "Fem::MaterialReinforced"):
+                has_reinforced_mat = True
+                Console.PrintLog(
+                    "Reinforced material object detected, "
+                    "reinforced principal stresses and standard principal "
+                    "stresses will be added.\n"
+                )
+                resulttools.add_principal_stress_reinforced(res_obj)
+                break
+        if has_reinforced_mat is False:
+            Console.PrintLog(
+                "No reinforced material object detected, "
+                "standard principal stresses will be added.\n"
+            )
+            # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
+            res_obj = resulttools.add_principal_stress_std(res_obj)
+    else:
+        Console.PrintLog("No Analysis detected, standard principal stresses will be added.\n")
+        # if a pure frd file was opened no analysis and thus no parent group
+        # fill PrincipalMax, PrincipalMed, PrincipalMin, MaxShear
+        res_obj = resulttools.add_principal_stress_std(res_obj)
+    # fill Stats
+    res_obj = resulttools.fill_femresult_stats(res_obj)
+
+    return res_obj
+
+
+class LazyResultLoader:
+    """Fills the result objects of a multi step frd file on demand.
+
+    Parameters
+    ----------
+    frd_index : readCcxFrd.FrdResultIndex
+        index of the result sets of the frd file
+    max_loaded : int
+        number of result objects which keep their node data
+
+    The loader is set as lazy_loader attribute of the result object
+    proxies, see resulttools.load_lazy_result(). A result set is parsed
+    and its derived results and Stats are added when the result object
+    is loaded the first time. The node data of the least recently loaded
+    result object is emptied, only Stats and NodeNumbers are kept. The
+    frd file, the result set number and the file stamp are stored on the
+    result object, a restored document gets its loader from
+    restore_lazy_result().
+    """
+
+    def __init__(self, frd_file, max_loaded=3, frd_index=None):
+        self.frd_file = frd_file
+        # indexed on first load if not given
+        self._frd_index = frd_index
+        self.max_loaded = max(1, max_loaded)
+        # result object name: (result set number, compacted node numbers)
+        # the node numbers are None if no result set compacted the result mesh yet
+        self.result_objects = {}
+        # NodeNumbers of the first result object compacted on load
+        self.compacted_node_numbers = None
+        self.loaded = OrderedDict()
+
+    @property
+    def frd_index(self):
+        if self._frd_index is None:
+            from . import readCcxFrd
+
+            self._frd_index = readCcxFrd.FrdResultIndex(self.frd_file)
+        return self._frd_index
+
+    def add(self, res_obj, set_number, node_numbers, loaded=False):
+        self.result_objects[res_obj.Name] = (set_number, node_numbers)
+        res_obj.Proxy.lazy_loader = self
+        if not hasattr(res_obj, "FrdFile"):
+            for prop_type, prop, description in (
+                ("App::PropertyString", "FrdFile", "frd file the node data is loaded from"),
+                ("App::PropertyInteger", "FrdResultSet", "Result set number in the frd file"),
+                ("App::PropertyString", "FrdFileStamp", "Size and time of the frd file"),
+            ):
+                res_obj.addProperty(prop_type, prop, "LazyResult", description, True)
+            res_obj.FrdFile = self.frd_file
+            res_obj.FrdResultSet = set_number
+            res_obj.FrdFileStamp = _file_stamp_string(self.frd_index.file_stamp)
+        if loaded:
+            self._set_loaded(res_obj)
+
+    def is_loaded(self, res_obj):
+        return res_obj.Name in self.loaded
+
+    def load(self, res_obj):
+        """Fills the node data of the result object if it is not filled."""
+        from . import importToolsFem
+
+        if res_obj.Name in self.loaded:
+            self.loaded.move_to_end(res_obj.Name)
+            return res_obj
+        set_number, node_numbers = self.result_objects[res_obj.Name]
+        try:
+            frd_index = self.frd_index
+        except OSError as e:
+            Console.PrintError(f"Can not load the result data of {res_obj.Name}: {e}\n")
+            return res_obj
+        if _file_stamp_string(frd_index.file_stamp) != res_obj.FrdFileStamp:
+            Console.PrintError(
+                f"Can not load the result data of {res_obj.Name}, "
+                f"the frd file was changed: {self.frd_file}\n"
+            )
+            return res_obj
+        Console.PrintLog(f"Load result set {set_number} into {res_obj.Name}\n")
+        result_set = frd_index.get_result_set(set_number)
+        res_obj = importToolsFem.fill_femresult_mechanical(res_obj, result_set)
+        if node_numbers is None:
+            node_numbers = self.compacted_node_numbers
+        res_obj = add_result_data(res_obj, node_numbers)
+        if node_numbers is None and not res_obj.MassFlowRate:
+            # the result mesh was compacted, the next loads use its NodeNumbers
+            self.compacted_node_numbers = list(res_obj.NodeNumbers)
+            self.result_objects[res_obj.Name] = (set_number, self.compacted_node_numbers)
+        self._set_loaded(res_obj)
+        return res_obj
+
+    def _set_loaded(self, res_obj):
+        self.loaded[res_obj.Name] = res_obj.Document
+        while len(self.loaded) > self.max_loaded:
+            name, doc = self.loaded.popitem(last=False)
+            old_obj = doc.getObject(name)
+            if old_obj is not None:
+                self.unload(old_obj)
+
+    def unload(self, res_obj):
+        """Empties the node data of the result object, Stats and NodeNumbers are kept."""
+        Console.PrintLog(f"Unload result data of {res_obj.Name}\n")
+        self.loaded.pop(res_obj.Name, None)
+        for prop in _node_data_properties(res_obj):
+            setattr(res_obj, prop, [])
+
+
+# restored lazy loaders by document and frd file, see restore_lazy_result()
+_restored_loaders = weakref.WeakValueDictionary()
+
+
+def _file_stamp_string(file_stamp):
+    return "{} {}".format(*file_stamp)
+
+
+def _node_data_properties(res_obj):
+    # NodeNumbers are needed to load the node data again
+    return [
+        prop
+        for prop in res_obj.PropertiesList
+        if res_obj.getGroupOfProperty(prop) == "NodeData" and prop != "NodeNumbers"
+    ]
+
+
+def restore_lazy_result(res_obj):
+    """Sets the lazy loader of a restored result object imported with lazy loading.
+
+    All result objects of the same frd file in a document share one
+    loader, the frd file is indexed on the first load.
+    """
+    key = (res_obj.Document.Name, res_obj.FrdFile)
+    lazy_loader = _restored_loaders.get(key)
+    if lazy_loader is None:
+        ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
+        lazy_loader = LazyResultLoader(res_obj.FrdFile, ccx_prefs.GetInt("LazyFrdResultsLoaded", 3))
+        _restored_loaders[key] = lazy_loader
+    loaded = any(len(getattr(res_obj, prop)) for prop in _node_data_properties(res_obj))
+    # no NodeNumbers if the result object was never loaded and no result set compacted the mesh
+    node_numbers = list(res_obj.NodeNumbers) or None
+    lazy_loader.add(res_obj, res_obj.FrdResultSet, node_numbers, loaded)
+
+
 # read a calculix result file and extract the nodes
 # displacement vectors and stress values.
 def read_frd_result(frd_input):
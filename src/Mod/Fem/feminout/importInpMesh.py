@@ -33,10 +33,75 @@ __date__ = "04/08/2016"
 
 import os
 
+import numpy as np
+
 import FreeCAD
 from FreeCAD import Console
 from builtins import open as pyopen
 
+from femmesh.mesharrays import get_block_kind
+
+
+# data lines parsed at once, this bounds the memory of the not yet parsed lines
+CHUNK_LINES = 100000
+# lines between two progress calls
+PROGRESS_LINES = 10000
+
+# inp element type: element block of femmesh.mesharrays
+INP_ELEMENT_TYPES = {
+    "S3": "Face3",
+    "CPS3": "Face3",
+    "CPE3": "Face3",
+    "CAX3": "Face3",
+    "S6": "Face6",
+    "CPS6": "Face6",
+    "CPE6": "Face6",
+    "CAX6": "Face6",
+    "S4": "Face4",
+    "S4R": "Face4",
+    "CPS4": "Face4",
+    "CPS4R": "Face4",
+    "CPE4": "Face4",
+    "CPE4R": "Face4",
+    "CAX4": "Face4",
+    "CAX4R": "Face4",
+    "S8": "Face8",
+    "S8R": "Face8",
+    "CPS8": "Face8",
+    "CPS8R": "Face8",
+    "CPE8": "Face8",
+    "CPE8R": "Face8",
+    "CAX8": "Face8",
+    "CAX8R": "Face8",
+    "C3D4": "Volume4",
+    "C3D10": "Volume10",
+    "C3D8": "Volume8",
+    "C3D8R": "Volume8",
+    "C3D8I": "Volume8",
+    "C3D20": "Volume20",
+    "C3D20R": "Volume20",
+    "C3D20RI": "Volume20",
+    "C3D6": "Volume6",
+    "C3D15": "Volume15",
+    "B31": "Edge2",
+    "B31R": "Edge2",
+    "T3D2": "Edge2",
+    "B32": "Edge3",
+    "B32R": "Edge3",
+    "T3D3": "Edge3",
+}
+
+# element block of femmesh.mesharrays: FreeCAD node order in CalculiX node positions
+CCX_TO_FREECAD_NODE_ORDER = {
+    "Volume4": [1, 0, 2, 3],
+    "Volume10": [1, 0, 2, 3, 4, 6, 5, 8, 7, 9],
+    "Volume8": [5, 6, 7, 4, 1, 2, 3, 0],
+    "Volume20": [5, 6, 7, 4, 1, 2, 3, 0, 13, 14, 15, 12, 9, 10, 11, 8, 17, 18, 19, 16],
+    "Volume6": [4, 5, 3, 1, 2, 0],
+    "Volume15": [4, 5, 3, 1, 2, 0, 10, 11, 9, 7, 8, 6, 13, 14, 12],
+    "Edge3": [0, 2, 1],
+}
+
 
 # ********* generic FreeCAD import and export methods *********
 
@@ -61,7 +126,20 @@ def insert(filename, docname):
 def read(filename):
     """read a FemMesh from a inp mesh file and return the FemMesh"""
     # no document object is created, just the FemMesh is returned
-    mesh_data = read_inp(filename)
+    progress_bar = FreeCAD.Base.ProgressIndicator()
+    progress_bar.start(f"Reading inp mesh {os.path.basename(filename)} ...", 100)
+    percent = 0
+
+    def progress(done, total):
+        nonlocal percent
+        while percent < 100 * done // max(total, 1):
+            progress_bar.next()
+            percent += 1
+
+    try:
+        mesh_data = read_inp(filename, progress)
+    finally:
+        progress_bar.stop()
     from . import importToolsFem
 
     return importToolsFem.make_femmesh(mesh_data)
@@ -76,222 +154,187 @@ def import_inp(filename):
         mesh_object.FemMesh = femmesh
 
 
-def read_inp(file_name):
-    """read .inp file"""
+def read_inp(file_name, progress=None):
+    """read .inp file, returns the mesh arrays of femmesh.mesharrays
+
+    The data lines of the *NODE and *ELEMENT blocks are parsed in chunks
+    of CHUNK_LINES lines into arrays. *INCLUDE files are read in place,
+    they may include further files. progress is called with the number
+    of read and the total number of characters of file_name.
+    """
     # ATM only mesh reading is supported (no boundary conditions)
+    parser = _InpMeshParser()
+    for line in iter_inp_lines(file_name, progress):
+        if line[0] == "*":
+            if line[:2] != "**":  # comments
+                parser.start_block(line)
+        elif line.strip():
+            parser.add_data_line(line)
+    parser.end_block()
+    parser.print_errors()
+    mesh_arrays = parser.get_mesh_arrays()
 
-    class elements:
-
-        tria3 = {}
-        tria6 = {}
-        quad4 = {}
-        quad8 = {}
-        tetra4 = {}
-        tetra10 = {}
-        hexa8 = {}
-        hexa20 = {}
-        penta6 = {}
-        penta15 = {}
-        seg2 = {}
-        seg3 = {}
-
-    error_seg3 = False  # to print "not supported"
-    nodes = {}
-    model_definition = True
-
-    f = pyopen(file_name, "r")
-    line = "\n"
-    include = ""
-    f_include = None
-    while line != "":
-        if include:
-            line = f_include.readline()
-            if line == "":
-                f_include.close()
-                include = ""
-                line = f.readline()
-        else:
-            line = f.readline()
-        if line.strip() == "":
-            continue
-        elif line[0] == "*":  # start/end of a reading set
-            if line[0:2] == "**":  # comments
-                continue
+    # switch from the CalculiX node numbering to the FreeCAD node numbering
+    # numbering do not change: tria3, tria6, quad4, quad8, seg2
+    for block_name, order in CCX_TO_FREECAD_NODE_ORDER.items():
+        if block_name + "_nodes" in mesh_arrays:
+            mesh_arrays[block_name + "_nodes"] = mesh_arrays[block_name + "_nodes"][:, order]
+
+    return mesh_arrays
+
+
+def iter_inp_lines(file_name, progress=None, _including_files=()):
+    """Yields the lines of an inp file, the lines of *INCLUDE files in their place."""
+    real_file_name = os.path.realpath(file_name)
+    if real_file_name in _including_files:
+        Console.PrintError(f"Recursive *INCLUDE of {file_name} is ignored.\n")
+        return
+    total = os.path.getsize(file_name)
+    done = 0
+    with pyopen(file_name, "r") as f:
+        for line_number, line in enumerate(f, 1):
+            if progress is not None:
+                done += len(line)
+                if line_number % PROGRESS_LINES == 0:
+                    progress(done, total)
             if line[:8].upper() == "*INCLUDE":
-                start = 1 + line.index("=")
-                include = line[start:].strip().strip('"')
-                include_path = os.path.normpath(include)
-                if os.path.isfile(include_path) is True:
-                    f_include = pyopen(include_path, "r")
-                else:
-                    path_start = os.path.split(file_name)[0]
-                    include_full_path = os.path.join(path_start, include_path)
-                    f_include = pyopen(include_full_path, "r")
+                include_file = get_include_file(line, file_name)
+                if include_file:
+                    yield from iter_inp_lines(
+                        include_file, None, _including_files + (real_file_name,)
+                    )
                 continue
-            read_node = False
-            elm_category = []
-            number_of_nodes = 0
-            elm_type = ""
-            elm_2nd_line = False
-            error_seg3 = False
-            error_not_supported_elemtype = False
-
-        # reading nodes
-        if (line[:5].upper() == "*NODE") and (model_definition is True):
-            read_node = True
-        elif read_node is True:
-            line_list = line.split(",")
-            number = int(line_list[0])
-            x = float(line_list[1])
-            y = float(line_list[2])
-            z = float(line_list[3])
-            nodes[number] = [x, y, z]
-
-        # reading elements
-        elif line[:8].upper() == "*ELEMENT":
-            line_list = line[8:].upper().split(",")
-            for line_part in line_list:
-                if line_part.lstrip()[:4] == "TYPE":
-                    elm_type = line_part.split("=")[1].strip()
-
-            if elm_type in ["S3", "CPS3", "CPE3", "CAX3"]:
-                elm_category = elements.tria3
-                number_of_nodes = 3
-            elif elm_type in ["S6", "CPS6", "CPE6", "CAX6"]:
-                elm_category = elements.tria6
-                number_of_nodes = 6
-            elif elm_type in ["S4", "S4R", "CPS4", "CPS4R", "CPE4", "CPE4R", "CAX4", "CAX4R"]:
-                elm_category = elements.quad4
-                number_of_nodes = 4
-            elif elm_type in ["S8", "S8R", "CPS8", "CPS8R", "CPE8", "CPE8R", "CAX8", "CAX8R"]:
-                elm_category = elements.quad8
-                number_of_nodes = 8
-            elif elm_type == "C3D4":
-                elm_category = elements.tetra4
-                number_of_nodes = 4
-            elif elm_type == "C3D10":
-                elm_category = elements.tetra10
-                number_of_nodes = 10
-            elif elm_type in ["C3D8", "C3D8R", "C3D8I"]:
-                elm_category = elements.hexa8
-                number_of_nodes = 8
-            elif elm_type in ["C3D20", "C3D20R", "C3D20RI"]:
-                elm_category = elements.hexa20
-                number_of_nodes = 20
-            elif elm_type == "C3D6":
-                elm_category = elements.penta6
-                number_of_nodes = 6
-            elif elm_type == "C3D15":
-                elm_category = elements.penta15
-                number_of_nodes = 15
-            elif elm_type in ["B31", "B31R", "T3D2"]:
-                elm_category = elements.seg2
-                number_of_nodes = 2
-            elif elm_type in ["B32", "B32R", "T3D3"]:
-                elm_category = elements.seg3
-                number_of_nodes = 3
-                error_seg3 = True  # to print "not supported"
-            else:
-                error_not_supported_elemtype = True
-
-        elif elm_category != [] and number_of_nodes > 0:
-            line_list = line.split(",")
-            if elm_2nd_line is False:
-                number = int(line_list[0])
-                elm_category[number] = []
-                pos = 1
-            else:
-                pos = 0
-                elm_2nd_line = False
-            for en in range(pos, pos + number_of_nodes - len(elm_category[number])):
-                try:
-                    enode = int(line_list[en])
-                    elm_category[number].append(enode)
-                except Exception:
-                    elm_2nd_line = True
-                    break
-
-        elif line[:5].upper() == "*STEP":
-            model_definition = False
-    if error_seg3 is True:  # to print "not supported"
-        Console.PrintError("Error: seg3 (3-node beam element type) not supported, yet.\n")
-    elif error_not_supported_elemtype is True:
-        Console.PrintError(f"Error: {elm_type} not supported.\n")
-    f.close()
+            yield line
+    if progress is not None:
+        progress(total, total)
 
-    # switch from the CalculiX node numbering to the FreeCAD node numbering
-    # numbering do not change: tria3, tria6, quad4, quad8, seg2
-    for en in elements.tetra4:
-        n = elements.tetra4[en]
-        elements.tetra4[en] = [n[1], n[0], n[2], n[3]]
-    for en in elements.tetra10:
-        n = elements.tetra10[en]
-        elements.tetra10[en] = [n[1], n[0], n[2], n[3], n[4], n[6], n[5], n[8], n[7], n[9]]
-    for en in elements.hexa8:
-        n = elements.hexa8[en]
-        elements.hexa8[en] = [n[5], n[6], n[7], n[4], n[1], n[2], n[3], n[0]]
-    for en in elements.hexa20:
-        n = elements.hexa20[en]
-        elements.hexa20[en] = [
-            n[5],
-            n[6],
-            n[7],
-            n[4],
-            n[1],
-            n[2],
-            n[3],
-            n[0],
-            n[13],
-            n[14],
-            n[15],
-            n[12],
-            n[9],
-            n[10],
-            n[11],
-            n[8],
-            n[17],
-            n[18],
-            n[19],
-            n[16],
-        ]
-    for en in elements.penta6:
-        n = elements.penta6[en]
-        elements.penta6[en] = [n[4], n[5], n[3], n[1], n[2], n[0]]
-    for en in elements.penta15:
-        n = elements.penta15[en]
-        elements.penta15[en] = [
-            n[4],
-            n[5],
-            n[3],
-            n[1],
-            n[2],
-            n[0],
-            n[10],
-            n[11],
-            n[9],
-            n[7],
-            n[8],
-            n[6],
-            n[13],
-            n[14],
-            n[12],
-        ]
-    for en in elements.seg3:
-        n = elements.seg3[en]
-        elements.seg3[en] = [n[0], n[2], n[1]]
-
-    return {
-        "Nodes": nodes,
-        "Seg2Elem": elements.seg2,
-        "Seg3Elem": elements.seg3,
-        "Tria3Elem": elements.tria3,
-        "Tria6Elem": elements.tria6,
-        "Quad4Elem": elements.quad4,
-        "Quad8Elem": elements.quad8,
-        "Tetra4Elem": elements.tetra4,
-        "Tetra10Elem": elements.tetra10,
-        "Hexa8Elem": elements.hexa8,
-        "Hexa20Elem": elements.hexa20,
-        "Penta6Elem": elements.penta6,
-        "Penta15Elem": elements.penta15,
-    }
+
+def get_include_file(line, file_name):
+    """Returns the file of an *INCLUDE line, relative paths are relative to file_name."""
+    parameters = _get_keyword_parameters(line)
+    include = parameters.get("INPUT", "").strip('"')
+    if not include:
+        Console.PrintError(f"No INPUT in {line.strip()}\n")
+        return None
+    include_path = os.path.normpath(include)
+    if not os.path.isfile(include_path):
+        include_path = os.path.join(os.path.dirname(file_name), include_path)
+    if not os.path.isfile(include_path):
+        Console.PrintError(f"Include file {include} not found.\n")
+        return None
+    return include_path
+
+
+def _get_keyword_parameters(line):
+    # "*ELEMENT, TYPE=C3D10, ELSET=Eall" --> {"TYPE": "C3D10", "ELSET": "Eall"}
+    parameters = {}
+    for part in line.split(",")[1:]:
+        key, _, value = part.partition("=")
+        parameters[key.strip().upper()] = value.strip()
+    return parameters
+
+
+class _InpMeshParser:
+    """Collects the data lines of the node and element blocks into arrays."""
+
+    def __init__(self):
+        self.model_definition = True
+        self.node_chunks = []
+        self.element_chunks = {}
+        self.not_supported_types = []
+        self.error_seg3 = False  # to print "not supported"
+        # current block: "Nodes", an element block name or None
+        self.block_name = None
+        self.lines = []
+        # tokens of an element which continues in the next chunk
+        self.tokens = []
+
+    def start_block(self, line):
+        self.end_block()
+        keyword = line.split(",")[0].strip().upper()
+        if keyword == "*NODE" and self.model_definition:
+            self.block_name = "Nodes"
+        elif keyword == "*ELEMENT":
+            elm_type = _get_keyword_parameters(line).get("TYPE", "").upper()
+            self.block_name = INP_ELEMENT_TYPES.get(elm_type)
+            if self.block_name is None and elm_type not in self.not_supported_types:
+                self.not_supported_types.append(elm_type)
+            if elm_type in ("B32", "B32R", "T3D3"):
+                self.error_seg3 = True  # to print "not supported"
+        elif keyword == "*STEP":
+            self.model_definition = False
+
+    def print_errors(self):
+        # once after parsing, not for every element block
+        if self.error_seg3:
+            Console.PrintError("Error: seg3 (3-node beam element type) not supported, yet.\n")
+        for elm_type in self.not_supported_types:
+            Console.PrintError(f"Error: {elm_type} not supported.\n")
+
+    def add_data_line(self, line):
+        if self.block_name is not None:
+            self.lines.append(line)
+            if len(self.lines) >= CHUNK_LINES:
+                self.parse_lines()
+
+    def end_block(self):
+        self.parse_lines()
+        if self.tokens:
+            Console.PrintError(f"Incomplete {self.block_name} element is ignored.\n")
+            self.tokens = []
+        self.block_name = None
+
+    def parse_lines(self):
+        if not self.lines:
+            return
+        if self.block_name == "Nodes":
+            self.node_chunks.append(_parse_node_lines(self.lines))
+        else:
+            node_count = get_block_kind(self.block_name)[1]
+            chunk, self.tokens = _parse_element_lines(self.lines, node_count, self.tokens)
+            self.element_chunks.setdefault(self.block_name, []).append(chunk)
+        self.lines = []
+
+    def get_mesh_arrays(self):
+        if self.node_chunks:
+            nodes = np.concatenate(self.node_chunks)
+        else:
+            nodes = np.empty((0, 4))
+        mesh_arrays = {
+            "node_ids": nodes[:, 0].astype(np.int64),
+            "node_coords": np.ascontiguousarray(nodes[:, 1:]),
+        }
+        for block_name, chunks in self.element_chunks.items():
+            elements = np.concatenate(chunks)
+            if len(elements):
+                mesh_arrays[block_name + "_ids"] = elements[:, 0].copy()
+                mesh_arrays[block_name + "_nodes"] = np.ascontiguousarray(elements[:, 1:])
+        return mesh_arrays
+
+
+def _parse_node_lines(lines):
+    # returns the rows id, x, y, z
+    values = [line.replace(",", " ").split() for line in lines]
+    if all(len(line_values) == 4 for line_values in values):
+        try:
+            return np.array(values, dtype=np.float64).reshape(-1, 4)
+        except ValueError:
+            pass
+    # lines with missing coordinates or other irregular lines
+    rows = []
+    for line in lines:
+        line_list = [value for value in line.split(",") if value.strip()]
+        row = [float(value) for value in line_list[:4]]
+        rows.append(row + [0.0] * (4 - len(row)))
+    return np.array(rows, dtype=np.float64).reshape(-1, 4)
+
+
+def _parse_element_lines(lines, node_count, tokens):
+    # returns the rows id, nodes and the tokens of an incomplete last element
+    # the nodes of an element may continue on the next lines
+    # the last line of an included file may have no line end
+    tokens = tokens + "\n".join(lines).replace(",", " ").split()
+    row_length = node_count + 1
+    complete = len(tokens) - len(tokens) % row_length
+    rows = np.array(tokens[:complete], dtype=np.int64).reshape(-1, row_length)
+    return rows, tokens[complete:]
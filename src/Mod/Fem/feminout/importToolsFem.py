@@ -29,9 +29,15 @@ __url__ = "https://www.freecad.org"
 #  \ingroup FEM
 #  \brief FreeCAD FEM import tools
 
+from itertools import chain
+
+import numpy as np
+
 import FreeCAD
 from FreeCAD import Console
 
+from femmesh import mesharrays
+
 
 def get_FemMeshObjectMeshGroups(fem_mesh_obj):
     """
@@ -131,154 +137,97 @@ def get_MaxDimElementFromList(elem_list):
     return elem_list[-1]
 
 
+# mesh data element key: element block name of femmesh.mesharrays
+MESH_DATA_BLOCKS = {
+    "Seg2Elem": "Edge2",
+    "Seg3Elem": "Edge3",
+    "Tria3Elem": "Face3",
+    "Tria6Elem": "Face6",
+    "Quad4Elem": "Face4",
+    "Quad8Elem": "Face8",
+    "Tetra4Elem": "Volume4",
+    "Tetra10Elem": "Volume10",
+    "Hexa8Elem": "Volume8",
+    "Hexa20Elem": "Volume20",
+    "Penta6Elem": "Volume6",
+    "Penta15Elem": "Volume15",
+}
+
+
 def make_femmesh(mesh_data):
-    """makes an FreeCAD FEM Mesh object from FEM Mesh data"""
+    """makes an FreeCAD FEM Mesh object from FEM Mesh data
+
+    mesh_data is either a dict with "Nodes" and the element dicts like
+    "Tetra10Elem", which hold {id: nodes} or FrdBlock arrays, or it is
+    the mesh arrays dict of femmesh.mesharrays, see get_mesh_arrays().
+    """
     import Fem
 
     mesh = Fem.FemMesh()
-    m = mesh_data
-    if ("Nodes" in m) and (len(m["Nodes"]) > 0):
-        FreeCAD.Console.PrintLog("Found: nodes\n")
-        if (
-            ("Seg2Elem" in m)
-            or ("Seg3Elem" in m)
-            or ("Tria3Elem" in m)
-            or ("Tria6Elem" in m)
-            or ("Quad4Elem" in m)
-            or ("Quad8Elem" in m)
-            or ("Tetra4Elem" in m)
-            or ("Tetra10Elem" in m)
-            or ("Penta6Elem" in m)
-            or ("Penta15Elem" in m)
-            or ("Hexa8Elem" in m)
-            or ("Hexa20Elem" in m)
-        ):
-
-            nds = m["Nodes"]
-            FreeCAD.Console.PrintLog("Found: elements\n")
-            for i in nds:
-                n = nds[i]
-                mesh.addNode(n[0], n[1], n[2], i)
-            elms_hexa8 = m["Hexa8Elem"]
-            for i in elms_hexa8:
-                e = elms_hexa8[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_penta6 = m["Penta6Elem"]
-            for i in elms_penta6:
-                e = elms_penta6[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_tetra4 = m["Tetra4Elem"]
-            for i in elms_tetra4:
-                e = elms_tetra4[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3]], i)
-            elms_tetra10 = m["Tetra10Elem"]
-            for i in elms_tetra10:
-                e = elms_tetra10[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9]], i)
-            elms_penta15 = m["Penta15Elem"]
-            for i in elms_penta15:
-                e = elms_penta15[i]
-                mesh.addVolume(
-                    [
-                        e[0],
-                        e[1],
-                        e[2],
-                        e[3],
-                        e[4],
-                        e[5],
-                        e[6],
-                        e[7],
-                        e[8],
-                        e[9],
-                        e[10],
-                        e[11],
-                        e[12],
-                        e[13],
-                        e[14],
-                    ],
-                    i,
-                )
-            elms_hexa20 = m["Hexa20Elem"]
-            for i in elms_hexa20:
-                e = elms_hexa20[i]
-                mesh.addVolume(
-                    [
-                        e[0],
-                        e[1],
-                        e[2],
-                        e[3],
-                        e[4],
-                        e[5],
-                        e[6],
-                        e[7],
-                        e[8],
-                        e[9],
-                        e[10],
-                        e[11],
-                        e[12],
-                        e[13],
-                        e[14],
-                        e[15],
-                        e[16],
-                        e[17],
-                        e[18],
-                        e[19],
-                    ],
-                    i,
-                )
-            elms_tria3 = m["Tria3Elem"]
-            for i in elms_tria3:
-                e = elms_tria3[i]
-                mesh.addFace([e[0], e[1], e[2]], i)
-            elms_tria6 = m["Tria6Elem"]
-            for i in elms_tria6:
-                e = elms_tria6[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_quad4 = m["Quad4Elem"]
-            for i in elms_quad4:
-                e = elms_quad4[i]
-                mesh.addFace([e[0], e[1], e[2], e[3]], i)
-            elms_quad8 = m["Quad8Elem"]
-            for i in elms_quad8:
-                e = elms_quad8[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_seg2 = m["Seg2Elem"]
-            for i in elms_seg2:
-                e = elms_seg2[i]
-                mesh.addEdge([e[0], e[1]], i)
-            elms_seg3 = m["Seg3Elem"]
-            for i in elms_seg3:
-                e = elms_seg3[i]
-                mesh.addEdge([e[0], e[1], e[2]], i)
-            Console.PrintLog(
-                "imported mesh: {} nodes, {} HEXA8, {} PENTA6, {} TETRA4, {} TETRA10, {} PENTA15\n".format(
-                    len(nds),
-                    len(elms_hexa8),
-                    len(elms_penta6),
-                    len(elms_tetra4),
-                    len(elms_tetra10),
-                    len(elms_penta15),
-                )
-            )
-            Console.PrintLog(
-                "imported mesh: {} "
-                "HEXA20, {} TRIA3, {} TRIA6, {} QUAD4, {} QUAD8, {} SEG2, {} SEG3\n".format(
-                    len(elms_hexa20),
-                    len(elms_tria3),
-                    len(elms_tria6),
-                    len(elms_quad4),
-                    len(elms_quad8),
-                    len(elms_seg2),
-                    len(elms_seg3),
-                )
-            )
-        else:
+    if "node_ids" not in mesh_data:
+        if not ("Nodes" in mesh_data and len(mesh_data["Nodes"]) > 0):
+            Console.PrintError("No Nodes found!\n")
+            return mesh
+        if not any(key in mesh_data for key in MESH_DATA_BLOCKS):
             Console.PrintError("No Elements found!\n")
-    else:
+            return mesh
+        mesh_data = get_mesh_arrays(mesh_data)
+    if len(mesh_data["node_ids"]) == 0:
         Console.PrintError("No Nodes found!\n")
+        return mesh
+    block_names = mesharrays.get_block_names(mesh_data)
+    if not block_names:
+        Console.PrintError("No Elements found!\n")
+        return mesh
+
+    FreeCAD.Console.PrintLog("Found: nodes\n")
+    FreeCAD.Console.PrintLog("Found: elements\n")
+    mesharrays.add_mesh_arrays(mesh, mesh_data)
+    counts = {block_name: len(mesh_data[block_name + "_ids"]) for block_name in block_names}
+    Console.PrintLog(
+        "imported mesh: {} nodes, {}\n".format(
+            len(mesh_data["node_ids"]),
+            ", ".join(
+                "{} {}".format(counts.get(block_name, 0), key[: -len("Elem")].upper())
+                for key, block_name in MESH_DATA_BLOCKS.items()
+            ),
+        )
+    )
     return mesh
 
 
+def get_mesh_arrays(mesh_data):
+    """Returns the mesh arrays of femmesh.mesharrays for FEM Mesh data.
+
+    The node and the element entries of mesh_data are dicts {id: tuple}
+    or blocks with ids and data arrays like feminout.readCcxFrd.FrdBlock.
+    Empty element entries are left out.
+    """
+    node_ids, node_coords = _get_block_arrays(mesh_data["Nodes"], 3, np.float64)
+    mesh_arrays = {"node_ids": node_ids, "node_coords": node_coords}
+    for key, block_name in MESH_DATA_BLOCKS.items():
+        elements = mesh_data.get(key)
+        if elements is not None and len(elements) > 0:
+            node_count = mesharrays.get_block_kind(block_name)[1]
+            ids, connectivity = _get_block_arrays(elements, node_count, np.int64)
+            mesh_arrays[block_name + "_ids"] = ids
+            mesh_arrays[block_name + "_nodes"] = connectivity
+    return mesh_arrays
+
+
+def _get_block_arrays(block, columns, dtype):
+    if hasattr(block, "ids") and hasattr(block, "data"):
+        return (
+            np.asarray(block.ids, dtype=np.int64),
+            np.asarray(block.data, dtype=dtype).reshape(-1, columns),
+        )
+    count = len(block)
+    ids = np.fromiter(block.keys(), dtype=np.int64, count=count)
+    # the values may be tuples, lists or FreeCAD.Vector
+    data = np.fromiter(chain.from_iterable(block.values()), dtype=dtype, count=count * columns)
+    return ids, data.reshape(-1, columns)
+
+
 def make_dict_from_femmesh(femmesh):
     """
     Converts FemMesh into dictionary structure which can immediately used
@@ -353,6 +302,22 @@ def make_dict_from_femmesh(femmesh):
     return mesh_data
 
 
+def get_result_components(result_values, count):
+    """Returns one list per component of node result values.
+
+    result_values is either a dict {node: tuple} or a columnar block of
+    feminout.readCcxFrd, which already holds the values as NumPy array.
+    """
+    data = getattr(result_values, "data", None)
+    if data is not None:
+        return [data[:, i].tolist() for i in range(count)]
+    components = [[] for i in range(count)]
+    for values in result_values.values():
+        for i in range(count):
+            components[i].append(values[i])
+    return components
+
+
 def fill_femresult_mechanical(res_obj, result_set):
     """fills a FreeCAD FEM mechanical result object with result data"""
     if "number" in result_set:
@@ -378,21 +343,8 @@ def fill_femresult_mechanical(res_obj, result_set):
         # Should we check if the key in stress and strain dict
         # is the same as the number in NodeNumbers?
         if "stress" in result_set:
-            stress = result_set["stress"]
-            Sxx = []
-            Syy = []
-            Szz = []
-            Sxy = []
-            Sxz = []
-            Syz = []
             # values_S .. stress_tensor .. (Sxx, Syy, Szz, Sxy, Sxz, Syz)
-            for i, values_S in enumerate(stress.values()):
-                Sxx.append(values_S[0])
-                Syy.append(values_S[1])
-                Szz.append(values_S[2])
-                Sxy.append(values_S[3])
-                Sxz.append(values_S[4])
-                Syz.append(values_S[5])
+            Sxx, Syy, Szz, Sxy, Sxz, Syz = get_result_components(result_set["stress"], 6)
             res_obj.NodeStressXX = Sxx
             res_obj.NodeStressYY = Syy
             res_obj.NodeStressZZ = Szz
@@ -402,21 +354,8 @@ def fill_femresult_mechanical(res_obj, result_set):
 
         # fill res_obj.NodeStrainXX etc if they exist in result_set
         if "strain" in result_set:
-            strain = result_set["strain"]
-            Exx = []
-            Eyy = []
-            Ezz = []
-            Exy = []
-            Exz = []
-            Eyz = []
             # values_E .. straintuple .. (Exx, Eyy, Ezz, Exy, Exz, Eyz)
-            for i, values_E in enumerate(strain.values()):
-                Exx.append(values_E[0])
-                Eyy.append(values_E[1])
-                Ezz.append(values_E[2])
-                Exy.append(values_E[3])
-                Exz.append(values_E[4])
-                Eyz.append(values_E[5])
+            Exx, Eyy, Ezz, Exy, Exz, Eyz = get_result_components(result_set["strain"], 6)
             res_obj.NodeStrainXX = Exx
             res_obj.NodeStrainYY = Eyy
             res_obj.NodeStrainZZ = Ezz
@@ -131,7 +131,7 @@ def read(filename):
 
 def read_z88_mesh(z88_mesh_input):
     """reads a z88 mesh file z88i1.txt (Z88OSV14) or z88structure.txt (Z88AuroraV3)
-    and extracts the nodes and elements
+    and extracts the nodes and elements, returns the mesh arrays of femmesh.mesharrays
     """
     nodes = {}
     elements_hexa8 = {}
@@ -187,7 +187,7 @@ def read_z88_mesh(z88_mesh_input):
                 node_z = 0.0
             elif nodes_dimension == 3:
                 node_z = float(linecolumns[4])
-            nodes[node_no] = FreeCAD.Vector(node_x, node_y, node_z)
+            nodes[node_no] = (node_x, node_y, node_z)
 
         if lno >= elemts_first_line and lno <= elements_last_line:
             # first element line
@@ -364,29 +364,27 @@ def read_z88_mesh(z88_mesh_input):
                     Console.PrintError("Unknown element\n")
                     return {}
 
-    for n in nodes:
-        Console.PrintLog(str(n) + "  " + str(nodes[n]) + "\n")
-    for e in elements_tria6:
-        Console.PrintLog(str(e) + "  " + str(elements_tria6[e]) + "\n")
-    FreeCAD.Console.PrintLog("\n")
-
     z88_mesh_file.close()
 
-    return {
-        "Nodes": nodes,
-        "Seg2Elem": elements_seg2,
-        "Seg3Elem": elements_seg3,
-        "Tria3Elem": elements_tria3,
-        "Tria6Elem": elements_tria6,
-        "Quad4Elem": elements_quad4,
-        "Quad8Elem": elements_quad8,
-        "Tetra4Elem": elements_tetra4,
-        "Tetra10Elem": elements_tetra10,
-        "Hexa8Elem": elements_hexa8,
-        "Hexa20Elem": elements_hexa20,
-        "Penta6Elem": elements_penta6,
-        "Penta15Elem": elements_penta15,
-    }
+    from . import importToolsFem
+
+    return importToolsFem.get_mesh_arrays(
+        {
+            "Nodes": nodes,
+            "Seg2Elem": elements_seg2,
+            "Seg3Elem": elements_seg3,
+            "Tria3Elem": elements_tria3,
+            "Tria6Elem": elements_tria6,
+            "Quad4Elem": elements_quad4,
+            "Quad8Elem": elements_quad8,
+            "Tetra4Elem": elements_tetra4,
+            "Tetra10Elem": elements_tetra10,
+            "Hexa8Elem": elements_hexa8,
+            "Hexa20Elem": elements_hexa20,
+            "Penta6Elem": elements_penta6,
+            "Penta15Elem": elements_penta15,
+        }
+    )
 
 
 # ********* writer *******************************************************************************
@@ -0,0 +1,699 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Columnar reader for Calculix frd file format"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## @package readCcxFrd
+#  \ingroup FEM
+#  \brief Columnar NumPy based reader for CalculiX frd result files
+#
+#  The frd ASCII format stores all records in fixed width columns. Instead of
+#  slicing every line with int() and float() this reader memory maps the file,
+#  locates the line starts once and parses each block of records in bulk by
+#  gathering the fixed width columns into NumPy byte string arrays.
+#  The returned data has the same structure as the one of
+#  importCcxFrdResults.read_frd_result(), but every node, element or result
+#  block is a FrdBlock holding NumPy arrays instead of a Python dict.
+
+import mmap
+import os
+from collections import OrderedDict
+from collections import namedtuple
+
+import numpy as np
+
+from FreeCAD import Console
+from builtins import open as pyopen
+
+
+# number of records parsed at once, bounds the size of the temporary arrays
+_CHUNK_RECORDS = 1 << 18
+
+# number of bytes searched for line ends at once
+_CHUNK_BYTES = 1 << 26
+
+_NEWLINE = ord("\n")
+_SPACE = ord(" ")
+_MINUS = ord("-")
+_PLUS = ord("+")
+_DOT = ord(".")
+_E = ord("E")
+_ZERO = ord("0")
+_ONE = ord("1")
+_TWO = ord("2")
+
+# exact powers of ten as double, 10**22 is the largest one
+_POWERS_OF_TEN = np.array([float(10**i) for i in range(23)])
+
+# positions of the mantissa digits in a " 1.23456E+01" field
+_MANTISSA_COLUMNS = [1, 3, 4, 5, 6, 7]
+
+# frd element type: (mesh data key, number of nodes, FreeCAD node order)
+# node order fits with node order in writeAbaqus() in FemMesh.cpp
+# for the reasons of the hexa20, penta15 and seg3 orders
+# see the notes in importCcxFrdResults.read_frd_result()
+FRD_ELEMENT_TYPES = {
+    1: ("Hexa8Elem", 8, (5, 6, 7, 4, 1, 2, 3, 0)),
+    2: ("Penta6Elem", 6, (4, 5, 3, 1, 2, 0)),
+    3: ("Tetra4Elem", 4, (1, 0, 2, 3)),
+    4: (
+        "Hexa20Elem",
+        20,
+        (7, 4, 5, 6, 3, 0, 1, 2, 19, 16, 17, 18, 11, 8, 9, 10, 15, 12, 13, 14),
+    ),
+    5: ("Penta15Elem", 15, (4, 5, 3, 1, 2, 0, 13, 14, 12, 7, 8, 6, 10, 11, 9)),
+    6: ("Tetra10Elem", 10, (1, 0, 2, 3, 4, 6, 5, 8, 7, 9)),
+    7: ("Tria3Elem", 3, (0, 1, 2)),
+    8: ("Tria6Elem", 6, (0, 1, 2, 3, 4, 5)),
+    9: ("Quad4Elem", 4, (0, 1, 2, 3)),
+    10: ("Quad8Elem", 8, (0, 1, 2, 3, 4, 5, 6, 7)),
+    11: ("Seg2Elem", 2, (0, 1)),
+    12: ("Seg3Elem", 3, (0, 1, 2)),
+}
+
+# frd result block name: (name, result set key, number of values, column order, factor)
+# CalculiX frd files: (Sxx, Syy, Szz, Sxy, Syz, Szx)
+# FreeCAD:            (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+# thus exchange the last two entries of stress and strain
+# the checks are done in the same order as in importCcxFrdResults.read_frd_result()
+FRD_RESULT_FIELDS = (
+    ("DISP", "disp", 3, None, 1.0),
+    ("STRESS", "stress", 6, (0, 1, 2, 3, 5, 4), 1.0),
+    ("TOSTRAIN", "strain", 6, (0, 1, 2, 3, 5, 4), 1.0),
+    ("PE", "peeq", 1, None, 1.0),
+    ("NDTEMP", "temp", 1, None, 1.0),
+    ("FLUX", "heatflux", 3, None, 1.0),
+    # convert units to kg/s from t/s
+    ("MAFLOW", "mflow", 1, None, 1000.0),
+    ("STPRES", "npressure", 1, None, 1.0),
+)
+
+
+# byte range of the records of a not yet parsed result block
+FrdBlockRef = namedtuple("FrdBlockRef", ["field", "begin", "end"])
+
+
+class FrdBlock:
+    """Node, element or result block of an frd file held as NumPy arrays.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray
+        node or element numbers, shape (N,)
+    data : numpy.ndarray
+        one row per id, shape (N,) for scalar and (N, k) for vector,
+        tensor or connectivity data
+
+    The block implements the read only mapping protocol {id: row}, thus
+    code written for the dicts returned by the legacy frd reader works
+    unchanged. Code which knows about FrdBlock should use the arrays.
+    """
+
+    __slots__ = ("ids", "data", "_index")
+
+    def __init__(self, ids, data):
+        self.ids = ids
+        self.data = data
+        self._index = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids.tolist())
+
+    def __contains__(self, key):
+        return key in self._get_index()
+
+    def __getitem__(self, key):
+        row = self.data[self._get_index()[key]]
+        if self.data.ndim == 1:
+            return row.item()
+        return tuple(row.tolist())
+
+    def __repr__(self):
+        return f"FrdBlock({len(self.ids)} ids, data shape {self.data.shape})"
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = dict(zip(self.ids.tolist(), range(len(self.ids))))
+        return self._index
+
+    def keys(self):
+        return self.ids.tolist()
+
+    def values(self):
+        if self.data.ndim == 1:
+            return self.data.tolist()
+        return list(map(tuple, self.data.tolist()))
+
+    def items(self):
+        return list(zip(self.keys(), self.values()))
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def column(self, index):
+        """Returns the values of one component as a list of floats."""
+        if self.data.ndim == 1:
+            return self.data.tolist()
+        return self.data[:, index].tolist()
+
+
+def _empty_block(columns=0, dtype=np.float64):
+    shape = (0, columns) if columns else (0,)
+    return FrdBlock(np.empty(0, dtype=np.int64), np.empty(shape, dtype=dtype))
+
+
+def _concat_blocks(blocks):
+    if len(blocks) == 1:
+        return blocks[0]
+    return FrdBlock(
+        np.concatenate([b.ids for b in blocks]),
+        np.concatenate([b.data for b in blocks]),
+    )
+
+
+def get_line_starts(buf):
+    """Returns the byte offsets of all line starts of a memory mapped file.
+
+    buf is a numpy.uint8 view of the file. The search for the line ends
+    is done in chunks to keep the temporary boolean array small.
+    """
+    parts = [np.zeros(1, dtype=np.int64)]
+    size = len(buf)
+    for begin in range(0, size, _CHUNK_BYTES):
+        chunk = buf[begin : begin + _CHUNK_BYTES]
+        parts.append(np.flatnonzero(chunk == _NEWLINE).astype(np.int64) + (begin + 1))
+    starts = np.concatenate(parts)
+    # a newline at the very end of the file does not start a new line
+    if len(starts) > 1 and starts[-1] >= size:
+        starts = starts[:-1]
+    return starts
+
+
+def get_data_line_mask(buf, starts):
+    """Returns a bool array, True for the " -1" and " -2" record lines."""
+    size = len(buf)
+    second = buf[np.minimum(starts + 1, size - 1)]
+    third = buf[np.minimum(starts + 2, size - 1)]
+    return (second == _MINUS) & ((third == _ONE) | (third == _TWO)) & (starts + 2 < size)
+
+
+def parse_columns(buf, starts, offset, width, count, dtype):
+    """Parses fixed width columns of many lines at once.
+
+    Parameters
+    ----------
+    buf : numpy.ndarray
+        numpy.uint8 view of the frd file
+    starts : numpy.ndarray
+        byte offsets of the lines to parse
+    offset : int
+        column of the first field
+    width : int
+        width of every field
+    count : int
+        number of consecutive fields
+    dtype : numpy.dtype
+        numpy.int64 or numpy.float64
+
+    Returns an array of shape (len(starts), count).
+    """
+    result = np.empty((len(starts), count), dtype=dtype)
+    for begin in range(0, len(starts), _CHUNK_RECORDS):
+        chunk = starts[begin : begin + _CHUNK_RECORDS]
+        chars = _get_chars(buf, chunk, offset, width * count).reshape(-1, width)
+        if dtype == np.int64:
+            values = _chars_to_int(chars)
+        else:
+            values = _chars_to_float(chars)
+        result[begin : begin + len(chunk)] = values.reshape(-1, count)
+    return result
+
+
+def _get_chars(buf, starts, offset, length):
+    # consecutive lines of equal length, e.g. all records of a nodes or a result block,
+    # are a 2D view into the file, otherwise the columns are gathered line by line
+    record_length = int(starts[1] - starts[0]) if len(starts) > 1 else 0
+    end = int(starts[-1]) + record_length
+    if (
+        record_length >= offset + length
+        and end <= len(buf)
+        and buf[end - 1] == _NEWLINE
+        and (np.diff(starts) == record_length).all()
+    ):
+        records = buf[int(starts[0]) : end].reshape(-1, record_length)
+        return np.ascontiguousarray(records[:, offset : offset + length])
+    positions = starts[:, None] + np.arange(offset, offset + length, dtype=np.int64)
+    np.minimum(positions, len(buf) - 1, out=positions)
+    return buf[positions]
+
+
+def _chars_to_int(chars):
+    # right aligned integer fields, the digits are summed up with their place value
+    digits = chars - np.uint8(_ZERO)
+    is_digit = digits <= 9
+    if not (is_digit | (chars == _SPACE) | (chars == _MINUS)).all():
+        # something unexpected, let NumPy parse and raise on wrong values
+        return chars.view(f"S{chars.shape[1]}")[:, 0].astype(np.int64)
+    digits = np.where(is_digit, digits, 0).astype(np.int64)
+    values = np.zeros(len(chars), dtype=np.int64)
+    for column in range(chars.shape[1]):
+        values *= 10
+        values += digits[:, column]
+    return np.where((chars == _MINUS).any(axis=1), -values, values)
+
+
+def _chars_to_float(chars):
+    # CalculiX writes the values with "%12.5E", e.g. " 1.23456E+01"
+    # mantissa and exponent are parsed by their fixed positions, the value is
+    # mantissa * 10**exp or mantissa / 10**-exp which is the correctly rounded
+    # value as long as the power of ten is exact, thus identical to float()
+    # every field not matching the layout is parsed by NumPy
+    if chars.shape[1] != 12:
+        return chars.view(f"S{chars.shape[1]}")[:, 0].astype(np.float64)
+    digits = chars - np.uint8(_ZERO)
+    mantissa_digits = digits[:, _MANTISSA_COLUMNS]
+    exponent_digits = digits[:, 10:12]
+    exponent_sign = chars[:, 9]
+    is_negative = chars[:, 0] == _MINUS
+    matches = (
+        ((chars[:, 0] == _SPACE) | is_negative)
+        & (chars[:, 2] == _DOT)
+        & (chars[:, 8] == _E)
+        & ((exponent_sign == _PLUS) | (exponent_sign == _MINUS))
+        & (mantissa_digits <= 9).all(axis=1)
+        & (exponent_digits <= 9).all(axis=1)
+    )
+    mantissa_digits = mantissa_digits.astype(np.int32)
+    mantissa = mantissa_digits[:, 0]
+    for column in range(1, 6):
+        mantissa = mantissa * 10 + mantissa_digits[:, column]
+    exponent = exponent_digits[:, 0].astype(np.int16) * 10 + exponent_digits[:, 1]
+    exponent = np.where(exponent_sign == _MINUS, -exponent, exponent) - 5
+    exponent_abs = np.abs(exponent)
+    matches &= exponent_abs < len(_POWERS_OF_TEN)
+    power = _POWERS_OF_TEN[np.minimum(exponent_abs, len(_POWERS_OF_TEN) - 1)]
+    mantissa = mantissa.astype(np.float64)
+    values = np.where(exponent >= 0, mantissa * power, mantissa / power)
+    np.negative(values, out=values, where=is_negative)
+    if not matches.all():
+        others = ~matches
+        values[others] = chars[others].view("S12")[:, 0].astype(np.float64)
+    return values
+
+
+def parse_nodes(buf, starts):
+    """Parses the " -1" lines of a nodes block."""
+    ids = parse_columns(buf, starts, 3, 10, 1, np.int64)[:, 0]
+    coords = parse_columns(buf, starts, 13, 12, 3, np.float64)
+    return FrdBlock(ids, coords)
+
+
+def parse_elements(buf, starts, inout_nodes=None):
+    """Parses the " -1" and " -2" lines of an elements block.
+
+    Returns a dict {mesh data key: FrdBlock} with the connectivity
+    already in FreeCAD node order.
+    """
+    elements = {}
+    size = len(buf)
+    is_header = buf[np.minimum(starts + 2, size - 1)] == _ONE
+    headers = np.flatnonzero(is_header)
+    if not len(headers):
+        return elements
+    head_starts = starts[headers]
+    ele_ids = parse_columns(buf, head_starts, 3, 10, 1, np.int64)[:, 0]
+    ele_types = parse_columns(buf, head_starts, 13, 5, 1, np.int64)[:, 0]
+    for ele_type in np.unique(ele_types).tolist():
+        if ele_type not in FRD_ELEMENT_TYPES:
+            Console.PrintWarning(f"FEM: frd element type {ele_type} is not supported.\n")
+            continue
+        key, node_count, order = FRD_ELEMENT_TYPES[ele_type]
+        selected = headers[ele_types == ele_type]
+        parts = []
+        for line_offset, first_node in enumerate(range(0, node_count, 10), start=1):
+            count = min(10, node_count - first_node)
+            parts.append(parse_columns(buf, starts[selected + line_offset], 3, 10, count, np.int64))
+        connectivity = np.hstack(parts)[:, order]
+        block = FrdBlock(ele_ids[ele_types == ele_type], connectivity)
+        if ele_type == 12 and inout_nodes:
+            block = _seg3_inout_block(block, inout_nodes)
+        elements[key] = block
+    return elements
+
+
+def _seg3_inout_block(block, inout_nodes):
+    # fluid inlet and outlet node numbering of D elements
+    # 1D flow networks are small, thus this is done in Python
+    inout = [(int(row[1]), int(row[2])) for row in inout_nodes]
+    ids = []
+    conn = []
+    for ele, (nd1, nd2, nd3) in zip(block.ids.tolist(), block.data.tolist()):
+        for node, new_node in inout:
+            if nd1 == node:
+                ids.append(ele)
+                conn.append((new_node, nd3, nd1))
+            elif nd3 == node:
+                ids.append(ele)
+                conn.append((nd1, new_node, nd3))
+    if not ids:
+        return _empty_block(3, np.int64)
+    return FrdBlock(np.array(ids, dtype=np.int64), np.array(conn, dtype=np.int64))
+
+
+def parse_result(buf, starts, field, inout_nodes=None):
+    """Parses the " -1" lines of a nodal result block.
+
+    field is an entry of FRD_RESULT_FIELDS. Continuation lines (" -2")
+    are only written for more than six components and are skipped.
+    """
+    name, key, count, order, factor = field
+    size = len(buf)
+    starts = starts[buf[np.minimum(starts + 2, size - 1)] == _ONE]
+    ids = parse_columns(buf, starts, 3, 10, 1, np.int64)[:, 0]
+    values = parse_columns(buf, starts, 13, 12, count, np.float64)
+    if order is not None:
+        values = values[:, order]
+    if factor != 1.0:
+        values *= factor
+    if count == 1:
+        values = values[:, 0]
+    block = FrdBlock(ids, values)
+    if inout_nodes and key in ("mflow", "npressure"):
+        block = _inout_result_block(block, inout_nodes)
+    return block
+
+
+def parse_block_ref(buf, block_ref, inout_nodes=None):
+    """Parses a result block recorded by the lazy index pass."""
+    if block_ref.begin == block_ref.end:
+        starts = np.empty(0, dtype=np.int64)
+    else:
+        starts = get_line_starts(buf[block_ref.begin : block_ref.end]) + block_ref.begin
+    return parse_result(buf, starts, block_ref.field, inout_nodes)
+
+
+def _inout_result_block(block, inout_nodes):
+    # values of the inlet and outlet nodes of 1D flow networks
+    # are copied to the additional nodes, see read_frd_result()
+    values = dict(zip(block.ids.tolist(), block.data.tolist()))
+    for node, value in list(values.items()):
+        for row in inout_nodes:
+            if node == int(row[1]):
+                values[int(row[2])] = value
+    return FrdBlock(
+        np.fromiter(values.keys(), dtype=np.int64, count=len(values)),
+        np.fromiter(values.values(), dtype=np.float64, count=len(values)),
+    )
+
+
+def get_result_field(line):
+    """Returns the FRD_RESULT_FIELDS entry of a " -4" line or None."""
+    for field in FRD_RESULT_FIELDS:
+        name = field[0]
+        if line[5 : 5 + len(name)] == name:
+            return field
+    return None
+
+
+def read_inout_nodes(frd_input):
+    """Reads the special 1DFlow nodes data file written next to the frd file."""
+    inout_nodes = []
+    inout_nodes_file = frd_input.rsplit(".", 1)[0] + "_inout_nodes.txt"
+    if os.path.exists(inout_nodes_file):
+        Console.PrintMessage(f"Read special 1DFlow nodes data form: {inout_nodes_file}\n")
+        with pyopen(inout_nodes_file, "r") as f:
+            for line in f.readlines():
+                inout_nodes.append(line.split(","))
+        Console.PrintMessage(f"{inout_nodes}\n")
+    return inout_nodes
+
+
+def iter_control_lines(buf, starts):
+    """Yields (line index, line text) of all lines which are not records.
+
+    These are the few header, step and end of block lines which drive
+    the block structure of the file.
+    """
+    ends = np.append(starts[1:], len(buf))
+    control = np.flatnonzero(~get_data_line_mask(buf, starts))
+    for index in control.tolist():
+        text = buf[starts[index] : ends[index]].tobytes().decode("latin-1").rstrip("\r\n")
+        yield index, text
+
+
+def read_frd_result(frd_input):
+    """Reads a CalculiX frd result file into NumPy arrays.
+
+    Parameters
+    ----------
+    frd_input : str
+        path of the frd file
+
+    Returns the same dict as importCcxFrdResults.read_frd_result(),
+    "Nodes" and every element entry are FrdBlock and every result set
+    in "Results" is a dict with "number", "time" and FrdBlock values.
+    """
+    Console.PrintMessage(f"Read ccx results from frd file (columnar): {frd_input}\n")
+    return _read_frd(frd_input, read_inout_nodes(frd_input), False)
+
+
+def _read_frd(frd_input, inout_nodes, lazy):
+    mesh_data = {key: [] for key, count, order in FRD_ELEMENT_TYPES.values()}
+    nodes = []
+    results = []
+
+    with pyopen(frd_input, "rb") as frd_file:
+        if os.fstat(frd_file.fileno()).st_size == 0:
+            Console.PrintError("FEM: No nodes found in Frd file.\n")
+            return _make_mesh_data([], mesh_data, results)
+        with mmap.mmap(frd_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            result_sets = iter_result_sets(buf, get_line_starts(buf), inout_nodes, lazy)
+            try:
+                for result_set in result_sets:
+                    if "Nodes" in result_set:
+                        nodes.append(result_set["Nodes"])
+                    elif "Elements" in result_set:
+                        for key, block in result_set["Elements"].items():
+                            mesh_data[key].append(block)
+                    else:
+                        results.append(result_set)
+            finally:
+                # release all numpy views, otherwise the mmap can not be closed
+                result_sets.close()
+                del result_sets
+                del buf
+
+    if not inout_nodes:
+        if results:
+            if "mflow" in results[0] or "npressure" in results[0]:
+                Console.PrintError("We have mflow or npressure, but no inout_nodes file.\n")
+    if not nodes:
+        Console.PrintError("FEM: No nodes found in Frd file.\n")
+
+    return _make_mesh_data(nodes, mesh_data, results)
+
+
+def _make_mesh_data(nodes, mesh_data, results):
+    data = {"Nodes": _concat_blocks(nodes) if nodes else _empty_block(3)}
+    for key, node_count, order in FRD_ELEMENT_TYPES.values():
+        blocks = mesh_data[key]
+        data[key] = _concat_blocks(blocks) if blocks else _empty_block(node_count, np.int64)
+    data["Results"] = results
+    return data
+
+
+def iter_result_sets(buf, starts, inout_nodes=None, lazy=False):
+    """Walks the control lines of an frd file and parses its blocks.
+
+    Yields {"Nodes": FrdBlock} and {"Elements": {key: FrdBlock}} for the
+    mesh blocks and one dict per result set. A result set is finished
+    by the same rules as in importCcxFrdResults.read_frd_result(): if
+    the eigenmode number or the step time increases or the end of the
+    frd data is found after the end of a result block.
+    If lazy is True, the result blocks are not parsed, a FrdBlockRef
+    with the byte range of the records is stored instead.
+    """
+    mode_results = {"number": float("NaN"), "time": float("NaN")}
+    block_kind = None
+    field = None
+    previous_index = -1
+    mode_time_found = False
+    end_of_section_found = False
+    node_element_section = False
+    eigenmode = 0
+    timestep = 0
+
+    for index, line in iter_control_lines(buf, starts):
+        mode_eigen_changed = False
+        mode_time_changed = False
+        end_of_frd_data_found = False
+
+        if line[4:6] == "2C":
+            block_kind = "nodes"
+        elif line[4:6] == "3C":
+            block_kind = "elements"
+
+        # Check if we found new eigenmode line
+        if line[5:10] == "PMODE":
+            eigentemp = int(line[30:36])
+            if eigentemp > eigenmode:
+                eigenmode = eigentemp
+                mode_eigen_changed = True
+
+        # Check if we found new time step
+        if line[4:10] == "1PSTEP":
+            mode_time_found = True
+        if mode_time_found and line[2:7] == "100CL":
+            timetemp = float(line[13:25])
+            if timetemp > timestep:
+                timestep = timetemp
+                mode_time_changed = True
+
+        if line[1:3] == "-4":
+            field = get_result_field(line)
+            block_kind = "result" if field else "unknown"
+
+        # end of a block, the records are the lines since the last control line
+        if line[1:3] == "-3":
+            end_of_section_found = True
+            records = starts[previous_index + 1 : index]
+            if block_kind == "nodes":
+                yield {"Nodes": parse_nodes(buf, records)}
+                node_element_section = True
+            elif block_kind == "elements":
+                yield {"Elements": parse_elements(buf, records, inout_nodes)}
+                node_element_section = True
+            elif block_kind == "result":
+                if lazy:
+                    begin = int(records[0]) if len(records) else int(starts[index])
+                    block = FrdBlockRef(field, begin, int(starts[index]))
+                else:
+                    block = parse_result(buf, records, field, inout_nodes)
+                mode_results[field[1]] = block
+                node_element_section = False
+            block_kind = None
+            field = None
+
+        # Check if we found the end of frd data
+        if line[1:5] == "9999":
+            end_of_frd_data_found = True
+
+        if (
+            (mode_eigen_changed or mode_time_changed or end_of_frd_data_found)
+            and end_of_section_found
+            and not node_element_section
+        ):
+            yield mode_results
+            mode_results = {"number": float("NaN"), "time": float("NaN")}
+            end_of_section_found = False
+
+        if mode_eigen_changed:
+            mode_results["number"] = eigenmode
+        if mode_time_changed:
+            mode_results["time"] = timestep
+            mode_time_found = False
+
+        previous_index = index
+
+
+class FrdResultIndex:
+    """Index of the result blocks of an frd file for on demand parsing.
+
+    Parameters
+    ----------
+    frd_input : str
+        path of the frd file
+    cache_size : int
+        number of parsed result sets which are kept in memory
+
+    The index pass parses the mesh and records the byte range of every
+    result block, grouped into result sets by the same rules as
+    read_frd_result(). A result set is parsed when it is requested
+    by get_result_set(), the least recently used ones are dropped.
+    """
+
+    def __init__(self, frd_input, cache_size=2):
+        Console.PrintMessage(f"Index ccx results of frd file: {frd_input}\n")
+        self.frd_input = frd_input
+        self.cache_size = max(1, cache_size)
+        self.inout_nodes = read_inout_nodes(frd_input)
+        self.file_stamp = self._get_file_stamp()
+        data = _read_frd(frd_input, self.inout_nodes, True)
+        self.result_sets = data.pop("Results")
+        self.mesh_data = data
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.result_sets)
+
+    def _get_file_stamp(self):
+        stat = os.stat(self.frd_input)
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def get_mesh_data(self):
+        """Returns the mesh data and the result set infos, see read_frd_result().
+
+        The "Results" entries only contain "number" and "time".
+        """
+        data = dict(self.mesh_data)
+        data["Results"] = [self.get_info(i) for i in range(len(self))]
+        return data
+
+    def get_info(self, set_number):
+        """Returns the "number" and "time" of a result set without parsing it."""
+        result_set = self.result_sets[set_number]
+        return {"number": result_set["number"], "time": result_set["time"]}
+
+    def get_result_set(self, set_number):
+        """Returns a parsed result set, like one of read_frd_result()["Results"]."""
+        if set_number in self._cache:
+            self._cache.move_to_end(set_number)
+            return self._cache[set_number]
+        if self._get_file_stamp() != self.file_stamp:
+            raise RuntimeError(f"frd file was changed after indexing: {self.frd_input}")
+
+        Console.PrintLog(f"Parse result set {set_number} of frd file: {self.frd_input}\n")
+        result_set = {}
+        with pyopen(self.frd_input, "rb") as frd_file:
+            with mmap.mmap(frd_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                buf = np.frombuffer(mm, dtype=np.uint8)
+                try:
+                    for key, value in self.result_sets[set_number].items():
+                        if isinstance(value, FrdBlockRef):
+                            value = parse_block_ref(buf, value, self.inout_nodes)
+                        result_set[key] = value
+                finally:
+                    del buf
+
+        self._cache[set_number] = result_set
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result_set
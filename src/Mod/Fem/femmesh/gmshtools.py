@@ -37,6 +37,7 @@ from FreeCAD import Console
 from FreeCAD import Units
 
 import Fem
+from . import meshcache
 from . import meshtools
 from femtools import femutils
 from femtools import geomtools
@@ -69,6 +70,11 @@ class GmshTools:
         self.load_properties()
         self.error = False
 
+        # False bypasses the mesh cache, see femmesh.meshcache
+        self.use_mesh_cache = True
+        self.mesh_cache_lookup = None
+        self.mesh_from_cache = False
+
     def load_properties(self):
         # part to mesh
         self.part_obj = self.mesh_obj.Shape
@@ -217,8 +223,12 @@ class GmshTools:
         self.get_tmp_file_paths()
         self.get_gmsh_command()
         self.write_gmsh_input_files()
+        self.lookup_mesh_cache()
 
     def compute(self):
+        if self.mesh_from_cache:
+            # the process is not started, update_properties() reads the cached mesh
+            return self.process
         log_level = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh").GetString(
             "LogVerbosity", "3"
         )
@@ -228,6 +238,7 @@ class GmshTools:
 
     def update_properties(self):
         self.mesh_obj.FemMesh = Fem.read(self.temp_file_mesh)
+        self.store_mesh_cache()
 
     def create_mesh(self):
         try:
@@ -235,8 +246,14 @@ class GmshTools:
             self.get_tmp_file_paths()
             self.get_gmsh_command()
             self.write_gmsh_input_files()
-            error = self.run_gmsh_with_geo()
+            self.lookup_mesh_cache()
+            if self.mesh_from_cache:
+                error = ""
+            else:
+                error = self.run_gmsh_with_geo()
             self.read_and_set_new_mesh()
+            if not self.error:
+                self.store_mesh_cache()
         except GmshError as e:
             error = str(e)
         return error
@@ -969,6 +986,29 @@ class GmshTools:
 
         return new_err
 
+    def get_mesh_key_parts(self):
+        # the geo file holds all mesh parameters, its comments only the file paths
+        with open(self.temp_file_geo) as f:
+            geo = "".join(line for line in f if not line.startswith("//"))
+        with open(self.temp_file_geometry, "rb") as f:
+            brep = f.read()
+        return (self.name, geo, brep, meshcache.get_mesher_version(self.gmsh_bin))
+
+    def lookup_mesh_cache(self):
+        # on a hit the cached mesh is copied to the mesh file and Gmsh does not need to run
+        self.mesh_cache_lookup = None
+        if self.use_mesh_cache:
+            self.mesh_cache_lookup = meshcache.lookup(
+                self.temp_file_mesh, ".unv", self.get_mesh_key_parts
+            )
+        self.mesh_from_cache = bool(self.mesh_cache_lookup and self.mesh_cache_lookup.hit)
+        if self.mesh_from_cache:
+            Console.PrintMessage("  Mesh of unchanged geometry and parameters taken from cache.\n")
+
+    def store_mesh_cache(self):
+        if self.mesh_cache_lookup:
+            self.mesh_cache_lookup.store()
+
     def read_and_set_new_mesh(self):
         if not self.error:
             fem_mesh = Fem.read(self.temp_file_mesh)
@@ -0,0 +1,195 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM mesh arrays"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+# A FEM mesh held as NumPy arrays, a dict of
+#     "node_ids": (N,) int, "node_coords": (N, 3) float
+#     and per element block, for example "Volume10":
+#     "Volume10_ids": (M,) int, "Volume10_nodes": (M, 10) int
+# The arrays are saved as .npz file, which loads much faster than
+# a Python module with one femmesh.addNode() call per node.
+# This module does not need FreeCAD, besides make_femmesh and add_mesh_arrays.
+
+import numpy as np
+
+
+# the FemMesh add methods are addEdge, addEdgeList, addFace ...
+ELEMENT_KINDS = ("Edge", "Face", "Volume")
+
+
+def get_block_names(mesh_arrays):
+    """Returns the element block names of mesh arrays, for example ["Volume10"]."""
+    block_names = []
+    for key in mesh_arrays:
+        if key.endswith("_ids") and key[: -len("_ids")].rstrip("0123456789") in ELEMENT_KINDS:
+            block_names.append(key[: -len("_ids")])
+    return block_names
+
+
+def get_block_kind(block_name):
+    """Returns the kind and the node count of a block name, "Volume10" --> ("Volume", 10)."""
+    kind = block_name.rstrip("0123456789")
+    return kind, int(block_name[len(kind) :])
+
+
+class MeshRecorder:
+    """Records the add calls of FemMesh creating code into mesh arrays.
+
+    The recorder is used instead of a Fem.FemMesh, for example for the
+    create_nodes() and create_elements() functions of the femexamples mesh
+    modules, thus no FreeCAD is needed to convert them.
+    """
+
+    def __init__(self):
+        self.node_ids = []
+        self.node_coords = []
+        self.blocks = {}
+
+    def addNode(self, x, y, z, node_id):
+        self.node_ids.append(node_id)
+        self.node_coords.append((x, y, z))
+        return node_id
+
+    def _add_element(self, kind, nodes, element_id):
+        ids, connectivity = self.blocks.setdefault(f"{kind}{len(nodes)}", ([], []))
+        ids.append(element_id)
+        connectivity.append(nodes)
+        return element_id
+
+    def addEdge(self, nodes, element_id):
+        return self._add_element("Edge", nodes, element_id)
+
+    def addFace(self, nodes, element_id):
+        return self._add_element("Face", nodes, element_id)
+
+    def addVolume(self, nodes, element_id):
+        return self._add_element("Volume", nodes, element_id)
+
+    def get_mesh_arrays(self):
+        mesh_arrays = {
+            "node_ids": np.array(self.node_ids, dtype=np.int64),
+            "node_coords": np.array(self.node_coords, dtype=np.float64).reshape(-1, 3),
+        }
+        for block_name, (ids, connectivity) in self.blocks.items():
+            mesh_arrays[block_name + "_ids"] = np.array(ids, dtype=np.int64)
+            mesh_arrays[block_name + "_nodes"] = np.array(connectivity, dtype=np.int64)
+        return mesh_arrays
+
+
+def record_mesh_module(module):
+    """Returns the mesh arrays of a module with create_nodes() and create_elements()."""
+    recorder = MeshRecorder()
+    if not module.create_nodes(recorder) or not module.create_elements(recorder):
+        raise ValueError(f"Mesh module {module.__name__} did not create its mesh.")
+    return recorder.get_mesh_arrays()
+
+
+def save_npz(file_name, mesh_arrays):
+    """Saves mesh arrays compressed to an .npz file."""
+    np.savez_compressed(file_name, **mesh_arrays)
+
+
+def load_npz(file_name):
+    """Returns the mesh arrays of an .npz file."""
+    with np.load(file_name, allow_pickle=False) as npz:
+        return {key: npz[key] for key in npz.files}
+
+
+def make_femmesh(mesh_arrays):
+    """Returns a new Fem.FemMesh made from mesh arrays."""
+    import Fem
+
+    femmesh = Fem.FemMesh()
+    add_mesh_arrays(femmesh, mesh_arrays)
+    return femmesh
+
+
+def add_mesh_arrays(femmesh, mesh_arrays):
+    """Adds the nodes and the elements of mesh arrays to a Fem.FemMesh.
+
+    The nodes and the elements keep their ids. The nodes are added with
+    one addNodeList call and the elements with one addVolumeList,
+    addFaceList or addEdgeList call per block, the ids do not need to
+    be sequential. If a list call raises a TypeError before it added
+    anything, for example with a FemMesh without the list methods with
+    ids, the nodes or the elements of the block are added one by one.
+    """
+    node_ids = mesh_arrays["node_ids"].tolist()
+    node_coords = mesh_arrays["node_coords"]
+    node_count_before = femmesh.NodeCount
+    try:
+        new_ids = femmesh.addNodeList(node_coords.ravel().tolist(), node_ids)
+    except (AttributeError, TypeError) as e:
+        if femmesh.NodeCount != node_count_before:
+            raise
+        _print_list_call_error("nodes", e)
+        add_node = femmesh.addNode
+        for node_id, (x, y, z) in zip(node_ids, node_coords.tolist()):
+            add_node(x, y, z, node_id)
+    else:
+        if new_ids != node_ids:
+            raise RuntimeError("Unexpected node ids on adding the nodes.")
+
+    # blocks in the order of their first element id
+    blocks = []
+    for block_name in get_block_names(mesh_arrays):
+        ids = mesh_arrays[block_name + "_ids"]
+        if len(ids):
+            blocks.append((int(ids[0]), block_name, ids, mesh_arrays[block_name + "_nodes"]))
+    blocks.sort()
+
+    for first_id, block_name, ids, connectivity in blocks:
+        kind, node_count = get_block_kind(block_name)
+        element_count = getattr(femmesh, f"{kind}Count")
+        add_list = getattr(femmesh, f"add{kind}List")
+        ids = ids.tolist()
+        try:
+            new_ids = add_list(connectivity.ravel().tolist(), [node_count] * len(ids), ids)
+        except TypeError as e:
+            # the list call failed on an element, not on its arguments
+            if getattr(femmesh, f"{kind}Count") != element_count:
+                raise
+            _print_list_call_error(block_name, e)
+            add_element = getattr(femmesh, f"add{kind}")
+            for element_id, nodes in zip(ids, connectivity.tolist()):
+                add_element(nodes, element_id)
+        else:
+            if new_ids != ids:
+                raise RuntimeError(f"Unexpected element ids on adding {block_name} elements.")
+
+
+def _print_list_call_error(what, error):
+    import FreeCAD
+
+    FreeCAD.Console.PrintLog(
+        f"Adding the {what} with one call failed, adding them one by one: {error}\n"
+    )
+
+
+##  @}
@@ -0,0 +1,234 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM mesh cache"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+
+import FreeCAD
+
+from femtools import femutils
+
+
+# the cache is configured in the FEM general preferences
+#     MeshCache: bool, default True, False bypasses the cache
+#     MeshCacheSize: int, maximum size of all cached meshes in MB
+#     MeshCacheDir: string, default is a directory in the user cache path
+PREFS = "User parameter:BaseApp/Preferences/Mod/Fem/General"
+DEFAULT_SIZE = 500
+
+# (binary, mtime, size): version string
+_mesher_versions = {}
+
+
+def get_mesh_cache():
+    """Returns the MeshCache of the preferences or None if the cache is switched off."""
+    prefs = FreeCAD.ParamGet(PREFS)
+    if not prefs.GetBool("MeshCache", True):
+        return None
+    cache_dir = prefs.GetString("MeshCacheDir", "")
+    if not cache_dir:
+        cache_dir = os.path.join(FreeCAD.getUserCachePath(), "FemMeshCache")
+    return MeshCache(cache_dir, prefs.GetInt("MeshCacheSize", DEFAULT_SIZE) * 1024 * 1024)
+
+
+def lookup(result_file, suffix, get_key_parts):
+    """Looks for a cached result file of a mesher run.
+
+    Parameters
+    ----------
+    result_file : str
+        file the mesher writes its result to, a cached file is copied there
+    suffix : str
+        suffix of the cached file, for example ".unv"
+    get_key_parts : callable
+        returns the parts of the cache key, see get_mesh_key()
+
+    Returns None if the cache is switched off in the preferences,
+    otherwise a MeshCacheLookup. Its hit is True if the cached result
+    was copied to result_file and the mesher does not need to run.
+    """
+    mesh_cache = get_mesh_cache()
+    if mesh_cache is None:
+        return None
+    return MeshCacheLookup(mesh_cache, result_file, suffix, get_mesh_key(*get_key_parts()))
+
+
+def get_mesh_key(*parts):
+    """Returns the cache key of a mesh, a hash of all parts.
+
+    The parts are everything the mesh depends on, for example the BREP
+    of the shape, the mesh parameters and the mesher version. A part is
+    str or bytes.
+    """
+    sha = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        sha.update(len(part).to_bytes(8, "little"))
+        sha.update(part)
+    return sha.hexdigest()
+
+
+def get_mesher_version(binary, version_args=("--version",)):
+    """Returns the version output of a mesher binary, it is run once per binary file.
+
+    A bare name like "gmsh" is looked up in PATH.
+    """
+    binary = shutil.which(binary) or binary
+    try:
+        stat = os.stat(binary)
+    except OSError:
+        return ""
+    key = (binary, stat.st_mtime, stat.st_size)
+    if key not in _mesher_versions:
+        try:
+            p = subprocess.run(
+                [binary, *version_args],
+                capture_output=True,
+                universal_newlines=True,
+                startupinfo=femutils.startProgramInfo("hide"),
+            )
+            version = (p.stdout + p.stderr).strip()
+        except OSError:
+            version = ""
+        # the binary file identifies the version as well
+        _mesher_versions[key] = f"{binary} {stat.st_mtime} {stat.st_size} {version}"
+    return _mesher_versions[key]
+
+
+class MeshCacheLookup:
+    """One lookup of a mesher result file in a MeshCache, see lookup()."""
+
+    def __init__(self, mesh_cache, result_file, suffix, key):
+        self.mesh_cache = mesh_cache
+        self.result_file = result_file
+        self.suffix = suffix
+        self.key = key
+        self.hit = mesh_cache.load(key, suffix, result_file)
+        # a result file of an earlier run must not be stored under this key
+        self.old_result = _get_file_stat(result_file)
+
+    def store(self):
+        """Stores the result file in the cache, if the mesher has written a new one."""
+        if self.hit:
+            return
+        new_result = _get_file_stat(self.result_file)
+        if new_result is None or new_result == self.old_result:
+            return
+        self.mesh_cache.store(self.key, self.suffix, self.result_file)
+
+
+def _get_file_stat(file_name):
+    try:
+        stat = os.stat(file_name)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class MeshCache:
+    """Content addressed directory of mesher result files.
+
+    Parameters
+    ----------
+    cache_dir : str
+        directory of the cached files, it is created on first store
+    max_size : int
+        maximum size of all cached files in bytes
+
+    A result file is stored under its key, see get_mesh_key(). Every hit
+    updates the modification time of the file, if the cache grows over
+    max_size the files not used for the longest time are deleted.
+    """
+
+    def __init__(self, cache_dir, max_size=DEFAULT_SIZE * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    def get_cache_file(self, key, suffix):
+        return os.path.join(self.cache_dir, key + suffix)
+
+    def load(self, key, suffix, target_file):
+        """Copies the cached file of key to target_file, returns False if there is none."""
+        cache_file = self.get_cache_file(key, suffix)
+        try:
+            shutil.copyfile(cache_file, target_file)
+            os.utime(cache_file)
+        except OSError:
+            return False
+        FreeCAD.Console.PrintLog(f"Mesh loaded from cache: {cache_file}\n")
+        return True
+
+    def store(self, key, suffix, source_file):
+        """Copies source_file into the cache and evicts old files if the cache is too big."""
+        if os.path.getsize(source_file) > self.max_size:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # copy to a temporary file first, a concurrent load never sees a partial file
+        fd, tmp_file = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        os.close(fd)
+        try:
+            shutil.copyfile(source_file, tmp_file)
+            os.replace(tmp_file, self.get_cache_file(key, suffix))
+        except OSError as e:
+            FreeCAD.Console.PrintWarning(f"Mesh could not be stored in cache: {e}\n")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return
+        self.evict()
+
+    def evict(self):
+        """Deletes the least recently used files until the cache fits into max_size."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total_size = sum(size for mtime, size, path in entries)
+        for mtime, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+
+    def clear(self):
+        """Deletes all cached files."""
+        if os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
+
+
+##  @}
@@ -28,6 +28,7 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+import os
 import time
 
 import FreeCAD
@@ -100,6 +101,11 @@ class MeshSetsGetter:
         self.femelement_edges_table = {}
         self.femelement_count_test = True
         self.mat_geo_sets = []
+        # processes for the node loads of face loads, 0 means one per cpu, not used with the GUI
+        ccx_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Ccx")
+        self.node_load_processes = ccx_prefs.GetInt("InputWriterProcesses", 1)
+        if self.node_load_processes < 1:
+            self.node_load_processes = os.cpu_count() or 1
 
     # ********************************************************************************************
     # ********************************************************************************************
@@ -125,33 +131,38 @@ class MeshSetsGetter:
 
         time_start = time.process_time()
 
-        # materials and element geometry element sets getter
-        self.get_element_sets_material_and_femelement_geometry()
-
-        # constraints element sets getter
-        self.get_constraints_centrif_elements()
-        self.get_constraints_bodyheatsource_elements()
-
-        # constraints node sets getter
-        self.get_constraints_fixed_nodes()
-        self.get_constraints_displacement_nodes()
-        self.get_constraints_rigidbody_nodes()
-        self.get_constraints_planerotation_nodes()
-
-        # constraints surface sets getter
-        self.get_constraints_contact_faces()
-        self.get_constraints_tie_faces()
-        self.get_constraints_sectionprint_faces()
-        self.get_constraints_transform_nodes()
-        self.get_constraints_temperature_nodes()
-        self.get_constraints_electrostatic_nodes()
-
-        # constraints sets with constraint data
-        self.get_constraints_force_nodeloads()
-        self.get_constraints_pressure_faces()
-        self.get_constraints_heatflux_faces()
-        self.get_constraints_electrostatic_faces()
-        self.get_constraints_electricchargedensity_faces()
+        # the searches of the reference shapes in the mesh are cached for all runs of the analysis
+        refshape_cache = getattr(self.member, "refshape_cache", None)
+        if refshape_cache is not None and not self.femnodes_mesh:
+            self.femnodes_mesh = self.femmesh.Nodes
+        with meshtools.use_refshape_cache(refshape_cache, self.femmesh, self.femnodes_mesh):
+            # materials and element geometry element sets getter
+            self.get_element_sets_material_and_femelement_geometry()
+
+            # constraints element sets getter
+            self.get_constraints_centrif_elements()
+            self.get_constraints_bodyheatsource_elements()
+
+            # constraints node sets getter
+            self.get_constraints_fixed_nodes()
+            self.get_constraints_displacement_nodes()
+            self.get_constraints_rigidbody_nodes()
+            self.get_constraints_planerotation_nodes()
+
+            # constraints surface sets getter
+            self.get_constraints_contact_faces()
+            self.get_constraints_tie_faces()
+            self.get_constraints_sectionprint_faces()
+            self.get_constraints_transform_nodes()
+            self.get_constraints_temperature_nodes()
+            self.get_constraints_electrostatic_nodes()
+
+            # constraints sets with constraint data
+            self.get_constraints_force_nodeloads()
+            self.get_constraints_pressure_faces()
+            self.get_constraints_heatflux_faces()
+            self.get_constraints_electrostatic_faces()
+            self.get_constraints_electricchargedensity_faces()
 
         setstime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(f"Getting mesh data time: {setstime} seconds.\n")
@@ -307,6 +318,7 @@ class MeshSetsGetter:
             "    The appropriate finite element mesh node load values will "
             "be calculated according to the finite element definition.\n"
         )
+        face_loads = []
         for femobj in self.member.cons_force:
             # femobj --> dict, FreeCAD document object is femobj["Object"]
             frc_obj = femobj["Object"]
@@ -322,9 +334,37 @@ class MeshSetsGetter:
                     self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
                 )
             elif femobj["RefShapeType"] == "Face":  # area load on faces
-                femobj["NodeLoadTable"] = meshtools.get_force_obj_face_nodeload_table(
-                    self.femmesh, self.femelement_table, self.femnodes_mesh, frc_obj
+                # the mesh is searched here, the node loads are calculated for all loads together
+                ref_face_tables = meshtools.get_force_obj_ref_face_tables(
+                    self.femmesh, self.femelement_table, frc_obj
                 )
+                face_loads.append((femobj, ref_face_tables))
+        if face_loads:
+            self.get_constraints_force_face_nodeloads(face_loads)
+
+    def get_constraints_force_face_nodeloads(self, face_loads):
+        # face_loads: [ (femobj, ref_face_tables), ... ]
+        # the node areas of all reference faces are independent from each other
+        # on big meshes with many loads they might be calculated in parallel processes
+        face_tables = [
+            face_table
+            for femobj, ref_face_tables in face_loads
+            for o, elem, ref_face, face_table in ref_face_tables
+        ]
+        processes = min(self.node_load_processes, len(face_tables))
+        time_start = time.perf_counter()
+        with meshtools.node_area_pool(self.femnodes_mesh, processes) as map_node_areas:
+            node_sum_area_tables = iter(map_node_areas(face_tables))
+        FreeCAD.Console.PrintLog(
+            "    Node areas of {} reference faces calculated with {} process(es) in {:.3f} "
+            "seconds.\n".format(len(face_tables), processes, time.perf_counter() - time_start)
+        )
+        for femobj, ref_face_tables in face_loads:
+            femobj["NodeLoadTable"] = meshtools.get_force_obj_face_nodeload_table_by_areas(
+                femobj["Object"],
+                ref_face_tables,
+                [next(node_sum_area_tables) for ref_face_table in ref_face_tables],
+            )
 
     # ********************************************************************************************
     # ********************************************************************************************
@@ -506,7 +546,9 @@ class MeshSetsGetter:
                     # in the gui this is checked
                     ref_shape = o.Shape.getElement(elem)
                     if ref_shape.ShapeType == "Face":
-                        v = self.mesh_object.FemMesh.getccxVolumesByFace(ref_shape)
+                        v = meshtools.search_by_shape(
+                            self.femmesh, "getccxVolumesByFace", ref_shape
+                        )
                         if len(v) > 0:
                             femobj["SectionPrintFaces"] = v
                             # volume elements found
@@ -552,7 +594,9 @@ class MeshSetsGetter:
                     ho = o.Shape.getElement(elem)
                     if ho.ShapeType == "Face":
                         elem_info = f"{o.Name}:{elem}"
-                        face_table = self.mesh_object.FemMesh.getccxVolumesByFace(ho)
+                        face_table = meshtools.search_by_shape(
+                            self.femmesh, "getccxVolumesByFace", ho
+                        )
                         femobj["HeatFluxFaceTable"].append((elem_info, face_table))
 
     # ********************************************************************************************
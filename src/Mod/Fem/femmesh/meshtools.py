@@ -27,6 +27,9 @@ __url__ = "https://www.freecad.org"
 ## \addtogroup FEM
 #  @{
 
+from contextlib import contextmanager
+from itertools import chain
+
 import numpy as np
 
 import FreeCAD
@@ -34,6 +37,49 @@ import FreeCAD
 from femtools import geomtools
 
 
+# the cache of the femmesh searches by reference shapes, see use_refshape_cache()
+_refshape_cache = None
+
+# the femmesh.Nodes of the node area worker processes, see node_area_pool()
+_pool_femnodes_mesh = None
+
+
+# ************************************************************************************************
+@contextmanager
+def use_refshape_cache(refshape_cache, femmesh, femnodes_mesh=None):
+    """Caches the searches of reference shapes in femmesh inside the with block.
+
+    refshape_cache is a femmesh.refshapecache.RefShapeCache, for example
+    the one of membertools.AnalysisMember. With None nothing is cached.
+    """
+    global _refshape_cache
+    if refshape_cache is None:
+        yield
+        return
+    refshape_cache.set_mesh(femmesh, femnodes_mesh)
+    previous_cache = _refshape_cache
+    _refshape_cache = refshape_cache
+    try:
+        yield
+    finally:
+        _refshape_cache = previous_cache
+        FreeCAD.Console.PrintLog(
+            "Reference shape cache: {} hits, {} misses\n".format(
+                refshape_cache.hits, refshape_cache.misses
+            )
+        )
+
+
+def search_by_shape(femmesh, method_name, shape):
+    """Returns getattr(femmesh, method_name)(shape), cached in use_refshape_cache() blocks.
+
+    method_name is a FemMesh search method, for example getNodesByFace.
+    """
+    if _refshape_cache is not None:
+        return _refshape_cache.lookup(femmesh, method_name, shape)
+    return getattr(femmesh, method_name)(shape)
+
+
 # ************************************************************************************************
 def get_femnodes_by_femobj_with_references(femmesh, femobj):
     node_set = []
@@ -106,16 +152,16 @@ def get_femnodes_by_refshape(femmesh, ref):
             "Element name: {}\n".format(r.ShapeType, ref[0].Name, ref[0].Label, refelement)
         )
         if r.ShapeType == "Vertex":
-            nodes += femmesh.getNodesByVertex(r)
+            nodes += search_by_shape(femmesh, "getNodesByVertex", r)
         elif r.ShapeType == "Edge":
-            nodes += femmesh.getNodesByEdge(r)
+            nodes += search_by_shape(femmesh, "getNodesByEdge", r)
         elif r.ShapeType == "Face":
-            nodes += femmesh.getNodesByFace(r)
+            nodes += search_by_shape(femmesh, "getNodesByFace", r)
         elif r.ShapeType == "Solid":
-            nodes += femmesh.getNodesBySolid(r)
+            nodes += search_by_shape(femmesh, "getNodesBySolid", r)
         elif r.ShapeType == "Compound":
             for s in r.Solids:
-                nodes += femmesh.getNodesBySolid(s)
+                nodes += search_by_shape(femmesh, "getNodesBySolid", s)
         else:
             FreeCAD.Console.PrintMessage("  No Vertice, Edge, Face or Solid as reference shapes!\n")
     return nodes
@@ -171,6 +217,135 @@ def get_femelement_edges_table(femmesh, edges_only=None):
 
 
 # ************************************************************************************************
+class FemNodesEleTable:
+    """Node to element adjacency of a femelement_table in compressed sparse row layout.
+
+    Parameters
+    ----------
+    femnodes_mesh : dict or iterable
+        node ids of the mesh, for example femmesh.Nodes
+    femelement_table : dict
+        {eleID : [nodeID, nodeID, ...]}, see get_femelement_table()
+
+    For each node the elements and the position of the node in the element
+    are stored in the arrays elements and positions between offsets[row]
+    and offsets[row + 1], row is the index of the node id in node_ids.
+    For compatibility with the former dict the table can be read as
+    {nodeID : [[eleID, 1 << NodePosition], ...]}.
+    The table is built once and is used for all reference lookups,
+    see get_bit_pattern_dict().
+    """
+
+    def __init__(self, femnodes_mesh, femelement_table):
+        ele_count = len(femelement_table)
+        self.ele_ids = np.fromiter(femelement_table.keys(), dtype=np.int64, count=ele_count)
+        self.node_counts = np.fromiter(
+            map(len, femelement_table.values()), dtype=np.int64, count=ele_count
+        )
+        ele_nodes = np.fromiter(
+            chain.from_iterable(femelement_table.values()),
+            dtype=np.int64,
+            count=int(self.node_counts.sum()),
+        )
+        ele_index = np.repeat(np.arange(ele_count), self.node_counts)
+        ele_starts = np.cumsum(self.node_counts) - self.node_counts
+        positions = np.arange(len(ele_nodes)) - np.repeat(ele_starts, self.node_counts)
+
+        self.node_ids = np.unique(np.fromiter(femnodes_mesh, dtype=np.int64))
+        rows, all_found = self._get_rows(ele_nodes)
+        if not all_found:
+            raise KeyError("Element nodes are missing in the mesh nodes.")
+        # stable sort keeps the element order of femelement_table for each node
+        order = np.argsort(rows, kind="stable")
+        self.offsets = np.zeros(len(self.node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self.node_ids)), out=self.offsets[1:])
+        self.elements = ele_index[order]
+        self.positions = positions[order].astype(np.int8)
+
+    def _get_rows(self, nodes):
+        # rows of the nodes in node_ids, unknown nodes are skipped
+        rows = np.searchsorted(self.node_ids, nodes)
+        found = rows < len(self.node_ids)
+        found[found] = self.node_ids[rows[found]] == nodes[found]
+        return rows[found], bool(found.all())
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def __iter__(self):
+        return iter(self.node_ids.tolist())
+
+    def __contains__(self, node):
+        row = np.searchsorted(self.node_ids, node)
+        return row < len(self.node_ids) and self.node_ids[row] == node
+
+    def __getitem__(self, node):
+        if node not in self:
+            raise KeyError(node)
+        row = np.searchsorted(self.node_ids, node)
+        entries = slice(self.offsets[row], self.offsets[row + 1])
+        return [
+            [ele, 1 << pos]
+            for ele, pos in zip(
+                self.ele_ids[self.elements[entries]].tolist(), self.positions[entries].tolist()
+            )
+        ]
+
+    def get_bit_patterns(self, node_set):
+        """Returns the bit pattern of every element as array, see get_bit_pattern_dict().
+
+        The bit of a node position is set if the node is in node_set.
+        """
+        rows = self._get_rows(np.asarray(list(node_set), dtype=np.int64))[0]
+        starts = self.offsets[rows]
+        lengths = self.offsets[rows + 1] - starts
+        # the entries of all nodes of node_set
+        entries = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(
+            lengths.sum()
+        )
+        # all bits are below 2**53, thus the float sum is exact
+        patterns = np.bincount(
+            self.elements[entries],
+            weights=np.left_shift(1, self.positions[entries].astype(np.int64)),
+            minlength=len(self.ele_ids),
+        )
+        return patterns.astype(np.int64)
+
+
+class BitPatternTable:
+    """The bit patterns of get_bit_pattern_dict() as arrays.
+
+    ele_ids, node_counts and patterns are arrays in the element order
+    of the femelement_table. The table can be read as the former dict
+    {eleID : [lenEleNodes, binary_position]} too.
+    """
+
+    def __init__(self, ele_ids, node_counts, patterns):
+        self.ele_ids = ele_ids
+        self.node_counts = node_counts
+        self.patterns = patterns
+        # {eleID : row}, built on the first lookup by element id
+        self._rows = None
+
+    def __len__(self):
+        return len(self.ele_ids)
+
+    def __iter__(self):
+        return iter(self.ele_ids.tolist())
+
+    def __getitem__(self, ele):
+        if self._rows is None:
+            self._rows = dict(zip(self.ele_ids.tolist(), range(len(self.ele_ids))))
+        row = self._rows[ele]
+        return [int(self.node_counts[row]), int(self.patterns[row])]
+
+    def items(self):
+        return zip(
+            self.ele_ids.tolist(),
+            (list(item) for item in zip(self.node_counts.tolist(), self.patterns.tolist())),
+        )
+
+
 def get_femnodes_ele_table(femnodes_mesh, femelement_table):
     """the femnodes_ele_table contains for each node its membership in elements
     {nodeID : [[eleID, NodePosition], [], ...], nodeID : [[], [], ...], ...}
@@ -186,19 +361,10 @@ def get_femnodes_ele_table(femnodes_mesh, femelement_table):
     volume or face or edgemesh the femnodes_ele_table only
     has either volume or face or edge elements
     see get_femelement_table()
+    The table is a FemNodesEleTable, arrays instead of Python lists
     """
-    femnodes_ele_table = {}  # node_dict in ulrichs class
-    for n in femnodes_mesh:  # initialize it with sorted node keys and empty lists
-        femnodes_ele_table[n] = []
-    for ele in femelement_table:
-        ele_list = femelement_table[ele]
-        # FreeCAD.Console.PrintMessage("{}\n".format(ele_list))
-        pos = int(1)
-        for ele_node in ele_list:
-            femnodes_ele_table[ele_node].append([ele, pos])
-            pos = pos << 1
+    femnodes_ele_table = FemNodesEleTable(femnodes_mesh, femelement_table)
     FreeCAD.Console.PrintLog(f"len femnodes_ele_table: {len(femnodes_ele_table)}\n")
-    FreeCAD.Console.PrintLog(f"femnodes_ele_table: {femnodes_ele_table}\n")
     return femnodes_ele_table
 
 
@@ -223,10 +389,19 @@ def get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_set):
     or has this element a face we are searching for?
     The number in the ele_dict is organized as a bit array.
     The corresponding bit is set, if the node of the node_set is contained in the element.
+    A BitPatternTable is returned for a FemNodesEleTable.
     """
     # print("BIT PATTERN", femelement_table, femnodes_ele_table, node_set)
     FreeCAD.Console.PrintLog("len femnodes_ele_table: " + str(len(femnodes_ele_table)) + "\n")
     FreeCAD.Console.PrintLog("len node_set: " + str(len(node_set)) + "\n")
+    if isinstance(femnodes_ele_table, FemNodesEleTable):
+        bit_pattern_dict = BitPatternTable(
+            femnodes_ele_table.ele_ids,
+            femnodes_ele_table.node_counts,
+            femnodes_ele_table.get_bit_patterns(node_set),
+        )
+        FreeCAD.Console.PrintLog("len bit_pattern_dict: " + str(len(bit_pattern_dict)) + "\n")
+        return bit_pattern_dict
     FreeCAD.Console.PrintLog(f"node_set: {node_set}\n")
     bit_pattern_dict = get_copy_of_empty_femelement_table(femelement_table)
     # # initializing the bit_pattern_dict
@@ -241,6 +416,58 @@ def get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_set):
     return bit_pattern_dict
 
 
+def _get_bit_pattern_arrays(bit_pattern_dict):
+    # element ids, node counts and bit patterns of a bit_pattern_dict
+    if isinstance(bit_pattern_dict, BitPatternTable):
+        return bit_pattern_dict.ele_ids, bit_pattern_dict.node_counts, bit_pattern_dict.patterns
+    count = len(bit_pattern_dict)
+    ele_ids = np.fromiter(bit_pattern_dict.keys(), dtype=np.int64, count=count)
+    node_counts = np.fromiter(
+        (value[0] for value in bit_pattern_dict.values()), dtype=np.int64, count=count
+    )
+    patterns = np.fromiter(
+        (value[1] for value in bit_pattern_dict.values()), dtype=np.int64, count=count
+    )
+    return ele_ids, node_counts, patterns
+
+
+def _check_node_counts(ele_ids, node_counts, supported):
+    # the former dict lookups raised a KeyError for not supported element types
+    unsupported = np.flatnonzero(~np.isin(node_counts, list(supported)))
+    if len(unsupported):
+        row = unsupported[0]
+        FreeCAD.Console.PrintError(
+            "Element {} with {} nodes is not supported by the binary search, "
+            "{} elements with not supported node count.\n".format(
+                ele_ids[row], node_counts[row], len(unsupported)
+            )
+        )
+        raise KeyError(int(node_counts[row]))
+
+
+def _search_bit_masks(bit_pattern_dict, mask_dicts):
+    """Returns the element ids and mask values of all masks which are set in the bit patterns.
+
+    mask_dicts ... {lenEleNodes : {mask : value}}
+    The order is the one of a loop over the elements and their masks.
+    A KeyError is raised for elements with a number of nodes not in mask_dicts.
+    """
+    ele_ids, node_counts, patterns = _get_bit_pattern_arrays(bit_pattern_dict)
+    _check_node_counts(ele_ids, node_counts, mask_dicts)
+    width = max(len(mask_dict) for mask_dict in mask_dicts.values())
+    masks = np.zeros((len(ele_ids), width), dtype=np.int64)
+    values = np.zeros((len(ele_ids), width), dtype=np.int64)
+    valid = np.zeros((len(ele_ids), width), dtype=bool)
+    for len_ele, mask_dict in mask_dicts.items():
+        ele_rows = node_counts == len_ele
+        for column, (mask, value) in enumerate(mask_dict.items()):
+            masks[ele_rows, column] = mask
+            values[ele_rows, column] = value
+            valid[ele_rows, column] = True
+    found_rows, found_columns = np.nonzero(valid & ((masks & patterns[:, None]) == masks))
+    return ele_ids[found_rows], values[found_rows, found_columns]
+
+
 # ************************************************************************************************
 def get_ccxelement_volumes_elements_from_binary_search(bit_pattern_dict):
     tet10_mask = {0b1111111111: 1}
@@ -257,12 +484,7 @@ def get_ccxelement_volumes_elements_from_binary_search(bit_pattern_dict):
         15: pent15_mask,
         20: hex20_mask,
     }
-    volumes = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                volumes.append(ele)
+    volumes = _search_bit_masks(bit_pattern_dict, vol_dict)[0].tolist()
     # print("VOLUMES:", volumes)
     FreeCAD.Console.PrintLog(f"found Volumes: {len(volumes)}\n")
     # FreeCAD.Console.PrintMessage("faces: {}\n".format(faces))
@@ -280,12 +502,7 @@ def get_ccxelement_faces_elements_from_binary_search(bit_pattern_dict):
         4: quad4_mask,
         8: quad8_mask,
     }
-    faces = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                faces.append(ele)
+    faces = _search_bit_masks(bit_pattern_dict, vol_dict)[0].tolist()
     # print("CARAS:", faces)
     FreeCAD.Console.PrintMessage(f"found Edges: {len(faces)}\n")
     return faces
@@ -302,12 +519,8 @@ def get_ccxelement_edges_from_binary_search(bit_pattern_dict):
         4: quad4_mask,
         8: quad8_mask,
     }
-    faces = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                faces.append([ele, mask_dict[key]])
+    eles, edge_numbers = _search_bit_masks(bit_pattern_dict, vol_dict)
+    faces = [list(face) for face in zip(eles.tolist(), edge_numbers.tolist())]
     # print("EDGES:", faces)
     FreeCAD.Console.PrintMessage(f"found Edges: {len(faces)}\n")
 
@@ -335,12 +548,8 @@ def get_ccxelement_faces_from_binary_search(bit_pattern_dict):
         15: pent15_mask,
         20: hex20_mask,
     }
-    faces = []
-    for ele in bit_pattern_dict:
-        mask_dict = vol_dict[bit_pattern_dict[ele][0]]
-        for key in mask_dict:
-            if (key & bit_pattern_dict[ele][1]) == key:
-                faces.append([ele, mask_dict[key]])
+    eles, face_numbers = _search_bit_masks(bit_pattern_dict, vol_dict)
+    faces = [list(face) for face in zip(eles.tolist(), face_numbers.tolist())]
     # print("FACES:", faces)
     FreeCAD.Console.PrintLog(f"found Faces: {len(faces)}\n")
     # FreeCAD.Console.PrintMessage("faces: {}\n".format(faces))
@@ -359,12 +568,10 @@ def get_femelements_by_femnodes_bin(femelement_table, femnodes_ele_table, node_l
     # Now we are looking for nodes inside of the Volumes = filling the bit_pattern_dict
     FreeCAD.Console.PrintMessage(f"len femnodes_ele_table: {len(femnodes_ele_table)}\n")
     bit_pattern_dict = get_bit_pattern_dict(femelement_table, femnodes_ele_table, node_list)
-    # search
-    ele_list = []  # The ele_list contains the result of the search.
-    for ele in bit_pattern_dict:
-        FreeCAD.Console.PrintLog(f"bit_pattern_dict[ele][0]: {bit_pattern_dict[ele][0]}\n")
-        if bit_pattern_dict[ele][1] == vol_masks[bit_pattern_dict[ele][0]]:
-            ele_list.append(ele)
+    # search, all bits of the volume need to be set
+    ele_ids, node_counts, patterns = _get_bit_pattern_arrays(bit_pattern_dict)
+    _check_node_counts(ele_ids, node_counts, vol_masks)
+    ele_list = ele_ids[patterns == (1 << node_counts) - 1].tolist()
     FreeCAD.Console.PrintMessage(f"found Volumes: {len(ele_list)}\n")
     # FreeCAD.Console.PrintMessage("   volumes: {}\n".format(ele_list))
     return ele_list
@@ -567,7 +774,8 @@ def get_femelement_directions_theshape(femmesh, femelement_table, theshape):
     for e in theshape.Shape.Edges:
         the_edge = {}
         the_edge["direction"] = e.Vertexes[1].Point - e.Vertexes[0].Point
-        edge_femnodes = femmesh.getNodesByEdge(e)  # femnodes for the current edge
+        # femnodes for the current edge
+        edge_femnodes = search_by_shape(femmesh, "getNodesByEdge", e)
         # femelements for this edge
         the_edge["ids"] = get_femelements_by_femnodes_std(femelement_table, edge_femnodes)
         for rot in rotations_ids:
@@ -770,7 +978,7 @@ def get_force_obj_vertex_nodeload_table(femmesh, frc_obj):
                 "Object label: {}, "
                 "Element name: {}\n".format(ref_node.ShapeType, o.Name, o.Label, elem)
             )
-            node = femmesh.getNodesByVertex(ref_node)
+            node = search_by_shape(femmesh, "getNodesByVertex", ref_node)
             elem_info_string = "node load on shape: " + o.Name + ":" + elem
             if len(node) == 1:
                 force_obj_node_load_table.append(
@@ -878,7 +1086,7 @@ def get_force_obj_edge_nodeload_table(femmesh, femelement_table, femnodes_mesh,
         FreeCAD.Console.PrintMessage(f"{bad_refedge}\n")
 
         FreeCAD.Console.PrintMessage("bad_refedge_nodes\n")
-        bad_refedge_nodes = femmesh.getNodesByEdge(bad_refedge)
+        bad_refedge_nodes = search_by_shape(femmesh, "getNodesByEdge", bad_refedge)
         FreeCAD.Console.PrintMessage(f"{len(bad_refedge_nodes)}\n")
         FreeCAD.Console.PrintMessage(f"{bad_refedge_nodes}\n")
         # import FreeCADGui
@@ -920,7 +1128,7 @@ def get_force_obj_edge_nodeload_table(femmesh, femelement_table, femnodes_mesh,
 # ************************************************************************************************
 def get_ref_edgenodes_table(femmesh, femelement_table, refedge):
     edge_table = {}  # { meshedgeID : ( nodeID, ... , nodeID ) }
-    refedge_nodes = femmesh.getNodesByEdge(refedge)
+    refedge_nodes = search_by_shape(femmesh, "getNodesByEdge", refedge)
     if is_solid_femmesh(femmesh):
         refedge_fem_volumeelements = []
         # if at least two nodes of a femvolumeelement are in
@@ -1037,10 +1245,23 @@ def get_force_obj_face_nodeload_table(femmesh, femelement_table, femnodes_mesh,
     #         ...,
     #         ("refshape_name.elemname",node_load_table)
     #     ]
-    force_obj_node_load_table = []
-    sum_ref_face_area = 0
-    sum_ref_face_node_area = 0  # for debugging
-    sum_node_load = 0  # for debugging
+    ref_face_tables = get_force_obj_ref_face_tables(femmesh, femelement_table, frc_obj)
+    node_sum_area_tables = [
+        get_ref_face_node_sum_area_table(femnodes_mesh, face_table)
+        for o, elem, ref_face, face_table in ref_face_tables
+    ]
+    return get_force_obj_face_nodeload_table_by_areas(
+        frc_obj, ref_face_tables, node_sum_area_tables
+    )
+
+
+# ************************************************************************************************
+def get_force_obj_ref_face_tables(femmesh, femelement_table, frc_obj):
+    # searches the mesh faces of all reference faces of a force object
+    # ref_face_tables:
+    #     [ (refshape_obj, elemname, ref_face, face_table), ... ]
+    # the searches need the femmesh, thus they can not be done in a worker process
+    ref_face_tables = []
     for o, elem_tup in frc_obj.References:
         for elem in elem_tup:
             ref_face = sub_shape_at_global_placement(o, elem)
@@ -1051,47 +1272,134 @@ def get_force_obj_face_nodeload_table(femmesh, femelement_table, femnodes_mesh,
                 "Object label: {}, "
                 "Element name: {}\n".format(ref_face.ShapeType, o.Name, o.Label, elem)
             )
-            sum_ref_face_area += ref_face.Area
-    if sum_ref_face_area != 0:
-        force_quantity = FreeCAD.Units.Quantity(frc_obj.Force.getValueAs("N"))
-        force_per_sum_ref_face_area = force_quantity / sum_ref_face_area
-    for o, elem_tup in frc_obj.References:
-        for elem in elem_tup:
-            ref_face = sub_shape_at_global_placement(o, elem)
-
             # face_table:
             #    { meshfaceID : ( nodeID, ... , nodeID ) }
             face_table = get_ref_facenodes_table(femmesh, femelement_table, ref_face)
+            ref_face_tables.append((o, elem, ref_face, face_table))
+    return ref_face_tables
 
-            # node_area_table:
-            #    [ (nodeID, Area), ... , (nodeID, Area) ]
-            # some nodes will have more than one entry
-            node_area_table = get_ref_facenodes_areas(femnodes_mesh, face_table)
 
-            # node_sum_area_table:
-            #    { nodeID : Area, ... , nodeID : Area }
-            # AreaSum for each node, one entry for each node
-            node_sum_area_table = get_ref_shape_node_sum_geom_table(node_area_table)
+# ************************************************************************************************
+def get_ref_face_node_sum_area_table(femnodes_mesh, face_table):
+    # node_area_table:
+    #    [ (nodeID, Area), ... , (nodeID, Area) ]
+    # some nodes will have more than one entry
+    node_area_table = get_ref_facenodes_areas(femnodes_mesh, face_table)
 
-            # node_load_table:
-            #    { nodeID : NodeLoad, ... , nodeID : NodeLoad }
-            # NodeLoad for each node, one entry for each node
-            node_load_table = {}
-            sum_node_areas = 0  # for debugging
-            for node in node_sum_area_table:
-                sum_node_areas += node_sum_area_table[node]  # for debugging
-                node_load_table[node] = node_sum_area_table[node] * force_per_sum_ref_face_area
-            ratio_refface_areas = sum_node_areas / ref_face.Area
-            if ratio_refface_areas < 0.99 or ratio_refface_areas > 1.01:
-                FreeCAD.Console.PrintError(
-                    "Error on: " + frc_obj.Name + " --> " + o.Name + "." + elem + "\n"
-                )
-                FreeCAD.Console.PrintMessage(f"  sum_node_areas: {sum_node_areas}\n")
-                FreeCAD.Console.PrintMessage(f"  ref_face_area:  {ref_face.Area}\n")
-            sum_ref_face_node_area += sum_node_areas
+    # node_sum_area_table:
+    #    { nodeID : Area, ... , nodeID : Area }
+    # AreaSum for each node, one entry for each node
+    return get_ref_shape_node_sum_geom_table(node_area_table)
 
-            elem_info_string = "node loads on shape: " + o.Name + ":" + elem
-            force_obj_node_load_table.append((elem_info_string, node_load_table))
+
+# ************************************************************************************************
+@contextmanager
+def node_area_pool(femnodes_mesh, processes=1):
+    """Yields a function which maps face tables to node sum area tables.
+
+    Parameters
+    ----------
+    femnodes_mesh : dict
+        the femmesh.Nodes
+    processes : int
+        number of worker processes, with 1 the areas are calculated in
+        this process
+
+    The node areas of the face tables are independent from each other, thus
+    with more than one process they are calculated in a pool of forked
+    processes. The workers inherit femnodes_mesh from the fork, only the
+    face tables and the resulting node areas are transferred. The results
+    are returned in the order of the face tables. With the GUI up or where
+    no fork is available the areas are calculated in this process, the Qt
+    and Coin state and the document observers of the GUI must not be
+    shared with a forked process.
+    """
+    global _pool_femnodes_mesh
+
+    def map_serial(face_tables):
+        return [get_ref_face_node_sum_area_table(femnodes_mesh, ft) for ft in face_tables]
+
+    if processes <= 1:
+        yield map_serial
+        return
+    if FreeCAD.GuiUp:
+        FreeCAD.Console.PrintLog("The GUI is up, node areas are calculated serial.\n")
+        yield map_serial
+        return
+    import multiprocessing
+
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        FreeCAD.Console.PrintLog("No fork on this platform, node areas are calculated serial.\n")
+        yield map_serial
+        return
+
+    def map_pool(face_tables):
+        face_tables = list(face_tables)
+        results = [None] * len(face_tables)
+        todo = []
+        for i, ft in enumerate(face_tables):
+            if ft:
+                todo.append(i)
+            else:
+                # prints the error here, the workers do not print to the console
+                results[i] = get_ref_face_node_sum_area_table(femnodes_mesh, ft)
+        chunksize = max(1, len(todo) // (4 * processes))
+        pool_results = pool.map(
+            _get_pool_node_sum_area_table, [face_tables[i] for i in todo], chunksize
+        )
+        for i, node_sum_area_table in zip(todo, pool_results):
+            results[i] = node_sum_area_table
+        return results
+
+    # set before the fork, thus the workers inherit the nodes
+    _pool_femnodes_mesh = femnodes_mesh
+    try:
+        with context.Pool(processes) as pool:
+            yield map_pool
+    finally:
+        _pool_femnodes_mesh = None
+
+
+def _get_pool_node_sum_area_table(face_table):
+    return get_ref_face_node_sum_area_table(_pool_femnodes_mesh, face_table)
+
+
+# ************************************************************************************************
+def get_force_obj_face_nodeload_table_by_areas(frc_obj, ref_face_tables, node_sum_area_tables):
+    # node_sum_area_tables are in the order of the ref_face_tables
+    force_obj_node_load_table = []
+    sum_ref_face_area = 0
+    sum_ref_face_node_area = 0  # for debugging
+    sum_node_load = 0  # for debugging
+    for o, elem, ref_face, face_table in ref_face_tables:
+        sum_ref_face_area += ref_face.Area
+    if sum_ref_face_area != 0:
+        force_quantity = FreeCAD.Units.Quantity(frc_obj.Force.getValueAs("N"))
+        force_per_sum_ref_face_area = force_quantity / sum_ref_face_area
+    for (o, elem, ref_face, face_table), node_sum_area_table in zip(
+        ref_face_tables, node_sum_area_tables
+    ):
+        # node_load_table:
+        #    { nodeID : NodeLoad, ... , nodeID : NodeLoad }
+        # NodeLoad for each node, one entry for each node
+        node_load_table = {}
+        sum_node_areas = 0  # for debugging
+        for node in node_sum_area_table:
+            sum_node_areas += node_sum_area_table[node]  # for debugging
+            node_load_table[node] = node_sum_area_table[node] * force_per_sum_ref_face_area
+        ratio_refface_areas = sum_node_areas / ref_face.Area
+        if ratio_refface_areas < 0.99 or ratio_refface_areas > 1.01:
+            FreeCAD.Console.PrintError(
+                "Error on: " + frc_obj.Name + " --> " + o.Name + "." + elem + "\n"
+            )
+            FreeCAD.Console.PrintMessage(f"  sum_node_areas: {sum_node_areas}\n")
+            FreeCAD.Console.PrintMessage(f"  ref_face_area:  {ref_face.Area}\n")
+        sum_ref_face_node_area += sum_node_areas
+
+        elem_info_string = "node loads on shape: " + o.Name + ":" + elem
+        force_obj_node_load_table.append((elem_info_string, node_load_table))
 
     for ref_shape in force_obj_node_load_table:
         for node in ref_shape[1]:
@@ -1132,12 +1440,12 @@ def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
             # they are not sorted, we just have the nodes.
             # We need to sort them according to the
             # shell mesh notation of tria3, tria6, quad4, quad8
-            ref_face_nodes = femmesh.getNodesByFace(ref_face)
+            ref_face_nodes = search_by_shape(femmesh, "getNodesByFace", ref_face)
             # try to use getccxVolumesByFace() to get the volume ids
             # of element with elementfaces on the ref_face
             # --> should work for tetra4 and tetra10
             # list of tuples (mv, ccx_face_nr)
-            ref_face_volume_elements = femmesh.getccxVolumesByFace(ref_face)
+            ref_face_volume_elements = search_by_shape(femmesh, "getccxVolumesByFace", ref_face)
             if ref_face_volume_elements:  # mesh with tetras
                 FreeCAD.Console.PrintLog(
                     "  Use of getccxVolumesByFace() has "
@@ -1171,11 +1479,11 @@ def get_ref_facenodes_table(femmesh, femelement_table, ref_face):
                 # we need to resort the nodes to make them build an element face
                 face_table = build_mesh_faces_of_volume_elements(face_table, femelement_table)
         else:  # the femmesh has face_data
-            faces = femmesh.getFacesByFace(ref_face)  # (mv, mf)
+            faces = search_by_shape(femmesh, "getFacesByFace", ref_face)  # (mv, mf)
             for mf in faces:
                 face_table[mf] = femmesh.getElementNodes(mf)
     elif is_face_femmesh(femmesh):
-        ref_face_nodes = femmesh.getNodesByFace(ref_face)
+        ref_face_nodes = search_by_shape(femmesh, "getNodesByFace", ref_face)
         ref_face_elements = get_femelements_by_femnodes_std(femelement_table, ref_face_nodes)
         for mf in ref_face_elements:
             face_table[mf] = femelement_table[mf]
@@ -1617,7 +1925,7 @@ def get_pressure_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj
             for obj, elems in femobj["Object"].References:
                 for e in elems:
                     ref_face = sub_shape_at_global_placement(obj, e)
-                    meshfaces = femmesh.getFacesByFace(ref_face)
+                    meshfaces = search_by_shape(femmesh, "getFacesByFace", ref_face)
                     for mf in meshfaces:
                         pressure_faces.append([mf, -1])
 
@@ -1713,8 +2021,8 @@ def get_contact_obj_faces(femmesh, femelement_table, femnodes_ele_table, femobj)
         master_ref_shape = master_ref[0].Shape.getElement(master_ref[1][0])
 
         FreeCAD.Console.PrintLog("    Get the FaceIDs.\n")
-        slave_face_ids = femmesh.getFacesByFace(slave_ref_shape)
-        master_face_ids = femmesh.getFacesByFace(master_ref_shape)
+        slave_face_ids = search_by_shape(femmesh, "getFacesByFace", slave_ref_shape)
+        master_face_ids = search_by_shape(femmesh, "getFacesByFace", master_ref_shape)
 
         # build slave_faces and master_faces
         # face 2 for tria6 element
@@ -35,6 +35,8 @@ import FreeCAD
 import Fem
 from freecad import utils
 
+from . import meshcache
+
 try:
     from netgen import occ, meshing, config as ng_config
     import pyngcore as ngcore
@@ -85,6 +87,10 @@ class NetgenTools:
         self.process = QProcess()
         self.mesh_params = {}
         self.param_grp = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Netgen")
+        # False bypasses the mesh cache, see femmesh.meshcache
+        self.use_mesh_cache = True
+        self.mesh_cache_lookup = None
+        self.mesh_from_cache = False
 
     def write_geom(self):
         if not self.tmpdir:
@@ -126,7 +132,18 @@ class NetgenTools:
                 )
             )
 
+        # on a hit the cached result is copied to the result file and Netgen does not need to run
+        self.mesh_cache_lookup = None
+        if self.use_mesh_cache:
+            self.mesh_cache_lookup = meshcache.lookup(
+                self.result_file, ".npy", self.get_mesh_key_parts
+            )
+        self.mesh_from_cache = bool(self.mesh_cache_lookup and self.mesh_cache_lookup.hit)
+
     def compute(self):
+        if self.mesh_from_cache:
+            # the process is not started, update_properties() reads the cached result
+            return self.process
         self.process.start(utils.get_python_exe(), [self.script_file])
 
         return self.process
@@ -290,6 +307,27 @@ run_netgen(**{kwds})
 
     def update_properties(self):
         self.obj.FemMesh = self.fem_mesh_from_result()
+        if self.mesh_cache_lookup:
+            self.mesh_cache_lookup.store()
+
+    def get_mesh_key_parts(self):
+        # file paths and the log verbosity do not change the mesh
+        params = {
+            key: value
+            for key, value in self.mesh_params.items()
+            if key not in ("brep_file", "result_file", "verbosity", "mesh_region")
+        }
+        regions = [(shape.exportBrepToString(), size) for shape, size in self.get_mesh_region()]
+        with open(self.brep_file, "rb") as f:
+            brep = f.read()
+        return (
+            self.name,
+            self.code,
+            repr(sorted(params.items())),
+            repr(regions),
+            brep,
+            NetgenTools.version(),
+        )
 
     def get_meshing_parameters(self):
         params = {
@@ -0,0 +1,155 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM reference shape lookup cache"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from itertools import chain
+
+import numpy as np
+
+import FreeCAD
+
+
+# one cache per analysis, kept as long as the document is open
+_refshape_caches = {}
+
+
+def get_refshape_cache(analysis):
+    """Returns the RefShapeCache of an analysis, a new one on first use.
+
+    The cache is kept between solver runs, thus a second run of an
+    unchanged analysis does not need to search the mesh again.
+    """
+    open_documents = FreeCAD.listDocuments()
+    for key in list(_refshape_caches):
+        if key[0] not in open_documents:
+            del _refshape_caches[key]
+    key = (analysis.Document.Name, analysis.Name)
+    if key not in _refshape_caches:
+        _refshape_caches[key] = RefShapeCache()
+    return _refshape_caches[key]
+
+
+class RefShapeCache:
+    """Memoizes the searches of reference shapes in a FemMesh.
+
+    Parameters
+    ----------
+    max_entries : int
+        number of search results which are kept
+
+    The key of a search is the content hash of the mesh, the geometry hash
+    of the reference shape and the FemMesh search method, for example
+    getNodesByFace. If the mesh changes, all results are dropped. If a
+    reference shape changes, its hash changes and it is searched again.
+    See meshtools.use_refshape_cache() for how the cache is activated.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.femmesh = None
+        self.mesh_key = None
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    def set_mesh(self, femmesh, femnodes_mesh=None):
+        """Sets the mesh for the following searches.
+
+        femnodes_mesh are the femmesh.Nodes, if they are known already.
+        """
+        mesh_key = get_femmesh_hash(femmesh, femnodes_mesh)
+        if mesh_key != self.mesh_key:
+            if self._results:
+                FreeCAD.Console.PrintLog("Mesh has changed, reference shape cache cleared.\n")
+            self._results.clear()
+            self.mesh_key = mesh_key
+        self.femmesh = femmesh
+
+    def lookup(self, femmesh, method_name, shape):
+        """Returns getattr(femmesh, method_name)(shape), from the cache if possible."""
+        if femmesh is not self.femmesh:
+            # some other mesh, the mesh key is only known for the mesh of set_mesh()
+            return getattr(femmesh, method_name)(shape)
+        key = (self.mesh_key, get_shape_hash(shape), method_name)
+        if key in self._results:
+            self.hits += 1
+            self._results.move_to_end(key)
+            return list(self._results[key])
+        self.misses += 1
+        result = getattr(femmesh, method_name)(shape)
+        self._results[key] = tuple(result)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._results.clear()
+        self.mesh_key = None
+        self.femmesh = None
+
+
+def get_femmesh_hash(femmesh, femnodes_mesh=None):
+    """Returns a hash of the nodes and the elements with their nodes of a FemMesh."""
+    if femnodes_mesh is None:
+        femnodes_mesh = femmesh.Nodes
+    node_count = len(femnodes_mesh)
+    sha = hashlib.sha1()
+    sha.update(
+        np.array(
+            [node_count, femmesh.EdgeCount, femmesh.FaceCount, femmesh.VolumeCount], dtype=np.int64
+        ).tobytes()
+    )
+    sha.update(np.fromiter(femnodes_mesh.keys(), dtype=np.int64, count=node_count).tobytes())
+    sha.update(
+        np.fromiter(
+            chain.from_iterable(femnodes_mesh.values()), dtype=np.float64, count=3 * node_count
+        ).tobytes()
+    )
+    # a remesh may keep the nodes and the element ids but connect them differently
+    # the dat export writes the ids and the nodes of all elements in one call
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dat_file = os.path.join(tmp_dir, "femmesh.dat")
+        femmesh.write(dat_file)
+        with open(dat_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha.update(chunk)
+    return sha.hexdigest()
+
+
+def get_shape_hash(shape):
+    """Returns a hash of the geometry and the placement of a shape."""
+    # a triangulation of the shape is written too, at worst this is a cache miss
+    return hashlib.sha1(shape.exportBrepToString().encode()).hexdigest()
+
+
+##  @}
@@ -232,6 +232,12 @@ class ResultMechanical(base_fempythonobject.BaseFemPythonObject):
         zero_list = 26 * [0]
         obj.Stats = zero_list
 
+    def onChanged(self, obj, prop):
+        # drop the cached stats of a changed field, see resulttools.get_field_stats()
+        field_stats = getattr(self, "field_stats", None)
+        if field_stats:
+            field_stats.pop(prop, None)
+
     def onDocumentRestored(self, obj):
         # migrate old result objects, because property "StressValues"
         # was renamed to "vonMises" in commit 8b68ab7
@@ -255,3 +261,9 @@ class ResultMechanical(base_fempythonobject.BaseFemPythonObject):
             for i in range(12, -1, -1):
                 del temp[3 * i + 1]
             obj.Stats = temp
+
+        # result objects imported with lazy loading, see importCcxFrdResults.LazyResultLoader
+        if getattr(obj, "FrdFile", ""):
+            from feminout.importCcxFrdResults import restore_lazy_result
+
+            restore_lazy_result(obj)
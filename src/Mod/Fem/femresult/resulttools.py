@@ -27,6 +27,7 @@ __url__ = "https://www.freecad.org"
 #  @{
 
 import numpy as np
+from collections import namedtuple
 from math import isnan
 
 import FreeCAD
@@ -34,6 +35,30 @@ import FreeCAD
 from femtools.femutils import is_of_type
 
 
+# result type: (result object property, vector component or None for scalars)
+# the order is the order of the min, max pairs in the Stats property
+STATS_FIELDS = {
+    "U1": ("DisplacementVectors", 0),
+    "U2": ("DisplacementVectors", 1),
+    "U3": ("DisplacementVectors", 2),
+    "Uabs": ("DisplacementLengths", None),
+    "Sabs": ("vonMises", None),
+    "MaxPrin": ("PrincipalMax", None),
+    "MidPrin": ("PrincipalMed", None),
+    "MinPrin": ("PrincipalMin", None),
+    "MaxShear": ("MaxShear", None),
+    "Peeq": ("Peeq", None),
+    "Temp": ("Temperature", None),
+    "MFlow": ("MassFlowRate", None),
+    "NPress": ("NetworkPressure", None),
+}
+
+# percentiles calculated with the field stats, for example to clip the color range
+STATS_PERCENTILES = (1.0, 2.0, 5.0, 95.0, 98.0, 99.0)
+
+FieldStats = namedtuple("FieldStats", ["min", "max", "nan_count", "percentiles"])
+
+
 def purge_results(analysis):
     """Removes all result objects and result meshes from an analysis group.
 
@@ -76,6 +101,24 @@ def purge_results(analysis):
     analysis.Document.recompute()
 
 
+def load_lazy_result(resultobj):
+    """Fills the node data of a result object imported with lazy loading.
+
+    Parameters
+    ----------
+    resultobj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+
+    Result objects without lazy loader or with their data already
+    loaded are returned unchanged, see importCcxFrdResults.importFrd().
+    """
+
+    lazy_loader = getattr(getattr(resultobj, "Proxy", None), "lazy_loader", None)
+    if lazy_loader is not None:
+        resultobj = lazy_loader.load(resultobj)
+    return resultobj
+
+
 def reset_mesh_deformation(resultobj):
     """Resets result mesh deformation.
 
@@ -110,6 +153,7 @@ def reset_mesh_color(resultobj):
 
 def show_displacement(resultobj, displacement_factor=0.0):
     if FreeCAD.GuiUp:
+        load_lazy_result(resultobj)
         if resultobj.Mesh.ViewObject.Visibility is False:
             resultobj.Mesh.ViewObject.Visibility = True
         resultobj.Mesh.ViewObject.setNodeDisplacementByVectors(
@@ -118,7 +162,7 @@ def show_displacement(resultobj, displacement_factor=0.0):
         resultobj.Mesh.ViewObject.applyDisplacement(displacement_factor)
 
 
-def show_result(resultobj, result_type="Sabs", limit=None):
+def show_result(resultobj, result_type="Sabs", limit=None, percentile=None):
     """Sets mesh color using selected type of results.
 
     Parameters
@@ -127,34 +171,36 @@ def show_result(resultobj, result_type="Sabs", limit=None):
         FreeCAD FEM mechanical result object
     result_type : str, optional
         default is Sabs
-        FreeCAD FEM mechanical result object
+        allowed are: see dict keys of STATS_FIELDS, for example
         - U1, U2, U3 - deformation
         - Uabs - absolute deformation
         - Sabs - Von Mises stress
     limit : float
         limit cutoff value. All values over the limit are treated
         as equal to the limit. Useful for filtering out hotspots.
+    percentile : float, optional
+        one of STATS_PERCENTILES over 50, for example 99. The values are
+        clipped to the range between the 100 - percentile and the
+        percentile percentile of the result type.
     """
 
     if result_type == "None":
         reset_mesh_color(resultobj.Mesh)
         return
     if resultobj:
-        if result_type == "Sabs":
-            values = resultobj.vonMises
-        elif result_type == "Uabs":
-            values = resultobj.DisplacementLengths
-        # TODO: the result object does have more result types to show, implement them
-        else:
-            match = {"U1": 0, "U2": 1, "U3": 2}
-            d = zip(*resultobj.DisplacementVectors)
-            values = list(d[match[result_type]])
-        show_color_by_scalar_with_cutoff(resultobj, values, limit)
+        load_lazy_result(resultobj)
+        values = get_field_values(resultobj, result_type)
+        lower_limit = None
+        if percentile is not None:
+            lower_limit, upper_limit = get_color_range(resultobj, result_type, percentile)
+            if not limit or upper_limit < limit:
+                limit = upper_limit
+        show_color_by_scalar_with_cutoff(resultobj, values.tolist(), limit, lower_limit)
     else:
         FreeCAD.Console.PrintError("Error, No result object given.\n")
 
 
-def show_color_by_scalar_with_cutoff(resultobj, values, limit=None):
+def show_color_by_scalar_with_cutoff(resultobj, values, limit=None, lower_limit=None):
     """Sets mesh color using list of values. Internally used by show_result function.
 
     Parameters
@@ -168,15 +214,12 @@ def show_color_by_scalar_with_cutoff(resultobj, values, limit=None):
     limit : float
         limit cutoff value. All values over the limit are treated
         as equal to the limit. Useful for filtering out hotspots.
+    lower_limit : float, optional
+        All values under the lower limit are treated as equal to it.
     """
 
-    if limit:
-        filtered_values = []
-        for v in values:
-            if v > limit:
-                filtered_values.append(limit)
-            else:
-                filtered_values.append(v)
+    if limit or lower_limit is not None:
+        filtered_values = np.clip(values, lower_limit, limit or None).tolist()
     else:
         filtered_values = values
     if FreeCAD.GuiUp:
@@ -247,24 +290,126 @@ def get_all_stats(res_obj):
     """
 
     m = res_obj.Stats
-    stats_dict = {
-        "U1": (m[0], m[1]),
-        "U2": (m[2], m[3]),
-        "U3": (m[4], m[5]),
-        "Uabs": (m[6], m[7]),
-        "Sabs": (m[8], m[9]),
-        "MaxPrin": (m[10], m[11]),
-        "MidPrin": (m[12], m[13]),
-        "MinPrin": (m[14], m[15]),
-        "MaxShear": (m[16], m[17]),
-        "Peeq": (m[18], m[19]),
-        "Temp": (m[20], m[21]),
-        "MFlow": (m[22], m[23]),
-        "NPress": (m[24], m[25]),
-    }
+    stats_dict = {}
+    for i, result_type in enumerate(STATS_FIELDS):
+        stats_dict[result_type] = (m[2 * i], m[2 * i + 1])
     return stats_dict
 
 
+def get_field_values(res_obj, result_type):
+    """Returns the values of a result type as NumPy array.
+
+    Parameters
+    ----------
+    res_obj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+    result_type : str
+        type of FEM result, see dict keys of STATS_FIELDS
+    """
+
+    prop, component = STATS_FIELDS[result_type]
+    values = getattr(res_obj, prop)
+    if component is None:
+        return np.asarray(values, dtype=np.float64)
+    return np.asarray(values, dtype=np.float64).reshape(-1, 3)[:, component]
+
+
+def get_field_stats(res_obj, result_type):
+    """Returns the FieldStats of a result type.
+
+    Parameters
+    ----------
+    res_obj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+    result_type : str
+        type of FEM result, see dict keys of STATS_FIELDS
+
+    The stats are calculated once per result property and kept on the
+    result object proxy until the property changes, see
+    ResultMechanical.onChanged(). Result objects with lazy loading are
+    loaded first.
+    """
+
+    load_lazy_result(res_obj)
+    return _get_field_stats(res_obj, result_type)
+
+
+def _get_field_stats(res_obj, result_type):
+    prop, component = STATS_FIELDS[result_type]
+    proxy = getattr(res_obj, "Proxy", None)
+    stats_cache = getattr(proxy, "field_stats", None)
+    if stats_cache is None and proxy is not None:
+        stats_cache = proxy.field_stats = {}
+    stats = stats_cache.get(prop) if stats_cache is not None else None
+    if stats is None:
+        values = np.asarray(getattr(res_obj, prop), dtype=np.float64)
+        if component is not None:
+            values = values.reshape(-1, 3)
+        stats = calculate_field_stats(values)
+        if stats_cache is not None:
+            stats_cache[prop] = stats
+    return stats[component or 0]
+
+
+def get_color_range(res_obj, result_type, percentile=99.0):
+    """Returns the color range of a result type clipped to percentiles.
+
+    Parameters
+    ----------
+    res_obj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+    result_type : str
+        type of FEM result, see dict keys of STATS_FIELDS
+    percentile : float
+        upper percentile of the range, the lower one is 100 - percentile,
+        both have to be in STATS_PERCENTILES
+
+    Returns the values of the lower and the upper percentile.
+    """
+
+    stats = get_field_stats(res_obj, result_type)
+    return stats.percentiles[100.0 - percentile], stats.percentiles[percentile]
+
+
+def calculate_field_stats(values, percentiles=STATS_PERCENTILES):
+    """Returns the stats of a scalar or vector field in one vectorized pass.
+
+    Parameters
+    ----------
+    values : list or NumPy array
+        N values of a scalar field or (N, 3) values of a vector field
+    percentiles : tuple of float
+        percentiles to calculate additionally to min and max
+
+    Returns a list with one FieldStats per column, a scalar field has one
+    column. NaN values are ignored and counted. The stats of a column
+    without any value are 0.0.
+    """
+
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim == 1:
+        array = array[:, np.newaxis]
+    count = len(array)
+    nan_counts = np.count_nonzero(np.isnan(array), axis=0)
+    # min and max are the 0 and the 100 percentile
+    q = (0.0, 100.0) + tuple(percentiles)
+    if count == 0:
+        table = np.zeros((len(q), array.shape[1]))
+    elif nan_counts.any():
+        # columns with NaN only are set to 0.0 to avoid all-NaN slice warnings
+        array = np.where(nan_counts == count, 0.0, array)
+        table = np.nanpercentile(array, q, axis=0)
+    else:
+        table = np.percentile(array, q, axis=0)
+
+    stats = []
+    for column, nan_count in zip(table.T.tolist(), nan_counts.tolist()):
+        stats.append(
+            FieldStats(column[0], column[1], nan_count, dict(zip(percentiles, column[2:])))
+        )
+    return stats
+
+
 def fill_femresult_stats(res_obj):
     """Fills a FreeCAD FEM mechanical result object with stats data.
 
@@ -275,102 +420,17 @@ def fill_femresult_stats(res_obj):
     """
 
     FreeCAD.Console.PrintLog("Calculate stats list for result obj: " + res_obj.Name + "\n")
-    # set stats values to 0, they may not exist in res_obj
-    x_min = y_min = z_min = x_max = y_max = z_max = 0
-    a_max = a_min = s_max = s_min = 0
-    p1_min = p1_max = p2_min = p2_max = p3_min = p3_max = 0
-    ms_min = ms_max = peeq_min = peeq_max = 0
-    temp_min = temp_max = 0
-    mflow_min = mflow_max = npress_min = npress_max = 0
-
-    if res_obj.DisplacementVectors:
-        x_max, y_max, z_max = map(max, zip(*res_obj.DisplacementVectors))
-        x_min, y_min, z_min = map(min, zip(*res_obj.DisplacementVectors))
-    if res_obj.DisplacementLengths:
-        a_min = min(res_obj.DisplacementLengths)
-        a_max = max(res_obj.DisplacementLengths)
-    if res_obj.vonMises:
-        s_min = min(res_obj.vonMises)
-        s_max = max(res_obj.vonMises)
-    if res_obj.PrincipalMax:
-        p1_min = min(res_obj.PrincipalMax)
-        p1_max = max(res_obj.PrincipalMax)
-    if res_obj.PrincipalMed:
-        p2_min = min(res_obj.PrincipalMed)
-        p2_max = max(res_obj.PrincipalMed)
-    if res_obj.PrincipalMin:
-        p3_min = min(res_obj.PrincipalMin)
-        p3_max = max(res_obj.PrincipalMin)
-    if res_obj.MaxShear:
-        ms_min = min(res_obj.MaxShear)
-        ms_max = max(res_obj.MaxShear)
-    if res_obj.Peeq:
-        peeq_min = min(res_obj.Peeq)
-        peeq_max = max(res_obj.Peeq)
-    if res_obj.Temperature:
-        temp_min = min(res_obj.Temperature)
-        temp_max = max(res_obj.Temperature)
-    if res_obj.MassFlowRate:
-        # DisplacementVectors is empty, no_of_values needs to be set
-        mflow_min = min(res_obj.MassFlowRate)
-        mflow_max = max(res_obj.MassFlowRate)
-    if res_obj.NetworkPressure:
-        npress_min = min(res_obj.NetworkPressure)
-        npress_max = max(res_obj.NetworkPressure)
-
-    res_obj.Stats = [
-        x_min,
-        x_max,
-        y_min,
-        y_max,
-        z_min,
-        z_max,
-        a_min,
-        a_max,
-        s_min,
-        s_max,
-        p1_min,
-        p1_max,
-        p2_min,
-        p2_max,
-        p3_min,
-        p3_max,
-        ms_min,
-        ms_max,
-        peeq_min,
-        peeq_max,
-        temp_min,
-        temp_max,
-        mflow_min,
-        mflow_max,
-        npress_min,
-        npress_max,
-    ]
-    """
-    stat_types = [
-        "U1",
-        "U2",
-        "U3",
-        "Uabs",
-        "Sabs",
-        "MaxPrin",
-        "MidPrin",
-        "MinPrin",
-        "MaxShear",
-        "Peeq",
-        "Temp",
-        "MFlow",
-        "NPress"
-    ]
-    """
-    # len(stat_types) == 13*3 == 39
+    # the stats of result types not in res_obj are 0
+    stats = []
+    for result_type in STATS_FIELDS:
+        field_stats = _get_field_stats(res_obj, result_type)
+        stats += [field_stats.min, field_stats.max]
+    res_obj.Stats = stats
+    # len(STATS_FIELDS) * 2 == 26
     # do not forget to adapt initialization of all Stats items in modules:
-    # - module femobjects/_FemResultMechanical.py
+    # - module femobjects/result_mechanical.py
     # do not forget to adapt the def get_stats in:
-    # - get_stats in module femresult/resulttools.py
-    # - module femtest/testccxtools.py
-    # TODO: all stats stuff should be reimplemented
-    # maybe a dictionary would be far more robust than a list
+    # - module femtest/app/test_ccxtools.py
 
     FreeCAD.Console.PrintLog("Stats list for result obj: " + res_obj.Name + " calculated\n")
     return res_obj
@@ -382,9 +442,19 @@ def add_disp_apps(res_obj):
     return res_obj
 
 
-def add_von_mises(res_obj):
-    mstress = []
-    iterator = zip(
+def get_stress_tensors(res_obj):
+    """Returns the node stresses of a result object as (N, 6) array.
+
+    Parameters
+    ----------
+    resultobj : Fem::ResultMechanical
+        FreeCAD FEM mechanical result object
+
+    The columns are Sxx, Syy, Szz, Sxy, Sxz, Syz, the stress_tensor
+    order of the calculate methods below.
+    """
+
+    columns = (
         res_obj.NodeStressXX,
         res_obj.NodeStressYY,
         res_obj.NodeStressZZ,
@@ -392,9 +462,17 @@ def add_von_mises(res_obj):
         res_obj.NodeStressXZ,
         res_obj.NodeStressYZ,
     )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        mstress.append(calculate_von_mises((Sxx, Syy, Szz, Sxy, Sxz, Syz)))
-    res_obj.vonMises = mstress
+    # the stress lists might differ in length, zip did cut them as well
+    count = min(len(c) for c in columns)
+    stress_tensors = np.empty((count, 6), dtype=np.float64)
+    for i, column in enumerate(columns):
+        stress_tensors[:, i] = column[:count]
+    return stress_tensors
+
+
+def add_von_mises(res_obj):
+    stress_tensors = get_stress_tensors(res_obj)
+    res_obj.vonMises = calculate_von_mises_batch(stress_tensors).tolist()
     FreeCAD.Console.PrintLog("Added von Mises stress.\n")
     return res_obj
 
@@ -404,28 +482,15 @@ def add_principal_stress_std(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
-    )
-    for Sxx, Syy, Szz, Sxy, Sxz, Syz in iterator:
-        prin1, prin2, prin3, shear = calculate_principal_stress_std((Sxx, Syy, Szz, Sxy, Sxz, Syz))
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+    stress_tensors = get_stress_tensors(res_obj)
+    principal = calculate_principal_stress_std_batch(stress_tensors)
+    prinstress1 = principal[:, 0]
+    prinstress2 = principal[:, 1]
+    prinstress3 = principal[:, 2]
+    res_obj.PrincipalMax = prinstress1.tolist()
+    res_obj.PrincipalMed = prinstress2.tolist()
+    res_obj.PrincipalMin = prinstress3.tolist()
+    res_obj.MaxShear = principal[:, 3].tolist()
     FreeCAD.Console.PrintLog("Added standard principal stresses and max shear values.\n")
 
     #
@@ -477,20 +542,19 @@ def calculate_csr(ps1, ps2, ps3, alpha, beta, res_obj):
             unless available from extensive research experiments
             T = pressure / von Mises stress (stress triaxiality)
     """
-    csr = []  # critical strain ratio
+    ps1 = np.asarray(ps1, dtype=np.float64)
+    ps2 = np.asarray(ps2, dtype=np.float64)
+    ps3 = np.asarray(ps3, dtype=np.float64)
     nsr = len(ps1)  # number of stress results
-    for i in range(nsr):
-        p = (ps1[i] + ps2[i] + ps3[i]) / 3.0  # pressure
-        svm = np.sqrt(
-            1.5 * (ps1[i] - p) ** 2 + 1.5 * (ps2[i] - p) ** 2 + 1.5 * (ps3[i] - p) ** 2
-        )  # von Mises stress: https://en.wikipedia.org/wiki/Von_Mises_yield_criterion
-        if svm != 0.0:
-            T = p / svm  # stress triaxiality
-        else:
-            T = 0.0
-        critical_strain = alpha * np.exp(-beta * T)  # critical strain
-        csr.append(abs(res_obj.Peeq[i]) / critical_strain)  # critical strain ratio
-    return csr
+    p = (ps1 + ps2 + ps3) / 3.0  # pressure
+    svm = np.sqrt(
+        1.5 * (ps1 - p) ** 2 + 1.5 * (ps2 - p) ** 2 + 1.5 * (ps3 - p) ** 2
+    )  # von Mises stress: https://en.wikipedia.org/wiki/Von_Mises_yield_criterion
+    T = np.zeros(nsr)  # stress triaxiality
+    np.divide(p, svm, out=T, where=svm != 0.0)
+    critical_strain = alpha * np.exp(-beta * T)  # critical strain
+    peeq = np.asarray(res_obj.Peeq[:nsr], dtype=np.float64)
+    return (np.abs(peeq) / critical_strain).tolist()  # critical strain ratio
 
 
 def get_concrete_nodes(res_obj):
@@ -550,21 +614,6 @@ def add_principal_stress_reinforced(res_obj):
     # TODO may be use only one container for principal stresses in result object
     # https://forum.freecad.org/viewtopic.php?f=18&t=33106&p=416006#p416006
     # but which one is better
-    prinstress1 = []
-    prinstress2 = []
-    prinstress3 = []
-    shearstress = []
-    ps1v = []
-    ps2v = []
-    ps3v = []
-    #
-    # additional arrays to hold reinforcement ratios
-    # and mohr coulomb stress
-    #
-    rhx = []
-    rhy = []
-    rhz = []
-    moc = []
 
     # material parameter
     for obj in res_obj.getParentGroup().Group:
@@ -582,65 +631,42 @@ def add_principal_stress_reinforced(res_obj):
     # print(matrix_cs)
     # print(reinforce_yield)
 
-    iterator = zip(
-        res_obj.NodeStressXX,
-        res_obj.NodeStressYY,
-        res_obj.NodeStressZZ,
-        res_obj.NodeStressXY,
-        res_obj.NodeStressXZ,
-        res_obj.NodeStressYZ,
+    stress_tensors = get_stress_tensors(res_obj)
+    nsr = len(stress_tensors)
+    concrete = ic[:nsr] == 1
+    principal, psv = calculate_principal_stress_reinforced_batch(stress_tensors)
+
+    #
+    # reinforcement ratios and mohr coulomb criterion
+    # for concrete scxx etc. are affected by
+    # reinforcement (see calculate_rho(stress_tensor)). for all other
+    # materials scxx etc. are the original stresses
+    #
+    rho = np.zeros((nsr, 3))
+    for isv in np.flatnonzero(concrete):
+        rho[isv] = calculate_rho(stress_tensors[isv], reinforce_yield)
+    moc = np.zeros(nsr)
+    moc[concrete] = calculate_mohr_coulomb(
+        principal[concrete, 0], principal[concrete, 2], matrix_af, matrix_cs
     )
-    for isv, stress_tensor in enumerate(iterator):
-
-        rhox = 0.0
-        rhoy = 0.0
-        rhoz = 0.0
-        mc = 0.0
-
-        if ic[isv] == 1:
-            #
-            # for concrete scxx etc. are affected by
-            # reinforcement (see calculate_rho(stress_tensor)). for all other
-            # materials scxx etc. are the original stresses
-            #
-            rhox, rhoy, rhoz = calculate_rho(stress_tensor, reinforce_yield)
-
-        prin1, prin2, prin3, shear, psv = calculate_principal_stress_reinforced(stress_tensor)
-
-        prinstress1.append(prin1)
-        prinstress2.append(prin2)
-        prinstress3.append(prin3)
-        shearstress.append(shear)
-        ps1v.append(psv[0])
-        ps2v.append(psv[1])
-        ps3v.append(psv[2])
-
-        #
-        # reinforcement ratios and mohr coulomb criterion
-        #
-        rhx.append(rhox)
-        rhy.append(rhoy)
-        rhz.append(rhoz)
-        if ic[isv] == 1:
-            mc = calculate_mohr_coulomb(prin1, prin3, matrix_af, matrix_cs)
-        moc.append(mc)
-
-    res_obj.PrincipalMax = prinstress1
-    res_obj.PrincipalMed = prinstress2
-    res_obj.PrincipalMin = prinstress3
-    res_obj.MaxShear = shearstress
+
+    res_obj.PrincipalMax = principal[:, 0].tolist()
+    res_obj.PrincipalMed = principal[:, 1].tolist()
+    res_obj.PrincipalMin = principal[:, 2].tolist()
+    res_obj.MaxShear = principal[:, 3].tolist()
     #
     # additional concrete and principal stress plot
     # results for use in _ViewProviderFemResultMechanical
     #
-    res_obj.ReinforcementRatio_x = rhx
-    res_obj.ReinforcementRatio_y = rhy
-    res_obj.ReinforcementRatio_z = rhz
-    res_obj.MohrCoulomb = moc
+    res_obj.ReinforcementRatio_x = rho[:, 0].tolist()
+    res_obj.ReinforcementRatio_y = rho[:, 1].tolist()
+    res_obj.ReinforcementRatio_z = rho[:, 2].tolist()
+    res_obj.MohrCoulomb = moc.tolist()
 
-    res_obj.PS1Vector = ps1v
-    res_obj.PS2Vector = ps2v
-    res_obj.PS3Vector = ps3v
+    # PropertyVectorList needs tuples
+    res_obj.PS1Vector = list(map(tuple, psv[:, 0].tolist()))
+    res_obj.PS2Vector = list(map(tuple, psv[:, 1].tolist()))
+    res_obj.PS3Vector = list(map(tuple, psv[:, 2].tolist()))
 
     FreeCAD.Console.PrintLog(
         "Added reinforcement principal stresses and max shear values as well as "
@@ -767,6 +793,82 @@ def calculate_principal_stress_reinforced(stress_tensor):
     )
 
 
+def calculate_von_mises_batch(stress_tensors):
+    """Calculate Von mises stress of many nodes, see calculate_von_mises().
+
+    stress_tensors ... (N, 6) array of (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+
+    NaN in a stress tensor results in NaN.
+    """
+    stress_tensors = np.asarray(stress_tensors, dtype=np.float64).reshape(-1, 6)
+    normal = stress_tensors[:, :3]
+    shear = stress_tensors[:, 3:]
+    pressure = normal.mean(axis=1, keepdims=True)
+    return np.sqrt(
+        1.5 * np.square(normal - pressure).sum(axis=1) + 3.0 * np.square(shear).sum(axis=1)
+    )
+
+
+def _get_stress_matrices(stress_tensors):
+    # (N, 3, 3) stress matrices and the mask of the tensors without NaN
+    # the NaN tensors are set to zero, LAPACK does not accept NaN
+    stress_tensors = np.asarray(stress_tensors, dtype=np.float64).reshape(-1, 6)
+    valid = ~np.isnan(stress_tensors).any(axis=1)
+    s11, s22, s33, s12, s31, s23 = np.where(valid[:, None], stress_tensors, 0.0).T
+    sigma = np.stack(
+        (
+            np.stack((s11, s12, s31), axis=-1),
+            np.stack((s12, s22, s23), axis=-1),
+            np.stack((s31, s23, s33), axis=-1),
+        ),
+        axis=1,
+    )  # https://forum.freecad.org/viewtopic.php?f=18&t=24637&start=10#p240408
+    return sigma, valid
+
+
+def calculate_principal_stress_std_batch(stress_tensors):
+    """Calculate principal stresses of many nodes, see calculate_principal_stress_std().
+
+    stress_tensors ... (N, 6) array of (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+
+    Returns a (N, 4) array of the three principal stresses in descending
+    order and the max shear. NaN in a stress tensor results in NaN.
+    """
+    sigma, valid = _get_stress_matrices(stress_tensors)
+    principal = np.empty((len(sigma), 4))
+    principal[:, :3] = np.linalg.eigvalsh(sigma)[:, ::-1]
+    principal[:, 3] = (principal[:, 0] - principal[:, 2]) / 2.0
+    principal[~valid] = np.nan
+    return principal
+
+
+def calculate_principal_stress_reinforced_batch(stress_tensors):
+    """Calculate principal stresses and vectors of many nodes.
+
+    stress_tensors ... (N, 6) array of (Sxx, Syy, Szz, Sxy, Sxz, Syz)
+
+    Returns a (N, 4) array like calculate_principal_stress_std_batch()
+    and a (N, 3, 3) array of the principal stress vectors, the vectors
+    of calculate_principal_stress_reinforced() for every node.
+    NaN in a stress tensor results in NaN.
+    """
+    sigma, valid = _get_stress_matrices(stress_tensors)
+    eigenvalues, eigenvectors = np.linalg.eig(sigma)
+
+    # see calculate_principal_stress_reinforced()
+    eigenvalues = eigenvalues.real
+    eigenvectors = eigenvectors.real * eigenvalues[:, None, :]
+
+    idx = eigenvalues.argsort(axis=1)[:, ::-1]
+    principal = np.empty((len(sigma), 4))
+    principal[:, :3] = np.take_along_axis(eigenvalues, idx, axis=1)
+    principal[:, 3] = (principal[:, 0] - principal[:, 2]) / 2.0
+    vectors = np.take_along_axis(eigenvectors, idx[:, None, :], axis=2).transpose(0, 2, 1)
+    principal[~valid] = np.nan
+    vectors[~valid] = np.nan
+    return principal, vectors
+
+
 def calculate_rho(stress_tensor, fy):
     """Calculation of Reinforcement Ratios and Concrete Stresses
     (in accordance with http://heronjournal.nl/53-4/3.pdf)
@@ -933,21 +1035,26 @@ def calculate_mohr_coulomb(prin1, prin3, phi, fck):
     ----------
     - phi: angle of internal friction
     - fck: factored compressive strength of the matrix material (usually concrete)
+
+    prin1 and prin3 might be arrays of many nodes too.
     """
 
     coh = fck * (1 - np.sin(phi)) / 2 / np.cos(phi)
 
     mc_stress = (prin1 - prin3) + (prin1 + prin3) * np.sin(phi) - 2.0 * coh * np.cos(phi)
 
-    if mc_stress < 0.0:
-        mc_stress = 0.0
-
+    # NaN is kept
+    mc_stress = np.where(mc_stress < 0.0, 0.0, mc_stress)
+    if mc_stress.ndim == 0:
+        return float(mc_stress)
     return mc_stress
 
 
 def calculate_disp_abs(displacements):
     # see https://forum.freecad.org/viewtopic.php?f=18&t=33106&start=100#p296657
-    return [np.linalg.norm(nd) for nd in displacements]
+    if len(displacements) == 0:
+        return []
+    return np.linalg.norm(np.asarray(displacements, dtype=np.float64), axis=1).tolist()
 
 
 ##  @}
@@ -0,0 +1,422 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "FreeCAD FEM CalculiX parametric study"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## \addtogroup FEM
+#  @{
+
+import csv
+import itertools
+import json
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from concurrent.futures import FIRST_COMPLETED
+
+from builtins import open as pyopen
+
+import numpy as np
+
+import FreeCAD
+
+from femmesh import meshsetsgetter
+from femsolver import settings
+from femtools import femutils
+from femtools import membertools
+from . import writer
+
+
+STATE_FILE = "study.json"
+SUMMARY_FILE = "summary.csv"
+SUMMARY_COLUMNS = ("max_displacement", "max_von_mises", "max_temperature")
+
+# job status
+PENDING = "pending"
+WRITTEN = "written"
+DONE = "done"
+FAILED = "failed"
+
+
+def get_sweep_variants(sweep):
+    """Returns the parameters of all combinations of a parameter sweep.
+
+    Parameters
+    ----------
+    sweep : dict
+        {parameter: [value, ...]}, see CcxStudy.add_variant() for parameters
+
+    The variants are returned as a list of dicts {parameter: value}, the last
+    parameter of the sweep changes fastest.
+    """
+    keys = list(sweep)
+    return [dict(zip(keys, values)) for values in itertools.product(*sweep.values())]
+
+
+class CcxStudy:
+    """Runs variants of a CalculiX analysis without user interaction.
+
+    Parameters
+    ----------
+    analysis : Fem::FemAnalysis
+        the analysis the variants are made from
+    study_dir : str
+        directory of the study, every variant gets a sub directory
+    solver : Fem::FemSolverObjectPython, optional
+        CalculiX solver of the analysis, the first one if not given
+    processes : int, optional
+        number of solver runs at the same time, default one per cpu
+    threads_per_job : int, optional
+        OMP_NUM_THREADS of every solver run
+
+    A variant sets document object properties, for example a force, a
+    material value or the size of the mesh. The variants are applied one
+    after the other to the analysis itself and the original values are
+    restored afterwards, thus no copies of the document objects are needed.
+    The input file of a variant is written in this thread, the solver runs
+    in the background while the next input file is written. The solver
+    runs are bound by processes.
+
+    The state of all jobs is saved to study.json in the study directory
+    after every change. A new CcxStudy on the same directory continues an
+    interrupted study, solved variants are not solved again.
+
+    Example:
+    study = CcxStudy(doc.Analysis, "/tmp/box_study")
+    study.add_sweep({"FemConstraintForce.Force": ["10 kN", "20 kN"]})
+    summary = study.run()
+    """
+
+    def __init__(self, analysis, study_dir, solver=None, processes=None, threads_per_job=1):
+        self.analysis = analysis
+        self.document = analysis.Document
+        self.study_dir = study_dir
+        if solver is None:
+            solver = membertools.get_single_member(analysis, "Fem::SolverCalculiX")
+        if solver is None:
+            solver = membertools.get_single_member(analysis, "Fem::SolverCcxTools")
+        if solver is None:
+            raise ValueError("No CalculiX solver in the analysis.")
+        self.solver = solver
+        self.processes = processes or os.cpu_count() or 1
+        self.threads_per_job = threads_per_job
+        self.mesh_obj = membertools.get_mesh_to_solve(analysis)[0]
+        self.jobs = {}
+        os.makedirs(study_dir, exist_ok=True)
+        self.load_state()
+
+    # ********************************************************************************************
+    # jobs
+    def add_variant(self, name, parameters):
+        """Adds a variant, or keeps the state of a known variant with the same parameters.
+
+        Parameters
+        ----------
+        name : str
+            name of the variant, used as directory name
+        parameters : dict
+            {"ObjectName.Property": value} or for map properties like the
+            Material of a material object {"ObjectName.Property.Key": value}.
+            Values are set as in the Python console, for example "20 kN",
+            they must be JSON serializable to be saved in the state file.
+        """
+        job = self.jobs.get(name)
+        if job is not None and job["parameters"] == parameters:
+            return
+        self.jobs[name] = {"parameters": parameters, "status": PENDING, "results": {}}
+        self.save_state()
+
+    def add_sweep(self, sweep, name_format="variant_{:03d}"):
+        """Adds a variant for every combination of the sweep values, see get_sweep_variants()."""
+        for i, parameters in enumerate(get_sweep_variants(sweep)):
+            self.add_variant(name_format.format(i), parameters)
+
+    def get_job_dir(self, name):
+        return os.path.join(self.study_dir, name)
+
+    # ********************************************************************************************
+    # state
+    def load_state(self):
+        state_file = os.path.join(self.study_dir, STATE_FILE)
+        if not os.path.isfile(state_file):
+            return
+        with pyopen(state_file) as f:
+            self.jobs = json.load(f)["jobs"]
+        FreeCAD.Console.PrintMessage(
+            "Study state loaded, {} of {} variants done.\n".format(
+                self.count_jobs(DONE), len(self.jobs)
+            )
+        )
+
+    def save_state(self):
+        # write to a temporary file first, an interruption does not leave a broken state
+        state_file = os.path.join(self.study_dir, STATE_FILE)
+        with pyopen(state_file + ".tmp", "w") as f:
+            json.dump({"jobs": self.jobs}, f, indent=1)
+        os.replace(state_file + ".tmp", state_file)
+
+    def count_jobs(self, status):
+        return sum(1 for job in self.jobs.values() if job["status"] == status)
+
+    # ********************************************************************************************
+    # run
+    def run(self):
+        """Writes, solves and evaluates all variants which are not done yet.
+
+        Returns the summary, see get_summary().
+        """
+        time_start = time.perf_counter()
+        todo = [name for name, job in self.jobs.items() if job["status"] != DONE]
+        FreeCAD.Console.PrintMessage(
+            "Study: {} of {} variants to solve with {} solver processes.\n".format(
+                len(todo), len(self.jobs), self.processes
+            )
+        )
+        ccx_binary = settings.get_binary("Calculix")
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.processes) as executor:
+            try:
+                for name in todo:
+                    if not self.is_written(name):
+                        self.write_job(name)
+                    if self.is_written(name):
+                        future = executor.submit(self.solve_job, name, ccx_binary)
+                        running[future] = name
+                    # evaluate the finished solver runs while the next input file is written
+                    self.evaluate_finished([f for f in running if f.done()], running)
+                while running:
+                    finished = wait(list(running), return_when=FIRST_COMPLETED)[0]
+                    self.evaluate_finished(finished, running)
+            finally:
+                for future in running:
+                    future.cancel()
+                self.save_state()
+        self.write_summary()
+        FreeCAD.Console.PrintMessage(
+            "Study: {} variants done, {} failed in {:.1f} seconds.\n".format(
+                self.count_jobs(DONE), self.count_jobs(FAILED), time.perf_counter() - time_start
+            )
+        )
+        return self.get_summary()
+
+    def is_written(self, name):
+        job = self.jobs[name]
+        input_file = job.get("input_file", "")
+        return job["status"] in (WRITTEN, FAILED) and os.path.isfile(input_file)
+
+    def write_job(self, name):
+        """Applies the variant to the analysis and writes its input file."""
+        job = self.jobs[name]
+        job_dir = self.get_job_dir(name)
+        os.makedirs(job_dir, exist_ok=True)
+        FreeCAD.Console.PrintMessage(f"Study: write input file of {name}\n")
+        original_values = {}
+        original_femmesh = None
+        try:
+            # a failing parameter leaves the already set ones to be restored
+            self.apply_parameters(job["parameters"], original_values)
+            if self.needs_remesh(original_values):
+                original_femmesh = self.mesh_obj.FemMesh.copy()
+                self.remesh()
+            meshdatagetter = meshsetsgetter.MeshSetsGetter(
+                self.analysis,
+                self.solver,
+                self.mesh_obj,
+                membertools.AnalysisMember(self.analysis),
+            )
+            meshdatagetter.get_mesh_sets()
+            inp_writer = writer.FemInputWriterCcx(
+                self.analysis,
+                self.solver,
+                self.mesh_obj,
+                meshdatagetter.member,
+                job_dir,
+                meshdatagetter.mat_geo_sets,
+            )
+            job["input_file"] = inp_writer.write_solver_input()
+        except Exception as e:
+            FreeCAD.Console.PrintError(f"Study: writing input file of {name} failed: {e}\n")
+            job["input_file"] = ""
+        finally:
+            self.restore_parameters(original_values)
+            if original_femmesh is not None:
+                self.mesh_obj.FemMesh = original_femmesh
+        job["status"] = WRITTEN if job["input_file"] else FAILED
+        self.save_state()
+
+    def solve_job(self, name, ccx_binary):
+        # runs in a thread of the pool, only the files of the job are used here
+        input_file = self.jobs[name]["input_file"]
+        job_dir = os.path.dirname(input_file)
+        env = dict(os.environ)
+        env["OMP_NUM_THREADS"] = str(self.threads_per_job)
+        time_start = time.perf_counter()
+        with pyopen(os.path.join(job_dir, "ccx_output.txt"), "w") as output:
+            returncode = subprocess.call(
+                [ccx_binary, "-i", os.path.splitext(os.path.basename(input_file))[0]],
+                cwd=job_dir,
+                env=env,
+                stdout=output,
+                stderr=subprocess.STDOUT,
+                startupinfo=femutils.startProgramInfo(""),
+            )
+        return returncode, time.perf_counter() - time_start
+
+    def evaluate_finished(self, finished, running):
+        for future in finished:
+            name = running.pop(future)
+            job = self.jobs[name]
+            try:
+                returncode, solve_time = future.result()
+            except OSError as e:
+                FreeCAD.Console.PrintError(f"Study: CalculiX of {name} could not be run: {e}\n")
+                job["status"] = FAILED
+                self.save_state()
+                continue
+            job["returncode"] = returncode
+            job["solve_time"] = round(solve_time, 3)
+            frd_file = os.path.splitext(job["input_file"])[0] + ".frd"
+            if returncode != 0 or not os.path.isfile(frd_file):
+                FreeCAD.Console.PrintError(
+                    f"Study: CalculiX of {name} failed with exit code {returncode}.\n"
+                )
+                job["status"] = FAILED
+            else:
+                job["results"] = get_frd_result_summary(frd_file)
+                job["status"] = DONE
+                FreeCAD.Console.PrintMessage(f"Study: {name} done in {solve_time:.1f} seconds.\n")
+            self.save_state()
+
+    # ********************************************************************************************
+    # parameters
+    def apply_parameters(self, parameters, original_values):
+        """Sets the parameters, adds the original values to original_values.
+
+        The original value of a property is added to the dict
+        {(object, property): value} before the property is set.
+        """
+        for parameter, value in parameters.items():
+            obj_name, prop, *key = parameter.split(".", 2)
+            obj = self.document.getObject(obj_name)
+            if obj is None or not hasattr(obj, prop):
+                raise ValueError(f"Study parameter {parameter}: unknown object or property.")
+            if (obj, prop) not in original_values:
+                original_values[(obj, prop)] = getattr(obj, prop)
+            if key:
+                # map properties have to be set as a whole
+                prop_map = dict(getattr(obj, prop))
+                prop_map[key[0]] = value
+                value = prop_map
+            setattr(obj, prop, value)
+        self.document.recompute()
+
+    def restore_parameters(self, original_values):
+        for (obj, prop), value in original_values.items():
+            setattr(obj, prop, value)
+        self.document.recompute()
+
+    def needs_remesh(self, changed_values):
+        # a changed mesh object, mesh region or geometry needs a new mesh
+        mesh_dependencies = self.mesh_obj.OutListRecursive
+        for obj, prop in changed_values:
+            if obj is self.mesh_obj or obj in mesh_dependencies:
+                return True
+        return False
+
+    def remesh(self):
+        mesh_type = femutils.type_of_obj(self.mesh_obj)
+        if mesh_type == "Fem::FemMeshGmsh":
+            from femmesh import gmshtools
+
+            error = gmshtools.GmshTools(self.mesh_obj, self.analysis).create_mesh()
+            if error:
+                raise RuntimeError(f"Gmsh failed: {error}")
+        elif mesh_type == "Fem::FemMeshNetgen":
+            from femmesh import netgentools
+
+            tool = netgentools.NetgenTools(self.mesh_obj)
+            tool.prepare()
+            process = tool.compute()
+            process.waitForFinished(-1)
+            if process.exitCode() != 0:
+                raise RuntimeError("Netgen failed.")
+            tool.update_properties()
+        else:
+            raise RuntimeError(f"Meshes of type {mesh_type} can not be remeshed by a study.")
+
+    # ********************************************************************************************
+    # summary
+    def get_summary(self):
+        """Returns one dict per variant with name, status, parameters and result values."""
+        summary = []
+        for name, job in self.jobs.items():
+            row = {"name": name, "status": job["status"]}
+            row.update(job["parameters"])
+            row["solve_time"] = job.get("solve_time")
+            for column in SUMMARY_COLUMNS:
+                row[column] = job["results"].get(column)
+            summary.append(row)
+        return summary
+
+    def write_summary(self):
+        """Writes the summary to summary.csv in the study directory."""
+        summary = self.get_summary()
+        fieldnames = []
+        for row in summary:
+            fieldnames.extend(key for key in row if key not in fieldnames)
+        summary_file = os.path.join(self.study_dir, SUMMARY_FILE)
+        with pyopen(summary_file, "w", newline="") as f:
+            csv_writer = csv.DictWriter(f, fieldnames=fieldnames)
+            csv_writer.writeheader()
+            csv_writer.writerows(summary)
+        FreeCAD.Console.PrintMessage(f"Study summary written to {summary_file}\n")
+
+
+def get_frd_result_summary(frd_file):
+    """Returns the maxima of all result sets of an frd file, see SUMMARY_COLUMNS."""
+    from feminout import readCcxFrd
+    from femresult import resulttools
+
+    maxima = {}
+
+    def set_max(column, values):
+        if len(values) and not np.isnan(values).all():
+            maxima[column] = max(maxima.get(column, -np.inf), float(np.nanmax(values)))
+
+    for result_set in readCcxFrd.read_frd_result(frd_file)["Results"]:
+        if "disp" in result_set:
+            set_max("max_displacement", np.linalg.norm(result_set["disp"].data, axis=1))
+        if "stress" in result_set:
+            set_max(
+                "max_von_mises", resulttools.calculate_von_mises_batch(result_set["stress"].data)
+            )
+        if "temp" in result_set:
+            set_max("max_temperature", result_set["temp"].data)
+    return maxima
+
+
+##  @}
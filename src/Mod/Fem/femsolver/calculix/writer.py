@@ -120,12 +120,53 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         self.femmesh_file = ""  # the file the femmesh is in, no matter if one or split input file
         self.gravity = int(Units.Quantity(constants.gravity()).getValueAs("mm/s^2"))  # 9820 mm/s2
         self.units_information = units_information
+        self.section_times = []  # [(section name, seconds), ...] in writing order
+
+    # ********************************************************************************************
+    # timing of the input file sections
+    def write_section(self, section_name, write_method, *args):
+        time_start = time.perf_counter()
+        result = write_method(*args)
+        self.section_times.append((section_name, time.perf_counter() - time_start))
+        return result
+
+    def write_constraints_meshsets(self, f, femobjs, con_module):
+        if femobjs:
+            self.write_section(
+                con_module.get_sets_name(),
+                super().write_constraints_meshsets,
+                f,
+                femobjs,
+                con_module,
+            )
+
+    def write_constraints_propdata(self, f, femobjs, con_module):
+        if femobjs:
+            self.write_section(
+                con_module.__name__.rsplit(".", 1)[-1].replace("write_", "", 1) + "_data",
+                super().write_constraints_propdata,
+                f,
+                femobjs,
+                con_module,
+            )
+
+    def print_section_times(self):
+        for section_name, seconds in self.section_times:
+            FreeCAD.Console.PrintLog(f"    {section_name}: {seconds:.3f} seconds\n")
+        slowest = sorted(self.section_times, key=lambda st: st[1], reverse=True)[:3]
+        if slowest:
+            FreeCAD.Console.PrintMessage(
+                "Slowest input file sections: {}\n".format(
+                    ", ".join(f"{name} {seconds:.3f} s" for name, seconds in slowest)
+                )
+            )
 
     # ********************************************************************************************
     # write calculix input
     def write_solver_input(self):
 
         time_start = time.process_time()
+        self.section_times = []
         FreeCAD.Console.PrintMessage("\n")  # because of time print in separate line
         FreeCAD.Console.PrintMessage("CalculiX solver input writing...\n")
         FreeCAD.Console.PrintMessage(f"Input file:{self.file_name}\n")
@@ -138,13 +179,23 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             self.split_inpfile = False
 
         # mesh
-        inpfile = write_mesh.write_mesh(self)
+        inpfile = self.write_section("mesh", write_mesh.write_mesh, self)
 
         # element sets for materials and element geometry
-        write_femelement_matgeosets.write_femelement_matgeosets(inpfile, self)
+        self.write_section(
+            "femelement_matgeosets",
+            write_femelement_matgeosets.write_femelement_matgeosets,
+            inpfile,
+            self,
+        )
 
         # some fluidsection objs need special treatment, mat_geo_sets are needed for this
-        inpfile = con_fluidsection.handle_fluidsection_liquid_inlet_outlet(inpfile, self)
+        inpfile = self.write_section(
+            "fluidsection_liquid_inlet_outlet",
+            con_fluidsection.handle_fluidsection_liquid_inlet_outlet,
+            inpfile,
+            self,
+        )
 
         # element sets constraints
         self.write_constraints_meshsets(inpfile, self.member.cons_centrif, con_centrif)
@@ -170,9 +221,19 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         self.write_constraints_meshsets(inpfile, self.member.cons_sectionprint, con_sectionprint)
 
         # materials and fem element types
-        write_femelement_material.write_femelement_material(inpfile, self)
+        self.write_section(
+            "femelement_material",
+            write_femelement_material.write_femelement_material,
+            inpfile,
+            self,
+        )
         self.write_constraints_propdata(inpfile, self.member.cons_initialtemperature, con_itemp)
-        write_femelement_geometry.write_femelement_geometry(inpfile, self)
+        self.write_section(
+            "femelement_geometry",
+            write_femelement_geometry.write_femelement_geometry,
+            inpfile,
+            self,
+        )
 
         # constraints independent from steps
         self.write_constraints_propdata(inpfile, self.member.cons_planerotation, con_planerotation)
@@ -182,7 +243,7 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
         self.write_constraints_propdata(inpfile, self.member.cons_rigidbody, con_rigidbody)
 
         # step equation
-        write_step_equation.write_step_equation(inpfile, self)
+        self.write_section("step_equation", write_step_equation.write_step_equation, inpfile, self)
 
         # constraints dependent from steps
         self.write_constraints_propdata(inpfile, self.member.cons_fixed, con_fixed)
@@ -204,20 +265,26 @@ class FemInputWriterCcx(writerbase.FemInputWriter):
             inpfile, self.member.cons_electricchargedensity, con_electricchargedensity
         )
         self.write_constraints_propdata(inpfile, self.member.cons_electrostatic, con_electrostatic)
-        con_fluidsection.write_constraints_fluidsection(inpfile, self)
+        self.write_section(
+            "constraints_fluidsection",
+            con_fluidsection.write_constraints_fluidsection,
+            inpfile,
+            self,
+        )
 
         # output and step end
-        write_step_output.write_step_output(inpfile, self)
-        write_step_equation.write_step_end(inpfile, self)
+        self.write_section("step_output", write_step_output.write_step_output, inpfile, self)
+        self.write_section("step_end", write_step_equation.write_step_end, inpfile, self)
 
         # footer
-        write_footer.write_footer(inpfile, self)
+        self.write_section("footer", write_footer.write_footer, inpfile, self)
 
         # close file
         inpfile.close()
 
         writetime = round((time.process_time() - time_start), 3)
         FreeCAD.Console.PrintMessage(f"Writing time CalculiX input file: {writetime} seconds.\n")
+        self.print_section_times()
 
         # return
         if self.femelement_count_test is True:
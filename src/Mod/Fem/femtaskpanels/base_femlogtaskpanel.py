@@ -118,6 +118,13 @@ class _BaseLogTaskPanel(base_femtaskpanel._BaseTaskPanel, ABC):
             return None
 
     def preparation_finished(self):
+        if getattr(self.tool, "mesh_from_cache", False):
+            # no process is started for a cached mesh
+            self.timer.stop()
+            self.update_timer_text()
+            self.tool.update_properties()
+            self.write_log("Mesh loaded from cache\n", QtGui.QColor(getOutputWinColor("Text")))
+            return
         self.tool.compute()
 
     def process_finished(self, code, status):
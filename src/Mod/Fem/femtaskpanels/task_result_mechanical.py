@@ -64,7 +64,8 @@ class _TaskPanel:
     """
 
     def __init__(self, obj):
-        self.result_obj = obj
+        # results of multi step frd files might be loaded on demand
+        self.result_obj = resulttools.load_lazy_result(obj)
         self.mesh_obj = self.result_obj.Mesh
         # task panel should be started by use of setEdit of view provider
         # in view provider checks: Mesh, active analysis and
@@ -582,18 +583,14 @@ class _TaskPanel:
 
         if UserDefinedFormula:
             self.result_obj.UserDefined = UserDefinedFormula
-            minm = min(UserDefinedFormula)
-            maxm = max(UserDefinedFormula)
-            self.update_colors_stats(UserDefinedFormula, "", minm, maxm)
+            stats = resulttools.calculate_field_stats(UserDefinedFormula)[0]
+            self.update_colors_stats(UserDefinedFormula, "", stats.min, stats.max)
 
         # finally we must recompute the result_obj
         self.result_obj.Document.recompute()
 
     def get_scalar_disp_list(self, vector_list, axis):
-        # list is needed, as zib-object is not subscriptable in py3
-        d = list(zip(*self.result_obj.DisplacementVectors))
-        scalar_list = list(d[axis])
-        return scalar_list
+        return resulttools.get_field_values(self.result_obj, ("U1", "U2", "U3")[axis]).tolist()
 
     def result_selected(self, res_type, res_values, res_unit, res_title):
         self.results_name = res_title
@@ -336,6 +336,46 @@ class TestCcxTools(unittest.TestCase):
         setup(self.document, "ccxtools")
         self.input_file_writing_test(get_namefromdef("test_"))
 
+    # ********************************************************************************************
+    def test_study_box_static(self):
+        from femexamples.boxanalysis_static import setup
+        from femsolver.calculix import study
+
+        setup(self.document, "ccxtools")
+        study_dir = testtools.get_fem_test_tmp_dir(self.pre_dir_name + "study_box_static")
+        ccx_study = study.CcxStudy(self.document.Analysis, study_dir, processes=1)
+        sweep = {
+            "FemConstraintForce.Force": ["10000.0 N", "20000.0 N"],
+            "MechanicalMaterial.Material.YoungsModulus": ["100000 MPa", "300000 MPa"],
+        }
+        ccx_study.add_sweep(sweep)
+        self.assertEqual(len(ccx_study.jobs), 4)
+        for name in ccx_study.jobs:
+            ccx_study.write_job(name)
+        self.assertEqual(ccx_study.count_jobs(study.WRITTEN), 4)
+
+        # the variant is in the input file, the analysis is unchanged
+        with open(ccx_study.jobs["variant_001"]["input_file"]) as f:
+            self.assertIn("*ELASTIC\n300000,", f.read())
+        self.assertEqual(self.document.FemConstraintForce.Force.getValueAs("N"), 40000.0)
+        self.assertEqual(self.document.MechanicalMaterial.Material["YoungsModulus"], "200000 MPa")
+
+        # resume, known variants keep their state, changed variants are reset
+        ccx_study = study.CcxStudy(self.document.Analysis, study_dir, processes=1)
+        ccx_study.add_sweep(sweep)
+        ccx_study.add_variant("variant_003", {"FemConstraintForce.Force": "30000.0 N"})
+        self.assertEqual(ccx_study.count_jobs(study.WRITTEN), 3)
+        self.assertEqual(ccx_study.jobs["variant_003"]["status"], study.PENDING)
+
+        # the second parameter fails, the first one is restored
+        ccx_study.add_variant(
+            "variant_bad",
+            {"FemConstraintForce.Force": "50000.0 N", "MechanicalMaterial.NoSuchProperty": 1},
+        )
+        ccx_study.write_job("variant_bad")
+        self.assertEqual(ccx_study.jobs["variant_bad"]["status"], study.FAILED)
+        self.assertEqual(self.document.FemConstraintForce.Force.getValueAs("N"), 40000.0)
+
     # ********************************************************************************************
     def input_file_writing_test(
         self,
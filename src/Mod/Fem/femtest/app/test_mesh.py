@@ -25,6 +25,7 @@ __title__ = "Mesh FEM unit tests"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+import os
 import unittest
 from os.path import join
 
@@ -192,6 +193,307 @@ class TestMeshCommon(unittest.TestCase):
             f"Problem in test_writeAbaqus_precision, \n{read_node_line}\n{expected}",
         )
 
+    # ********************************************************************************************
+    def test_femnodes_ele_table(self):
+        from femmesh import meshtools
+
+        tetra4 = Fem.FemMesh()
+        tetra4.addNode(0, 0, 0, 1)
+        tetra4.addNode(1, 0, 0, 2)
+        tetra4.addNode(0, 1, 0, 3)
+        tetra4.addNode(0, 0, 1, 4)
+        tetra4.addNode(1, 1, 1, 5)
+        tetra4.addVolume([1, 2, 3, 4], 1)
+        tetra4.addVolume([5, 2, 3, 4], 2)
+
+        femelement_table = meshtools.get_femelement_table(tetra4)
+        femnodes_ele_table = meshtools.get_femnodes_ele_table(tetra4.Nodes, femelement_table)
+        self.assertEqual(list(femnodes_ele_table), [1, 2, 3, 4, 5])
+        self.assertEqual(femnodes_ele_table[1], [[1, 1]])
+        self.assertEqual(femnodes_ele_table[2], [[1, 2], [2, 2]])
+        self.assertEqual(femnodes_ele_table[5], [[2, 1]])
+
+        # the shared face 2, 3, 4 is face 4 of both tetras
+        bit_pattern_dict = meshtools.get_bit_pattern_dict(
+            femelement_table, femnodes_ele_table, [2, 3, 4]
+        )
+        self.assertEqual(dict(bit_pattern_dict.items()), {1: [4, 14], 2: [4, 14]})
+        self.assertEqual(bit_pattern_dict[2], [4, 14])
+        with self.assertRaises(KeyError):
+            bit_pattern_dict[3]
+        self.assertEqual(
+            meshtools.get_ccxelement_faces_from_binary_search(bit_pattern_dict), [[1, 4], [2, 4]]
+        )
+        self.assertEqual(
+            meshtools.get_ccxelement_volumes_elements_from_binary_search(bit_pattern_dict), []
+        )
+        self.assertEqual(
+            meshtools.get_femelements_by_femnodes_bin(
+                femelement_table, femnodes_ele_table, [1, 2, 3, 4]
+            ),
+            [1],
+        )
+        # there is no volume element with 5 nodes
+        with self.assertRaises(KeyError):
+            meshtools.get_ccxelement_faces_from_binary_search({1: [4, 14], 2: [5, 14]})
+
+    # ********************************************************************************************
+    def test_mesh_arrays_ids(self):
+        import numpy as np
+        from femmesh import mesharrays
+
+        # not sequential node and element ids, as in frd and inp files
+        mesh_arrays = {
+            "node_ids": np.array([10, 20, 30, 40, 50]),
+            "node_coords": np.array(
+                [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=np.float64
+            ),
+            "Volume4_ids": np.array([7, 3]),
+            "Volume4_nodes": np.array([[10, 20, 30, 40], [50, 20, 30, 40]]),
+            "Face3_ids": np.array([101]),
+            "Face3_nodes": np.array([[10, 20, 30]]),
+        }
+        femmesh = mesharrays.make_femmesh(mesh_arrays)
+        self.assertEqual(sorted(femmesh.Nodes), [10, 20, 30, 40, 50])
+        self.assertEqual(femmesh.Nodes[50], FreeCAD.Vector(1, 1, 1))
+        self.assertEqual(sorted(femmesh.Volumes), [3, 7])
+        self.assertEqual(list(femmesh.getElementNodes(3)), [50, 20, 30, 40])
+        self.assertEqual(list(femmesh.Faces), [101])
+
+    # ********************************************************************************************
+    def test_add_lists_with_ids(self):
+        # not contiguous and not sorted ids
+        femmesh = Fem.FemMesh()
+        coords = [0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1]
+        node_ids = [40, 7, 25, 3, 90]
+        self.assertEqual(femmesh.addNodeList(coords, node_ids), node_ids)
+        self.assertEqual(femmesh.NodeCount, 5)
+        self.assertEqual(femmesh.getNodeById(7), FreeCAD.Vector(1, 0, 0))
+        self.assertEqual(femmesh.getNodeById(90), FreeCAD.Vector(1, 1, 1))
+
+        volume_ids = [12, 5]
+        self.assertEqual(
+            femmesh.addVolumeList([40, 7, 25, 3, 90, 7, 25, 3], [4, 4], volume_ids), volume_ids
+        )
+        face_ids = [300, 101, 200]
+        self.assertEqual(
+            femmesh.addFaceList([40, 7, 25, 7, 25, 90, 3, 90, 40], [3, 3, 3], face_ids), face_ids
+        )
+        edge_ids = [77, 61]
+        self.assertEqual(femmesh.addEdgeList([40, 7, 3, 90], [2, 2], edge_ids), edge_ids)
+
+        self.assertEqual(sorted(femmesh.Volumes), [5, 12])
+        self.assertEqual(sorted(femmesh.Faces), [101, 200, 300])
+        self.assertEqual(sorted(femmesh.Edges), [61, 77])
+        self.assertEqual(list(femmesh.getElementNodes(12)), [40, 7, 25, 3])
+        self.assertEqual(list(femmesh.getElementNodes(5)), [90, 7, 25, 3])
+        self.assertEqual(list(femmesh.getElementNodes(101)), [7, 25, 90])
+        self.assertEqual(list(femmesh.getElementNodes(61)), [3, 90])
+
+        # an used id raises, it does not crash
+        with self.assertRaises(Exception):
+            femmesh.addNodeList([2, 2, 2], [25])
+        with self.assertRaises(Exception):
+            femmesh.addVolumeList([40, 7, 25, 90], [4], [101])
+        with self.assertRaises(Exception):
+            femmesh.addEdgeList([40, 25], [2], [77])
+        self.assertEqual(femmesh.NodeCount, 5)
+
+    # ********************************************************************************************
+    def test_refshape_cache(self):
+        import Part
+        from femmesh import meshtools
+        from femmesh.refshapecache import RefShapeCache
+
+        tetra4 = Fem.FemMesh()
+        tetra4.addNode(0, 0, 0, 1)
+        tetra4.addNode(1, 0, 0, 2)
+        tetra4.addNode(0, 1, 0, 3)
+        tetra4.addNode(0, 0, 1, 4)
+        tetra4.addVolume([1, 2, 3, 4], 1)
+        # Face5 is the face in the xy plane
+        bottom_face = Part.makeBox(1, 1, 1).Face5
+
+        refshape_cache = RefShapeCache()
+        for run in range(2):
+            with meshtools.use_refshape_cache(refshape_cache, tetra4):
+                nodes = meshtools.search_by_shape(tetra4, "getNodesByFace", bottom_face)
+            self.assertEqual(sorted(nodes), [1, 2, 3])
+        self.assertEqual((refshape_cache.hits, refshape_cache.misses), (1, 1))
+
+        # a changed mesh drops all results
+        tetra4.addNode(1, 1, 0, 5)
+        tetra4.addVolume([5, 3, 2, 4], 2)
+        with meshtools.use_refshape_cache(refshape_cache, tetra4):
+            nodes = meshtools.search_by_shape(tetra4, "getNodesByFace", bottom_face)
+        self.assertEqual(sorted(nodes), [1, 2, 3, 5])
+        self.assertEqual((refshape_cache.hits, refshape_cache.misses), (1, 2))
+
+        # the same nodes and element ids, connected differently
+        from femmesh.refshapecache import get_femmesh_hash
+
+        remeshed = Fem.FemMesh()
+        for node_id, node in tetra4.Nodes.items():
+            remeshed.addNode(node.x, node.y, node.z, node_id)
+        remeshed.addVolume([1, 2, 3, 4], 1)
+        remeshed.addVolume([5, 2, 3, 4], 2)
+        self.assertNotEqual(get_femmesh_hash(remeshed), get_femmesh_hash(tetra4))
+
+    # ********************************************************************************************
+    def test_node_area_pool(self):
+        from femmesh import meshtools
+
+        femnodes_mesh = {
+            1: FreeCAD.Vector(0, 0, 0),
+            2: FreeCAD.Vector(2, 0, 0),
+            3: FreeCAD.Vector(2, 2, 0),
+            4: FreeCAD.Vector(0, 2, 0),
+        }
+        face_tables = [{1: (1, 2, 3)}, {1: (1, 2, 3, 4)}, {1: (1, 2, 3), 2: (1, 3, 4)}] * 4
+        with meshtools.node_area_pool(femnodes_mesh) as map_node_areas:
+            expected = map_node_areas(face_tables)
+        with meshtools.node_area_pool(femnodes_mesh, 2) as map_node_areas:
+            node_sum_area_tables = map_node_areas(face_tables)
+        self.assertEqual(node_sum_area_tables, expected)
+        self.assertAlmostEqual(sum(expected[1].values()), 4.0)
+        self.assertAlmostEqual(expected[2][1], 4.0 / 3.0)
+
+    # ********************************************************************************************
+    def test_read_inp_include(self):
+        from feminout import importInpMesh
+
+        inp_dir = testtools.get_fem_test_tmp_dir("read_inp_include")
+        os.makedirs(join(inp_dir, "mesh"))
+        with open(join(inp_dir, "main.inp"), "w") as f:
+            f.write("** nodes and elements are in include files\n")
+            f.write("*INCLUDE, INPUT=mesh/nodes.inp\n")
+            f.write("*ELEMENT, TYPE=C3D4, ELSET=Eall\n")
+            f.write("1, 2, 1, 3,\n4\n")
+            f.write("*STEP\n*NODE PRINT, NSET=Nall\nU\n*END STEP\n")
+        with open(join(inp_dir, "mesh", "nodes.inp"), "w") as f:
+            f.write("*NODE, NSET=Nall\n1, 0.0, 0.0, 0.0\n2, 1.0, 0.0, 0.0\n")
+            f.write("*INCLUDE, INPUT=more_nodes.inp\n")
+        with open(join(inp_dir, "mesh", "more_nodes.inp"), "w") as f:
+            f.write("*NODE, NSET=Nall\n3, 0.0, 1.0, 0.0\n4, 0.0, 0.0, 1.0\n")
+            f.write("*ELEMENT, TYPE=S3\n2, 1, 2, 3\n")
+
+        progress = []
+        mesh_arrays = importInpMesh.read_inp(
+            join(inp_dir, "main.inp"), lambda done, total: progress.append(done / total)
+        )
+        self.assertEqual(mesh_arrays["node_ids"].tolist(), [1, 2, 3, 4])
+        self.assertEqual(mesh_arrays["node_coords"][3].tolist(), [0.0, 0.0, 1.0])
+        self.assertEqual(mesh_arrays["Face3_ids"].tolist(), [2])
+        # the tetra4 element continues on the next line and is renumbered for FreeCAD
+        self.assertEqual(mesh_arrays["Volume4_ids"].tolist(), [1])
+        self.assertEqual(mesh_arrays["Volume4_nodes"].tolist(), [[1, 2, 3, 4]])
+        self.assertEqual(progress[-1], 1.0)
+
+    # ********************************************************************************************
+    def test_read_inp_irregular_lines(self):
+        from feminout import importInpMesh
+
+        inp_dir = testtools.get_fem_test_tmp_dir("read_inp_irregular")
+        with open(join(inp_dir, "main.inp"), "w") as f:
+            # a missing and a surplus coordinate in the same chunk
+            f.write("*NODE, NSET=Nall\n1, 0.5, 0.5\n2, 1.0, 2.0, 3.0, 9.0\n3, 0.0, 1.0, 0.0\n")
+            f.write("*ELEMENT, TYPE=C3D4, ELSET=Eall\n")
+            f.write("*INCLUDE, INPUT=elements.inp\n")
+            f.write("5, 2, 1, 3, 3\n")
+        with open(join(inp_dir, "elements.inp"), "w") as f:
+            # the last line has no line end
+            f.write("4, 2, 1, 3, 1")
+
+        mesh_arrays = importInpMesh.read_inp(join(inp_dir, "main.inp"))
+        self.assertEqual(mesh_arrays["node_ids"].tolist(), [1, 2, 3])
+        self.assertEqual(
+            mesh_arrays["node_coords"].tolist(),
+            [[0.5, 0.5, 0.0], [1.0, 2.0, 3.0], [0.0, 1.0, 0.0]],
+        )
+        self.assertEqual(mesh_arrays["Volume4_ids"].tolist(), [4, 5])
+        self.assertEqual(mesh_arrays["Volume4_nodes"].tolist(), [[1, 2, 3, 1], [1, 2, 3, 3]])
+
+    # ********************************************************************************************
+    def test_mesh_arrays_npz(self):
+        import importlib
+        from femexamples import meshes
+        from femmesh import mesharrays
+
+        # seg3 element ids start with 1, quad4 element ids do not
+        for mesh_name in ("mesh_canticcx_seg3", "mesh_canticcx_quad4"):
+            module = importlib.import_module("femexamples.meshes." + mesh_name)
+            expected = Fem.FemMesh()
+            module.create_nodes(expected)
+            module.create_elements(expected)
+
+            npz_file = join(testtools.get_fem_test_tmp_dir("mesh_arrays"), mesh_name + ".npz")
+            mesharrays.save_npz(npz_file, mesharrays.record_mesh_module(module))
+            for mesh_arrays in (meshes.load_mesh_arrays(mesh_name), mesharrays.load_npz(npz_file)):
+                fm = mesharrays.make_femmesh(mesh_arrays)
+                self.assertEqual(fm.Nodes, expected.Nodes, mesh_name)
+                self.assertEqual(fm.Edges, expected.Edges, mesh_name)
+                self.assertEqual(fm.Faces, expected.Faces, mesh_name)
+                for ele in expected.Edges + expected.Faces:
+                    self.assertEqual(fm.getElementNodes(ele), expected.getElementNodes(ele))
+
+    # ********************************************************************************************
+    def test_mesh_cache(self):
+        from femmesh.meshcache import MeshCache, MeshCacheLookup, get_mesh_key
+
+        base_dir = testtools.get_fem_test_tmp_dir("mesh_cache")
+        mesh_cache = MeshCache(join(base_dir, "cache"), max_size=250)
+        result_file = join(base_dir, "result.unv")
+        keys = [get_mesh_key("brep", "params {}".format(i), b"version") for i in range(3)]
+        self.assertEqual(len(set(keys)), 3)
+        # the parts are separated, moving a character between them gives a new key
+        self.assertNotEqual(get_mesh_key("ab", "c"), get_mesh_key("a", "bc"))
+
+        for i, key in enumerate(keys[:2]):
+            lookup = MeshCacheLookup(mesh_cache, result_file, ".unv", key)
+            self.assertFalse(lookup.hit)
+            with open(result_file, "w") as f:
+                f.write(str(i) * (100 + i))
+            lookup.store()
+
+        lookup = MeshCacheLookup(mesh_cache, result_file, ".unv", keys[0])
+        self.assertTrue(lookup.hit)
+        with open(result_file) as f:
+            self.assertEqual(f.read(), "0" * 100)
+
+        # keys[0] was used last, keys[1] is evicted to fit the max size
+        os.utime(mesh_cache.get_cache_file(keys[1], ".unv"), (0, 0))
+        with open(result_file, "w") as f:
+            f.write("2" * 100)
+        mesh_cache.store(keys[2], ".unv", result_file)
+        self.assertTrue(os.path.isfile(mesh_cache.get_cache_file(keys[0], ".unv")))
+        self.assertFalse(os.path.isfile(mesh_cache.get_cache_file(keys[1], ".unv")))
+        self.assertTrue(os.path.isfile(mesh_cache.get_cache_file(keys[2], ".unv")))
+        mesh_cache.clear()
+
+    # ********************************************************************************************
+    @unittest.skipIf(os.name == "nt", "shell script mesher")
+    def test_mesher_version(self):
+        from femmesh.meshcache import get_mesher_version
+
+        bin_dir = testtools.get_fem_test_tmp_dir("mesher_version")
+        mesher = join(bin_dir, "fakemesher")
+
+        def write_mesher(version):
+            with open(mesher, "w") as f:
+                f.write(f"#!/bin/sh\necho fakemesher {version}\n")
+            os.chmod(mesher, 0o755)
+
+        path = os.environ.get("PATH", "")
+        os.environ["PATH"] = bin_dir + os.pathsep + path
+        try:
+            # a bare name is found in PATH, an upgraded binary gives a new version
+            write_mesher("1.0")
+            self.assertIn("fakemesher 1.0", get_mesher_version("fakemesher"))
+            write_mesher("10.0")
+            self.assertIn("fakemesher 10.0", get_mesher_version("fakemesher"))
+        finally:
+            os.environ["PATH"] = path
+
 
 # ************************************************************************************************
 # ************************************************************************************************
@@ -386,6 +688,20 @@ class TestMeshEleTetra10(unittest.TestCase):
 
         self.compare_mesh_files(femmesh_testfile, femmesh_outfile, file_extension)
 
+    # ********************************************************************************************
+    def test_tetra10_inp_python(self):
+        # tetra10 element: reading inp mesh file format by the Python reader into mesh arrays
+        from feminout import importInpMesh
+
+        file_extension = "inp"
+        outfile, testfile = self.get_file_paths(file_extension)
+
+        self.femmesh.writeABAQUS(outfile, 1, False)  # write the mesh
+        femmesh_outfile = importInpMesh.read(outfile)  # read the mesh from written mesh
+        femmesh_testfile = importInpMesh.read(testfile)  # read the mesh from test mesh
+
+        self.compare_mesh_files(femmesh_testfile, femmesh_outfile, file_extension)
+
     # ********************************************************************************************
     def test_tetra10_unv(self):
         # tetra10 element: reading from and writing to unv mesh file format
@@ -486,16 +802,9 @@ class TestMeshGroups(unittest.TestCase):
         correct.
         """
 
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes import load_mesh
 
-        fm = Fem.FemMesh()
-        control = create_nodes(fm)
-        if not control:
-            fcc_print("failed to create nodes")
-        control = create_elements(fm)
-        if not control:
-            fcc_print("failed to create elements")
+        fm = load_mesh("mesh_canticcx_tetra10")
 
         # information
         # fcc_print(fm)
@@ -541,16 +850,9 @@ class TestMeshGroups(unittest.TestCase):
         Adds a number of groups to FemMesh and deletes them
         afterwards. Checks whether GroupCount is OK
         """
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
+        from femexamples.meshes import load_mesh
 
-        fm = Fem.FemMesh()
-        control = create_nodes(fm)
-        if not control:
-            fcc_print("failed to create nodes")
-        control = create_elements(fm)
-        if not control:
-            fcc_print("failed to create elements")
+        fm = load_mesh("mesh_canticcx_tetra10")
 
         # information
         # fcc_print(fm)
@@ -576,16 +878,9 @@ class TestMeshGroups(unittest.TestCase):
         Add a node group, add elements to it. Verify that elements added
         and elements in getGroupElements are the same.
         """
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_elements
-        from femexamples.meshes.mesh_canticcx_tetra10 import create_nodes
-
-        fm = Fem.FemMesh()
-        control = create_nodes(fm)
-        if not control:
-            fcc_print("failed to create nodes")
-        control = create_elements(fm)
-        if not control:
-            fcc_print("failed to create elements")
+        from femexamples.meshes import load_mesh
+
+        fm = load_mesh("mesh_canticcx_tetra10")
 
         # information
         # fcc_print(fm)
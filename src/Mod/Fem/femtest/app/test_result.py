@@ -25,6 +25,7 @@ __title__ = "Results FEM unit tests"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecad.org"
 
+import math
 import unittest
 from os.path import join
 
@@ -111,6 +112,35 @@ class TestResult(unittest.TestCase):
             "Calculated principal reinforced stresses are not the expected values.",
         )
 
+    # ********************************************************************************************
+    def test_stress_batch(self):
+        from femresult import resulttools
+
+        stress = self.get_stress_values()
+        nan_stress = (float("NaN"),) + stress[1:]
+        stress_tensors = [stress, nan_stress, (0.0,) * 6]
+
+        mises = resulttools.calculate_von_mises_batch(stress_tensors)
+        self.assertAlmostEqual(mises[0], resulttools.calculate_von_mises(stress))
+        self.assertTrue(math.isnan(mises[1]))
+        self.assertEqual(mises[2], 0.0)
+
+        principal = resulttools.calculate_principal_stress_std_batch(stress_tensors)
+        expected = resulttools.calculate_principal_stress_std(stress)
+        for value, expected_value in zip(principal[0], expected):
+            self.assertAlmostEqual(value, expected_value)
+        self.assertTrue(all(math.isnan(value) for value in principal[1]))
+        self.assertEqual(principal[2].tolist(), [0.0] * 4)
+
+        principal, vectors = resulttools.calculate_principal_stress_reinforced_batch(stress_tensors)
+        expected = resulttools.calculate_principal_stress_reinforced(stress)
+        for value, expected_value in zip(principal[0], expected[:4]):
+            self.assertAlmostEqual(value, expected_value)
+        for vector, expected_vector in zip(vectors[0], expected[4]):
+            for value, expected_value in zip(vector, expected_vector):
+                self.assertAlmostEqual(value, expected_value)
+        self.assertTrue(all(math.isnan(value) for value in principal[1]))
+
     # ********************************************************************************************
     def test_rho(self):
         data = (
@@ -191,3 +221,146 @@ class TestResult(unittest.TestCase):
         self.assertEqual(
             disp_abs, expected_dispabs, "Calculated displacement abs are not the expected values."
         )
+
+    # ********************************************************************************************
+    def test_field_stats(self):
+        import ObjectsFem
+        from femresult import resulttools
+
+        nan = float("NaN")
+        stats = resulttools.calculate_field_stats([3.0, nan, -1.0, 2.0])[0]
+        self.assertEqual((stats.min, stats.max, stats.nan_count), (-1.0, 3.0, 1))
+        self.assertAlmostEqual(stats.percentiles[99.0], 2.98)
+        # a vector field has stats per column, empty or NaN only columns are 0
+        x, y, z = resulttools.calculate_field_stats([[1.0, nan, 0.5], [2.0, nan, -0.5]])
+        self.assertEqual((x.min, x.max), (1.0, 2.0))
+        self.assertEqual((y.min, y.max, y.nan_count), (0.0, 0.0, 2))
+        self.assertEqual((z.min, z.max), (-0.5, 0.5))
+        self.assertEqual(resulttools.calculate_field_stats([])[0].max, 0.0)
+
+        res_obj = ObjectsFem.makeResultMechanical(self.document)
+        res_obj.DisplacementVectors = [FreeCAD.Vector(1, -2, 3), FreeCAD.Vector(-1, 4, nan)]
+        res_obj.vonMises = [float(i) for i in range(101)]
+        resulttools.fill_femresult_stats(res_obj)
+        self.assertEqual(resulttools.get_stats(res_obj, "U2"), (-2.0, 4.0))
+        self.assertEqual(resulttools.get_stats(res_obj, "U3"), (3.0, 3.0))
+        self.assertEqual(resulttools.get_stats(res_obj, "Sabs"), (0.0, 100.0))
+        self.assertEqual(resulttools.get_stats(res_obj, "Temp"), (0.0, 0.0))
+        self.assertEqual(resulttools.get_color_range(res_obj, "Sabs", 95.0), (5.0, 95.0))
+        self.assertIn("vonMises", res_obj.Proxy.field_stats)
+        # a changed field is calculated again
+        res_obj.vonMises = [1.0, 2.0]
+        self.assertNotIn("vonMises", res_obj.Proxy.field_stats)
+        self.assertEqual(resulttools.get_field_stats(res_obj, "Sabs").max, 2.0)
+
+    # ********************************************************************************************
+    def compare_frd_readers(self, base_name):
+        from feminout.importCcxFrdResults import read_frd_result as read_legacy
+        from feminout.readCcxFrd import read_frd_result as read_columnar
+
+        frd_file = join(testtools.get_fem_test_home_dir(), "calculix", base_name + ".frd")
+        legacy = read_legacy(frd_file)
+        columnar = read_columnar(frd_file)
+
+        self.assertEqual(sorted(legacy), sorted(columnar), "Different mesh data keys.")
+        for key in legacy:
+            if key == "Results":
+                continue
+            self.assertEqual(list(legacy[key]), list(columnar[key]), f"Different ids in {key}.")
+            for ident, values in legacy[key].items():
+                self.assertEqual(tuple(values), tuple(columnar[key][ident]), f"Diff in {key}.")
+
+        self.assertEqual(len(legacy["Results"]), len(columnar["Results"]))
+        for legacy_set, columnar_set in zip(legacy["Results"], columnar["Results"]):
+            self.assertEqual(sorted(legacy_set), sorted(columnar_set))
+            for key in ("number", "time"):
+                # NaN if not set in frd file
+                self.assertEqual(str(legacy_set[key]), str(columnar_set[key]), f"Diff in {key}.")
+            for key in ("disp", "stress", "strain"):
+                if key not in legacy_set:
+                    continue
+                self.assertEqual(list(legacy_set[key]), list(columnar_set[key]))
+                for node, values in legacy_set[key].items():
+                    for expected, value in zip(values, columnar_set[key][node]):
+                        self.assertAlmostEqual(expected, value, msg=f"Diff in {key} {node}.")
+
+    # ********************************************************************************************
+    def test_frd_reader_columnar_static(self):
+        self.compare_frd_readers("box_static")
+
+    # ********************************************************************************************
+    def test_frd_reader_columnar_frequency(self):
+        self.compare_frd_readers("box_frequency")
+
+    # ********************************************************************************************
+    def test_frd_reader_lazy_index(self):
+        from femtest.benchmark_frd import load_example_mesh
+        from femtest.benchmark_frd import write_frd
+        from feminout.readCcxFrd import FrdResultIndex
+        from feminout.readCcxFrd import read_frd_result
+
+        frd_file = join(testtools.get_fem_test_tmp_dir("result_lazy"), "multistep.frd")
+        write_frd(load_example_mesh("mesh_canticcx_hexa20"), frd_file, steps=4)
+        columnar = read_frd_result(frd_file)
+        frd_index = FrdResultIndex(frd_file, cache_size=2)
+
+        self.assertEqual(len(frd_index), 4)
+        mesh_data = frd_index.get_mesh_data()
+        self.assertEqual(list(mesh_data["Nodes"]), list(columnar["Nodes"]))
+        self.assertEqual(list(mesh_data["Hexa20Elem"]), list(columnar["Hexa20Elem"]))
+        for set_number in reversed(range(len(frd_index))):
+            expected = columnar["Results"][set_number]
+            result_set = frd_index.get_result_set(set_number)
+            self.assertEqual(expected["time"], mesh_data["Results"][set_number]["time"])
+            self.assertEqual(expected["time"], result_set["time"])
+            for key in ("disp", "stress"):
+                self.assertEqual(expected[key].ids.tolist(), result_set[key].ids.tolist())
+                self.assertEqual(expected[key].data.tolist(), result_set[key].data.tolist())
+        # only the last two parsed result sets are kept
+        self.assertEqual(sorted(frd_index._cache), [0, 1])
+
+    # ********************************************************************************************
+    def test_frd_import_lazy_restore(self):
+        from femtest.benchmark_frd import load_example_mesh
+        from femtest.benchmark_frd import write_frd
+        from feminout.importCcxFrdResults import importFrd
+        from femresult.resulttools import load_lazy_result
+
+        tmp_dir = testtools.get_fem_test_tmp_dir("result_lazy_restore")
+        frd_file = join(tmp_dir, "multistep.frd")
+        write_frd(load_example_mesh("mesh_canticcx_hexa20"), frd_file, steps=4)
+        FreeCAD.setActiveDocument(self.document.Name)
+        importFrd(frd_file, columnar=True, lazy=True)
+
+        def result_objects(doc):
+            return sorted(
+                (obj for obj in doc.Objects if obj.isDerivedFrom("Fem::FemResultObjectPython")),
+                key=lambda obj: obj.FrdResultSet,
+            )
+
+        results = result_objects(self.document)
+        self.assertEqual(len(results), 4)
+        # only the first result set is parsed on import
+        lazy_loader = results[0].Proxy.lazy_loader
+        self.assertEqual(list(lazy_loader.frd_index._cache), [0])
+        self.assertTrue(lazy_loader.is_loaded(results[0]))
+        for obj in results[1:]:
+            self.assertFalse(lazy_loader.is_loaded(obj))
+            self.assertEqual(len(obj.DisplacementLengths), 0)
+            self.assertEqual(list(obj.NodeNumbers), list(results[0].NodeNumbers))
+        stats = []
+        for obj in results:
+            obj = load_lazy_result(obj)
+            self.assertTrue(any(obj.Stats))
+            stats.append(list(obj.Stats))
+
+        # the result objects are loaded from the frd file after save and restore
+        fcstd_file = join(tmp_dir, "lazy_results.FCStd")
+        self.document.saveAs(fcstd_file)
+        FreeCAD.closeDocument(self.document.Name)
+        self.document = FreeCAD.openDocument(fcstd_file)
+        results = result_objects(self.document)
+        for obj, obj_stats in zip(results, stats):
+            obj = load_lazy_result(obj)
+            self.assertEqual(len(obj.DisplacementLengths), len(obj.NodeNumbers))
+            self.assertEqual(list(obj.Stats), obj_stats)
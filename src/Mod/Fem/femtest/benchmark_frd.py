@@ -0,0 +1,204 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Benchmark of the CalculiX frd result readers"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## @package benchmark_frd
+#  \ingroup FEM
+#  \brief compares the legacy and the columnar frd reader
+#
+#  Synthetic frd files are written for the femexamples meshes and read by
+#  both readers. Run from the FreeCAD Python console:
+#
+#  from femtest import benchmark_frd
+#  benchmark_frd.run()
+#  benchmark_frd.run(["mesh_contact_tube_tube_tria3"], steps=10)
+
+import math
+import os
+import time
+import tracemalloc
+
+from builtins import open as pyopen
+
+import FreeCAD
+
+from femexamples import meshes
+from femmesh import mesharrays
+from femtest.app.support_utils import get_fem_test_tmp_dir
+
+
+# FreeCAD element node count: frd element type
+_VOLUME_TYPES = {8: 1, 6: 2, 4: 3, 20: 4, 15: 5, 10: 6}
+_FACE_TYPES = {3: 7, 6: 8, 4: 9, 8: 10}
+_EDGE_TYPES = {2: 11, 3: 12}
+
+DEFAULT_MESHES = (
+    "mesh_canticcx_hexa20",
+    "mesh_canticcx_tetra10",
+    "mesh_canticcx_tria6",
+    "mesh_contact_tube_tube_tria3",
+    "mesh_multibodybeam_tetra10",
+    "mesh_platewithhole_tetra10",
+)
+
+
+class _ExampleMesh:
+    """Nodes and elements of a femexamples mesh, no Fem.FemMesh needed."""
+
+    def __init__(self):
+        self.nodes = {}
+        self.elements = []
+
+
+def load_example_mesh(mesh_name):
+    """Returns the nodes and elements of a femexamples mesh."""
+    mesh_arrays = meshes.load_mesh_arrays(mesh_name)
+    mesh = _ExampleMesh()
+    mesh.nodes = dict(
+        zip(
+            mesh_arrays["node_ids"].tolist(),
+            map(tuple, mesh_arrays["node_coords"].tolist()),
+        )
+    )
+    frd_types = {"Edge": _EDGE_TYPES, "Face": _FACE_TYPES, "Volume": _VOLUME_TYPES}
+    for block_name in mesharrays.get_block_names(mesh_arrays):
+        kind, node_count = mesharrays.get_block_kind(block_name)
+        ele_type = frd_types[kind][node_count]
+        for ele_id, nodes in zip(
+            mesh_arrays[block_name + "_ids"].tolist(),
+            mesh_arrays[block_name + "_nodes"].tolist(),
+        ):
+            mesh.elements.append((ele_id, ele_type, nodes))
+    mesh.elements.sort()
+    return mesh
+
+
+def write_frd(mesh, frd_file, steps=1):
+    """Writes a CalculiX like frd file with synthetic DISP and STRESS results."""
+    from feminout.readCcxFrd import FRD_ELEMENT_TYPES
+
+    node_count = len(mesh.nodes)
+    with pyopen(frd_file, "w") as f:
+        f.write("    1C\n")
+        f.write(f"    2C{node_count:30d}{1:37d}\n")
+        for node, (x, y, z) in mesh.nodes.items():
+            f.write(f" -1{node:10d}{x:12.5E}{y:12.5E}{z:12.5E}\n")
+        f.write(" -3\n")
+        f.write(f"    3C{len(mesh.elements):30d}{1:37d}\n")
+        for ele, ele_type, nodes in mesh.elements:
+            # FreeCAD node order back to frd node order
+            order = FRD_ELEMENT_TYPES[ele_type][2]
+            frd_nodes = [0] * len(nodes)
+            for i, position in enumerate(order):
+                frd_nodes[position] = nodes[i]
+            f.write(f" -1{ele:10d}{ele_type:5d}{0:5d}{1:5d}\n")
+            for first in range(0, len(frd_nodes), 10):
+                f.write(" -2" + "".join(f"{n:10d}" for n in frd_nodes[first : first + 10]) + "\n")
+        f.write(" -3\n")
+        for step in range(1, steps + 1):
+            factor = step / steps
+            f.write(f"    1PSTEP{step * 2 - 1:25d}{1:12d}{1:12d}\n")
+            f.write(f"  100CL{100 + step:5d}{factor:12.5E}{node_count:12d}\n")
+            f.write(" -4  DISP        4    1\n")
+            for node, (x, y, z) in mesh.nodes.items():
+                ux = factor * math.sin(x * 1e-3)
+                uy = factor * math.cos(y * 1e-3)
+                uz = factor * 1e-3 * z
+                f.write(f" -1{node:10d}{ux:12.5E}{uy:12.5E}{uz:12.5E}\n")
+            f.write(" -3\n")
+            f.write(f"    1PSTEP{step * 2:25d}{1:12d}{1:12d}\n")
+            f.write(f"  100CL{100 + step:5d}{factor:12.5E}{node_count:12d}\n")
+            f.write(" -4  STRESS      6    1\n")
+            for node, (x, y, z) in mesh.nodes.items():
+                s = [factor * math.sin(node + i) * 100.0 for i in range(6)]
+                f.write(f" -1{node:10d}" + "".join(f"{v:12.5E}" for v in s) + "\n")
+            f.write(" -3\n")
+        f.write(" 9999\n")
+
+
+def _measure(read_method, frd_file):
+    # tracemalloc slows down the pure Python reader a lot
+    # thus time and memory are measured in separate runs
+    start = time.perf_counter()
+    data = read_method(frd_file)
+    duration = time.perf_counter() - start
+    del data
+    tracemalloc.start()
+    data = read_method(frd_file)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return data, duration, peak
+
+
+def run(mesh_names=DEFAULT_MESHES, steps=1):
+    """Writes an frd file per mesh and reads it with both readers.
+
+    Returns a list of dicts with the timings and the peak memory, the
+    results are printed as a table to the report view too.
+    """
+    from feminout import importCcxFrdResults
+    from feminout import readCcxFrd
+
+    bench_dir = get_fem_test_tmp_dir("benchmark_frd")
+    rows = []
+    for mesh_name in mesh_names:
+        frd_file = os.path.join(bench_dir, mesh_name + ".frd")
+        write_frd(load_example_mesh(mesh_name), frd_file, steps)
+        legacy, legacy_time, legacy_peak = _measure(importCcxFrdResults.read_frd_result, frd_file)
+        columnar, columnar_time, columnar_peak = _measure(readCcxFrd.read_frd_result, frd_file)
+        rows.append(
+            {
+                "mesh": mesh_name,
+                "nodes": len(columnar["Nodes"]),
+                "size_mb": os.path.getsize(frd_file) / 1e6,
+                "legacy_s": legacy_time,
+                "columnar_s": columnar_time,
+                "legacy_peak_mb": legacy_peak / 1e6,
+                "columnar_peak_mb": columnar_peak / 1e6,
+                "same_node_count": len(legacy["Nodes"]) == len(columnar["Nodes"]),
+            }
+        )
+
+    lines = [
+        "{:<32} {:>8} {:>8} {:>10} {:>10} {:>8} {:>10} {:>10}".format(
+            "mesh", "nodes", "MB", "legacy s", "columnar s", "speedup", "legacy MB", "column MB"
+        )
+    ]
+    for r in rows:
+        lines.append(
+            "{:<32} {:>8} {:>8.1f} {:>10.3f} {:>10.3f} {:>8.1f} {:>10.1f} {:>10.1f}".format(
+                r["mesh"],
+                r["nodes"],
+                r["size_mb"],
+                r["legacy_s"],
+                r["columnar_s"],
+                r["legacy_s"] / max(r["columnar_s"], 1e-9),
+                r["legacy_peak_mb"],
+                r["columnar_peak_mb"],
+            )
+        )
+    FreeCAD.Console.PrintMessage("\n".join(lines) + "\n")
+    return rows
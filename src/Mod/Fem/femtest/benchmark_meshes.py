@@ -0,0 +1,202 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD Project Association                        *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__title__ = "Benchmark of loading the femexamples meshes"
+__author__ = "FreeCAD Project Association"
+__url__ = "https://www.freecad.org"
+
+## @package benchmark_meshes
+#  \ingroup FEM
+#  \brief compares loading the example meshes from Python modules and from .npz files
+#
+#  The Python module is compiled from its source every run, as it happens
+#  on the first import after installation. Run from the FreeCAD Python console:
+#
+#  from femtest import benchmark_meshes
+#  benchmark_meshes.run()
+#  benchmark_meshes.run(["mesh_multibodybeam_tetra10"])
+#
+#  run_ids() compares adding the nodes and the elements of meshes with not
+#  sequential ids one by one and with the list methods of the FemMesh:
+#
+#  benchmark_meshes.run_ids()
+
+import os
+import time
+
+from builtins import open as pyopen
+
+import FreeCAD
+
+import Fem
+
+from femexamples import meshes
+from femmesh import mesharrays
+
+
+def _load_module_mesh(mesh_name):
+    py_file = os.path.join(meshes.MESH_DIR, mesh_name + ".py")
+    with pyopen(py_file) as f:
+        code = compile(f.read(), py_file, "exec")
+    namespace = {}
+    exec(code, namespace)
+    femmesh = Fem.FemMesh()
+    namespace["create_nodes"](femmesh)
+    namespace["create_elements"](femmesh)
+    return femmesh
+
+
+def _load_npz_mesh(mesh_name):
+    return mesharrays.make_femmesh(mesharrays.load_npz(meshes.get_npz_file(mesh_name)))
+
+
+def _measure(load_method, mesh_name):
+    start = time.perf_counter()
+    femmesh = load_method(mesh_name)
+    return femmesh, time.perf_counter() - start
+
+
+def run(mesh_names=None):
+    """Loads every mesh from its Python module and from its .npz file.
+
+    Returns a list of dicts with the timings, the results are printed
+    as a table to the report view too.
+    """
+    if mesh_names is None:
+        mesh_names = meshes.get_mesh_names()
+    rows = []
+    for mesh_name in mesh_names:
+        module_mesh, module_time = _measure(_load_module_mesh, mesh_name)
+        npz_mesh, npz_time = _measure(_load_npz_mesh, mesh_name)
+        rows.append(
+            {
+                "mesh": mesh_name,
+                "nodes": npz_mesh.NodeCount,
+                "module_s": module_time,
+                "npz_s": npz_time,
+                "same_mesh": (
+                    module_mesh.Nodes == npz_mesh.Nodes
+                    and module_mesh.Edges == npz_mesh.Edges
+                    and module_mesh.Faces == npz_mesh.Faces
+                    and module_mesh.Volumes == npz_mesh.Volumes
+                ),
+            }
+        )
+
+    lines = [
+        "{:<44} {:>8} {:>10} {:>10} {:>8} {:>6}".format(
+            "mesh", "nodes", "module s", "npz s", "speedup", "same"
+        )
+    ]
+    for r in rows:
+        lines.append(
+            "{:<44} {:>8} {:>10.3f} {:>10.3f} {:>8.1f} {:>6}".format(
+                r["mesh"],
+                r["nodes"],
+                r["module_s"],
+                r["npz_s"],
+                r["module_s"] / max(r["npz_s"], 1e-9),
+                str(r["same_mesh"]),
+            )
+        )
+    lines.append(
+        "total: module {:.3f} s, npz {:.3f} s".format(
+            sum(r["module_s"] for r in rows), sum(r["npz_s"] for r in rows)
+        )
+    )
+    FreeCAD.Console.PrintMessage("\n".join(lines) + "\n")
+    return rows
+
+
+def _get_spread_ids(mesh_arrays):
+    # every second id of 1001 on, like the ids of an frd or inp file of a part of a model
+    spread = dict(mesh_arrays)
+    spread["node_ids"] = 2 * mesh_arrays["node_ids"] + 1001
+    for block_name in mesharrays.get_block_names(mesh_arrays):
+        spread[block_name + "_ids"] = 2 * mesh_arrays[block_name + "_ids"] + 1001
+        spread[block_name + "_nodes"] = 2 * mesh_arrays[block_name + "_nodes"] + 1001
+    return spread
+
+
+def _add_one_by_one(mesh_arrays):
+    femmesh = Fem.FemMesh()
+    for node_id, (x, y, z) in zip(
+        mesh_arrays["node_ids"].tolist(), mesh_arrays["node_coords"].tolist()
+    ):
+        femmesh.addNode(x, y, z, node_id)
+    for block_name in mesharrays.get_block_names(mesh_arrays):
+        kind = mesharrays.get_block_kind(block_name)[0]
+        add_element = getattr(femmesh, f"add{kind}")
+        for element_id, nodes in zip(
+            mesh_arrays[block_name + "_ids"].tolist(), mesh_arrays[block_name + "_nodes"].tolist()
+        ):
+            add_element(nodes, element_id)
+    return femmesh
+
+
+def run_ids(mesh_names=None):
+    """Builds every mesh with not sequential ids one by one and with the list methods.
+
+    Returns a list of dicts with the timings, the results are printed
+    as a table to the report view too.
+    """
+    if mesh_names is None:
+        mesh_names = meshes.get_mesh_names()
+    rows = []
+    for mesh_name in mesh_names:
+        mesh_arrays = _get_spread_ids(mesharrays.load_npz(meshes.get_npz_file(mesh_name)))
+        single_mesh, single_time = _measure(_add_one_by_one, mesh_arrays)
+        list_mesh, list_time = _measure(mesharrays.make_femmesh, mesh_arrays)
+        rows.append(
+            {
+                "mesh": mesh_name,
+                "nodes": list_mesh.NodeCount,
+                "single_s": single_time,
+                "list_s": list_time,
+                "same_mesh": (
+                    single_mesh.Nodes == list_mesh.Nodes
+                    and single_mesh.Edges == list_mesh.Edges
+                    and single_mesh.Faces == list_mesh.Faces
+                    and single_mesh.Volumes == list_mesh.Volumes
+                ),
+            }
+        )
+
+    lines = [
+        "{:<44} {:>8} {:>10} {:>10} {:>8} {:>6}".format(
+            "mesh", "nodes", "single s", "list s", "speedup", "same"
+        )
+    ]
+    for r in rows:
+        lines.append(
+            "{:<44} {:>8} {:>10.3f} {:>10.3f} {:>8.1f} {:>6}".format(
+                r["mesh"],
+                r["nodes"],
+                r["single_s"],
+                r["list_s"],
+                r["single_s"] / max(r["list_s"], 1e-9),
+                str(r["same_mesh"]),
+            )
+        )
+    FreeCAD.Console.PrintMessage("\n".join(lines) + "\n")
+    return rows
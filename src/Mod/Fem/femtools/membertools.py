@@ -247,6 +247,11 @@ class AnalysisMember:
             [{"Object":transform_obj, "xxxxxxxx":value}, {}, ...]
         """
 
+        # cached searches of reference shapes in the mesh, kept for all runs of the analysis
+        from femmesh.refshapecache import get_refshape_cache
+
+        self.refshape_cache = get_refshape_cache(analysis)
+
         # get member
         # constants
         self.cota_vacuumpermittivity = self.get_several_member("Fem::ConstantVacuumPermittivity")